@@ -35,8 +35,11 @@
     register_comm_handlers, comm_handler)
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.mpl import automatic_backend, MPL_BACKENDS_TO_SPYDER
-from spyder_kernels.utils.nsview import (
-    get_remote_data, make_remote_view, get_size)
+from spyder_kernels.utils.nsview import get_remote_data, get_size
+from spyder_kernels.utils.nsviewcache import NamespaceViewCache
+from spyder_kernels.utils.sampler import DEFAULT_INTERVAL, StackSampler
+from spyder_kernels.utils.viewhandles import (
+    ViewHandleManager, is_viewable, is_viewable_array)
 from spyder_kernels.console.shell import SpyderShell
 from spyder_kernels.comms.utils import WriteContext
 
@@ -65,6 +68,9 @@ def __init__(self, *args, **kwargs):
         register_comm_handlers(self.shell, self.frontend_comm)
 
         self.namespace_view_settings = {}
+        self.namespace_view_cache = NamespaceViewCache()
+        self.view_handles = ViewHandleManager()
+        self.sampler = None
         self.faulthandler_handle = None
         self._cwd_initialised = False
 
@@ -111,7 +117,8 @@ def get_state(self):
         with WriteContext("get_state"):
             if self._cwd_initialised:
                 state["cwd"] = self.get_cwd()
-            state["namespace_view"] = self.get_namespace_view()
+            state["namespace_view_delta"] = self.get_namespace_view_delta(
+                base=self.namespace_view_cache.version)
             state["var_properties"] = self.get_var_properties()
         return state
 
@@ -225,6 +232,7 @@ def get_system_threads_id(self):
             self.parent.iopub_thread.thread,  # iopub
             gc.thread,  # ZMQ garbage collector thread
             self.parent.control_thread,  # control
+            self.sampler.thread if self.sampler else None,  # profiler
         ]
         return [
             thread.ident for thread in ignore_threads if thread is not None]
@@ -306,8 +314,33 @@ def get_namespace_view(self, frame=None):
         settings = self.namespace_view_settings
         if settings:
             ns = self.shell._get_current_namespace(frame=frame)
-            view = make_remote_view(ns, settings, EXCLUDED_NAMES)
-            return view
+            return self.namespace_view_cache.get_view(
+                ns, settings, EXCLUDED_NAMES)
+        else:
+            return None
+
+    @comm_handler
+    def get_namespace_view_timings(self, count=5):
+        """
+        Return the variables that took the longest to display in the last
+        namespace view, as a list of (name, seconds) pairs.
+        """
+        return self.namespace_view_cache.get_slowest(count)
+
+    @comm_handler
+    def get_namespace_view_delta(self, base=None):
+        """
+        Return the changes in the namespace view since the version `base`.
+
+        If `base` is not the version of the last view computed by the
+        kernel, the full view is returned. See
+        `NamespaceViewCache.get_delta` for the structure of the result.
+        """
+        settings = self.namespace_view_settings
+        if settings:
+            ns = self.shell._get_current_namespace()
+            return self.namespace_view_cache.get_delta(
+                ns, settings, base, EXCLUDED_NAMES)
         else:
             return None
 
@@ -335,7 +368,9 @@ def get_var_properties(self):
                     'is_data_frame': self._is_data_frame(value),
                     'is_series': self._is_series(value),
                     'array_shape': self._get_array_shape(value),
-                    'array_ndim': self._get_array_ndim(value)
+                    'array_ndim': self._get_array_ndim(value),
+                    'viewable_by_handle': is_viewable(value),
+                    'is_viewable_array': is_viewable_array(value)
                 }
 
             return properties
@@ -348,6 +383,52 @@ def get_value(self, name):
         ns = self.shell._get_current_namespace()
         return ns[name]
 
+    @comm_handler
+    def open_view_handle(self, name):
+        """
+        Open a handle to view a variable without sending its value.
+
+        Returns a dictionary describing the variable (see
+        `ViewHandleManager.get_info`). The handle must be closed with
+        `close_view_handle` when the frontend no longer needs it.
+        """
+        ns = self.shell._get_current_namespace()
+        return self.view_handles.open(name, ns[name])
+
+    @comm_handler
+    def close_view_handle(self, handle_id):
+        """Close a view handle."""
+        self.view_handles.close(handle_id)
+
+    @comm_handler
+    def get_view_window(self, handle_id, row_start, row_stop, col_start,
+                        col_stop):
+        """Get a rectangular window of the data viewed by a handle."""
+        return self.view_handles.get_window(
+            handle_id, row_start, row_stop, col_start, col_stop)
+
+    @comm_handler
+    def get_view_tile(self, handle_id, row_start, row_stop, col_start,
+                      col_stop):
+        """Get a tile of an array viewed by a handle and its color range."""
+        return self.view_handles.get_tile(
+            handle_id, row_start, row_stop, col_start, col_stop)
+
+    @comm_handler
+    def get_view_header(self, handle_id, axis, start, stop):
+        """Get a slice of the column (0) or row (1) labels of a handle."""
+        return self.view_handles.get_header(handle_id, axis, start, stop)
+
+    @comm_handler
+    def get_view_max_min(self, handle_id):
+        """Get the maximum and minimum of each column of a handle."""
+        return self.view_handles.get_max_min(handle_id)
+
+    @comm_handler
+    def sort_view(self, handle_id, column, ascending=True):
+        """Sort the rows of a handle without modifying its variable."""
+        self.view_handles.sort(handle_id, column, ascending)
+
     @comm_handler
     def set_value(self, name, value):
         """Set the value of a variable"""
@@ -413,6 +494,39 @@ def save_namespace(self, filename):
                                more_excluded_names=EXCLUDED_NAMES).copy()
         return iofunctions.save(data, filename)
 
+    # --- For the Profiler
+    @comm_handler
+    def start_sampling_profiler(self, interval=DEFAULT_INTERVAL):
+        """
+        Start sampling the stack of the main thread every `interval`
+        seconds, forgetting previous samples.
+        """
+        if self.sampler is not None:
+            self.sampler.stop()
+        self.sampler = StackSampler(threading.main_thread().ident, interval)
+        self.sampler.start()
+
+    @comm_handler
+    def stop_sampling_profiler(self):
+        """
+        Stop sampling the stack of the main thread and return the stats of
+        the samples, in the format of pstats, or None if it was not sampled.
+        """
+        if self.sampler is None:
+            return None
+        self.sampler.stop()
+        return self.sampler.get_stats()
+
+    @comm_handler
+    def get_sampling_profiler_stats(self):
+        """
+        Return the stats of the samples of the main thread taken so far, in
+        the format of pstats, or None if it's not sampled.
+        """
+        if self.sampler is None:
+            return None
+        return self.sampler.get_stats()
+
     # --- For Pdb
     def _do_complete(self, code, cursor_pos):
         """Call parent class do_complete"""
@@ -647,6 +761,7 @@ def set_configuration(self, conf):
                 self.publish_state()
             elif key == "namespace_view_settings":
                 self.namespace_view_settings = value
+                self.namespace_view_cache.clear()
                 self.publish_state()
             elif key == "pdb":
                 self.shell.set_pdb_configuration(value)
@@ -347,6 +347,27 @@ async def run_code(self, *args, **kwargs):
         except KeyboardInterrupt:
             self.showtraceback()
 
+    @comm_handler
+    def set_file_code(self, filename, version, code=None):
+        """
+        Set the code of a file that Spyder is about to run, so that it
+        doesn't need to be requested.
+        """
+        code_runner = self.magics_manager.registry['SpyderCodeRunner']
+        return code_runner.set_file_code(filename, version, code)
+
+    @comm_handler
+    def get_pdb_filter_stats(self):
+        """
+        Get the number of trace events checked by the current debugger to
+        decide if it should stop, and of the ones filtered out because
+        they were in libraries or in spyder-kernels.
+        """
+        debugger = self.pdb_session
+        if not debugger:
+            return None
+        return dict(debugger.filter_stats)
+
     @comm_handler
     def pdb_input_reply(self, line, echo_stack_entry=True):
         """Get a pdb command from the frontend."""
@@ -33,7 +33,8 @@
 # Local imports
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.test_utils import get_kernel, get_log_text
-from spyder_kernels.customize.spyderpdb import SpyderPdb
+from spyder_kernels.customize.spyderpdb import (
+    CODE_KERNEL, CODE_LIBRARY, SpyderPdb)
 from spyder_kernels.comms.commbase import CommBase
 
 # =============================================================================
@@ -288,6 +289,24 @@ def test_get_namespace_view(kernel):
     assert "'python_type': 'int'" in nsview
 
 
+def test_get_namespace_view_delta(kernel):
+    """
+    Test that the kernel only sends the changes in the namespace view.
+    """
+    asyncio.run(kernel.do_execute('a = 1; b = 2', True))
+    delta = kernel.get_namespace_view_delta()
+    assert delta['base'] is None
+    assert 'a' in delta['changed'] and 'b' in delta['changed']
+
+    asyncio.run(kernel.do_execute('a = 3; del b', True))
+    state = kernel.get_state()
+    delta = state['namespace_view_delta']
+    assert delta['base'] is not None
+    assert list(delta['changed']) == ['a']
+    assert delta['changed']['a']['view'] == '3'
+    assert delta['removed'] == ['b']
+
+
 @pytest.mark.parametrize("filter_on", [True, False])
 def test_get_namespace_view_filter_on(kernel, filter_on):
     """
@@ -330,6 +349,8 @@ def test_get_var_properties(kernel):
     assert "'is_series': False" in var_properties
     assert "'array_shape': None" in var_properties
     assert "'array_ndim': None" in var_properties
+    assert "'viewable_by_handle': False" in var_properties
+    assert "'is_viewable_array': False" in var_properties
 
 
 def test_get_value(kernel):
@@ -341,6 +362,23 @@ def test_get_value(kernel):
     assert kernel.get_value(name) == 124
 
 
+def test_view_handle(kernel):
+    """Test viewing a dataframe by handle instead of getting its value."""
+    asyncio.run(kernel.do_execute(
+        "import pandas as pd; df = pd.DataFrame({'a': range(1000)})", True))
+
+    info = kernel.open_view_handle('df')
+    assert info['shape'] == (1000, 1)
+
+    handle_id = info['handle_id']
+    window = kernel.get_view_window(handle_id, 500, 502, 0, 1)
+    assert window['a'].tolist() == [500, 501]
+    assert kernel.get_view_header(handle_id, 1, 998, 1000) == [998, 999]
+
+    kernel.close_view_handle(handle_id)
+    assert not kernel.view_handles._handles
+
+
 def test_set_value(kernel):
     """Test setting the value of a variable."""
     name = 'a'
@@ -926,6 +964,81 @@ def test_callables_and_modules(kernel, exclude_callables_and_modules,
     settings['exclude_unsupported'] = False
 
 
+def test_pdb_code_kinds(kernel, tmpdir):
+    """
+    Test that the debugger classifies the code of files only once, and
+    that it reports how many trace events it filtered.
+    """
+    pdb_obj = SpyderPdb()
+    user_file = str(tmpdir.join('script.py'))
+
+    assert pdb_obj._get_code_kind(os.__file__) == CODE_LIBRARY
+    assert pdb_obj._get_code_kind(inspect.getfile(SpyderPdb)) & CODE_KERNEL
+    assert pdb_obj._get_code_kind(user_file) == 0
+    assert pdb_obj._get_code_kind(user_file) == 0
+    assert pdb_obj.filter_stats['classified_files'] == 3
+
+    # Kinds are computed again if sys.path changes
+    sys.path.append(str(tmpdir))
+    try:
+        pdb_obj._check_code_kinds_path()
+        assert pdb_obj._code_kinds == {}
+    finally:
+        sys.path.remove(str(tmpdir))
+
+    # Library frames are filtered when libraries are ignored. This test is
+    # in spyder-kernels, so its frames must not be hidden.
+    pdb_obj.pdb_ignore_lib = True
+    pdb_obj.skip_hidden = False
+    pdb_obj.stopframe = None
+    pdb_obj.botframe = None
+    pdb_obj.stoplineno = 0
+    frame = inspect.currentframe()
+    assert pdb_obj.stop_here(frame)
+    pdb_obj._code_kinds[frame.f_code.co_filename] = CODE_LIBRARY
+    assert not pdb_obj.stop_here(frame)
+
+    kernel.shell._namespace_stack = [pdb_obj]
+    stats = kernel.shell.get_pdb_filter_stats()
+    assert stats['checked_events'] == 2
+    assert stats['library_events'] == 1
+    kernel.shell._namespace_stack = []
+
+
+def test_set_file_code(kernel, tmpdir):
+    """
+    Test that runfile uses the code of a file sent by Spyder before running
+    it, instead of requesting it.
+    """
+    script = tmpdir.join('script.py')
+    script.write('source = "disk"')
+    filename = str(script)
+    command = '%runfile {} --current-namespace'.format(repr(filename))
+
+    # Only sending the version is not enough if the kernel doesn't have the
+    # code yet
+    assert not kernel.shell.set_file_code(filename, 'v1')
+    assert kernel.shell.set_file_code(filename, 'v1', 'source = "editor"')
+    asyncio.run(kernel.do_execute(command, True))
+    assert kernel.get_value('source') == 'editor'
+
+    # The code is only used once, so the file is read from disk now, since
+    # there's no frontend
+    asyncio.run(kernel.do_execute(command, True))
+    assert kernel.get_value('source') == 'disk'
+
+    # The code of the same version can be used again
+    assert kernel.shell.set_file_code(filename, 'v1')
+    asyncio.run(kernel.do_execute(command, True))
+    assert kernel.get_value('source') == 'editor'
+
+    # Code that is not used by the next command is discarded
+    assert kernel.shell.set_file_code(filename, 'v1')
+    asyncio.run(kernel.do_execute('a = 1', True))
+    asyncio.run(kernel.do_execute(command, True))
+    assert kernel.get_value('source') == 'disk'
+
+
 def test_comprehensions_with_locals_in_pdb(kernel):
     """
     Test that evaluating comprehensions with locals works in Pdb.
@@ -1264,6 +1377,101 @@ def test_debug_namespace(tmpdir):
                     break
 
 
+def test_breakpoints_while_continuing(tmpdir):
+    """
+    Test that the debugger stops at breakpoints after continuing, which is
+    done with sys.monitoring in Python 3.12+.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        # Write code to a file
+        d = tmpdir.join("pdb-continue-test.py")
+        d.write(
+            "def func(i):\n"
+            "    x = i * 2\n"
+            "    return x\n"
+            "\n"
+            "breakpoint()\n"
+            "for i in range(3):\n"
+            "    func(i)\n"
+        )
+
+        # Run code file `d`
+        client.execute("%runfile {}".format(repr(str(d))))
+
+        # Set a breakpoint in func and continue until it's hit twice
+        for command in ["b 2", "c", "c"]:
+            client.get_stdin_msg(timeout=TIMEOUT)
+            client.input(command)
+
+        # make sure that the debugger stopped with i == 1
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input("print('i =', i)")
+
+        t0 = time.time()
+        while True:
+            assert time.time() - t0 < 5
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg.get('msg_type') == 'stream':
+                if 'i = ' in msg["content"].get("text"):
+                    assert 'i = 1' in msg["content"].get("text")
+                    break
+
+
+def test_breakpoints_set_while_continuing(tmpdir):
+    """
+    Test that the debugger stops at breakpoints set while continuing, also
+    in functions that already ran.
+    """
+    # Command to start the kernel
+    cmd = "from spyder_kernels.console import start; start.main()"
+
+    with setup_kernel(cmd) as client:
+        # Write code to a file. Breakpoints are set from another thread, as
+        # it's done by Spyder while the code runs.
+        d = tmpdir.join("pdb-continue-set-test.py")
+        d.write(
+            "import threading\n"
+            "import time\n"
+            "\n"
+            "def func(i):\n"
+            "    x = i * 2\n"
+            "    return x\n"
+            "\n"
+            "def set_breakpoints():\n"
+            "    time.sleep(.5)\n"
+            "    get_ipython().set_pdb_configuration(\n"
+            "        {'breakpoints': {__file__: [(5, None)]}})\n"
+            "\n"
+            "breakpoint()\n"
+            "threading.Thread(target=set_breakpoints).start()\n"
+            "for i in range(100):\n"
+            "    func(i)\n"
+            "    time.sleep(.1)\n"
+        )
+
+        # Run code file `d` and continue without breakpoints
+        client.execute("%runfile {}".format(repr(str(d))))
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input("c")
+
+        # make sure that the debugger stopped in a later call
+        client.get_stdin_msg(timeout=TIMEOUT)
+        client.input("print('i =', i)")
+
+        t0 = time.time()
+        while True:
+            assert time.time() - t0 < 5
+            msg = client.get_iopub_msg(timeout=TIMEOUT)
+            if msg.get('msg_type') == 'stream':
+                if 'i = ' in msg["content"].get("text"):
+                    i = int(msg["content"].get("text").split('i = ')[1])
+                    assert 0 < i < 100
+                    break
+
+
 def test_interrupt():
     """
     Test that the kernel can be interrupted by calling a comm handler.
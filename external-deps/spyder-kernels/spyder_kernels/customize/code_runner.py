@@ -49,6 +49,10 @@
 # For logging
 logger = logging.getLogger(__name__)
 
+# Time after which getting the code of a file from Spyder is reported as
+# slow, in seconds
+SLOW_FILE_CODE_TIME = 0.5
+
 
 def runfile_arguments(func):
     """Decorator to add runfile magic arguments to magic."""
@@ -148,8 +152,21 @@ def __init__(self, *args, **kwargs):
         self.umr = UserModuleReloader(
             namelist=os.environ.get("SPY_UMR_NAMELIST", None)
         )
+
+        # Last code of every file sent by Spyder, with its version
+        self._file_codes = {}
+
+        # Code of the files that Spyder is about to run, so that it doesn't
+        # need to be requested
+        self._next_file_codes = {}
+
         super().__init__(*args, **kwargs)
 
+        # Code that was not used by the command it was sent for must not be
+        # used by a later one
+        self.shell.events.register(
+            'post_execute', self._discard_next_file_codes)
+
     @runfile_arguments
     @needs_local_scope
     @line_magic
@@ -373,10 +390,13 @@ def _exec_cell(
             print("Nothing to execute, this cell is empty.\n")
             return
 
+        # Get the file code before triggering `post_execute`, which discards
+        # the code sent by Spyder for this command.
+        file_code = self._get_file_code(filename, save_all=False)
+
         # Trigger `post_execute` to exit the additional pre-execution.
         # See Spyder PR #7310.
         self.shell.events.trigger("post_execute")
-        file_code = self._get_file_code(filename, save_all=False)
 
         # Here the remote filename has been used. It must now be valid locally.
         filename = canonic_filename
@@ -412,13 +432,52 @@ def _get_current_file_name(self):
             self.shell.showtraceback(exception_only=True)
             return None
 
+    def set_file_code(self, filename, version, code=None):
+        """
+        Set the code of a file that Spyder is about to run.
+
+        If code is None, the last code sent for the file is used if it has
+        the same version.
+
+        Returns
+        -------
+        bool
+            Whether the code of the file was set.
+        """
+        if code is None:
+            file_code = self._file_codes.get(filename)
+            if file_code is None or file_code[0] != version:
+                return False
+            code = file_code[1]
+        else:
+            self._file_codes[filename] = (version, code)
+        self._next_file_codes[filename] = code
+        return True
+
+    def _discard_next_file_codes(self):
+        """Discard the code of files that was not used by the last command."""
+        self._next_file_codes.clear()
+
     def _get_file_code(self, filename, save_all=True, raise_exception=False):
         """Retrieve the content of a file."""
+        # Use the code sent by Spyder before running the file
+        code = self._next_file_codes.pop(filename, None)
+        if code is not None:
+            return code
+
         # Get code from spyder
         try:
-            return frontend_request(blocking=True).get_file_code(
+            start_time = time.perf_counter()
+            code = frontend_request(blocking=True).get_file_code(
                 filename, save_all=save_all
             )
+            elapsed = time.perf_counter() - start_time
+            if elapsed > SLOW_FILE_CODE_TIME:
+                print(
+                    "Getting the code of {} from Spyder took {:.1f} s.\n"
+                    .format(os.path.basename(filename), elapsed)
+                )
+            return code
         except Exception:
             # Maybe this is a local file
             try:
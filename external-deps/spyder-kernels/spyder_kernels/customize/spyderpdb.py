@@ -32,6 +32,22 @@
 
 logger = logging.getLogger(__name__)
 
+# Whether breakpoints can be checked with sys.monitoring (PEP 669) instead of
+# sys.settrace while continuing, which is much faster.
+MONITORING_AVAILABLE = hasattr(sys, 'monitoring')
+
+if MONITORING_AVAILABLE:
+    MONITORING_TOOL_ID = sys.monitoring.DEBUGGER_ID
+    MONITORING_EVENTS = sys.monitoring.events
+
+# Directory of the spyder-kernels internals, which are hidden while debugging
+KERNELS_DIR = os.path.dirname(spyder_kernels.__file__)
+
+# Flags of the kinds of code run by the debugger. Code with none of them is
+# user code.
+CODE_LIBRARY = 1
+CODE_KERNEL = 2
+
 
 class DebugWrapper:
     """
@@ -83,7 +99,14 @@ def __init__(self, completekey='tab', stdin=None, stdout=None,
         self.pdb_publish_stack = False
         self._exclamation_warning_printed = False
         self.pdb_stop_first_line = True
+        self.pdb_use_monitoring = MONITORING_AVAILABLE
         self._disable_next_stack_entry = False
+
+        # State of the breakpoint checks done with sys.monitoring
+        self._monitoring = False
+        self._monitoring_thread = None
+        self._monitored_codes = set()
+        self._monitoring_interrupt = False
         super(SpyderPdb, self).__init__()
 
         # content of tuple: (filename, line number)
@@ -109,6 +132,21 @@ def __init__(self, completekey='tab', stdin=None, stdout=None,
         # Should the frontend force go to the current line?
         self._request_where = False
 
+        # Kinds of code by filename, which are computed only once per file
+        # because the debugger checks them for every trace event. They are
+        # computed again if sys.path changes.
+        self._code_kinds = {}
+        self._code_kinds_path = list(sys.path)
+
+        # Number of trace events that were checked to decide if the
+        # debugger should stop, and of the ones filtered out
+        self.filter_stats = {
+            'checked_events': 0,
+            'library_events': 0,
+            'kernel_events': 0,
+            'classified_files': 0,
+        }
+
         # Turn off IPython's debugger skip funcionality by default because
         # it makes our debugger quite slow. It's also important to remark
         # that this functionality doesn't do anything on its own. Users
@@ -241,6 +279,18 @@ def interrupt(self):
         """Stop debugger on next instruction."""
         self.interrupting = True
         self.message("\nProgram interrupted. (Use 'cont' to resume).")
+        if self._monitoring:
+            # This can be called from another thread, so stop at the next
+            # line run by the debugged thread.
+            self._monitoring_interrupt = True
+            sys.monitoring.set_events(
+                MONITORING_TOOL_ID,
+                MONITORING_EVENTS.PY_START
+                | MONITORING_EVENTS.PY_RESUME
+                | MONITORING_EVENTS.LINE
+            )
+            sys.monitoring.restart_events()
+            return
         self.set_step()
 
     def set_trace(self, frame=None):
@@ -250,6 +300,7 @@ def set_trace(self, frame=None):
 
     def set_quit(self):
         """Register that debugger is not tracing."""
+        self._stop_monitoring()
         self.shell.remove_pdb_session(self)
         super(SpyderPdb, self).set_quit()
 
@@ -257,6 +308,7 @@ def interaction(self, frame, traceback):
         """
         Called when a user interaction is required.
         """
+        self._check_code_kinds_path()
         with DebugWrapper(self):
             # Wrapp in case the frontend was not notified, e.g. postmortem
             return super(SpyderPdb, self).interaction(
@@ -294,10 +346,16 @@ def stop_here(self, frame):
         if filename.startswith('<'):
             # This is not a file
             return True
-        if self.pdb_ignore_lib and path_is_library(filename):
+
+        stats = self.filter_stats
+        stats['checked_events'] += 1
+        kind = self._get_code_kind(filename)
+        if self.pdb_ignore_lib and kind & CODE_LIBRARY:
+            stats['library_events'] += 1
             return False
-        if self.skip_hidden and os.path.dirname(spyder_kernels.__file__) in filename:
+        if self.skip_hidden and kind & CODE_KERNEL:
             # This is spyder-kernels internals
+            stats['kernel_events'] += 1
             return False
         return True
 
@@ -545,6 +603,8 @@ def set_continue(self):
         """
         # Don't stop except at breakpoints or when finished
         self._set_stopinfo(self.botframe, None, -1)
+        if self._can_use_monitoring():
+            self._start_monitoring(sys._getframe().f_back)
 
     def do_debug(self, arg):
         """
@@ -627,6 +687,7 @@ def canonic(self, filename):
     def do_exitdb(self, arg):
         """Exit the debugger"""
         self._set_stopinfo(self.botframe, None, -1)
+        self._stop_monitoring()
         sys.settrace(None)
         frame = sys._getframe().f_back
         while frame and frame is not self.botframe:
@@ -751,6 +812,10 @@ def set_spyder_breakpoints(self, breakpoints):
                     # The file is not readable
                     pass
 
+        if self._monitoring:
+            # Breakpoints can be set while continuing
+            self._restart_monitoring()
+
     breakpoints = property(fset=set_spyder_breakpoints)
 
     def get_pdb_state(self):
@@ -813,7 +878,10 @@ def run(self, cmd, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).run(cmd, globals, locals)
+            try:
+                super(SpyderPdb, self).run(cmd, globals, locals)
+            finally:
+                self._stop_monitoring()
 
     def runeval(self, expr, globals=None, locals=None):
         """Debug an expression executed via the eval() function.
@@ -821,7 +889,10 @@ def runeval(self, expr, globals=None, locals=None):
         globals defaults to __main__.dict; locals defaults to globals.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runeval(expr, globals, locals)
+            try:
+                super(SpyderPdb, self).runeval(expr, globals, locals)
+            finally:
+                self._stop_monitoring()
 
     def runcall(self, *args, **kwds):
         """Debug a single function call.
@@ -829,10 +900,203 @@ def runcall(self, *args, **kwds):
         Return the result of the function call.
         """
         with DebugWrapper(self):
-            super(SpyderPdb, self).runcall(*args, **kwds)
+            try:
+                super(SpyderPdb, self).runcall(*args, **kwds)
+            finally:
+                self._stop_monitoring()
 
     def set_remote_filename(self, filename):
         """Set remote filename to signal Spyder on mainpyfile."""
         self.remote_filename = filename
         self.mainpyfile = self.canonic(filename)
         self._wait_for_mainpyfile = True
+
+    def _get_code_kind(self, filename):
+        """
+        Get the flags of the kind of code of a file: CODE_LIBRARY and/or
+        CODE_KERNEL, or 0 for user code.
+        """
+        try:
+            return self._code_kinds[filename]
+        except KeyError:
+            pass
+
+        kind = 0
+        if path_is_library(filename):
+            kind |= CODE_LIBRARY
+        if KERNELS_DIR in filename:
+            kind |= CODE_KERNEL
+        self._code_kinds[filename] = kind
+        self.filter_stats['classified_files'] += 1
+        return kind
+
+    def _check_code_kinds_path(self):
+        """Forget the kinds of code if sys.path changed."""
+        if sys.path != self._code_kinds_path:
+            self._code_kinds = {}
+            self._code_kinds_path = list(sys.path)
+
+    # --- Methods defined by us to check breakpoints with sys.monitoring
+    # While continuing, sys.settrace calls the debugger for every function
+    # call and every line of the files with breakpoints. With sys.monitoring,
+    # line events are only enabled for the code objects that contain
+    # breakpoints, and every other event is disabled after its first call,
+    # so code without breakpoints runs at almost full speed. Tracing is
+    # restored when a breakpoint is hit or the debugger is interrupted.
+    def _can_use_monitoring(self):
+        """Check if breakpoints can be checked with sys.monitoring."""
+        if not (self.pdb_use_monitoring and MONITORING_AVAILABLE):
+            return False
+        if self._monitoring:
+            return True
+
+        # Function breakpoints stop on the first line of their function,
+        # which is not where they are registered.
+        for bp in bdb.Breakpoint.bpbynumber:
+            if bp and bp.funcname:
+                return False
+
+        return sys.monitoring.get_tool(MONITORING_TOOL_ID) is None
+
+    def _start_monitoring(self, frame):
+        """
+        Stop tracing and check breakpoints with sys.monitoring instead.
+
+        frame is the current frame of the debugged code.
+        """
+        monitoring = sys.monitoring
+        events = MONITORING_EVENTS
+        if not self._monitoring:
+            monitoring.use_tool_id(MONITORING_TOOL_ID, "Spyder debugger")
+            for event in (events.PY_START, events.PY_RESUME):
+                monitoring.register_callback(
+                    MONITORING_TOOL_ID, event, self._monitor_start)
+            monitoring.register_callback(
+                MONITORING_TOOL_ID, events.LINE, self._monitor_line)
+            self._monitoring = True
+
+        self._monitoring_thread = threading.get_ident()
+        self._monitoring_interrupt = False
+        self._clear_monitored_codes()
+        monitoring.set_events(
+            MONITORING_TOOL_ID, events.PY_START | events.PY_RESUME)
+
+        # Code that is already running won't start again
+        running_frame = frame
+        while running_frame is not None:
+            self._monitor_code(running_frame.f_code)
+            running_frame = running_frame.f_back
+        monitoring.restart_events()
+
+        # Stop tracing, as Bdb.set_continue does without breakpoints
+        sys.settrace(None)
+        while frame and frame is not self.botframe:
+            del frame.f_trace
+            frame = frame.f_back
+
+    def _restart_monitoring(self):
+        """
+        Check the current breakpoints with sys.monitoring.
+
+        This can be called from another thread while the debugged code runs,
+        so code objects that already started are checked again.
+        """
+        monitoring = sys.monitoring
+        events = MONITORING_EVENTS
+        self._clear_monitored_codes()
+        if self._monitoring_interrupt:
+            monitoring.set_events(
+                MONITORING_TOOL_ID,
+                events.PY_START | events.PY_RESUME | events.LINE
+            )
+        else:
+            monitoring.set_events(
+                MONITORING_TOOL_ID, events.PY_START | events.PY_RESUME)
+        monitoring.restart_events()
+
+        # Code that is already running won't start again
+        frame = sys._current_frames().get(self._monitoring_thread)
+        while frame is not None:
+            self._monitor_code(frame.f_code)
+            frame = frame.f_back
+
+    def _stop_monitoring(self):
+        """Stop checking breakpoints with sys.monitoring."""
+        if not self._monitoring:
+            return
+
+        monitoring = sys.monitoring
+        monitoring.set_events(MONITORING_TOOL_ID, 0)
+        self._clear_monitored_codes()
+        for event in (
+            MONITORING_EVENTS.PY_START,
+            MONITORING_EVENTS.PY_RESUME,
+            MONITORING_EVENTS.LINE,
+        ):
+            monitoring.register_callback(MONITORING_TOOL_ID, event, None)
+        monitoring.free_tool_id(MONITORING_TOOL_ID)
+        self._monitoring = False
+        self._monitoring_interrupt = False
+
+    def _clear_monitored_codes(self):
+        """Disable line events in the code objects that had them."""
+        # The set is replaced first because the debugged thread can add
+        # codes to it at the same time.
+        codes, self._monitored_codes = self._monitored_codes, set()
+        for code in codes:
+            sys.monitoring.set_local_events(MONITORING_TOOL_ID, code, 0)
+
+    def _monitor_code(self, code):
+        """Enable line events in code if it contains breakpoints."""
+        if code in self._monitored_codes:
+            return
+        breaks = self.breaks.get(self.canonic(code.co_filename))
+        if not breaks:
+            return
+        lines = {line for __, __, line in code.co_lines()}
+        if lines.isdisjoint(breaks):
+            return
+        sys.monitoring.set_local_events(
+            MONITORING_TOOL_ID, code, MONITORING_EVENTS.LINE)
+        self._monitored_codes.add(code)
+
+    def _monitor_start(self, code, instruction_offset):
+        """Callback for code objects that start or resume running."""
+        self._monitor_code(code)
+        return sys.monitoring.DISABLE
+
+    def _monitor_line(self, code, line_number):
+        """Callback for lines that can have breakpoints."""
+        if threading.get_ident() != self._monitoring_thread:
+            return None
+
+        frame = sys._getframe(1)
+        if self._monitoring_interrupt:
+            kind = self._get_code_kind(code.co_filename)
+            if kind & CODE_KERNEL or (
+                self.pdb_ignore_lib and kind & CODE_LIBRARY
+            ):
+                return None
+            self.set_step()
+        elif code not in self._monitored_codes:
+            return None
+        elif line_number not in self.breaks.get(
+                self.canonic(code.co_filename), ()):
+            return sys.monitoring.DISABLE
+        elif not self.break_here(frame):
+            return None
+
+        # Stop here and trace the code again, unless the user continues
+        self._stop_monitoring()
+        self.user_line(frame)
+        if self.quitting:
+            raise bdb.BdbQuit
+        if not self._monitoring:
+            running_frame = frame
+            while running_frame is not None:
+                running_frame.f_trace = self.trace_dispatch
+                if running_frame is self.botframe:
+                    break
+                running_frame = running_frame.f_back
+            sys.settrace(self.trace_dispatch)
+        return None
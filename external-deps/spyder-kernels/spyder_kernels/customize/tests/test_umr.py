@@ -96,3 +96,46 @@ def test_umr_reload_modules(user_module):
     # Reload user modules
     import foo3
     assert umr.is_module_reloadable(foo3, 'foo3')
+
+
+def test_umr_selective(user_module, tmpdir):
+    """
+    Test that the UMR only reloads the modules that changed and the ones
+    that import them in selective mode.
+    """
+    # Create user modules
+    user_module('foo4')
+    tmpdir.join('foo4_user.py').write('from foo4.bar import square\n')
+    tmpdir.join('foo4_other.py').write('import foo4\n')
+
+    # Create UMR in selective mode
+    umr = UserModuleReloader()
+    umr.selective = True
+    assert umr.run() == []
+
+    import foo4_user
+    import foo4_other
+
+    # Modules imported since the last run are kept if they didn't change
+    assert umr.run() == []
+    assert set(umr._module_states) == {
+        'foo4', 'foo4.bar', 'foo4_user', 'foo4_other'}
+
+    # Touching a file doesn't reload it
+    bar_file = tmpdir.join('foo4').join('bar.py')
+    os.utime(str(bar_file), (1, 1))
+    assert umr.run() == []
+
+    # Editing a module reloads it and the modules that import it, but not
+    # its package
+    bar_file.write('def square(x):\n    return x * x\n')
+    assert sorted(umr.run()) == ['foo4.bar', 'foo4_user']
+    assert 'foo4' in sys.modules
+    assert 'foo4_user' not in sys.modules
+
+    # Editing a package also reloads its submodules
+    import foo4_user
+    assert umr.run() == []
+    tmpdir.join('foo4').join('__init__.py').write('# Package\n')
+    assert sorted(umr.run()) == ['foo4', 'foo4.bar', 'foo4_other',
+                                 'foo4_user']
@@ -5,12 +5,120 @@
 
 """User module reloader."""
 
+import ast
+import hashlib
 import os
 import sys
+import time
 
 from spyder_kernels.customize.utils import path_is_library
 
 
+def get_file_stat(filename):
+    """
+    Get the modification time (in ns) and size of a file, or None if it
+    doesn't exist.
+    """
+    if filename is None:
+        return None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ModuleState:
+    """
+    State of the source file of a user module when it was checked.
+
+    The hash of the file is only computed if its modification time or size
+    change, to tell edited files apart from files that were just touched.
+    """
+
+    def __init__(self, filename, imports):
+        self.filename = filename
+        self.imports = imports
+        self.stat = get_file_stat(filename)
+        self.digest = self._get_digest(filename)
+
+    def has_changed(self, filename):
+        """Check if the source file of the module changed."""
+        if filename != self.filename:
+            return True
+
+        stat = get_file_stat(filename)
+        if stat == self.stat:
+            return False
+        if stat is None:
+            # The file was removed
+            return True
+
+        digest = self._get_digest(filename)
+        if digest != self.digest:
+            return True
+
+        # Only its modification time changed
+        self.stat = stat
+        return False
+
+    @staticmethod
+    def _get_digest(filename):
+        if filename is None:
+            return None
+        try:
+            with open(filename, 'rb') as f:
+                return hashlib.sha1(f.read()).digest()
+        except OSError:
+            return None
+
+
+def get_module_imports(module, modname):
+    """
+    Get the names of the modules that could be imported by the source code
+    of a module.
+
+    For `from package import name`, both package and package.name are
+    returned, since name can be a submodule.
+    """
+    filename = getattr(module, '__file__', None)
+    if filename is None or not filename.endswith('.py'):
+        return set()
+
+    try:
+        with open(filename, 'rb') as f:
+            tree = ast.parse(f.read(), filename)
+    except (OSError, SyntaxError, ValueError):
+        return set()
+
+    package = getattr(module, '__package__', None)
+    if package is None:
+        package = modname.rpartition('.')[0]
+
+    imports = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                imports.add(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                parts = package.split('.') if package else []
+                if node.level > 1:
+                    parts = parts[:-(node.level - 1)]
+                if node.module:
+                    parts.append(node.module)
+                base = '.'.join(parts)
+            else:
+                base = node.module
+            if not base:
+                continue
+            imports.add(base)
+            for alias in node.names:
+                imports.add(base + '.' + alias.name)
+
+    return imports
+
+
 class UserModuleReloader:
     """
     User Module Reloader (UMR) aims at deleting user modules
@@ -46,8 +154,8 @@ def __init__(self, namelist=None, pathlist=None):
 
         self.pathlist = pathlist
 
-        # List of previously loaded modules
-        self.previous_modules = list(sys.modules.keys())
+        # Set of previously loaded modules
+        self.previous_modules = set(sys.modules.keys())
 
         # Check if the UMR is enabled or not
         enabled = os.environ.get("SPY_UMR_ENABLED", "")
@@ -57,6 +165,17 @@ def __init__(self, namelist=None, pathlist=None):
         verbose = os.environ.get("SPY_UMR_VERBOSE", "")
         self.verbose = verbose.lower() == "true"
 
+        # Check if the UMR should only reload the modules that changed and
+        # the ones that depend on them
+        selective = os.environ.get("SPY_UMR_SELECTIVE", "")
+        self.selective = selective.lower() == "true"
+
+        # State of the user modules that were kept in the last run, by name
+        self._module_states = {}
+
+        # Time of the last run
+        self._last_run_time = None
+
     def is_module_reloadable(self, module, modname):
         """Decide if a module is reloadable or not."""
         if (
@@ -78,21 +197,99 @@ def run(self):
         Do not del modules which are considered as system modules, i.e.
         modules installed in subdirectories of Python interpreter's binary
         Do not del C modules
+
+        In selective mode, only the modules whose source changed since the
+        last run and the ones that import them are deleted.
         """
-        modnames_to_reload = []
+        start_time = time.perf_counter()
+        user_modules = {}
         for modname, module in list(sys.modules.items()):
             if modname not in self.previous_modules:
                 # Decide if a module can be reloaded or not
                 if self.is_module_reloadable(module, modname):
-                    modnames_to_reload.append(modname)
-                    del sys.modules[modname]
-                else:
-                    continue
+                    user_modules[modname] = module
+
+        if self.selective:
+            modnames_to_reload = self._get_modules_to_reload(user_modules)
+        else:
+            modnames_to_reload = list(user_modules)
+
+        for modname in modnames_to_reload:
+            del sys.modules[modname]
+            self._module_states.pop(modname, None)
 
         # Report reloaded modules
         if self.verbose and modnames_to_reload:
             modnames = modnames_to_reload
+            elapsed = (time.perf_counter() - start_time) * 1000
             print("\x1b[4;33m%s\x1b[24m%s\x1b[0m"
                   % ("Reloaded modules", ": "+", ".join(modnames)))
+            print("\x1b[33m%d of %d user modules reloaded, checked in "
+                  "%.1f ms\x1b[0m"
+                  % (len(modnames), len(user_modules), elapsed))
 
         return modnames_to_reload
+
+    # ---- Private API
+    def _get_modules_to_reload(self, user_modules):
+        """
+        Get the names of the user modules that changed since the last run,
+        and of the modules that depend on them.
+
+        A module depends on the modules it imports and on its parent
+        package, since the package would lose its submodules otherwise.
+        """
+        run_time = time.time()
+
+        # Forget the modules that were removed by users
+        for modname in list(self._module_states):
+            if modname not in user_modules:
+                del self._module_states[modname]
+
+        changed = set()
+        for modname, module in user_modules.items():
+            filename = getattr(module, '__file__', None)
+            state = self._module_states.get(modname)
+            if state is not None:
+                if state.has_changed(filename):
+                    changed.add(modname)
+                continue
+
+            # Modules imported since the last run can only be kept if their
+            # source was not modified after they were imported.
+            stat = get_file_stat(filename)
+            if (
+                self._last_run_time is None
+                or (stat is not None and stat[0] / 1e9 >= self._last_run_time)
+            ):
+                changed.add(modname)
+            else:
+                self._module_states[modname] = ModuleState(
+                    filename, get_module_imports(module, modname))
+        self._last_run_time = run_time
+
+        if not changed:
+            return []
+
+        # Modules that depend on every user module
+        dependents = {}
+        for modname in user_modules:
+            state = self._module_states.get(modname)
+            imports = state.imports if state is not None else set()
+            parent = modname.rpartition('.')[0]
+            if parent:
+                imports = imports | {parent}
+            for imported in imports:
+                if imported != modname and imported in user_modules:
+                    dependents.setdefault(imported, []).append(modname)
+
+        to_reload = set()
+        pending = list(changed)
+        while pending:
+            modname = pending.pop()
+            if modname in to_reload:
+                continue
+            to_reload.add(modname)
+            pending.extend(dependents.get(modname, []))
+
+        return [modname for modname in user_modules if modname in to_reload]
@@ -12,6 +12,7 @@
 from itertools import islice
 import inspect
 import re
+import time
 
 from spyder_kernels.utils.lazymodules import (
     bs4, FakeObject, numpy as np, pandas as pd, PIL)
@@ -269,8 +270,13 @@ def default_display(value, with_module=True):
         return type_str[1:-1]
 
 
-def collections_display(value, level):
-    """Display for collections (i.e. list, set, tuple and dict)."""
+def collections_display(value, level, deadline=None):
+    """
+    Display for collections (i.e. list, set, tuple and dict).
+
+    If `deadline` (as given by `time.perf_counter`) is reached, no more
+    elements are added to the display.
+    """
     is_dict = isinstance(value, dict)
     is_set = isinstance(value, set)
 
@@ -291,13 +297,21 @@ def collections_display(value, level):
 
     # Get display of each element
     if level <= 2:
-        if is_dict:
-            displays = [value_to_display(k, level=level) + ':' +
-                        value_to_display(v, level=level)
-                        for (k, v) in list(elements)]
-        else:
-            displays = [value_to_display(e, level=level)
-                        for e in elements]
+        displays = []
+        for element in elements:
+            if deadline is not None and time.perf_counter() > deadline:
+                truncate = True
+                break
+            if is_dict:
+                k, v = element
+                displays.append(
+                    value_to_display(k, level=level, deadline=deadline) +
+                    ':' + value_to_display(v, level=level, deadline=deadline)
+                )
+            else:
+                displays.append(
+                    value_to_display(element, level=level, deadline=deadline)
+                )
         if truncate:
             displays.append('...')
         display = ', '.join(displays)
@@ -317,8 +331,13 @@ def collections_display(value, level):
     return display
 
 
-def value_to_display(value, minmax=False, level=0):
-    """Convert value for display purpose"""
+def value_to_display(value, minmax=False, level=0, deadline=None):
+    """
+    Convert value for display purpose
+
+    `deadline` is the time (as given by `time.perf_counter`) after which the
+    display of collections is truncated.
+    """
     # To save current Numpy printoptions
     np_printoptions = FakeObject
     numeric_numpy_types = get_numeric_numpy_types()
@@ -355,7 +374,7 @@ def value_to_display(value, minmax=False, level=0):
             else:
                 display = 'Numpy array'
         elif any([type(value) == t for t in [list, set, tuple, dict]]):
-            display = collections_display(value, level+1)
+            display = collections_display(value, level+1, deadline)
         elif isinstance(value, PIL.Image.Image):
             if level == 0:
                 display = '%s  Mode: %s' % (address(value), value.mode)
@@ -615,6 +634,10 @@ def _is_string(obj):
 #==============================================================================
 # Create view to be displayed by NamespaceBrowser
 #==============================================================================
+# Maximum time (in seconds) to spend computing the display of a variable in
+# a namespace view
+DISPLAY_TIME_BUDGET = 0.2
+
 REMOTE_SETTINGS = ('check_all', 'exclude_private', 'exclude_uppercase',
                    'exclude_capitalized', 'exclude_unsupported',
                    'excluded_names', 'minmax', 'show_callable_attributes',
@@ -687,13 +710,27 @@ def make_remote_view(data, settings, more_excluded_names=None):
                            more_excluded_names=more_excluded_names)
     remote = {}
     for key, value in list(data.items()):
-        view = value_to_display(value, minmax=settings['minmax'])
-        remote[key] = {
-            'type':  get_human_readable_type(value),
-            'size':  get_size(value),
-            'view':  view,
-            'python_type': get_type_string(value),
-            'numpy_type': get_numpy_type_string(value)
-        }
+        remote[key] = make_remote_view_record(
+            value, settings['minmax'], DISPLAY_TIME_BUDGET)
 
     return remote
+
+
+def make_remote_view_record(value, minmax=False, time_budget=None):
+    """
+    Make the entry of *value* in a remote view
+
+    If *time_budget* (in seconds) is given, the display of collections is
+    truncated when it's exceeded.
+    """
+    deadline = None
+    if time_budget is not None:
+        deadline = time.perf_counter() + time_budget
+
+    return {
+        'type':  get_human_readable_type(value),
+        'size':  get_size(value),
+        'view':  value_to_display(value, minmax=minmax, deadline=deadline),
+        'python_type': get_type_string(value),
+        'numpy_type': get_numpy_type_string(value)
+    }
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Incremental namespace views for the Variable Explorer.
+
+Instead of sending the whole namespace view after every execution, the
+kernel remembers the last view it computed and sends only the entries that
+were added, changed or removed since then. Entries of immutable values are
+also reused while the variable keeps pointing to the same object.
+
+The same is done for entries that took longer than `DISPLAY_TIME_BUDGET` to
+compute (whose display is truncated), so that a single slow object doesn't
+delay every namespace refresh until it's rebound. For mutable values, those
+entries are also recomputed when the length or shape of the value changes.
+"""
+
+# Standard library imports
+import datetime
+import logging
+import time
+import uuid
+
+# Local imports
+from spyder_kernels.utils.lazymodules import numpy as np
+from spyder_kernels.utils.nsview import (
+    DISPLAY_TIME_BUDGET, get_remote_data, make_remote_view_record)
+
+
+logger = logging.getLogger(__name__)
+
+
+def is_immutable(value):
+    """
+    Check if the entry of value in a namespace view can't change while the
+    variable points to the same object.
+    """
+    if value is None or type(value) in (
+            bool, int, float, complex, str, bytes, range,
+            datetime.date, datetime.datetime, datetime.timedelta):
+        return True
+
+    try:
+        return isinstance(value, np.generic)
+    except Exception:
+        return False
+
+
+def get_fingerprint(value):
+    """
+    Get a cheap summary of value to detect the changes made in place to it
+    that affect its size, e.g. appending to a list or adding rows to a
+    DataFrame.
+    """
+    try:
+        length = len(value)
+    except Exception:
+        length = None
+
+    try:
+        shape = value.shape
+        if not isinstance(shape, tuple):
+            shape = None
+    except Exception:
+        shape = None
+
+    return length, shape
+
+
+class NamespaceViewCache:
+    """
+    Compute namespace views and the differences between them.
+
+    Each view gets a new version identifier. A delta is computed with respect
+    to the previous view, so it can only be applied by a frontend that has
+    that view. Otherwise the full view is sent.
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._view = None
+        self._version = None
+        self.timings = {}
+
+    # ---- Public API
+    @property
+    def version(self):
+        """Version of the last computed view."""
+        return self._version
+
+    def clear(self):
+        """
+        Forget all views and cached entries.
+
+        This must be called when the namespace view settings change because
+        they affect how entries are computed.
+        """
+        self._records.clear()
+        self._view = None
+        self._version = None
+        self.timings = {}
+
+    def get_view(self, namespace, settings, more_excluded_names=None):
+        """
+        Return the view of namespace, reusing cached entries.
+
+        The time spent computing each entry is saved in `timings`.
+        """
+        start = time.perf_counter()
+        data = get_remote_data(namespace, settings, mode='editable',
+                               more_excluded_names=more_excluded_names)
+        records = {}
+        timings = {}
+        view = {}
+        for name, value in list(data.items()):
+            try:
+                cached_value, record, fingerprint = self._records[name]
+                if cached_value is not value or (
+                    fingerprint is not None
+                    and get_fingerprint(value) != fingerprint
+                ):
+                    raise KeyError(name)
+                keep = True
+            except KeyError:
+                record_start = time.perf_counter()
+                record = make_remote_view_record(
+                    value, settings['minmax'], DISPLAY_TIME_BUDGET)
+                timings[name] = time.perf_counter() - record_start
+
+                # Only entries of immutable values and slow ones are kept,
+                # so that the entry of a value modified in place is
+                # recomputed. Slow entries of mutable values are checked
+                # against their fingerprint for the same reason.
+                fingerprint = None
+                if is_immutable(value):
+                    keep = True
+                elif timings[name] > DISPLAY_TIME_BUDGET:
+                    keep = True
+                    fingerprint = get_fingerprint(value)
+                else:
+                    keep = False
+
+            if keep:
+                records[name] = (value, record, fingerprint)
+            view[name] = record
+
+        self._records = records
+        self.timings = timings
+
+        total = time.perf_counter() - start
+        if total > DISPLAY_TIME_BUDGET:
+            logger.debug(
+                "Computing the namespace view took %.3f s. Slowest "
+                "variables: %s", total,
+                ", ".join(
+                    "%s (%.3f s)" % item for item in self.get_slowest()
+                )
+            )
+        return view
+
+    def get_slowest(self, count=5):
+        """
+        Return the names of the variables whose entries took the longest to
+        compute in the last view, together with that time in seconds.
+        """
+        timings = sorted(
+            self.timings.items(), key=lambda item: item[1], reverse=True)
+        return timings[:count]
+
+    def get_delta(self, namespace, settings, base=None,
+                  more_excluded_names=None):
+        """
+        Return the changes in the view of namespace since the view `base`.
+
+        This is a dictionary with the following structure
+
+        {
+            'version': 'e2a4...',
+            'base': 'b01f...',
+            'changed': {'a': {...}},
+            'removed': ['b']
+        }
+
+        Here 'changed' contains the entries (as returned by
+        `make_remote_view_record`) of the variables that were added or
+        changed, and 'removed' the names of the variables that were removed.
+
+        If `base` is not the version of the last computed view, 'base' is
+        None and 'changed' contains the full view.
+        """
+        previous_view = self._view
+        previous_version = self._version
+
+        view = self.get_view(namespace, settings, more_excluded_names)
+        self._view = view
+        self._version = uuid.uuid4().hex
+
+        if (
+            base is None
+            or previous_view is None
+            or base != previous_version
+        ):
+            return {
+                'version': self._version,
+                'base': None,
+                'changed': view,
+                'removed': [],
+            }
+
+        changed = {
+            name: record for name, record in view.items()
+            if previous_view.get(name) != record
+        }
+        removed = [name for name in previous_view if name not in view]
+        return {
+            'version': self._version,
+            'base': base,
+            'changed': changed,
+            'removed': removed,
+        }
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Statistical profiler of the code run by the kernel.
+
+Instead of tracing every call, as cProfile does, a thread takes samples of
+the stack of the thread that runs the code at a fixed rate, which has a much
+lower overhead. Samples are aggregated by stack and converted to the format
+of the stats of pstats when they're requested, so that they can be shown by
+the Profiler.
+"""
+
+# Standard library imports
+import os.path as osp
+import sys
+import threading
+import time
+
+
+# Default time between samples, in seconds
+DEFAULT_INTERVAL = 0.005
+
+# Minimum time between samples, in seconds
+MIN_INTERVAL = 0.001
+
+# Key of the function that makes the outermost calls of all samples, so
+# that the code run in different executions is shown under the same root.
+ROOT_KEY = ('', 0, '<sampled code>')
+
+# Files of the frames that run the code of users. Only the frames called
+# from them are sampled.
+RUN_CODE_FILES = (
+    "IPython/core/interactiveshell.py",
+    "IPython\\core\\interactiveshell.py",
+)
+
+# Frames of files in this directory are not shown in the results by default
+KERNELS_DIR = osp.dirname(osp.dirname(osp.abspath(__file__)))
+
+
+class StackSampler:
+    """
+    Sampler of the stack of a thread.
+
+    Parameters
+    ----------
+    thread_id: int
+        Identifier of the thread to sample.
+    interval: float
+        Time between samples, in seconds.
+    run_code_files: tuple of str
+        Only the frames called from the last frame of one of these files
+        are sampled, and if there's none, the thread is considered to be
+        idle. If empty, all frames are sampled.
+    excluded_dirs: tuple of str
+        Frames of files in these directories are not shown in the results.
+    """
+
+    def __init__(self, thread_id, interval=DEFAULT_INTERVAL,
+                 run_code_files=RUN_CODE_FILES, excluded_dirs=(KERNELS_DIR,)):
+        self.thread_id = thread_id
+        self.interval = max(interval, MIN_INTERVAL)
+        self.run_code_files = run_code_files
+        self.excluded_dirs = excluded_dirs
+        self.thread = None
+
+        # Map of stacks (tuples of code objects, from the innermost) to the
+        # number of samples taken of them and the time they represent.
+        self._samples = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._last_time = None
+
+    @property
+    def is_running(self):
+        """Whether samples are being taken."""
+        return self.thread is not None
+
+    @property
+    def num_samples(self):
+        """Number of samples taken."""
+        with self._lock:
+            return sum(count for count, __ in self._samples.values())
+
+    # ---- Public API
+    def start(self):
+        """Start taking samples."""
+        if self.thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._last_time = time.perf_counter()
+        self.thread = threading.Thread(
+            target=self._run, name="Spyder sampling profiler", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """Stop taking samples."""
+        if self.thread is None:
+            return
+
+        self._stop_event.set()
+        if self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def clear(self):
+        """Forget the samples taken."""
+        with self._lock:
+            self._samples = {}
+
+    def get_stats(self):
+        """
+        Get the stats of the samples in the format of pstats.
+
+        That's a dictionary that maps the (filename, line_number,
+        function_name) key of every sampled function to its (primitive
+        calls, calls, local time, cumulative time, callers) stats, where
+        callers maps the key of every caller to the (primitive calls,
+        calls, local time, cumulative time) of the calls it made. Calls are
+        the number of samples in which the function was in the stack.
+        """
+        with self._lock:
+            samples = list(self._samples.items())
+
+        code_keys = {}
+        stats = {}
+        for stack, (count, seconds) in samples:
+            keys = [ROOT_KEY]
+            for code in reversed(stack):
+                try:
+                    key = code_keys[code]
+                except KeyError:
+                    key = self._get_key(code)
+                    code_keys[code] = key
+                if key is not None:
+                    keys.append(key)
+
+            # Functions and calls are counted once per sample, even if
+            # they're in the stack more than once because of recursion.
+            seen_keys = set()
+            seen_calls = set()
+            last = len(keys) - 1
+            for index, key in enumerate(keys):
+                entry = stats.get(key)
+                if entry is None:
+                    entry = stats[key] = [0, 0, 0., 0., {}]
+                if index == last:
+                    entry[2] += seconds
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += seconds
+
+                if index == 0:
+                    continue
+                caller = keys[index - 1]
+                if (caller, key) in seen_calls:
+                    continue
+                seen_calls.add((caller, key))
+                call = entry[4].get(caller)
+                if call is None:
+                    call = entry[4][caller] = [0, 0, 0., 0.]
+                call[0] += count
+                call[1] += count
+                call[3] += seconds
+                if index == last:
+                    call[2] += seconds
+
+        return {
+            key: (cc, nc, tt, ct,
+                  {caller: tuple(call) for caller, call in callers.items()})
+            for key, (cc, nc, tt, ct, callers) in stats.items()
+        }
+
+    # ---- Private API
+    def _run(self):
+        """Take samples until stopped."""
+        while not self._stop_event.wait(self.interval):
+            self._take_sample()
+
+    def _take_sample(self):
+        """Take a sample of the stack of the thread."""
+        now = time.perf_counter()
+        elapsed = now - self._last_time
+        self._last_time = now
+
+        frame = sys._current_frames().get(self.thread_id)
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            if (
+                self.run_code_files
+                and code.co_filename.endswith(self.run_code_files)
+            ):
+                break
+            stack.append(code)
+            frame = frame.f_back
+        else:
+            if self.run_code_files:
+                # The thread is not running code
+                return
+
+        if not stack:
+            return
+
+        stack = tuple(stack)
+        with self._lock:
+            count, seconds = self._samples.get(stack, (0, 0.))
+            self._samples[stack] = (count + 1, seconds + elapsed)
+
+    def _get_key(self, code):
+        """
+        Get the pstats key of a code object, or None if its frames are not
+        shown.
+        """
+        filename = code.co_filename
+        if self.excluded_dirs and filename.startswith(self.excluded_dirs):
+            return None
+        return (filename, code.co_firstlineno, code.co_name)
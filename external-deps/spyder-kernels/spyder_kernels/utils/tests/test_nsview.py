@@ -176,6 +176,16 @@ def test_list_display():
     assert is_supported(li, filters=supported_types)
 
 
+def test_display_deadline():
+    """Test that the display of collections is truncated at a deadline."""
+    assert value_to_display([1, 2, 3], deadline=0) == '[...]'
+    assert value_to_display({'a': [1]}, deadline=0) == '{...}'
+
+    # Nothing is truncated if the deadline is not reached
+    deadline = float('inf')
+    assert value_to_display([1, [2, 3]], deadline=deadline) == '[1, [2, 3]]'
+
+
 @pytest.mark.skipif(
     sys.platform == 'darwin' and sys.version_info[:2] == (3, 8),
     reason="Fails on Mac with Python 3.8")
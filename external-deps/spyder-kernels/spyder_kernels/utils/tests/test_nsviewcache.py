@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for nsviewcache.py
+"""
+
+# Third party imports
+import numpy as np
+import pytest
+
+# Local imports
+from spyder_kernels.utils import nsviewcache
+from spyder_kernels.utils.nsviewcache import NamespaceViewCache
+
+
+SETTINGS = {
+    'check_all': False,
+    'exclude_private': True,
+    'exclude_uppercase': True,
+    'exclude_capitalized': False,
+    'exclude_unsupported': False,
+    'exclude_callables_and_modules': True,
+    'excluded_names': [],
+    'minmax': False,
+    'filter_on': True,
+}
+
+
+@pytest.fixture
+def cache():
+    return NamespaceViewCache()
+
+
+# --- Tests
+# -----------------------------------------------------------------------------
+def test_full_view(cache):
+    """Test that the first delta contains the full view."""
+    delta = cache.get_delta({'a': 1, 'b': 'x'}, SETTINGS, base='unknown')
+
+    assert delta['base'] is None
+    assert delta['version'] == cache.version
+    assert set(delta['changed']) == {'a', 'b'}
+    assert delta['changed']['a']['view'] == '1'
+    assert delta['removed'] == []
+
+
+def test_delta(cache):
+    """Test that only added, changed and removed entries are sent."""
+    namespace = {'a': 1, 'b': np.arange(3), 'c': 'x'}
+    version = cache.get_delta(namespace, SETTINGS)['version']
+
+    namespace['a'] = 2
+    namespace['b'][0] = 10
+    namespace['d'] = [1]
+    del namespace['c']
+    delta = cache.get_delta(namespace, SETTINGS, base=version)
+
+    assert delta['base'] == version
+    assert set(delta['changed']) == {'a', 'b', 'd'}
+    assert delta['changed']['b']['view'] == '[10  1  2]'
+    assert delta['removed'] == ['c']
+
+    # Nothing changed
+    delta = cache.get_delta(namespace, SETTINGS, base=delta['version'])
+    assert delta['changed'] == {}
+    assert delta['removed'] == []
+
+    # A delta with respect to an old view is a full view
+    delta = cache.get_delta(namespace, SETTINGS, base=version)
+    assert delta['base'] is None
+    assert set(delta['changed']) == {'a', 'b', 'd'}
+
+
+def test_reuse_immutable_records(cache, monkeypatch):
+    """Test that entries are only recomputed for new or mutable values."""
+    computed = []
+
+    def make_remote_view_record(value, minmax=False, time_budget=None):
+        computed.append(value)
+        return {'view': repr(value)}
+
+    monkeypatch.setattr(
+        nsviewcache, 'make_remote_view_record', make_remote_view_record)
+
+    value = 'spam' * 10
+    namespace = {'a': value, 'b': [1]}
+    cache.get_view(namespace, SETTINGS)
+    assert computed == [value, [1]]
+
+    computed.clear()
+    namespace['c'] = 3.5
+    cache.get_view(namespace, SETTINGS)
+    assert computed == [[1], 3.5]
+
+    # Cached entries are forgotten after clearing the cache
+    computed.clear()
+    cache.clear()
+    cache.get_view(namespace, SETTINGS)
+    assert len(computed) == 3
+
+
+def test_slow_records(cache, monkeypatch):
+    """
+    Test that entries that exceed the time budget are kept until the
+    variable is rebound or its size changes, and that their time is
+    reported.
+    """
+    monkeypatch.setattr(nsviewcache, 'DISPLAY_TIME_BUDGET', 0)
+    namespace = {'a': [1, 2], 'b': np.zeros((2, 2))}
+    view = cache.get_view(namespace, SETTINGS)
+    assert view['a']['view'] == '[...]'
+    assert sorted(name for name, __ in cache.get_slowest()) == ['a', 'b']
+
+    # The entry is not recomputed if the value doesn't change
+    assert cache.get_view(namespace, SETTINGS)['a'] is view['a']
+    assert cache.get_slowest() == []
+
+    # But it is when the list changes in place
+    namespace['a'].append(3)
+    new_view = cache.get_view(namespace, SETTINGS)
+    assert new_view['a'] is not view['a']
+    assert new_view['a']['size'] == 3
+    assert [name for name, __ in cache.get_slowest()] == ['a']
+
+    # Or when the shape of an array changes in place
+    namespace['b'].resize((3, 2), refcheck=False)
+    assert cache.get_view(namespace, SETTINGS)['b']['size'] == (3, 2)
+
+    # Or after rebinding the variable
+    view = cache.get_view(namespace, SETTINGS)
+    namespace['a'] = [1, 2, 3]
+    assert cache.get_view(namespace, SETTINGS)['a'] is not view['a']
+    assert [name for name, __ in cache.get_slowest()] == ['a']
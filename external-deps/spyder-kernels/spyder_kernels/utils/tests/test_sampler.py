@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for sampler.py
+"""
+
+# Standard library imports
+import pstats
+import threading
+import time
+
+# Local imports
+from spyder_kernels.utils.sampler import ROOT_KEY, StackSampler
+
+
+def busy_inner(end):
+    while time.perf_counter() < end:
+        pass
+
+
+def busy_outer(seconds):
+    busy_inner(time.perf_counter() + seconds)
+
+
+def test_sampler():
+    """Test that the stack of a thread is sampled."""
+    thread = threading.Thread(target=busy_outer, args=(0.5,))
+    thread.start()
+    sampler = StackSampler(
+        thread.ident, interval=0.002, run_code_files=(), excluded_dirs=())
+    sampler.start()
+    assert sampler.is_running
+    thread.join()
+    sampler.stop()
+    assert not sampler.is_running
+
+    stats = sampler.get_stats()
+    assert sampler.num_samples > 0
+    keys = {key[2]: key for key in stats}
+    outer = keys['busy_outer']
+    inner = keys['busy_inner']
+
+    # Time is spent in the innermost function
+    assert stats[inner][2] > 0
+    assert stats[outer][2] <= stats[inner][2]
+    assert stats[outer][3] >= stats[inner][3]
+
+    # Callers are recorded
+    assert outer in stats[inner][4]
+    assert ROOT_KEY in stats[keys['_bootstrap']][4]
+    assert stats[ROOT_KEY][1] == sampler.num_samples
+
+    # Stats can be shown by pstats
+    profile = pstats.Stats()
+    profile.stats = stats
+    profile.get_top_level_stats()
+    profile.calc_callees()
+    assert inner in profile.all_callees[outer]
+
+    sampler.clear()
+    assert sampler.get_stats() == {}
+
+
+def test_sampler_idle():
+    """Test that threads that don't run code are not sampled."""
+    thread = threading.Thread(target=busy_outer, args=(0.2,))
+    thread.start()
+    sampler = StackSampler(thread.ident, interval=0.002)
+    sampler.start()
+    thread.join()
+    sampler.stop()
+    assert sampler.num_samples == 0
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for viewhandles.py
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+import pytest
+
+# Local imports
+from spyder_kernels.utils.viewhandles import ViewHandleManager
+
+
+@pytest.fixture
+def manager():
+    return ViewHandleManager()
+
+
+# --- Tests
+# -----------------------------------------------------------------------------
+def test_open_dataframe(manager):
+    """Test the description returned when opening a handle."""
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': [1.5, np.nan, 0.5]})
+    info = manager.open('df', df)
+
+    assert info['name'] == 'df'
+    assert info['type'] == 'DataFrame'
+    assert info['shape'] == (3, 2)
+    assert info['header_shape'] == (1, 1)
+    assert info['dtypes'] == ['int64', 'float64']
+    assert info['names'] == [[None], [None]]
+
+
+def test_open_series_and_index(manager):
+    """Test that series and indexes are viewed as dataframes."""
+    info = manager.open('s', pd.Series([1, 2], name='x'))
+    assert info['type'] == 'Series'
+    assert info['shape'] == (2, 1)
+
+    info = manager.open('i', pd.Index(['a', 'b', 'c']))
+    assert info['type'] == 'Index'
+    assert info['shape'] == (3, 1)
+
+
+def test_open_unsupported(manager):
+    """Test that only pandas objects can be viewed."""
+    with pytest.raises(TypeError):
+        manager.open('l', [1, 2, 3])
+
+
+def test_get_window_and_header(manager):
+    """Test getting windows and header slices of a dataframe."""
+    df = pd.DataFrame(np.arange(100).reshape(20, 5))
+    handle_id = manager.open('df', df)['handle_id']
+
+    window = manager.get_window(handle_id, 10, 12, 1, 3)
+    assert window.shape == (2, 2)
+    assert window.iat[0, 0] == 51
+
+    assert manager.get_header(handle_id, 0, 3, 10) == [3, 4]
+    assert manager.get_header(handle_id, 1, 18, 25) == [18, 19]
+
+
+def test_get_header_multiindex(manager):
+    """Test header slices and level names for MultiIndex axes."""
+    index = pd.MultiIndex.from_tuples(
+        [('a', 1), ('a', 2), ('b', 1)], names=['x', 'y'])
+    df = pd.DataFrame({'c': [1, 2, 3]}, index=index)
+    info = manager.open('df', df)
+
+    assert info['header_shape'] == (1, 2)
+    assert info['names'] == [[None], ['x', 'y']]
+    assert manager.get_header(info['handle_id'], 1, 1, 3) == [
+        ('a', 2), ('b', 1)]
+
+
+def test_get_max_min(manager):
+    """Test that max/min are only computed for numeric columns."""
+    df = pd.DataFrame({
+        'int': [1, 5, 3],
+        'float': [2.0, np.nan, 2.0],
+        'complex': [1j, 3 + 4j, 0],
+        'str': ['a', 'b', 'c'],
+    })
+    handle_id = manager.open('df', df)['handle_id']
+
+    max_min = manager.get_max_min(handle_id)
+    assert max_min[0] == [5, 1]
+    assert max_min[1] == [2.0, 1.0]
+    assert max_min[2] == [5.0, 0.0]
+    assert max_min[3] is None
+
+
+def test_sort(manager):
+    """Test that sorting a handle doesn't modify the viewed object."""
+    df = pd.DataFrame({'a': [3, 1, 2]}, index=['x', 'y', 'z'])
+    handle_id = manager.open('df', df)['handle_id']
+
+    manager.sort(handle_id, 0, ascending=True)
+    assert manager.get_window(handle_id, 0, 3, 0, 1)['a'].tolist() == [
+        1, 2, 3]
+    assert manager.get_header(handle_id, 1, 0, 3) == ['y', 'z', 'x']
+
+    manager.sort(handle_id, -1, ascending=False)
+    assert manager.get_header(handle_id, 1, 0, 3) == ['z', 'y', 'x']
+
+    # The original dataframe is untouched
+    assert df['a'].tolist() == [3, 1, 2]
+
+
+def test_sort_is_stable(manager):
+    """Test that sorting keeps the order of the previous sort for ties."""
+    df = pd.DataFrame({'a': [1, 1, 2, 2], 'b': [4, 3, 2, 1]})
+    handle_id = manager.open('df', df)['handle_id']
+
+    manager.sort(handle_id, 1, ascending=True)
+    manager.sort(handle_id, 0, ascending=True)
+    assert manager.get_window(handle_id, 0, 4, 0, 2)['b'].tolist() == [
+        3, 4, 1, 2]
+
+
+def test_close(manager):
+    """Test that closed handles can't be used anymore."""
+    handle_id = manager.open('df', pd.DataFrame([1]))['handle_id']
+    manager.close(handle_id)
+    with pytest.raises(KeyError):
+        manager.get_info(handle_id)
+
+
+def test_open_array(manager):
+    """Test opening handles to one and two dimensional arrays."""
+    info = manager.open('a', np.arange(6, dtype=np.int32).reshape(2, 3))
+    assert info['kind'] == 'array'
+    assert info['shape'] == (2, 3)
+    assert info['ndim'] == 2
+    assert np.dtype(info['dtype']) == np.int32
+
+    # The dtypes of text arrays can be rebuilt from their info
+    for dtype in ['U256', 'S64']:
+        info = manager.open('c', np.zeros(3, dtype=dtype))
+        assert np.dtype(info['dtype']) == np.dtype(dtype)
+
+    # One dimensional arrays are viewed as a column
+    info = manager.open('b', np.arange(5.))
+    assert info['shape'] == (5, 1)
+    assert info['ndim'] == 1
+
+    # Three dimensional and masked arrays are not supported
+    with pytest.raises(TypeError):
+        manager.open('c', np.zeros((2, 2, 2)))
+    with pytest.raises(TypeError):
+        manager.open('d', np.ma.array([1, 2], mask=[0, 1]))
+
+
+def test_get_tile(manager):
+    """Test that tiles come with the range of their finite values."""
+    array = np.arange(20.).reshape(4, 5)
+    array[1, 1] = np.nan
+    array[1, 2] = np.inf
+    handle_id = manager.open('a', array)['handle_id']
+
+    tile = manager.get_tile(handle_id, 0, 2, 0, 3)
+    assert tile['data'].shape == (2, 3)
+    assert (tile['vmin'], tile['vmax']) == (0.0, 5.0)
+
+    # Tiles at the edges are truncated
+    tile = manager.get_tile(handle_id, 3, 10, 4, 10)
+    assert tile['data'].tolist() == [[19.0]]
+
+    # Non-numeric tiles have no range
+    handle_id = manager.open('s', np.array(['a', 'b']))['handle_id']
+    tile = manager.get_tile(handle_id, 0, 2, 0, 1)
+    assert tile['data'].tolist() == [['a'], ['b']]
+    assert tile['vmin'] is None and tile['vmax'] is None
+
+
+def test_get_tile_memmap(manager, tmp_path):
+    """Test that tiles of memory-mapped arrays are regular arrays."""
+    filename = str(tmp_path / 'data.npy')
+    np.save(filename, np.arange(1000).reshape(100, 10))
+    array = np.load(filename, mmap_mode='r')
+    handle_id = manager.open('m', array)['handle_id']
+
+    tile = manager.get_tile(handle_id, 50, 52, 8, 20)
+    assert type(tile['data']) is np.ndarray
+    assert tile['data'].tolist() == [[508, 509], [518, 519]]
+    assert (tile['vmin'], tile['vmax']) == (508, 519)
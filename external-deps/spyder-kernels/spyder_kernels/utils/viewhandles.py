@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+View handles for the Variable Explorer.
+
+A view handle keeps a reference to a (potentially huge) object in the kernel
+so that the frontend can request only the windows of data, header slices and
+statistics it needs to display, instead of transferring the whole object.
+
+Handles can be opened for DataFrames, Series and Index objects, as well as
+for one and two dimensional arrays, including memory-mapped arrays and
+HDF5 datasets, whose tiles are read from disk only when requested.
+"""
+
+# Standard library imports
+import itertools
+import sys
+
+# Local imports
+from spyder_kernels.utils.lazymodules import numpy as np, pandas as pd
+
+
+def is_real_numeric_dtype(dtype):
+    """Check if a Pandas dtype is a real (i.e. not complex) numeric type."""
+    try:
+        return pd.api.types.is_any_real_numeric_dtype(dtype)
+    except AttributeError:
+        # Pandas version 1
+        return (
+            pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            and not pd.api.types.is_complex_dtype(dtype)
+        )
+
+
+def get_axis_names(axis):
+    """Return the names of the levels of a Pandas axis as a list."""
+    if hasattr(axis, 'levels'):
+        return list(axis.names)
+    return [axis.name]
+
+
+def is_hdf5_dataset(value):
+    """Check if value is an HDF5 dataset, without importing h5py."""
+    h5py = sys.modules.get('h5py')
+    if h5py is None:
+        return False
+    try:
+        return isinstance(value, h5py.Dataset)
+    except Exception:
+        return False
+
+
+def is_viewable_array(value):
+    """
+    Check if value is an array that can be viewed through a handle.
+
+    These are one or two dimensional NumPy arrays (including memory-mapped
+    ones) and HDF5 datasets. Masked and record arrays are not supported
+    because their parts can't be shown as a single table.
+    """
+    if isinstance(value, np.ma.MaskedArray):
+        return False
+    if not (isinstance(value, np.ndarray) or is_hdf5_dataset(value)):
+        return False
+    try:
+        return value.ndim in (1, 2) and value.dtype.names is None
+    except Exception:
+        return False
+
+
+def is_viewable(value):
+    """Check if a handle can be opened to view value."""
+    try:
+        return (
+            isinstance(value, (pd.DataFrame, pd.Series, pd.Index))
+            or is_viewable_array(value)
+        )
+    except Exception:
+        return False
+
+
+def get_tile_stats(tile):
+    """
+    Compute the range of values used to color the cells of a tile.
+
+    Returns (vmin, vmax) or (None, None) if the tile is not numeric or only
+    has NaN or infinite values. As it's done by the array editor, complex
+    values are colored by their absolute value and all others by their
+    real part.
+    """
+    if tile.dtype.kind not in 'biufc' or tile.size == 0:
+        return None, None
+
+    if tile.dtype.kind == 'c':
+        values = np.abs(tile)
+    else:
+        values = np.real(tile)
+
+    if values.dtype.kind == 'f':
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            return None, None
+
+    return values.min().item(), values.max().item()
+
+
+class ViewHandleManager:
+    """
+    Keep the objects the frontend is viewing and serve parts of them.
+
+    Handles are identified by an integer that is sent to the frontend when
+    the handle is opened. They must be closed by the frontend when it no
+    longer needs them, so that the kernel stops holding a reference to the
+    object.
+    """
+
+    def __init__(self):
+        self._handles = {}
+        self._counter = itertools.count(1)
+
+    # ---- Public API
+    def open(self, name, value):
+        """
+        Open a handle to view `value` and return its description.
+
+        Series and Index objects are converted to a DataFrame, as it's done
+        by the DataFrame editor on the frontend.
+        """
+        if is_viewable_array(value):
+            return self._open_array(name, value)
+
+        if isinstance(value, pd.DataFrame):
+            df = value
+        elif isinstance(value, pd.Series):
+            df = value.to_frame()
+        elif isinstance(value, pd.Index):
+            df = pd.DataFrame(value)
+        else:
+            raise TypeError(
+                "Objects of type {} can't be viewed by handle".format(
+                    type(value).__name__)
+            )
+
+        handle_id = next(self._counter)
+        self._handles[handle_id] = {
+            'name': name,
+            'kind': 'dataframe',
+            'type': value.__class__.__name__,
+            'value': df,
+            'order': None,
+        }
+        return self.get_info(handle_id)
+
+    def close(self, handle_id):
+        """Close a handle, releasing the reference to its object."""
+        self._handles.pop(handle_id, None)
+
+    def close_all(self):
+        """Close all opened handles."""
+        self._handles.clear()
+
+    def get_info(self, handle_id):
+        """
+        Return a description of the object associated to a handle.
+
+        This is a dictionary with the following structure
+
+        {
+            'handle_id': 1,
+            'name': 'df',
+            'kind': 'dataframe',
+            'type': 'DataFrame',
+            'shape': (50000000, 3),
+            'header_shape': (1, 1),
+            'dtypes': ['int64', 'float64', 'object'],
+            'names': [[None], [None]]
+        }
+
+        Here 'header_shape' is the number of levels in the columns and
+        index, and 'names' are the names of those levels.
+
+        For arrays, 'kind' is 'array', 'shape' is always two dimensional
+        (one dimensional arrays are viewed as a column), and the keys
+        'header_shape', 'dtypes' and 'names' are replaced by 'ndim' and
+        'dtype'. The latter is the string representation of the dtype of the
+        array (e.g. '<U256'), from which it can be rebuilt with `np.dtype`.
+        """
+        handle = self._handles[handle_id]
+        if handle['kind'] == 'array':
+            array = handle['value']
+            return {
+                'handle_id': handle_id,
+                'name': handle['name'],
+                'kind': 'array',
+                'type': handle['type'],
+                'shape': self._get_array_shape(array),
+                'ndim': array.ndim,
+                'dtype': array.dtype.str,
+            }
+
+        df = handle['value']
+        return {
+            'handle_id': handle_id,
+            'name': handle['name'],
+            'kind': 'dataframe',
+            'type': handle['type'],
+            'shape': df.shape,
+            'header_shape': (
+                len(get_axis_names(df.columns)),
+                len(get_axis_names(df.index))
+            ),
+            'dtypes': [str(dtype) for dtype in df.dtypes],
+            'names': [get_axis_names(df.columns), get_axis_names(df.index)],
+        }
+
+    def get_window(self, handle_id, row_start, row_stop, col_start, col_stop):
+        """
+        Return a rectangular window of the viewed object.
+
+        Rows are counted in the current sort order of the handle. For
+        arrays, a two dimensional array is returned.
+        """
+        handle = self._handles[handle_id]
+        if handle['kind'] == 'array':
+            return self._get_array_window(
+                handle['value'], row_start, row_stop, col_start, col_stop)
+
+        df = handle['value']
+        rows = self._get_rows(handle, row_start, row_stop)
+        return df.iloc[rows, col_start:col_stop]
+
+    def get_tile(self, handle_id, row_start, row_stop, col_start, col_stop):
+        """
+        Return a rectangular tile of an array together with its color range.
+
+        This is a dictionary with the keys 'data' (the tile as a two
+        dimensional array), and 'vmin' and 'vmax' (see `get_tile_stats`).
+        The range is computed here, once per tile, so that the frontend
+        doesn't need to scan the whole array to color its cells.
+        """
+        tile = self.get_window(
+            handle_id, row_start, row_stop, col_start, col_stop)
+        vmin, vmax = get_tile_stats(tile)
+        return {'data': tile, 'vmin': vmin, 'vmax': vmax}
+
+    def get_header(self, handle_id, axis, start, stop):
+        """
+        Return the labels of the columns (axis 0) or index (axis 1).
+
+        Index labels are returned in the current sort order of the handle.
+        Labels of MultiIndex axes are tuples.
+        """
+        handle = self._handles[handle_id]
+        df = handle['value']
+        if axis == 0:
+            return df.columns[start:stop].tolist()
+        else:
+            rows = self._get_rows(handle, start, stop)
+            if isinstance(rows, slice):
+                return df.index[rows].tolist()
+            return df.index.take(rows).tolist()
+
+    def get_max_min(self, handle_id):
+        """
+        Determine the maximum and minimum number in each column.
+
+        The result is a list whose k-th entry is [vmax, vmin], where vmax and
+        vmin denote the maximum and minimum of the k-th column (ignoring NaN).
+
+        If the k-th column has a non-numerical dtype, then the k-th entry
+        is set to None. If the dtype is complex, then compute the maximum and
+        minimum of the absolute values. If vmax equals vmin, then vmin is
+        decreased by one.
+        """
+        df = self._handles[handle_id]['value']
+        if df.shape[0] == 0:
+            return None
+
+        max_min_col = []
+        for __, col in df.items():
+            try:
+                if is_real_numeric_dtype(col.dtype):
+                    vmax = col.max(skipna=True)
+                    vmin = col.min(skipna=True)
+                elif pd.api.types.is_complex_dtype(col.dtype):
+                    vmax = col.abs().max(skipna=True)
+                    vmin = col.abs().min(skipna=True)
+                else:
+                    max_min_col.append(None)
+                    continue
+
+                if vmax != vmin:
+                    max_min_col.append([vmax, vmin])
+                else:
+                    max_min_col.append([vmax, vmin - 1])
+            except TypeError:
+                max_min_col.append(None)
+
+        return max_min_col
+
+    def sort(self, handle_id, column, ascending=True):
+        """
+        Sort the rows of a handle by a column or, if `column` is -1, by index.
+
+        The viewed object is not modified. Instead, the order of its rows
+        is saved in the handle and used when serving windows and headers.
+        """
+        handle = self._handles[handle_id]
+        df = handle['value']
+        if column >= 0:
+            values = df.iloc[:, column].reset_index(drop=True)
+        else:
+            values = pd.Series(df.index)
+
+        # Start from the current order and use mergesort, which is stable, so
+        # that rows with the same value keep the order of the previous sort,
+        # as in the editor of local dataframes.
+        if handle['order'] is not None:
+            values = values.iloc[handle['order']]
+        values = values.sort_values(ascending=ascending, kind='mergesort')
+        handle['order'] = values.index.to_numpy(dtype=np.intp)
+
+    # ---- Private API
+    def _open_array(self, name, array):
+        """Open a handle to view an array."""
+        handle_id = next(self._counter)
+        self._handles[handle_id] = {
+            'name': name,
+            'kind': 'array',
+            'type': array.__class__.__name__,
+            'value': array,
+        }
+        return self.get_info(handle_id)
+
+    def _get_array_shape(self, array):
+        """Return the shape of an array viewed as a table."""
+        if array.ndim == 1:
+            return (array.shape[0], 1)
+        return tuple(array.shape)
+
+    def _get_array_window(self, array, row_start, row_stop, col_start,
+                          col_stop):
+        """
+        Return a window of an array as a new two dimensional array.
+
+        Only the requested part is read, which is important for memory-mapped
+        arrays and HDF5 datasets.
+        """
+        if array.ndim == 1:
+            if col_start > 0:
+                return np.empty((0, 0), dtype=array.dtype)
+            window = array[row_start:row_stop]
+            return np.array(window).reshape(-1, 1)
+        return np.array(array[row_start:row_stop, col_start:col_stop])
+
+    def _get_rows(self, handle, start, stop):
+        """Return the positions of the rows from start to stop."""
+        order = handle['order']
+        if order is None:
+            return slice(start, stop)
+        return order[start:stop]
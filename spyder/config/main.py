@@ -133,6 +133,7 @@
               'custom': False,
               'umr/enabled': True,
               'umr/verbose': True,
+              'umr/selective': False,
               'umr/namelist': [],
               'custom_interpreters_list': [],
               'custom_interpreter': '',
@@ -171,6 +172,10 @@
               # that generate a lot of Command Prompts while running,
               # and that's extremely annoying for Windows users.
               'hide_cmd_windows': True,
+              'kernel_pool_size': 1,
+              'kernel_pool_max_specs': 2,
+              'kernel_pool_max_memory': 1024,  # In MB
+              'kernel_pool_preload_modules': '',
               }),
             ('variable_explorer',
              {
@@ -318,7 +323,8 @@
               'show_hidden': True,
               'size_column': False,
               'type_column': False,
-              'date_column': False
+              'date_column': False,
+              'use_polling_watcher': WIN,
               }),
             ('explorer',
              {
@@ -343,6 +349,8 @@
               'case_sensitive': False,
               'exclude_case_sensitive': False,
               'max_results': 1000,
+              'respect_gitignore': True,
+              'use_index': False,
               }),
             ('completions',
              {
@@ -356,6 +364,7 @@
             ('profiler',
              {
               'enable': True,
+              'sampling_interval': 5,
               }),
             ('pylint',
              {
@@ -670,4 +679,4 @@
 #    or if you want to *rename* options, then you need to do a MAJOR update in
 #    version, e.g. from 3.0.0 to 4.0.0
 # 3. You don't need to touch this value if you're just adding a new option
-CONF_VERSION = '82.2.0'
+CONF_VERSION = '82.6.0'
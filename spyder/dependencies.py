@@ -39,7 +39,6 @@
 CHARDET_REQVER = '>=2.0.0'
 CLOUDPICKLE_REQVER = '>=0.5.0'
 COOKIECUTTER_REQVER = '>=1.6.0'
-DIFF_MATCH_PATCH_REQVER = '>=20181111'
 INTERVALTREE_REQVER = '>=3.0.2'
 IPYTHON_REQVER = ">=8.12.2,<8.13.0" if PY38 else ">=8.13.0,<9.0.0,!=8.17.1"
 JEDI_REQVER = '>=0.17.2,<0.20.0'
@@ -114,10 +113,6 @@
      'package_name': "cookiecutter",
      'features': _("Create projects from cookiecutter templates"),
      'required_version': COOKIECUTTER_REQVER},
-    {'modname': "diff_match_patch",
-     'package_name': "diff-match-patch",
-     'features': _("Compute text file diff changes during edition"),
-     'required_version': DIFF_MATCH_PATCH_REQVER},
     {'modname': "intervaltree",
      'package_name': "intervaltree",
      'features': _("Compute folding range nesting levels"),
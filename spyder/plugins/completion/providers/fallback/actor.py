@@ -21,13 +21,12 @@
 
 # Other imports
 from pygments.lexers import get_lexer_by_name
-from diff_match_patch import diff_match_patch
 
 # Local imports
 from spyder.plugins.completion.api import CompletionItemKind
 from spyder.plugins.completion.api import CompletionRequestTypes
 from spyder.plugins.completion.providers.fallback.utils import (
-    get_keywords, get_words, is_prefix_valid)
+    apply_text_changes, get_keywords, get_words, is_prefix_valid)
 
 
 FALLBACK_COMPLETION = "Fallback"
@@ -47,7 +46,6 @@ def __init__(self, parent):
         self.daemon = True
         self.mutex = QMutex()
         self.file_tokens = {}
-        self.diff_patch = diff_match_patch()
         self.thread = QThread(None)
         self.moveToThread(self.thread)
 
@@ -135,12 +133,13 @@ def handle_msg(self, message):
                     'offset': msg['offset'],
                     'language': msg['language'],
                 }
-            diff = msg['diff']
             text = self.file_tokens[file]
             text['offset'] = msg['offset']
-            text, _ = self.diff_patch.patch_apply(
-                diff, text['text'])
-            self.file_tokens[file]['text'] = text
+            if msg.get('changes') is not None:
+                text['text'] = apply_text_changes(
+                    text['text'], msg['changes'])
+            else:
+                text['text'] = msg['text']
         elif msg_type == CompletionRequestTypes.DOCUMENT_DID_CLOSE:
             self.file_tokens.pop(file, {})
         elif msg_type == CompletionRequestTypes.DOCUMENT_COMPLETION:
@@ -8,9 +8,9 @@
 import os.path as osp
 
 import pytest
-from diff_match_patch import diff_match_patch
 from spyder.plugins.completion.api import CompletionRequestTypes
-from spyder.plugins.completion.providers.fallback.utils import get_words
+from spyder.plugins.completion.providers.fallback.utils import (
+    apply_text_changes, get_words)
 
 
 DATA_PATH = osp.join(osp.dirname(osp.abspath(__file__)), "data")
@@ -58,12 +58,11 @@ def file_fixture(tokens_fixture, request):
 @pytest.fixture(scope="module")
 def fallback_fixture(fallback_completions, qtbot_module, request):
     fallback, completions = fallback_completions
-    diff_match = diff_match_patch()
-    return fallback, completions, diff_match
+    return fallback, completions
 
 
 def test_file_open_close(qtbot_module, fallback_fixture):
-    fallback, completions, diff_match = fallback_fixture
+    fallback, completions = fallback_fixture
 
     open_request = {
         'file': 'test.py',
@@ -95,8 +94,7 @@ def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
     filename, expected_tokens, contents = file_fixture
     _, ext = osp.splitext(filename)
     language = extension_map[ext[1:]]
-    fallback, completions, diff_match = fallback_fixture
-    # diff = diff_match.patch_make('', contents)
+    fallback, completions = fallback_fixture
     open_request = {
         'file': filename,
         'text': contents,
@@ -123,9 +121,8 @@ def test_tokenize(qtbot_module, fallback_fixture, file_fixture):
 
 
 def test_token_update(qtbot_module, fallback_fixture):
-    fallback, completions, diff_match = fallback_fixture
+    fallback, completions = fallback_fixture
 
-    # diff = diff_match.patch_make('', TEST_FILE)
     open_request = {
         'file': 'test.py',
         'text': TEST_FILE,
@@ -150,11 +147,17 @@ def test_token_update(qtbot_module, fallback_fixture):
     initial_tokens = {token['insertText'] for token in initial_tokens}
     assert 'args' not in initial_tokens
 
-    diff = diff_match.patch_make(TEST_FILE, TEST_FILE_UPDATE)
+    changes = [{
+        'range': {
+            'start': {'line': 3, 'character': 0},
+            'end': {'line': 3, 'character': 0},
+        },
+        'text': '\ndef func(args):\n    pass\n',
+    }]
     update_request = {
         'file': 'test.py',
-        'diff': diff,
-        'offset': len(diff),
+        'changes': changes,
+        'offset': len(TEST_FILE_UPDATE),
     }
     fallback.send_request(
         'python', CompletionRequestTypes.DOCUMENT_DID_CHANGE, update_request)
@@ -169,3 +172,29 @@ def test_token_update(qtbot_module, fallback_fixture):
     updated_tokens = blocker.args[0]
     updated_tokens = {token['insertText'] for token in updated_tokens}
     assert 'args' in updated_tokens
+
+
+def test_apply_text_changes():
+    """Test applying LSP content changes to a text."""
+    text = 'a = 1\r\nb = "😀"\r\nc = 3'
+
+    def change(start, end, new_text):
+        return {
+            'range': {
+                'start': {'line': start[0], 'character': start[1]},
+                'end': {'line': end[0], 'character': end[1]},
+            },
+            'text': new_text,
+        }
+
+    # Emojis take two UTF-16 code units
+    changes = [change((1, 8), (1, 8), ' + 1')]
+    assert apply_text_changes(text, changes) == (
+        'a = 1\r\nb = "😀" + 1\r\nc = 3')
+
+    # Changes spanning several lines are applied in order
+    changes = [change((0, 4), (2, 4), '2'), change((0, 5), (0, 5), '\r\n')]
+    assert apply_text_changes(text, changes) == 'a = 2\r\n3'
+
+    # Changes without range replace the whole text
+    assert apply_text_changes(text, [{'text': 'd = 4'}]) == 'd = 4'
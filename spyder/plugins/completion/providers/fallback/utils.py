@@ -21,13 +21,15 @@
 
 # Local imports
 from spyder.utils.misc import memoize
-from spyder.utils.qstringhelpers import qstring_length
+from spyder.utils.qstringhelpers import (
+    qstring_length, qstring_position_to_index)
 from spyder.utils.syntaxhighlighters import (
     custom_extension_lexer_mapping
 )
 
 
 letter_regex = re.compile(r'\w')
+eol_regex = re.compile(r'\r\n|\r|\n')
 empty_regex = re.compile(r'\s')
 
 # CamelCase and snake_case regex:
@@ -146,6 +148,45 @@ def is_prefix_valid(text, offset, language):
     return valid
 
 
+def apply_text_changes(text, changes):
+    """
+    Apply LSP content changes to text.
+
+    Each change replaces a range of text, given in lines and UTF-16 columns,
+    or the whole text if it has no range.
+    """
+    for change in changes:
+        change_range = change.get('range')
+        if change_range is None:
+            text = change['text']
+            continue
+
+        # Offsets of the start of each line
+        line_starts = [0] + [m.end() for m in eol_regex.finditer(text)]
+
+        offsets = []
+        for position in (change_range['start'], change_range['end']):
+            line = position['line']
+            if line >= len(line_starts):
+                offsets.append(len(text))
+                continue
+
+            line_start = line_starts[line]
+            if line + 1 < len(line_starts):
+                line_text = text[line_start:line_starts[line + 1]]
+            else:
+                line_text = text[line_start:]
+            offsets.append(
+                line_start
+                + qstring_position_to_index(line_text, position['character'])
+            )
+
+        start, end = offsets
+        text = text[:start] + change['text'] + text[end:]
+
+    return text
+
+
 @memoize
 def get_parent_until(path):
     """
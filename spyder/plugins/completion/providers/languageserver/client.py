@@ -21,7 +21,8 @@
 import time
 
 # Third-party imports
-from qtpy.QtCore import QObject, QProcess, QSocketNotifier, Signal, Slot
+from qtpy.QtCore import (
+    QObject, QProcess, QSocketNotifier, QTimer, Signal, Slot)
 import zmq
 import psutil
 
@@ -39,6 +40,8 @@
     send_request, send_notification, class_register, handles)
 from spyder.plugins.completion.providers.languageserver.transport import (
     MessageKind)
+from spyder.plugins.completion.providers.languageserver.transport.common.framing import (  # noqa
+    MessageStats, decode_message, encode_message)
 from spyder.plugins.completion.providers.languageserver.providers import (
     LSPMethodProviderMixIn)
 from spyder.utils.misc import getcwd_or_home, select_port
@@ -100,6 +103,18 @@ def __init__(self, parent,
         self.server_unresponsive = False
         self.transport_unresponsive = False
 
+        # Notifications are sent together at the next iteration of the event
+        # loop, or before the next request, to send bursts of them in a
+        # single message to the transport.
+        self._pending_frames = []
+        self._notifications_timer = QTimer(self)
+        self._notifications_timer.setSingleShot(True)
+        self._notifications_timer.setInterval(0)
+        self._notifications_timer.timeout.connect(self.flush_notifications)
+
+        # Sizes of the messages and response times
+        self.stats = MessageStats()
+
         # Select a free port to start the server.
         # NOTE: Don't use the new value to set server_setttings['port']!!
         # That's not required because this doesn't really correspond to a
@@ -357,6 +372,8 @@ def start(self):
     def stop(self):
         """Stop transport and server."""
         logger.info('Stopping {} client...'.format(self.language))
+        self._notifications_timer.stop()
+        self.flush_notifications()
         if self.notifier is not None:
             self.notifier.activated.disconnect(self.on_msg_received)
             self.notifier.setEnabled(False)
@@ -442,6 +459,7 @@ def send(self, method, params, kind):
         _id = self.request_seq
         if kind == MessageKind.REQUEST:
             msg = {
+                'jsonrpc': '2.0',
                 'id': self.request_seq,
                 'method': method,
                 'params': params
@@ -449,11 +467,13 @@ def send(self, method, params, kind):
             self.req_status[self.request_seq] = method
         elif kind == MessageKind.RESPONSE:
             msg = {
+                'jsonrpc': '2.0',
                 'id': self.request_seq,
                 'result': params
             }
         elif kind == MessageKind.NOTIFICATION:
             msg = {
+                'jsonrpc': '2.0',
                 'method': method,
                 'params': params
             }
@@ -464,20 +484,56 @@ def send(self, method, params, kind):
         if running_under_pytest():
             self._requests.append((_id, method))
 
-        # Try sending a message. If the send queue is full, keep trying for a
+        frame = encode_message(msg)
+        if kind == MessageKind.NOTIFICATION:
+            self._pending_frames.append(frame)
+            self.stats.message_sent(method, len(frame))
+            if not self._notifications_timer.isActive():
+                self._notifications_timer.start()
+            self.request_seq += 1
+            return int(_id)
+
+        # Pending notifications need to be sent before this message to keep
+        # the order in which they were generated.
+        self._notifications_timer.stop()
+        frames = self._pending_frames + [frame]
+        self._pending_frames = []
+        if self._send_frames(frames):
+            self.stats.message_sent(
+                method,
+                len(frame),
+                _id if kind == MessageKind.REQUEST else None
+            )
+            self.request_seq += 1
+            return int(_id)
+
+    @Slot()
+    def flush_notifications(self):
+        """Send pending notifications to transport."""
+        if self._pending_frames:
+            frames = self._pending_frames
+            self._pending_frames = []
+            self._send_frames(frames)
+
+    def _send_frames(self, frames):
+        """
+        Send frames to transport as a single multipart message.
+
+        Returns True if they could be sent.
+        """
+        # Try sending the frames. If the send queue is full, keep trying for
         # a second before giving up.
         timeout = 1
         start_time = time.time()
         timeout_time = start_time + timeout
         while True:
             try:
-                self.zmq_out_socket.send_pyobj(msg, flags=zmq.NOBLOCK)
-                self.request_seq += 1
-                return int(_id)
+                self.zmq_out_socket.send_multipart(frames, flags=zmq.NOBLOCK)
+                return True
             except zmq.error.Again:
                 if time.time() > timeout_time:
                     self.sig_went_down.emit(self.language)
-                    return
+                    return False
                 # The send queue is full! wait 0.1 seconds before retrying.
                 if self.initialized:
                     logger.warning("The send queue is full! Retrying...")
@@ -489,15 +545,29 @@ def on_msg_received(self):
         self.notifier.setEnabled(False)
         while True:
             try:
-                # events = self.zmq_in_socket.poll(1500)
-                resp = self.zmq_in_socket.recv_pyobj(flags=zmq.NOBLOCK)
-
+                frame = self.zmq_in_socket.recv(flags=zmq.NOBLOCK)
                 try:
+                    resp = decode_message(frame)
+                except ValueError as e:
+                    logger.error(
+                        '{} invalid message: {}'.format(self.language, e))
+                    continue
+
+                if 'method' in resp:
                     method = resp['method']
+                    self.stats.message_received(method, len(frame))
                     logger.debug(
                         '{} response: {}'.format(self.language, method))
-                except KeyError:
-                    pass
+                else:
+                    req_id = resp.get('id')
+                    method = self.req_status.get(req_id)
+                    latency = self.stats.message_received(
+                        method, len(frame), req_id)
+                    if latency is not None:
+                        logger.debug(
+                            '{} response to {} with id {}: {} bytes in '
+                            '{:.1f} ms'.format(self.language, method, req_id,
+                                               len(frame), latency * 1000))
 
                 if 'error' in resp:
                     logger.debug('{} Response error: {}'
@@ -46,14 +46,22 @@ def process_document_diagnostics(self, response, *args):
 
     @send_notification(method=CompletionRequestTypes.DOCUMENT_DID_CHANGE)
     def document_changed(self, params):
+        # Editors send only the changes made to the text when the server
+        # supports incremental synchronization.
+        if params.get('changes') is not None:
+            content_changes = [
+                {'range': change['range'], 'text': change['text']}
+                for change in params['changes']
+            ]
+        else:
+            content_changes = [{'text': params['text']}]
+
         params = {
             'textDocument': {
                 'uri': path_as_uri(params['file']),
                 'version': params['version']
             },
-            'contentChanges': [{
-                'text': params['text']
-            }]
+            'contentChanges': content_changes
         }
         return params
 
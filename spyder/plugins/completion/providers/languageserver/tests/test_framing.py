@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the framing of messages sent to the LSP transport."""
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.completion.providers.languageserver.transport.common import (  # noqa
+    framing)
+from spyder.plugins.completion.providers.languageserver.transport.common.framing import (  # noqa
+    MessageStats, add_content_length, decode_message, encode_message)
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'json'])
+def use_orjson(request, monkeypatch):
+    """Encode messages with orjson, if available, or with json."""
+    if request.param:
+        if framing.orjson is None:
+            pytest.skip('orjson is not installed')
+    else:
+        monkeypatch.setattr(framing, 'orjson', None)
+    return request.param
+
+
+def test_encode_decode(use_orjson):
+    """Test that messages are encoded as UTF-8 JSON and decoded back."""
+    message = {
+        'jsonrpc': '2.0',
+        'id': 1,
+        'method': 'textDocument/didChange',
+        'params': {'text': 'áé 字分误 😀\n', 'version': 2, 'changes': None}
+    }
+    frame = encode_message(message)
+    assert isinstance(frame, bytes)
+    assert 'áé 字分误 😀'.encode('utf-8') in frame
+    assert decode_message(frame) == message
+
+    with pytest.raises(ValueError):
+        decode_message(b'{"id": 1')
+
+
+def test_add_content_length():
+    """Test that the header gives the length of the frame in bytes."""
+    frame = encode_message({'text': 'é'})
+    content = add_content_length(frame)
+    header, body = content.split(b'\r\n\r\n')
+    assert header == b'Content-Length: %d' % len(frame)
+    assert body == frame
+
+
+def test_message_stats():
+    """Test the counters of the messages exchanged with a server."""
+    stats = MessageStats()
+    stats.message_sent('textDocument/didOpen', 100)
+    stats.message_sent('textDocument/completion', 50, req_id=1)
+    stats.message_sent('textDocument/completion', 60, req_id=2)
+
+    assert stats.message_received('textDocument/completion', 500, 1) >= 0
+    assert stats.message_received(
+        'textDocument/publishDiagnostics', 200) is None
+
+    summary = stats.get_summary()
+    completion = summary['textDocument/completion']
+    assert completion['sent'] == 2
+    assert completion['sent_bytes'] == 110
+    assert completion['received_bytes'] == 500
+    assert completion['responses'] == 1
+    assert completion['mean_latency'] == completion['total_latency']
+    assert summary['textDocument/didOpen']['received'] == 0
+    assert summary['textDocument/publishDiagnostics']['received'] == 1
+    assert summary['textDocument/publishDiagnostics']['mean_latency'] == 0
+
+    # A response to a request that's not pending is counted without latency
+    assert stats.message_received('textDocument/completion', 10, 1) is None
+
+    stats.reset()
+    assert stats.get_summary() == {}
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -11,12 +11,12 @@
 Spyder MS Language Server Protocol v3.0 base transport proxy implementation.
 
 This module handles and processes incoming messages sent by an LSP server,
-then it relays the information to the actual Spyder LSP client via ZMQ.
+then it relays their JSON body to the actual Spyder LSP client via ZMQ.
 """
 
 
+import codecs
 import os
-import json
 import socket
 import logging
 from threading import Thread, Lock
@@ -67,10 +67,11 @@ def read_posix(self):
         return self.encode_body(body, headers)
 
     def encode_body(self, body, headers):
-        encoding = 'utf8'
+        """Return body encoded in UTF-8, as expected by the client."""
         if b'Content-Type' in headers:
             encoding = headers[b'Content-Type'].split(b'=')[-1].decode('utf8')
-        body = body.decode(encoding)
+            if codecs.lookup(encoding).name != 'utf-8':
+                body = body.decode(encoding).encode('utf-8')
         return body
 
     def expect_windows(self):
@@ -107,16 +108,9 @@ def run(self):
                     break
             try:
                 body = self.read_incoming()
-                err = False
-                try:
-                    body = json.loads(body)
-                except (ValueError, TypeError) as e:
-                    err = True
-                    logger.error(e)
-                if not err:
-                    logger.debug(body)
-                    self.zmq_sock.send_pyobj(body)
-                    logger.debug('Message sent')
+                logger.debug(body)
+                self.zmq_sock.send(body)
+                logger.debug('Message sent')
             except socket.error as e:
                 logger.error(e)
         logger.debug('Thread stopped.')
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+
+"""
+Framing of the messages exchanged between Spyder and the LSP transport.
+
+Every ZMQ frame exchanged by the client and the transport contains the UTF-8
+encoded JSON body of a single JSON-RPC message, so that the transport only
+needs to add or remove the Content-Length header required by the protocol.
+Several messages can be sent together as the frames of a multipart message.
+"""
+
+# Standard library imports
+import json
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+CONTENT_LENGTH = b'Content-Length: %d\r\n\r\n'
+
+
+# ---- Encoding
+def encode_message(message):
+    """Encode a JSON-RPC message as a frame."""
+    if orjson is not None:
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(message, ensure_ascii=False).encode('utf-8')
+
+
+def decode_message(frame):
+    """
+    Decode a JSON-RPC message from a frame.
+
+    Raises ValueError if the frame is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(frame)
+    return json.loads(frame)
+
+
+def add_content_length(frame):
+    """Add the header required by the protocol to a frame."""
+    return CONTENT_LENGTH % len(frame) + frame
+
+
+# ---- Counters
+class MessageStats:
+    """
+    Counters of the messages exchanged with a language server.
+
+    The sizes of the frames are counted per method, as well as the time it
+    takes for requests to get a response, including the time spent in the
+    transport and in the event loop before the response is processed.
+    """
+
+    def __init__(self):
+        self.methods = {}
+        self._pending_requests = {}
+
+    def _get_counters(self, method):
+        try:
+            return self.methods[method]
+        except KeyError:
+            counters = self.methods[method] = {
+                'sent': 0,
+                'sent_bytes': 0,
+                'received': 0,
+                'received_bytes': 0,
+                'responses': 0,
+                'total_latency': 0.0,
+                'max_latency': 0.0,
+            }
+            return counters
+
+    # ---- Public API
+    def message_sent(self, method, size, req_id=None):
+        """
+        Count a message of size bytes sent to the server.
+
+        If req_id is given, the message is a request whose response time
+        will be measured.
+        """
+        counters = self._get_counters(method)
+        counters['sent'] += 1
+        counters['sent_bytes'] += size
+        if req_id is not None:
+            self._pending_requests[req_id] = (method, time.perf_counter())
+
+    def message_received(self, method, size, req_id=None):
+        """
+        Count a message of size bytes received from the server.
+
+        Returns the time it took to get a response to request req_id, or
+        None if the message is not a response to a pending request.
+        """
+        latency = None
+        if req_id in self._pending_requests:
+            method, start = self._pending_requests.pop(req_id)
+            latency = time.perf_counter() - start
+
+        counters = self._get_counters(method)
+        counters['received'] += 1
+        counters['received_bytes'] += size
+        if latency is not None:
+            counters['responses'] += 1
+            counters['total_latency'] += latency
+            counters['max_latency'] = max(counters['max_latency'], latency)
+        return latency
+
+    def get_summary(self):
+        """Return the counters per method, with the mean latency."""
+        summary = {}
+        for method, counters in self.methods.items():
+            summary[method] = dict(counters)
+            responses = counters['responses']
+            summary[method]['mean_latency'] = (
+                counters['total_latency'] / responses if responses else 0.0)
+        return summary
+
+    def reset(self):
+        """Reset all counters."""
+        self.methods = {}
+        self._pending_requests = {}
@@ -13,17 +13,20 @@
 This module provides the base class from which each transport-specific client
 should inherit from. LanguageServerClient implements functions to handle
 incoming requests from the actual Spyder LSP client ZMQ queue and to
-encapsulate them into valid JSONRPC messages before sending them to the
-LSP server, using the specific transport mode.
+add them the Content-Length header of the protocol before sending them to
+the LSP server, using the specific transport mode.
 """
 
 # Standard library imports
-import json
 import logging
 
 # Third party imports
 import zmq
 
+# Local imports
+from spyder.plugins.completion.providers.languageserver.transport.common.framing import (  # noqa
+    add_content_length, encode_message)
+
 TIMEOUT = 5000
 LOCALHOST = '127.0.0.1'
 
@@ -32,7 +35,6 @@
 
 class LanguageServerClient(object):
     """Base implementation of a v3.0 compilant language server client."""
-    CONTENT_LENGTH = 'Content-Length: {0}\r\n\r\n'
 
     def __init__(self, zmq_in_port=7000, zmq_out_port=7001):
         self.zmq_in_port = zmq_in_port
@@ -61,46 +63,24 @@ def finalize_initialization(self):
         self.zmq_out_socket.connect("tcp://{0}:{1}".format(
             LOCALHOST, self.zmq_out_port))
         logger.info('Sending server_ready...')
-        self.zmq_out_socket.send_pyobj({'id': 0, 'method': 'server_ready',
-                                        'params': {'pid': pid}})
+        self.zmq_out_socket.send(encode_message(
+            {'id': 0, 'method': 'server_ready', 'params': {'pid': pid}}))
 
     def listen(self):
         events = self.zmq_in_socket.poll(TIMEOUT)
-        # requests = []
         while events > 0:
-            client_request = self.zmq_in_socket.recv_pyobj()
-            logger.debug("Client Event: {0}".format(client_request))
-            server_request = self.__compose_request(client_request)
-            self.__send_request(server_request)
-            # self.zmq_socket.send_pyobj({'a': 'b'})
+            # The client sends messages already encoded as JSON-RPC, several
+            # at a time when there are bursts of notifications.
+            frames = self.zmq_in_socket.recv_multipart()
+            logger.debug(
+                'Sending {0} message(s) to server'.format(len(frames)))
+            for frame in frames:
+                logger.debug(frame)
+            self.transport_send(
+                b''.join(add_content_length(frame) for frame in frames))
             events -= 1
 
-    def __compose_request(self, request):
-        request['jsonrpc'] = '2.0'
-        return request
-
-    def __send_request(self, request):
-        json_req = json.dumps(request)
-        content = bytes(json_req.encode('utf-8'))
-        content_length = len(content)
-
-        if 'method' in request:
-            if 'id' in request:
-                logger.debug(
-                    'Sending request of type: {0}'.format(request['method']))
-            else:
-                logger.debug(
-                    'Sending notification of type: {0}'.format(
-                        request['method']))
-        else:
-            logger.debug('Sending reply to server')
-        logger.debug(json_req)
-
-        content_length = self.CONTENT_LENGTH.format(
-            content_length).encode('utf-8')
-        self.transport_send(bytes(content_length), content)
-
-    def transport_send(self, content_length, body):
+    def transport_send(self, content):
         """Subclasses should override this method"""
         raise NotImplementedError("Not implemented")
 
@@ -72,12 +72,10 @@ def stop(self):
         logger.debug('Joining thread...')
         logger.debug('Exit routine should be complete')
 
-    def transport_send(self, content_length, body):
+    def transport_send(self, content):
         if os.name == 'nt':
-            content_length = content_length.decode('utf-8')
-            body = body.decode('utf-8')
-        self.process.write(content_length)
-        self.process.write(body)
+            content = content.decode('utf-8')
+        self.process.write(content)
 
     def is_server_alive(self):
         """This method verifies if stdout is broken."""
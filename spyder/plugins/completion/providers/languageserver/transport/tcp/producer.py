@@ -61,11 +61,10 @@ def stop(self):
         self.reading_thread.stop()
         logger.debug('Exit routine should be complete')
 
-    def transport_send(self, content_length, body):
+    def transport_send(self, content):
         logger.debug('Sending message via TCP')
         try:
-            self.socket.send(content_length)
-            self.socket.send(body)
+            self.socket.sendall(content)
         except (BrokenPipeError, ConnectionError) as e:
             # This avoids a total freeze at startup
             # when we're trying to connect to a TCP
@@ -11,7 +11,6 @@
 import functools
 
 # Third party imports
-from diff_match_patch import diff_match_patch
 from qtpy.QtCore import QMutex, QMutexLocker, Qt
 from qtpy.QtGui import QTextCursor, QColor
 from superqt.utils import qdebounced
@@ -29,7 +28,6 @@
 
 
 MERGE_ALLOWED = {'int', 'name', 'whitespace'}
-VALID_UPDATES = {diff_match_patch.DIFF_DELETE, diff_match_patch.DIFF_INSERT}
 
 
 def no_undo(f):
@@ -141,11 +139,8 @@ def _undo(self):
             self.reset()
         if self.is_snippet_active:
             num_pops = 0
-            patch = self.editor.patch
-            for diffs in patch:
-                for (op, data) in diffs.diffs:
-                    if op in VALID_UPDATES:
-                        num_pops += len(data)
+            for change in self.editor.text_changes or []:
+                num_pops += change['rangeLength'] + len(change['text'])
             if len(self.undo_stack) > 0:
                 for _ in range(num_pops):
                     if len(self.undo_stack) == 0:
@@ -166,11 +161,8 @@ def _undo(self):
     def _redo(self):
         if self.is_snippet_active:
             num_pops = 0
-            patch = self.editor.patch
-            for diffs in patch:
-                for (op, data) in diffs.diffs:
-                    if op in VALID_UPDATES:
-                        num_pops += len(data)
+            for change in self.editor.text_changes or []:
+                num_pops += change['rangeLength'] + len(change['text'])
             if len(self.redo_stack) > 0:
                 for _ in range(num_pops):
                     if len(self.redo_stack) == 0:
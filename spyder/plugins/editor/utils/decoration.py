@@ -16,6 +16,9 @@
 <https://github.com/pyQode/pyqode.core/blob/master/pyqode/core/managers/decorations.py>
 """
 
+# Standard library imports
+from bisect import bisect_left, bisect_right
+
 # Third party imports
 from qtpy.QtCore import QObject, QTimer, Slot
 from qtpy.QtGui import QTextCharFormat
@@ -28,6 +31,11 @@
 # introduces a lot of sluggishness in the editor.
 UPDATE_TIMEOUT = 15  # milliseconds
 
+# Decorations spanning more blocks than this are not sorted in the index of
+# decorations because they would make looking for the ones in a range of
+# blocks slower. There are only a few of them (e.g. the current cell).
+LONG_SPAN = 100  # blocks
+
 
 def order_function(sel):
     end = sel.cursor.selectionEnd()
@@ -35,6 +43,71 @@ def order_function(sel):
     return sel.draw_order, -(end - start)
 
 
+def decoration_blocks(decoration):
+    """Get the numbers of the first and last blocks spanned by decoration."""
+    cursor = decoration.cursor
+    document = cursor.document()
+    start = document.findBlock(cursor.selectionStart()).blockNumber()
+    end = document.findBlock(cursor.selectionEnd()).blockNumber()
+    return start, end
+
+
+class BlocksIndex:
+    """
+    Index of a list of decorations by the range of blocks they span.
+
+    Decorations are sorted by their first block, so the ones overlapping a
+    range of blocks can be found by bisection.
+    """
+
+    def __init__(self, decorations):
+        self.decorations = decorations
+        self.size = len(decorations)
+
+        short = []
+        self._long = []
+        self._max_span = 0
+        for position, decoration in enumerate(decorations):
+            start, end = decoration_blocks(decoration)
+            item = (start, end, position, decoration)
+            span = end - start
+            if span > LONG_SPAN:
+                self._long.append(item)
+            else:
+                short.append(item)
+                self._max_span = max(self._max_span, span)
+
+        short.sort(key=lambda item: item[0])
+        self._short = short
+        self._starts = [item[0] for item in short]
+
+    def is_valid(self, decorations):
+        """
+        Whether the index corresponds to decorations.
+
+        The manager discards indexes when it adds or removes decorations,
+        so this only detects lists that were replaced or resized elsewhere.
+        """
+        return (
+            decorations is self.decorations
+            and len(decorations) == self.size
+        )
+
+    def get_overlapping(self, first, last):
+        """
+        Get the decorations that overlap blocks first to last, as tuples of
+        their position in the list of decorations and the decoration.
+        """
+        lo = bisect_left(self._starts, first - self._max_span)
+        hi = bisect_right(self._starts, last)
+        return [
+            (position, decoration)
+            for start, end, position, decoration in (
+                self._short[lo:hi] + self._long)
+            if start <= last and end >= first
+        ]
+
+
 class TextDecorationsManager(Manager, QObject):
     """
     Manages the collection of TextDecoration that have been set on the editor
@@ -44,6 +117,12 @@ def __init__(self, editor):
         super().__init__(editor)
         self._decorations = {"misc": []}
 
+        # Indexes of the decorations of each key by block numbers. They're
+        # discarded when block numbers change.
+        self._indexes = {}
+        self._document = None
+        self._block_count = 0
+
         # Timer to not constantly update decorations.
         self.update_timer = QTimer(self)
         self.update_timer.setSingleShot(True)
@@ -79,12 +158,14 @@ def add(self, decorations, key="misc"):
             added = 1
 
         if added > 0:
+            self._indexes.pop(key, None)
             self.update()
         return added
 
     def add_key(self, key, decorations):
         """Add decorations to key."""
         self._decorations[key] = decorations
+        self._indexes.pop(key, None)
         self.update()
 
     def remove(self, decoration, key="misc"):
@@ -99,6 +180,7 @@ def remove(self, decoration, key="misc"):
         """
         try:
             self._decorations[key].remove(decoration)
+            self._indexes.pop(key, None)
             self.update()
             return True
         except (ValueError, KeyError):
@@ -108,6 +190,7 @@ def remove_key(self, key):
         """Remove key"""
         try:
             del self._decorations[key]
+            self._indexes.pop(key, None)
             self.update()
         except KeyError:
             pass
@@ -119,6 +202,7 @@ def get(self, key, default=None):
     def clear(self):
         """Removes all text decoration from the editor."""
         self._decorations = {"misc": []}
+        self._indexes = {}
         self.update()
 
     def update(self):
@@ -149,29 +233,14 @@ def _update(self):
             first, last = editor.get_buffer_block_numbers()
 
             # Update visible decorations
-            visible_decorations = []
-            for decoration in self._sorted_decorations():
-                need_update_sel = False
-                cursor = decoration.cursor
-                sel_start = cursor.selectionStart()
-                # This is required to update extra selections from the point
-                # an initial selection was made.
-                # Fixes spyder-ide/spyder#14282
-                if sel_start is not None:
-                    doc = cursor.document()
-                    block_nb_start = doc.findBlock(sel_start).blockNumber()
-                    need_update_sel = first <= block_nb_start <= last
-
-                block_nb = decoration.cursor.block().blockNumber()
-                if (first <= block_nb <= last or need_update_sel or
-                        decoration.kind == 'current_cell'):
-                    visible_decorations.append(decoration)
-                    try:
-                        decoration.format.setFont(
-                            font, QTextCharFormat.FontPropertiesSpecifiedOnly)
-                    except (TypeError, AttributeError):  # Qt < 5.3
-                        decoration.format.setFontFamily(font.family())
-                        decoration.format.setFontPointSize(font.pointSize())
+            visible_decorations = self._visible_decorations(first, last)
+            for decoration in visible_decorations:
+                try:
+                    decoration.format.setFont(
+                        font, QTextCharFormat.FontPropertiesSpecifiedOnly)
+                except (TypeError, AttributeError):  # Qt < 5.3
+                    decoration.format.setFontFamily(font.family())
+                    decoration.format.setFontPointSize(font.pointSize())
 
             editor.setExtraSelections(visible_decorations)
         except RuntimeError:
@@ -191,3 +260,66 @@ def _sorted_decorations(self):
              for v in self._decorations[key]],
             key=order_function
         )
+
+    def _visible_decorations(self, first, last):
+        """
+        Get the sorted decorations that overlap blocks first to last, plus
+        the current cell.
+        """
+        document = self.editor.document()
+        if document is not self._document:
+            self._set_document(document)
+
+        visible = []
+        for key_number, (key, decorations) in enumerate(
+                self._decorations.items()):
+            if not decorations:
+                continue
+
+            # The current cell is always shown
+            if key == 'current_cell':
+                overlapping = enumerate(decorations)
+            else:
+                index = self._indexes.get(key)
+                if index is None or not index.is_valid(decorations):
+                    index = self._indexes[key] = BlocksIndex(decorations)
+                overlapping = index.get_overlapping(first, last)
+
+            for position, decoration in overlapping:
+                visible.append(
+                    (order_function(decoration), key_number, position,
+                     decoration)
+                )
+
+        # Sort decorations in the same way as _sorted_decorations does.
+        visible.sort(key=lambda item: item[:3])
+        return [item[3] for item in visible]
+
+    def _set_document(self, document):
+        """Discard indexes when the editor document changes."""
+        if self._document is not None:
+            try:
+                self._document.contentsChange.disconnect(
+                    self._on_contents_change)
+            except (TypeError, RuntimeError):
+                pass
+        self._document = document
+        self._block_count = document.blockCount()
+        self._indexes = {}
+        document.contentsChange.connect(self._on_contents_change)
+
+    @Slot(int, int, int)
+    def _on_contents_change(self, position, removed, added):
+        """Discard indexes when block numbers change."""
+        document = self._document
+        block_count = document.blockCount()
+
+        # If the numbers of blocks removed and added are the same, the text
+        # added spans several blocks.
+        if (
+            block_count != self._block_count
+            or document.findBlock(position) != document.findBlock(
+                position + added)
+        ):
+            self._block_count = block_count
+            self._indexes = {}
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Tracking of the changes made to a document.
+
+The changes are described as LSP content changes, i.e. by the range of text
+they replace (in lines and UTF-16 columns, like positions in QTextDocument)
+and the text they insert. This allows to send only the changes to language
+servers that support incremental synchronization, instead of the whole text
+of the document.
+"""
+
+# Local imports
+from spyder.utils.qstringhelpers import (
+    qstring_length, qstring_position_to_index)
+
+
+def block_text(block):
+    """
+    Return the text of block as it's found in the document plain text.
+
+    See QTextDocument.toPlainText.
+    """
+    return block.text().replace('\xa0', ' ')
+
+
+class TextChangesTracker:
+    """
+    Track the changes made to a QTextDocument.
+
+    The lines of the document are kept to be able to compute where the text
+    removed by a change ended, which QTextDocument doesn't report.
+    """
+
+    def __init__(self):
+        self._lines = None
+        self._changes = []
+
+    # ---- Public API
+    @property
+    def is_tracking(self):
+        """Whether changes are being tracked."""
+        return self._lines is not None
+
+    def reset(self, document):
+        """Start tracking changes from the current contents of document."""
+        self._changes = []
+        lines = []
+        block = document.firstBlock()
+        while block.isValid():
+            lines.append(block_text(block))
+            block = block.next()
+
+        # Line separators start new lines for language servers but not in
+        # QTextDocument, so changes can't be tracked in that case.
+        if any('\u2028' in line for line in lines):
+            self._lines = None
+        else:
+            self._lines = lines
+
+    def stop(self):
+        """Stop tracking changes."""
+        self._lines = None
+        self._changes = []
+
+    def track(self, document, position, removed, added):
+        """
+        Track a change of document.
+
+        This must be connected to the contentsChange signal of document.
+        """
+        if self._lines is None:
+            return
+
+        lines = self._lines
+
+        # Start of the change, which is the same before and after it
+        block = document.findBlock(position)
+        if not block.isValid():
+            self.stop()
+            return
+        start_line = block.blockNumber()
+        start_column = position - block.position()
+
+        # End of the removed text, before the change
+        end_line = start_line
+        end_column = start_column
+        remaining = removed
+        while True:
+            if end_line >= len(lines):
+                self.stop()
+                return
+            line_length = qstring_length(lines[end_line])
+            if remaining <= line_length - end_column:
+                end_column += remaining
+                break
+            remaining -= line_length - end_column + 1
+            end_line += 1
+            end_column = 0
+
+        # Lines after the change
+        end_block = document.findBlock(position + added)
+        if not end_block.isValid():
+            self.stop()
+            return
+        new_lines = []
+        while True:
+            new_lines.append(block_text(block))
+            if block == end_block:
+                break
+            block = block.next()
+
+        if any('\u2028' in line for line in new_lines):
+            self.stop()
+            return
+
+        # Changes that don't modify the text are also reported, e.g. when
+        # the syntax highlighter formats some text.
+        if removed == added and new_lines == lines[start_line:end_line + 1]:
+            return
+
+        # Inserted text
+        new_end_column = position + added - end_block.position()
+        if len(new_lines) == 1:
+            line = new_lines[0]
+            text = line[qstring_position_to_index(line, start_column):
+                        qstring_position_to_index(line, new_end_column)]
+        else:
+            first, last = new_lines[0], new_lines[-1]
+            text = '\n'.join(
+                [first[qstring_position_to_index(first, start_column):]]
+                + new_lines[1:-1]
+                + [last[:qstring_position_to_index(last, new_end_column)]]
+            )
+
+        lines[start_line:end_line + 1] = new_lines
+        self._changes.append({
+            'range': {
+                'start': {'line': start_line, 'character': start_column},
+                'end': {'line': end_line, 'character': end_column},
+            },
+            'rangeLength': removed,
+            'text': text,
+        })
+
+    def take_changes(self):
+        """
+        Return the changes tracked since the last call.
+
+        Returns None if changes couldn't be tracked, in which case `reset`
+        needs to be called to track them again.
+        """
+        if self._lines is None:
+            return None
+
+        changes = self._changes
+        self._changes = []
+        return changes
@@ -633,7 +633,7 @@ def get_shortcut_data(self):
         return [sc.data for sc in self.shortcuts]
 
     def closeEvent(self, event):
-        if isinstance(self.highlighter, sh.PygmentsSH):
+        if isinstance(self.highlighter, (sh.PygmentsSH, sh.PythonSH)):
             self.highlighter.stop()
         self.update_folding_thread.quit()
         self.update_folding_thread.wait()
@@ -887,7 +887,7 @@ def setup_editor(self,
 
             # Needed to show indent guides for splited editor panels
             # See spyder-ide/spyder#10900
-            self.patch = cloned_from.patch
+            self.text_changes = cloned_from.text_changes
 
             # Clone text and other properties
             self.set_as_clone(cloned_from)
@@ -1764,6 +1764,15 @@ def set_color_scheme(self, color_scheme):
 
     def set_text(self, text):
         """Set the text of the editor"""
+        if (isinstance(self.highlighter, sh.PythonSH)
+                and text.count('\n') >= sh.LAZY_HIGHLIGHTING_MIN_BLOCKS):
+            # Only highlight the blocks that will be visible before
+            # showing large files.
+            visible_blocks = (self.viewport().height()
+                              // self.fontMetrics().lineSpacing() + 1)
+            self.highlighter.start_lazy_highlighting(
+                visible_blocks + sh.LAZY_HIGHLIGHTING_MARGIN,
+                name=self.filename)
         self.setPlainText(text)
         self.set_eol_chars(text=text)
 
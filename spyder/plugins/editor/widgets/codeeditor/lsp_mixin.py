@@ -9,13 +9,13 @@
 """
 
 # Standard library imports
+from bisect import bisect_left, bisect_right
 import functools
 import logging
 import random
 import re
 
 # Third party imports
-from diff_match_patch import diff_match_patch
 from qtpy.QtCore import (
     QEventLoop,
     Qt,
@@ -45,6 +45,7 @@
     collect_folding_regions,
 )
 from spyder.plugins.editor.utils.editor import BlockUserData
+from spyder.plugins.editor.utils.textchanges import TextChangesTracker
 from spyder.utils import sourcecode
 
 
@@ -165,11 +166,13 @@ def __init__(self, *args, **kwargs):
         self.update_diagnostics_thread.finished.connect(
             self.finish_code_analysis)
         self._diagnostics = []
+        self._diagnostics_lines = []
 
-        # Text diffs across versions
-        self.differ = diff_match_patch()
-        self.previous_text = ''
-        self.patch = []
+        # Text changes across versions
+        self.text_changes = []
+        self._text_changes_tracker = TextChangesTracker()
+        self._text_changes_eol = None
+        self.document().contentsChange.connect(self._track_text_change)
         self.leading_whitespaces = {}
 
         # Other attributes
@@ -357,10 +360,7 @@ def document_did_open(self):
         )
 
         cursor = self.textCursor()
-        text = self.get_text_with_eol()
-        if self.is_ipython():
-            # Send valid python text to LSP as it doesn't support IPython
-            text = self.ipython_to_python(text)
+        text = self._get_text_for_server()
         params = {
             "file": self.filename,
             "language": self.language,
@@ -420,6 +420,55 @@ def _schedule_document_did_change(self):
         self._server_requests_timer.setInterval(self.LSP_REQUESTS_LONG_DELAY)
         self._server_requests_timer.start()
 
+    def _track_text_change(self, position, removed, added):
+        """Track a change of the document to send it to the server."""
+        self._text_changes_tracker.track(
+            self.document(), position, removed, added)
+
+    def _get_text_for_server(self):
+        """
+        Get the whole text of the document to send it to the server.
+
+        This also starts tracking the changes made to it from now on.
+        """
+        text = self.get_text_with_eol()
+        if self.is_ipython():
+            # Send valid python text to LSP as it doesn't support IPython
+            text = self.ipython_to_python(text)
+
+        tracker = self._text_changes_tracker
+        if tracker.is_tracking:
+            # The server gets all changes made so far with the text
+            tracker.take_changes()
+        else:
+            tracker.reset(self.document())
+        self._text_changes_eol = self.get_line_separator()
+
+        return text
+
+    def _get_changes_for_server(self):
+        """
+        Get the changes made to the document since it was last sent to the
+        server.
+
+        Returns None if they couldn't be tracked.
+        """
+        changes = self._text_changes_tracker.take_changes()
+        if changes is None or self.is_ipython():
+            return None
+
+        # The server needs a full update if the end-of-line characters
+        # changed.
+        eol = self.get_line_separator()
+        if eol != self._text_changes_eol:
+            return None
+
+        if eol != '\n':
+            for change in changes:
+                change['text'] = change['text'].replace('\n', eol)
+
+        return changes
+
     @request(
         method=CompletionRequestTypes.DOCUMENT_DID_CHANGE,
         requires_response=False,
@@ -436,22 +485,26 @@ def document_did_change(self):
         if self.is_cloned:
             return
 
-        # Get text
-        text = self.get_text_with_eol()
-        if self.is_ipython():
-            # Send valid python text to LSP
-            text = self.ipython_to_python(text)
+        # Send only the changes made to the text if the server supports it
+        # and they could be tracked. Otherwise, send the whole text.
+        changes = self._get_changes_for_server()
+        self.text_changes = changes
+        if (
+            changes is not None
+            and self.sync_mode == TextDocumentSyncKind.INCREMENTAL
+        ):
+            text = None
+        else:
+            text = self._get_text_for_server()
+            changes = None
 
         self.text_version += 1
-
-        self.patch = self.differ.patch_make(self.previous_text, text)
-        self.previous_text = text
         cursor = self.textCursor()
         params = {
             "file": self.filename,
             "version": self.text_version,
             "text": text,
-            "diff": self.patch,
+            "changes": changes,
             "offset": cursor.position(),
             "selection_start": cursor.selectionStart(),
             "selection_end": cursor.selectionEnd(),
@@ -508,7 +561,17 @@ def sync_symbols_and_folding(self):
     def process_code_analysis(self, diagnostics):
         """Process code analysis results in a thread."""
         self.cleanup_code_analysis()
-        self._diagnostics = diagnostics
+
+        # Sort diagnostics by line to find the ones in the visible region
+        # by bisection when underlining them.
+        self._diagnostics = sorted(
+            diagnostics,
+            key=lambda diagnostic: diagnostic["range"]["start"]["line"]
+        )
+        self._diagnostics_lines = [
+            diagnostic["range"]["start"]["line"]
+            for diagnostic in self._diagnostics
+        ]
 
         # Process diagnostics in a thread to improve performance.
         self.update_diagnostics_thread.start()
@@ -583,10 +646,18 @@ def _process_code_analysis(self, underline):
             them can't.
         """
         document = self.document()
+        diagnostics = self._diagnostics
         if underline:
+            # Only diagnostics in the visible region are underlined, so
+            # selections are created only for them.
             first_block, last_block = self.get_buffer_block_numbers()
+            diagnostics = diagnostics[
+                bisect_left(self._diagnostics_lines, first_block):
+                bisect_right(self._diagnostics_lines, last_block)
+            ]
+            selections = []
 
-        for diagnostic in self._diagnostics:
+        for diagnostic in diagnostics:
             if self.is_ipython() and (
                 diagnostic["message"] == "undefined name 'get_ipython'"
             ):
@@ -618,22 +689,19 @@ def _process_code_analysis(self, underline):
                 data = BlockUserData(self)
 
             if underline:
-                block_nb = block.blockNumber()
-                if first_block <= block_nb <= last_block:
-                    error = severity == DiagnosticSeverity.ERROR
-                    color = self.error_color if error else self.warning_color
-                    color = QColor(color)
-                    color.setAlpha(255)
-                    block.color = color
-
-                    data.selection_start = start
-                    data.selection_end = end
-
-                    self.highlight_selection(
-                        "code_analysis_underline",
-                        data._selection(),
-                        underline_color=block.color,
-                    )
+                error = severity == DiagnosticSeverity.ERROR
+                color = self.error_color if error else self.warning_color
+                color = QColor(color)
+                color.setAlpha(255)
+                block.color = color
+
+                data.selection_start = start
+                data.selection_end = end
+
+                selection = self.get_selection(
+                    data._selection(), underline_color=block.color)
+                if selection is not None:
+                    selections.append(selection)
             else:
                 # Don't append messages to data for cloned editors to avoid
                 # showing them twice or more times on hover.
@@ -644,6 +712,9 @@ def _process_code_analysis(self, underline):
                     )
                 block.setUserData(data)
 
+        if underline:
+            self.set_extra_selections("code_analysis_underline", selections)
+
     # ---- Completion
     # -------------------------------------------------------------------------
     @schedule_request(method=CompletionRequestTypes.DOCUMENT_COMPLETION)
@@ -1284,7 +1355,7 @@ def _finish_update_folding(self):
         self.highlight_folded_regions()
 
         # Update indent guides, which depend on folding
-        if self.indent_guides._enabled and len(self.patch) > 0:
+        if self.indent_guides._enabled and self.text_changes != []:
             line, column = self.get_cursor_line_column()
             self.update_whitespace_count(line, column)
 
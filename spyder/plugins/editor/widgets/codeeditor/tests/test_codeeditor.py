@@ -16,6 +16,9 @@
 import pytest
 
 # Local imports
+from spyder.plugins.completion.api import TextDocumentSyncKind
+from spyder.plugins.completion.providers.fallback.utils import (
+    apply_text_changes)
 from spyder.widgets.mixins import TIP_PARAMETER_HIGHLIGHT_COLOR
 
 
@@ -627,5 +630,49 @@ def test_cell_highlight(codeeditor, qtbot):
     assert editor.current_cell[0].selectionEnd() == 8
 
 
+def test_incremental_document_sync(codeeditor):
+    """
+    Test that only the changes made to the text are sent to servers that
+    support incremental synchronization.
+    """
+    editor = codeeditor
+    editor.set_text('a = 1\nb = "😀"\n')
+    editor.filename = 'test.py'
+    editor.completions_available = True
+    editor.sync_mode = TextDocumentSyncKind.INCREMENTAL
+
+    requests = []
+    editor.sig_perform_completion_request.connect(
+        lambda language, method, params: requests.append(params))
+
+    editor.document_did_open()
+    server_text = requests[-1]['text']
+
+    # Several changes are sent at once
+    cursor = editor.textCursor()
+    cursor.setPosition(4)
+    cursor.insertText('10\nc = ')
+    cursor.movePosition(QTextCursor.End)
+    cursor.insertText('d = 4')
+    cursor.setPosition(18)
+    cursor.setPosition(22, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+
+    editor.document_did_change()
+    params = requests[-1]
+    assert params['text'] is None
+    assert len(params['changes']) == 3
+    server_text = apply_text_changes(server_text, params['changes'])
+    assert server_text == editor.get_text_with_eol()
+
+    # The whole text is sent to other servers
+    editor.sync_mode = TextDocumentSyncKind.FULL
+    cursor.insertText('e')
+    editor.document_did_change()
+    params = requests[-1]
+    assert params['changes'] is None
+    assert params['text'] == editor.get_text_with_eol()
+
+
 if __name__ == '__main__':
     pytest.main(['test_codeeditor.py'])
@@ -17,6 +17,8 @@
 from qtpy.QtGui import QFont, QTextCursor
 
 # Local imports
+from spyder.plugins.editor.api.decoration import TextDecoration
+from spyder.plugins.editor.utils.decoration import decoration_blocks
 from spyder.plugins.editor.widgets.codeeditor import CodeEditor
 
 
@@ -92,6 +94,71 @@ def test_decorations(codeeditor, qtbot):
     assert decorations[0].kind == 'current_cell'
 
 
+def test_visible_decorations_index(codeeditor, qtbot):
+    """
+    Test that the decorations found through the index of block numbers are
+    the ones that overlap the visible region, also after editing the file.
+    """
+    editor = codeeditor
+    editor.set_text("spam = 1\neggs = spam\n" * 500)
+
+    # Add occurrences and a decoration spanning many blocks
+    editor.go_to_line(1)
+    editor.mark_occurrences()
+    cursor = editor.textCursor()
+    cursor.setPosition(0)
+    cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor, n=300)
+    editor.highlight_selection('misc', cursor, background_color=Qt.red)
+    decorations = editor.decorations
+
+    def expected(first, last):
+        return [
+            d for d in decorations._sorted_decorations()
+            if decoration_blocks(d)[0] <= last
+            and decoration_blocks(d)[1] >= first
+        ]
+
+    for first, last in [(0, 10), (290, 310), (500, 520), (990, 1000)]:
+        assert decorations._visible_decorations(first, last) == expected(
+            first, last)
+
+    # Add and remove lines before occurrences
+    cursor = editor.textCursor()
+    cursor.setPosition(0)
+    cursor.insertText("ham\nham\n")
+    cursor.setPosition(editor.document().findBlockByNumber(600).position())
+    cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor, n=5)
+    cursor.removeSelectedText()
+
+    for first, last in [(0, 10), (290, 310), (500, 520), (990, 1000)]:
+        assert decorations._visible_decorations(first, last) == expected(
+            first, last)
+
+
+def test_visible_decorations_after_remove_and_add(codeeditor):
+    """
+    Test that the index of decorations is discarded when one is removed and
+    another one added, which leaves the number of decorations unchanged.
+    """
+    editor = codeeditor
+    editor.set_text("spam = 1\n" * 100)
+    decorations = editor.decorations
+    document = editor.document()
+
+    old = TextDecoration(document, start_line=10, end_line=10)
+    decorations.add(old)
+    assert old in decorations._visible_decorations(0, 20)
+
+    # This is what the code folding panel does when the current scope
+    # changes.
+    new = TextDecoration(document, start_line=50, end_line=50)
+    decorations.remove(old)
+    decorations.add(new)
+
+    assert old not in decorations._visible_decorations(0, 20)
+    assert new in decorations._visible_decorations(40, 60)
+
+
 @flaky(max_runs=10)
 def test_update_decorations_when_scrolling(qtbot):
     """
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Functions to find text in files.
+
+They don't depend on Qt so that they can run in worker processes.
+"""
+
+# Standard library imports
+import mmap
+import os
+import os.path as osp
+import re
+
+# Local imports
+from spyder.utils.encoding import is_text_file
+
+
+# Files larger than this are memory-mapped instead of read
+MMAP_MIN_SIZE = 1024 * 1024
+
+
+def compile_search_text(text, text_re, case_sensitive):
+    """
+    Return a compiled regular expression to find text in a whole file.
+
+    Plain texts are escaped and regular expressions are compiled with the
+    MULTILINE flag, so that ``^`` and ``$`` match at every line, as they did
+    when files were searched line by line.
+    """
+    flags = re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+
+    if text_re:
+        if isinstance(text, re.Pattern):
+            flags |= text.flags
+            text = text.pattern
+    else:
+        text = re.escape(text)
+
+    return re.compile(text, flags)
+
+
+def find_matches_in_file(fname, texts, text_re, case_sensitive):
+    """
+    Find the matches of texts in a file.
+
+    The whole file is searched at once (memory-mapping it if it's large) and
+    line numbers and decoded lines are only computed for the matches.
+
+    Parameters
+    ----------
+    fname: str
+        Path of the file.
+    texts: list
+        List of (text, encoding) pairs, where text is the search text encoded
+        with encoding (or a compiled regular expression of it if `text_re` is
+        True). The first text found in the file is the one searched for.
+    text_re: bool
+        Whether texts are regular expressions.
+    case_sensitive: bool
+        Whether the search is case sensitive.
+
+    Returns
+    -------
+    list
+        List of (lineno, start, end, line) tuples, where lineno starts at 1,
+        start and end are the positions of the match in the decoded line and
+        line is the decoded line.
+
+    Raises
+    ------
+    OSError
+        If the file can't be read.
+    """
+    with open(fname, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        buffer = None
+        if size >= MMAP_MIN_SIZE:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+        if buffer is None:
+            buffer = f.read()
+
+    try:
+        for text, enc in texts:
+            pattern = compile_search_text(text, text_re, case_sensitive)
+            matches = _find_matches_in_buffer(buffer, pattern, enc)
+            if matches:
+                return matches
+        return []
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def search_files(files, texts, text_re, case_sensitive):
+    """
+    Find the matches of texts in several files.
+
+    This is the unit of work of the search processes.
+
+    Parameters
+    ----------
+    files: list
+        List of (fname, check_text) pairs, where check_text tells if it's
+        necessary to check that fname is a text file before searching in it.
+    texts, text_re, case_sensitive:
+        See `find_matches_in_file`.
+
+    Returns
+    -------
+    list
+        List of (fname, matches, error) tuples for the files that have
+        matches or that couldn't be read (in which case error is True).
+        fname is an absolute path.
+    """
+    results = []
+    for fname, check_text in files:
+        if check_text and not is_text_file(fname):
+            continue
+
+        try:
+            matches = find_matches_in_file(
+                fname, texts, text_re, case_sensitive)
+        except OSError:
+            results.append((osp.abspath(fname), [], True))
+            continue
+
+        if matches:
+            results.append((osp.abspath(fname), matches, False))
+
+    return results
+
+
+# ---- Private API
+def _find_matches_in_buffer(buffer, pattern, enc):
+    """Find the matches of a compiled pattern in the contents of a file."""
+    matches = []
+    size = len(buffer)
+
+    # Limits and number of the line of the last match
+    line_start = 0
+    line_end = -1
+    lineno = 1
+    line = line_dec = None
+
+    pos = 0
+    while pos <= size:
+        match = pattern.search(buffer, pos)
+        if match is None:
+            break
+        bstart, bend = match.span()
+
+        if bstart > line_end:
+            # The match is in a new line
+            lineno += buffer[line_start:bstart].count(b'\n')
+            line_start = buffer.rfind(b'\n', 0, bstart) + 1
+            line_end = buffer.find(b'\n', bstart)
+            if line_end == -1:
+                line_end = size
+            line = buffer[line_start:line_end + 1]
+            try:
+                line_dec = line.decode(enc)
+            except UnicodeDecodeError:
+                line_dec = line
+
+        if bend > line_end + 1:
+            # Matches can't span several lines, so search again in the line
+            # of the match only.
+            match = pattern.search(buffer, bstart, line_end + 1)
+            if match is None:
+                pos = line_end + 1
+                continue
+            bstart, bend = match.span()
+
+        # Go from binary position to decoded position
+        start = bstart - line_start
+        end = bend - line_start
+        try:
+            dec_start = len(line[:start].decode(enc))
+            end = dec_start + len(line[start:end].decode(enc))
+            start = dec_start
+        except UnicodeDecodeError:
+            pass
+        matches.append((lineno, start, end, line_dec))
+
+        # Skip empty matches to avoid finding them again
+        pos = bend if bend > bstart else bend + 1
+
+    return matches
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the functions to find text in files."""
+
+# Standard library imports
+import os.path as osp
+import random
+import re
+import time
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils import search
+from spyder.plugins.findinfiles.utils.search import (
+    find_matches_in_file, search_files)
+
+
+DATA = osp.join(
+    osp.dirname(osp.dirname(osp.dirname(osp.abspath(__file__)))),
+    'widgets', 'tests', 'data'
+)
+
+
+def find_matches_per_line(fname, texts, text_re, case_sensitive):
+    """
+    Find matches line by line, as Find in Files used to do.
+
+    This is the reference the whole-buffer search is compared against.
+    """
+    matches = []
+    with open(fname, 'rb') as f:
+        for lineno, line in enumerate(f):
+            for text, enc in texts:
+                line_search = line if case_sensitive else line.lower()
+                if text_re:
+                    found = list(re.finditer(text, line_search))
+                else:
+                    if not case_sensitive:
+                        text = text.lower()
+                    found = list(
+                        re.finditer(re.escape(text), line_search))
+                for match in found:
+                    start = len(line[:match.start()].decode(enc))
+                    end = start + len(
+                        line[match.start():match.end()].decode(enc))
+                    matches.append(
+                        (lineno + 1, start, end, line.decode(enc)))
+                if found:
+                    break
+    return matches
+
+
+def positions(matches):
+    return [(lineno, start) for lineno, start, __, __ in matches]
+
+
+@pytest.fixture(params=[False, True], ids=['read', 'mmap'])
+def use_mmap(request, monkeypatch):
+    """Search files reading them or memory-mapping them."""
+    if request.param:
+        monkeypatch.setattr(search, 'MMAP_MIN_SIZE', 0)
+    return request.param
+
+
+def test_find_text(use_mmap):
+    """Test finding a plain text."""
+    texts = [(b'spam', 'utf-8')]
+    expected = {
+        'spam.txt': [(1, 0), (1, 5), (3, 22)],
+        'spam.py': [(2, 7), (5, 1), (7, 12)],
+        'spam.cpp': [(2, 9), (6, 15), (8, 2), (11, 4), (11, 10), (13, 12)],
+    }
+    for name, result in expected.items():
+        matches = find_matches_in_file(
+            osp.join(DATA, name), texts, False, True)
+        assert positions(matches) == result
+
+
+def test_find_text_case_insensitive(use_mmap):
+    """Test that case insensitive searches use the text as given."""
+    matches = find_matches_in_file(
+        osp.join(DATA, 'ham.txt'), [(b'HaM', 'utf-8')], False, False)
+    assert positions(matches) == [
+        (1, 0), (1, 10), (3, 0), (4, 0), (5, 4), (9, 0), (10, 0)]
+
+    # Lowercase character classes are not affected
+    text_re = re.compile(rb'\S+am')
+    matches = find_matches_in_file(
+        osp.join(DATA, 'spam.txt'), [(text_re, 'utf-8')], True, False)
+    assert positions(matches) == positions(find_matches_per_line(
+        osp.join(DATA, 'spam.txt'), [(text_re, 'utf-8')], True, True))
+
+
+def test_find_regexp_lines(tmp_path, use_mmap):
+    """Test that regexps match whole lines as when searching by line."""
+    fname = tmp_path / 'lines.txt'
+    fname.write_bytes(b'spam eggs\nham\nspam\n\neggs spam')
+    fname = str(fname)
+
+    # Anchors
+    matches = find_matches_in_file(
+        fname, [(re.compile(rb'^spam'), 'utf-8')], True, True)
+    assert positions(matches) == [(1, 0), (3, 0)]
+    matches = find_matches_in_file(
+        fname, [(re.compile(rb'spam$'), 'utf-8')], True, True)
+    assert positions(matches) == [(3, 0), (5, 5)]
+
+    # Matches don't span several lines
+    matches = find_matches_in_file(
+        fname, [(re.compile(rb'ham\s+spam'), 'utf-8')], True, True)
+    assert matches == []
+    matches = find_matches_in_file(
+        fname, [(re.compile(rb'eggs\s*'), 'utf-8')], True, True)
+    assert matches == [(1, 5, 10, 'spam eggs\n'), (5, 0, 5, 'eggs spam')]
+
+    # Empty matches
+    matches = find_matches_in_file(
+        fname, [(re.compile(rb'^'), 'utf-8')], True, True)
+    assert positions(matches) == [(1, 0), (2, 0), (3, 0), (4, 0), (5, 0)]
+
+
+def test_find_non_ascii(tmp_path, use_mmap):
+    """Test that positions are given in characters and not in bytes."""
+    fname = tmp_path / 'non_ascii.txt'
+    fname.write_text('áé spam\n字分误 spam spam\n', encoding='utf-8')
+
+    matches = find_matches_in_file(
+        str(fname), [('spam'.encode('utf-8'), 'utf-8')], False, True)
+    assert matches == [
+        (1, 3, 7, 'áé spam\n'),
+        (2, 4, 8, '字分误 spam spam\n'),
+        (2, 9, 13, '字分误 spam spam\n'),
+    ]
+
+
+def test_search_files(tmp_path):
+    """Test searching in several files, some of which can't be read."""
+    files = [
+        (osp.join(DATA, 'spam.txt'), False),
+        (osp.join(DATA, 'ham.txt'), False),
+        (str(tmp_path / 'missing.txt'), False),
+    ]
+    results = search_files(files, [(b'spam', 'utf-8')], False, True)
+    assert [(osp.basename(fname), len(matches), error)
+            for fname, matches, error in results] == [
+        ('spam.txt', 3, False), ('missing.txt', 0, True)]
+
+
+@pytest.mark.slow
+def test_benchmark(tmp_path):
+    """
+    Compare the whole-buffer search with the line by line one on a
+    synthetic tree of files.
+    """
+    rng = random.Random(0)
+    words = [b'spam', b'ham', b'eggs', b'foo', b'bar', b'baz', b'qux']
+    files = []
+    for i in range(200):
+        directory = tmp_path / 'dir{}'.format(i % 10)
+        directory.mkdir(exist_ok=True)
+        lines = [
+            b' '.join(rng.choice(words) for __ in range(8))
+            for __ in range(2000)
+        ]
+        # Make matches of the searched text rare
+        for __ in range(5):
+            lines[rng.randrange(len(lines))] += b' needle'
+        fname = directory / 'file{}.txt'.format(i)
+        fname.write_bytes(b'\n'.join(lines))
+        files.append(str(fname))
+
+    texts = [(b'NEEDLE', 'utf-8')]
+
+    t0 = time.perf_counter()
+    expected = [
+        find_matches_per_line(fname, texts, False, False) for fname in files]
+    t_per_line = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    found = [
+        find_matches_in_file(fname, texts, False, False) for fname in files]
+    t_whole_buffer = time.perf_counter() - t0
+
+    print('Per line: {:.3f}s, whole buffer: {:.3f}s'.format(
+        t_per_line, t_whole_buffer))
+    assert found == expected
+
+
+if __name__ == '__main__':
+    pytest.main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the trigram index."""
+
+# Standard library imports
+import os
+
+# Local imports
+from spyder.plugins.findinfiles.utils import trigram_index
+from spyder.plugins.findinfiles.utils.trigram_index import (
+    compute_signatures, TrigramIndex)
+
+
+def update_index(index, root):
+    """Update index with the files in root and return the updated ones."""
+    outdated = index.get_outdated(list(os.scandir(root)))
+    index.update(outdated, compute_signatures(list(outdated)))
+    return sorted(os.path.basename(fname) for fname in outdated)
+
+
+def test_trigram_index(tmp_path, monkeypatch):
+    """Test filtering files and updating the index incrementally."""
+    monkeypatch.setattr(
+        trigram_index, 'get_conf_path', lambda name: str(tmp_path / name))
+    root = tmp_path / 'root'
+    root.mkdir()
+    (root / 'spam.py').write_text('import spam\n')
+    (root / 'eggs.py').write_text('import eggs\n')
+    spam, eggs = str(root / 'spam.py'), str(root / 'eggs.py')
+
+    index = TrigramIndex(str(root))
+    assert update_index(index, str(root)) == ['eggs.py', 'spam.py']
+    assert index.filter([spam, eggs], [b'spam']) == [spam]
+    assert index.filter([spam, eggs], [b'SPAM', b'eggs']) == [spam, eggs]
+    assert index.filter([spam, eggs], [b'ham']) == []
+
+    # Texts shorter than a trigram can't be filtered
+    assert index.filter([spam, eggs], [b'sp']) == [spam, eggs]
+
+    # The index is saved and loaded
+    index.save()
+    index = TrigramIndex(str(root))
+    index.load()
+    assert update_index(index, str(root)) == []
+
+    # Only modified files are indexed again and removed ones are forgotten
+    (root / 'eggs.py').write_text('import ham, eggs\n')
+    os.utime(eggs, ns=(0, 0))
+    os.remove(spam)
+    assert update_index(index, str(root)) == ['eggs.py']
+    assert list(index.files) == [eggs]
+    assert index.filter([eggs], [b'ham']) == [eggs]
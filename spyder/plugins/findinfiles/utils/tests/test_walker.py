@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the directory walker."""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils.walker import GitIgnore, walk_files
+
+
+def make_tree(root, files):
+    """Create files (given by their relative paths) under root."""
+    for fname, content in files.items():
+        path = osp.join(root, *fname.split('/'))
+        os.makedirs(osp.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+
+
+def walked(root, **kwargs):
+    """Return the relative paths of the files walked under root."""
+    return sorted(
+        osp.relpath(entry.path, root).replace(os.sep, '/')
+        for entry in walk_files(root, **kwargs)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern,path,is_dir,expected",
+    [
+        ('*.pyc', 'a/b/c.pyc', False, True),
+        ('*.pyc', 'a/b/c.py', False, None),
+        ('/build', 'build', True, True),
+        ('/build', 'a/build', True, None),
+        ('build/', 'a/build', True, True),
+        ('build/', 'a/build', False, None),
+        ('docs/**/*.html', 'docs/a/b/index.html', False, True),
+        ('docs/**/*.html', 'docs/index.html', False, True),
+        ('data[0-9].txt', 'data1.txt', False, True),
+    ]
+)
+def test_gitignore_match(pattern, path, is_dir, expected):
+    """Test matching paths against gitignore patterns."""
+    assert GitIgnore([pattern]).match(path, is_dir) is expected
+
+
+def test_gitignore_negation():
+    """Test that the last matching pattern decides."""
+    gitignore = GitIgnore(['# Comment', '*.log', '!keep.log', ''])
+    assert gitignore.match('error.log', False)
+    assert gitignore.match('keep.log', False) is False
+
+
+def test_walk_files(tmp_path):
+    """Test walking a tree honoring gitignore files and exclude patterns."""
+    root = str(tmp_path)
+    make_tree(root, {
+        '.gitignore': 'build/\n*.log\n',
+        'a.py': '',
+        'a.log': '',
+        'build/b.py': '',
+        '.hidden/c.py': '',
+        'sub/.gitignore': '!important.log\n',
+        'sub/important.log': '',
+        'sub/other.log': '',
+        'sub/d.txt': '',
+    })
+
+    assert walked(root) == [
+        '.gitignore', 'a.py', 'sub/.gitignore', 'sub/d.txt',
+        'sub/important.log'
+    ]
+
+    assert walked(root, use_gitignore=False) == [
+        '.gitignore', 'a.log', 'a.py', 'build/b.py', 'sub/.gitignore',
+        'sub/d.txt', 'sub/important.log', 'sub/other.log'
+    ]
+
+    exclude = re.compile(r'sub' + re.escape(os.sep))
+    assert walked(root, exclude=exclude) == ['.gitignore', 'a.py']
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Persistent trigram index to skip files that can't match a search.
+
+For each file, the index stores a signature: a bit array where the bits
+corresponding to the (lowercase) trigrams of its contents are set. A file can
+only contain a text if the bits of all the trigrams of that text are set in
+its signature. Since different trigrams can share bits, some files with no
+matches are still searched, but the signature of a file is much smaller
+than the list of its trigrams.
+
+The index is saved in Spyder's configuration directory and updated from the
+modification times and sizes of files, so only new and modified files are
+read again.
+"""
+
+# Standard library imports
+import hashlib
+import logging
+import os
+import os.path as osp
+import pickle
+
+# Local imports
+from spyder.config.base import get_conf_path
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Version of the on-disk format
+INDEX_VERSION = 1
+
+# Files larger than this (in bytes) are not indexed and always searched
+MAX_INDEXED_SIZE = 4 * 1024**2
+
+# Minimum and maximum number of bits of a signature
+MIN_SIGNATURE_BITS = 2**9
+MAX_SIGNATURE_BITS = 2**20
+
+
+# ---- Signatures
+# ----------------------------------------------------------------------------
+def get_trigrams(data):
+    """Return the set of trigrams of data (as integers)."""
+    data = data.lower()
+    return {
+        int.from_bytes(data[i:i + 3], 'big')
+        for i in range(len(data) - 2)
+    }
+
+
+def get_signature_bits(num_trigrams):
+    """Return the number of bits of the signature of a file."""
+    bits = MIN_SIGNATURE_BITS
+    while bits < 2 * num_trigrams and bits < MAX_SIGNATURE_BITS:
+        bits *= 2
+    return bits
+
+
+def get_bit(trigram, bits):
+    """Return the bit that corresponds to a trigram in a signature."""
+    # Fibonacci hashing: take the high bits of a 32 bits product, which
+    # depend on all the bits of the trigram.
+    shift = 33 - bits.bit_length()
+    return ((trigram * 0x9E3779B1) & 0xFFFFFFFF) >> shift
+
+
+def make_signature(trigrams, bits):
+    """Return the signature of a set of trigrams as an integer."""
+    array = bytearray(bits // 8)
+    for trigram in trigrams:
+        bit = get_bit(trigram, bits)
+        array[bit >> 3] |= 1 << (bit & 7)
+    return int.from_bytes(array, 'little')
+
+
+def compute_signatures(filenames):
+    """
+    Compute the signatures of several files.
+
+    This is the unit of work of the indexing processes. It returns a list of
+    (fname, bits, signature) tuples, where signature is None for files that
+    couldn't be read.
+    """
+    results = []
+    for fname in filenames:
+        try:
+            with open(fname, 'rb') as f:
+                data = f.read()
+        except OSError:
+            results.append((fname, 0, None))
+            continue
+
+        trigrams = get_trigrams(data)
+        bits = get_signature_bits(len(trigrams))
+        results.append((fname, bits, make_signature(trigrams, bits)))
+    return results
+
+
+# ---- Index
+# ----------------------------------------------------------------------------
+class TrigramIndex:
+    """
+    Trigram index of the files of a directory.
+
+    Parameters
+    ----------
+    root: str
+        Directory whose files are indexed.
+    """
+
+    def __init__(self, root):
+        self.root = osp.normpath(root)
+        self.filename = get_conf_path(
+            osp.join(
+                'findinfiles',
+                hashlib.sha1(self.root.encode('utf-8')).hexdigest() + '.idx'
+            )
+        )
+
+        # Map of file path to (mtime, size, bits, signature)
+        self.files = {}
+        self._modified = False
+
+    # ---- Public API
+    def load(self):
+        """Load the index from disk, if it was saved before."""
+        try:
+            with open(self.filename, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            return
+
+        if data.get('version') == INDEX_VERSION and data['root'] == self.root:
+            self.files = data['files']
+
+    def save(self):
+        """Save the index to disk if it was modified."""
+        if not self._modified:
+            return
+
+        data = {
+            'version': INDEX_VERSION,
+            'root': self.root,
+            'files': self.files,
+        }
+        try:
+            os.makedirs(osp.dirname(self.filename), exist_ok=True)
+            tmp_filename = self.filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, self.filename)
+            self._modified = False
+        except OSError:
+            logger.debug("Unable to save index of %s", self.root,
+                         exc_info=True)
+
+    def get_outdated(self, entries):
+        """
+        Return the files that need to be (re)indexed.
+
+        Parameters
+        ----------
+        entries: list of os.DirEntry
+            Files that currently exist in the indexed directory. Files in the
+            index that are not in entries are removed from it.
+
+        Returns
+        -------
+        dict
+            Map of the paths of outdated files to their (mtime, size).
+        """
+        outdated = {}
+        current = set()
+        for entry in entries:
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if stat.st_size > MAX_INDEXED_SIZE:
+                continue
+
+            current.add(entry.path)
+            info = self.files.get(entry.path)
+            if info is None or info[:2] != (stat.st_mtime_ns, stat.st_size):
+                outdated[entry.path] = (stat.st_mtime_ns, stat.st_size)
+
+        removed = [fname for fname in self.files if fname not in current]
+        for fname in removed:
+            del self.files[fname]
+        if removed:
+            self._modified = True
+
+        return outdated
+
+    def update(self, outdated, signatures):
+        """
+        Update the index with the signatures of outdated files.
+
+        Parameters
+        ----------
+        outdated: dict
+            As returned by `get_outdated`.
+        signatures: list
+            As returned by `compute_signatures` for files in outdated.
+        """
+        for fname, bits, signature in signatures:
+            if signature is None:
+                self.files.pop(fname, None)
+            else:
+                self.files[fname] = outdated[fname] + (bits, signature)
+            self._modified = True
+
+    def filter(self, filenames, texts):
+        """
+        Return the files of filenames that may contain any of texts.
+
+        Texts are given as bytes. Files that are not in the index are always
+        kept, as well as all files if a text is shorter than three bytes.
+        """
+        queries = [get_trigrams(text) for text in texts]
+        if not all(queries):
+            return list(filenames)
+
+        # Masks of the queries, by number of bits of the signatures
+        masks = {}
+
+        candidates = []
+        for fname in filenames:
+            info = self.files.get(fname)
+            if info is None:
+                candidates.append(fname)
+                continue
+
+            __, __, bits, signature = info
+            try:
+                file_masks = masks[bits]
+            except KeyError:
+                file_masks = masks[bits] = [
+                    make_signature(query, bits) for query in queries]
+
+            if any(signature & mask == mask for mask in file_masks):
+                candidates.append(fname)
+
+        return candidates
+
+
+# Indexes loaded in this session, by root directory
+_INDEXES = {}
+
+
+def get_index(root):
+    """Return the index of root, loading it from disk the first time."""
+    root = osp.normpath(root)
+    index = _INDEXES.get(root)
+    if index is None:
+        index = TrigramIndex(root)
+        index.load()
+        _INDEXES[root] = index
+    return index
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Walk a directory tree to find the files to search in."""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+GITIGNORE = '.gitignore'
+
+
+# ---- Gitignore support
+# ----------------------------------------------------------------------------
+def translate_gitignore_pattern(pattern):
+    """
+    Translate a gitignore glob pattern to a regular expression.
+
+    The expression matches paths relative to the directory that contains the
+    .gitignore file, using forward slashes as separators.
+    """
+    # Patterns with a slash (except at the end, which was removed before
+    # calling this function) are relative to the .gitignore directory.
+    # Others match at any level.
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+
+    i, n = 0, len(pattern)
+    result = []
+    while i < n:
+        if pattern.startswith('**/', i):
+            result.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == n:
+            result.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            result.append('.*')
+            i += 2
+        else:
+            c = pattern[i]
+            i += 1
+            if c == '*':
+                result.append('[^/]*')
+            elif c == '?':
+                result.append('[^/]')
+            elif c == '\\' and i < n:
+                result.append(re.escape(pattern[i]))
+                i += 1
+            elif c == '[':
+                j = pattern.find(']', i + 1)
+                if j == -1:
+                    result.append('\\[')
+                else:
+                    stuff = pattern[i:j].replace('\\', '\\\\')
+                    if stuff.startswith('!'):
+                        stuff = '^' + stuff[1:]
+                    result.append('[' + stuff + ']')
+                    i = j + 1
+            else:
+                result.append(re.escape(c))
+
+    prefix = '' if anchored else '(?:.*/)?'
+    return '^' + prefix + ''.join(result) + '$'
+
+
+class GitIgnore:
+    """
+    Patterns of a .gitignore file.
+
+    Parameters
+    ----------
+    lines: list of str
+        Lines of the .gitignore file.
+    """
+
+    def __init__(self, lines):
+        self.rules = []
+        for line in lines:
+            line = line.rstrip('\n').rstrip('\r')
+            if not line.strip() or line.startswith('#'):
+                continue
+
+            # Trailing spaces are ignored unless they're escaped
+            if not line.endswith('\\ '):
+                line = line.rstrip(' ')
+
+            negate = line.startswith('!')
+            if negate or line.startswith('\\!') or line.startswith('\\#'):
+                line = line[1:]
+
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+
+            try:
+                regex = re.compile(translate_gitignore_pattern(line))
+            except re.error:
+                continue
+            self.rules.append((regex, negate, dir_only))
+
+    @classmethod
+    def from_directory(cls, path):
+        """Read the .gitignore file of a directory, if it has one."""
+        try:
+            with open(osp.join(path, GITIGNORE), encoding='utf-8',
+                      errors='replace') as f:
+                return cls(f.readlines())
+        except OSError:
+            return None
+
+    def match(self, relpath, is_dir):
+        """
+        Check if a path is ignored by these patterns.
+
+        Returns True if it's ignored, False if it's explicitly included
+        (i.e. by a negated pattern) and None if no pattern matches it.
+        """
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(relpath):
+                result = not negate
+        return result
+
+
+def is_ignored(path, is_dir, gitignores):
+    """
+    Check if path is ignored by a list of (directory, GitIgnore) pairs.
+
+    Patterns of .gitignore files in deeper directories take precedence over
+    those of their parents.
+    """
+    for directory, gitignore in reversed(gitignores):
+        relpath = osp.relpath(path, directory).replace(os.sep, '/')
+        result = gitignore.match(relpath, is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+# ---- Walker
+# ----------------------------------------------------------------------------
+def walk_files(root, exclude=None, use_gitignore=True):
+    """
+    Generate the regular files to search in under root.
+
+    This yields `os.DirEntry` objects, so that callers that need the file
+    status don't have to ask the file system for it again.
+
+    Parameters
+    ----------
+    root: str
+        Directory to walk.
+    exclude: re.Pattern or None
+        Paths for which this expression is found are skipped. For
+        directories, it's tested against their path followed by a separator.
+    use_gitignore: bool
+        Whether to skip paths ignored by .gitignore files in root and its
+        subdirectories.
+
+    Notes
+    -----
+    Directories whose name starts with a dot are skipped and symbolic links
+    to directories are not followed.
+    """
+    stack = [(root, [])]
+    while stack:
+        path, gitignores = stack.pop()
+        if use_gitignore:
+            gitignore = GitIgnore.from_directory(path)
+            if gitignore is not None and gitignore.rules:
+                gitignores = gitignores + [(path, gitignore)]
+
+        try:
+            entries = list(os.scandir(path))
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_dir:
+                    if entry.name.startswith('.'):
+                        continue
+                    if exclude and exclude.search(entry.path + os.sep):
+                        continue
+                    if gitignores and is_ignored(entry.path, True,
+                                                 gitignores):
+                        continue
+                    subdirs.append(entry.path)
+                    continue
+
+                # Only search in regular files (i.e. not pipes). This follows
+                # symbolic links to files.
+                if not entry.is_file():
+                    continue
+            except OSError:
+                # This happens, for instance, with too many levels of
+                # symbolic links.
+                # Fixes spyder-ide/spyder#20798
+                continue
+
+            if exclude and exclude.search(entry.path):
+                continue
+            if gitignores and is_ignored(entry.path, False, gitignores):
+                continue
+            yield entry
+
+        # Visit subdirectories in alphabetical order, as they are popped
+        # from the end of the stack.
+        for subdir in sorted(subdirs, reverse=True):
+            stack.append((subdir, gitignores))
@@ -52,6 +52,8 @@ class FindInFilesWidgetActions:
     ToggleExcludeRegex = 'togle_use_regex_on_exlude_action'
     ToggleMoreOptions = 'toggle_more_options_action'
     ToggleSearchRegex = 'toggle_use_regex_on_search_action'
+    ToggleGitignore = 'toggle_respect_gitignore_action'
+    ToggleIndex = 'toggle_use_index_action'
 
 
 class FindInFilesWidgetToolbars:
@@ -311,6 +313,23 @@ def setup(self):
             tip=_('Set maximum number of results'),
             triggered=lambda x=None: self.set_max_results(),
         )
+        self.respect_gitignore_action = self.create_action(
+            FindInFilesWidgetActions.ToggleGitignore,
+            text=_('Skip files ignored by Git'),
+            tip=_('Skip files and folders listed in .gitignore files'),
+            toggled=True,
+            initial=self.get_conf('respect_gitignore'),
+            option='respect_gitignore'
+        )
+        self.use_index_action = self.create_action(
+            FindInFilesWidgetActions.ToggleIndex,
+            text=_('Index project files'),
+            tip=_('Keep an index of the current project files to speed up '
+                  'repeated searches in them'),
+            toggled=True,
+            initial=self.get_conf('use_index'),
+            option='use_index'
+        )
 
         # Toolbar
         toolbar = self.get_main_toolbar()
@@ -351,10 +370,9 @@ def setup(self):
             )
 
         menu = self.get_options_menu()
-        self.add_item_to_menu(
-            self.set_max_results_action,
-            menu=menu,
-        )
+        for item in [self.set_max_results_action,
+                     self.respect_gitignore_action, self.use_index_action]:
+            self.add_item_to_menu(item, menu=menu)
 
         # Set pane_empty widget at the beginning
         self.stacked_widget.setCurrentWidget(self.pane_empty)
@@ -481,9 +499,6 @@ def _get_options(self):
 
         exclude = str(self.exclude_pattern_edit.currentText())
 
-        if not case_sensitive:
-            texts = [(text[0].lower(), text[1]) for text in texts]
-
         file_search = self.path_selection_combo.is_file_search()
         path = self.path_selection_combo.get_current_searchpath()
 
@@ -707,7 +722,23 @@ def start(self):
             self.result_browser.append_result
         )
         self.result_browser.clear_title(search_text)
-        self.search_thread.initialize(*self._get_options())
+
+        # Only searches in the current project use its index
+        path, file_search = options[:2]
+        index_root = None
+        if (
+            self.get_conf('use_index')
+            and not file_search
+            and self.project_path
+            and osp.normpath(path) == osp.normpath(self.project_path)
+        ):
+            index_root = path
+
+        self.search_thread.initialize(
+            *options,
+            use_gitignore=self.get_conf('respect_gitignore'),
+            index_root=index_root
+        )
         self.search_thread.start()
         self.update_actions()
 
@@ -747,7 +778,7 @@ def set_max_results(self, value=None):
             # dialog. Since that value seems a bit arbitrary, we decided to set
             # it to 5.
             # See spyder-ide/spyder#16256
-            dialog.setIntRange(5, 10000)
+            dialog.setIntRange(5, 1000000)
 
             # Connect slot
             dialog.intValueSelected.connect(
@@ -7,24 +7,32 @@
 """Results browser."""
 
 # Standard library imports
+from array import array
+import itertools
+from operator import itemgetter
 import os.path as osp
 
 # Third party imports
-from qtpy.QtCore import QPoint, QSize, Qt, Signal, Slot
+from qtpy import PYQT5, PYQT6
+from qtpy.QtCore import (QAbstractItemModel, QModelIndex, QPoint, QSize, Qt,
+                         Signal, Slot)
 from qtpy.QtGui import (QAbstractTextDocumentLayout, QColor, QFontMetrics,
                         QTextDocument)
-from qtpy.QtWidgets import (QApplication, QStyle, QStyledItemDelegate,
-                            QStyleOptionViewItem, QTreeWidgetItem)
+from qtpy.QtWidgets import (QAbstractItemView, QApplication, QHeaderView,
+                            QStyle, QStyledItemDelegate, QStyleOptionViewItem,
+                            QTreeView)
 
 # Local imports
 from spyder.api.config.fonts import SpyderFontsMixin, SpyderFontType
 from spyder.api.translations import _
+from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.plugins.findinfiles.widgets.search_thread import (
-    ELLIPSIS, MAX_RESULT_LENGTH)
+    ELLIPSIS, MAX_RESULT_LENGTH, truncate_result)
 from spyder.utils import icon_manager as ima
 from spyder.utils.palette import QStylePalette
 from spyder.utils.stylesheet import AppStyle
-from spyder.widgets.onecolumntree import OneColumnTree
+from spyder.widgets.onecolumntree import (
+    OneColumnTreeActions, OneColumnTreeContextMenuSections)
 
 
 # ---- Constants
@@ -32,51 +40,85 @@
 ON = 'on'
 OFF = 'off'
 
+# Maximum number of texts of matches cached for display. Only the visible
+# ones are needed.
+MAX_CACHED_DISPLAYS = 1000
 
-# ---- Items
-# ----------------------------------------------------------------------------
-class LineMatchItem(QTreeWidgetItem):
-
-    def __init__(self, parent, lineno, colno, match, font, text_color):
-        self.lineno = lineno
-        self.colno = colno
-        self.match = match['formatted_text']
-        self.plain_match = match['text']
-        self.text_color = text_color
-        self.font = font
-        super().__init__(parent, [self.__repr__()], QTreeWidgetItem.Type)
 
-    def __repr__(self):
-        match = str(self.match).rstrip()
-        _str = (
-            f"<!-- LineMatchItem -->"
-            f"<p style=\"color:'{self.text_color}';\">"
-            f'&nbsp;&nbsp;'
-            f"<b>{self.lineno}</b> ({self.colno}): "
-            f"<span style='font-family:{self.font.family()};"
-            f"font-size:{self.font.pointSize()}pt;'>{match}</span></p>"
-        )
-        return _str
+# ---- Model
+# ----------------------------------------------------------------------------
+class FileResults:
+    """Matches found in a file."""
 
-    def __unicode__(self):
-        return self.__repr__()
+    def __init__(self, file_id, filename, rel_dirname, row):
+        self.file_id = file_id
+        self.filename = filename
+        self.rel_dirname = rel_dirname
 
-    def __str__(self):
-        return self.__repr__()
+        # Position of the file in the model
+        self.row = row
 
-    def __lt__(self, x):
-        return self.lineno < x.lineno
+        # Positions of its matches in the columns of the model
+        self.matches = array('i')
 
-    def __ge__(self, x):
-        return self.lineno >= x.lineno
+        self.icon = None
 
 
-class FileMatchItem(QTreeWidgetItem):
+class ResultsModel(QAbstractItemModel):
+    """
+    Model of the results of a search.
 
-    def __init__(self, parent, path, filename, sorting, text_color):
+    Files are the top level items and their matches are their children. To
+    handle a large number of matches, these are stored column by column (file
+    id, line number, start and end of the match) and the text displayed for
+    them is only built for the rows that are painted.
+    """
 
-        self.sorting = sorting
-        self.filename = osp.basename(filename)
+    def __init__(self, parent, text_color, font):
+        super().__init__(parent)
+        self.text_color = text_color
+        self.font = font
+        self.title = ''
+
+        self._files = []
+        self._files_by_name = {}
+        self._display_cache = {}
+        self._reset_columns()
+
+    # ---- Public API
+    @property
+    def num_files(self):
+        """Number of files with matches."""
+        return len(self._files)
+
+    @property
+    def num_matches(self):
+        """Number of matches."""
+        return len(self._linenos)
+
+    def clear(self):
+        """Remove all results."""
+        self.beginResetModel()
+        self._files = []
+        self._files_by_name = {}
+        self._display_cache = {}
+        self._reset_columns()
+        self.endResetModel()
+
+    def set_title(self, title):
+        """Set the title shown in the header."""
+        self.title = title
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 0)
+
+    def add_file(self, filename, path):
+        """
+        Add a file with matches.
+
+        `path` is the path where the search is performed, which is used to
+        display the directory of the file relative to it.
+        """
+        if filename in self._files_by_name:
+            return self._files_by_name[filename]
 
         # Get relative dirname according to the path we're searching in.
         dirname = osp.dirname(filename)
@@ -88,36 +130,230 @@ def __init__(self, parent, path, filename, sorting, text_color):
             rel_dirname = dirname.split(path)[1]
             if rel_dirname.startswith(osp.sep):
                 rel_dirname = rel_dirname[1:]
-        except IndexError:
+        except (IndexError, TypeError, ValueError):
             rel_dirname = dirname
 
-        self.rel_dirname = rel_dirname
+        row = len(self._files)
+        file_results = FileResults(
+            len(self._files_by_name), filename, rel_dirname, row)
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._files.append(file_results)
+        self._files_by_name[filename] = file_results
+        self.endInsertRows()
+
+        return file_results
+
+    def add_matches(self, items):
+        """
+        Add matches to the files they were found in.
+
+        `items` is a list of (filename, lineno, start, line, end) tuples.
+        Matches of files that were not added before are ignored.
+        """
+        for filename, group in itertools.groupby(items, key=itemgetter(0)):
+            file_results = self._files_by_name.get(filename)
+            if file_results is None:
+                continue
+
+            group = list(group)
+            first = len(file_results.matches)
+            self.beginInsertRows(
+                self.createIndex(file_results.row, 0),
+                first,
+                first + len(group) - 1
+            )
 
-        title = (
-            f'<!-- FileMatchItem -->'
-            f'<b style="color:{text_color}">{osp.basename(filename)}</b>'
-            f'&nbsp;&nbsp;&nbsp;'
-            f'<span style="color:{text_color}">'
-            f'<em>{self.rel_dirname}</em>'
-            f'</span>'
+            for __, lineno, start, line, end in group:
+                row = len(self._linenos)
+
+                # Share the text of lines with several matches
+                if (
+                    file_results.matches
+                    and self._linenos[-1] == lineno
+                    and self._file_ids[-1] == file_results.file_id
+                ):
+                    line = self._lines[-1]
+
+                self._file_ids.append(file_results.file_id)
+                self._linenos.append(lineno)
+                self._starts.append(start)
+                self._ends.append(end)
+                self._lines.append(line)
+                file_results.matches.append(row)
+
+            self.endInsertRows()
+
+    def get_files(self):
+        """Return the files with matches, in the order they're shown."""
+        return [file_results.filename for file_results in self._files]
+
+    def get_match(self, index):
+        """
+        Return the (filename, lineno, start, end) of the match at index.
+
+        Returns None if index doesn't correspond to a match.
+        """
+        file_results = index.internalPointer() if index.isValid() else None
+        if not isinstance(file_results, FileResults):
+            return None
+
+        row = file_results.matches[index.row()]
+        return (
+            file_results.filename,
+            self._linenos[row],
+            self._starts[row],
+            self._ends[row]
         )
 
-        super().__init__(parent, [title], QTreeWidgetItem.Type)
-
-        self.setIcon(0, ima.get_icon_by_extension_or_type(filename, 1.0))
-        self.setToolTip(0, filename)
-
-    def __lt__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename < x.filename
-        else:
-            return False
+    def get_matches(self):
+        """Return the (filename, lineno, start, end) of all matches."""
+        filenames = {
+            file_results.file_id: file_results.filename
+            for file_results in self._files
+        }
+        return [
+            (filenames[file_id], lineno, start, end)
+            for file_id, lineno, start, end in zip(
+                self._file_ids, self._linenos, self._starts, self._ends)
+        ]
+
+    def is_file(self, index):
+        """Whether index corresponds to a file."""
+        return (
+            index.isValid()
+            and not isinstance(index.internalPointer(), FileResults)
+        )
 
-    def __ge__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename >= x.filename
-        else:
-            return False
+    # ---- Qt methods
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column)
+
+        # The internal pointer of matches is the file they were found in
+        return self.createIndex(row, column, self._files[parent.row()])
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+
+        file_results = index.internalPointer()
+        if isinstance(file_results, FileResults):
+            return self.createIndex(file_results.row, 0)
+
+        return QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._files)
+        if self.is_file(parent):
+            return len(self._files[parent.row()].matches)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.title
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        file_results = index.internalPointer()
+        if isinstance(file_results, FileResults):
+            if role == Qt.DisplayRole:
+                return self._get_match_display(
+                    file_results.matches[index.row()])
+            return None
+
+        file_results = self._files[index.row()]
+        if role == Qt.DisplayRole:
+            return (
+                f'<!-- FileMatchItem -->'
+                f'<b style="color:{self.text_color}">'
+                f'{osp.basename(file_results.filename)}</b>'
+                f'&nbsp;&nbsp;&nbsp;'
+                f'<span style="color:{self.text_color}">'
+                f'<em>{file_results.rel_dirname}</em>'
+                f'</span>'
+            )
+        elif role == Qt.DecorationRole:
+            if file_results.icon is None:
+                file_results.icon = ima.get_icon_by_extension_or_type(
+                    file_results.filename, 1.0)
+            return file_results.icon
+        elif role == Qt.ToolTipRole:
+            return file_results.filename
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort files by name."""
+        self.layoutAboutToBeChanged.emit()
+
+        old_files = list(self._files)
+        self._files.sort(
+            key=lambda file_results: osp.basename(file_results.filename),
+            reverse=(order == Qt.DescendingOrder)
+        )
+        for row, file_results in enumerate(self._files):
+            file_results.row = row
+
+        # Only the indexes of files change. Matches are found through their
+        # file.
+        old_indexes = [
+            index for index in self.persistentIndexList()
+            if self.is_file(index)
+        ]
+        new_indexes = [
+            self.createIndex(old_files[index.row()].row, index.column())
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
+    # ---- Private API
+    def _reset_columns(self):
+        self._file_ids = array('i')
+        self._linenos = array('i')
+        self._starts = array('i')
+        self._ends = array('i')
+        self._lines = []
+
+    def _get_match_display(self, row):
+        """Return the text displayed for a match, caching it."""
+        try:
+            return self._display_cache[row]
+        except KeyError:
+            pass
+
+        if len(self._display_cache) >= MAX_CACHED_DISPLAYS:
+            self._display_cache.clear()
+
+        match = truncate_result(
+            self._lines[row],
+            self._starts[row],
+            self._ends[row],
+            self.text_color
+        )
+        text = str(match['formatted_text']).rstrip()
+        display = (
+            f"<!-- LineMatchItem -->"
+            f"<p style=\"color:'{self.text_color}';\">"
+            f'&nbsp;&nbsp;'
+            f"<b>{self._linenos[row]}</b> ({self._starts[row]}): "
+            f"<span style='font-family:{self.font.family()};"
+            f"font-size:{self.font.pointSize()}pt;'>{text}</span></p>"
+        )
+        self._display_cache[row] = display
+        return display
 
 
 # ---- Browser
@@ -185,49 +421,112 @@ def sizeHint(self, option, index):
         return size
 
 
-class ResultsBrowser(OneColumnTree, SpyderFontsMixin):
+class ResultsBrowser(QTreeView, SpyderWidgetMixin, SpyderFontsMixin):
 
     sig_edit_goto_requested = Signal(str, int, str, int, int)
     sig_max_results_reached = Signal()
 
     def __init__(self, parent, text_color, max_results=1000):
-        super().__init__(parent)
+        if PYQT5 or PYQT6:
+            super().__init__(parent, class_parent=parent)
+        else:
+            QTreeView.__init__(self, parent)
+            SpyderWidgetMixin.__init__(self, class_parent=parent)
+
         self.search_text = None
-        self.results = None
         self.max_results = max_results
-        self.total_matches = None
-        self.error_flag = None
-        self.completed = None
         self.sorting = {}
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.data = None
-        self.files = None
-        self.root_items = None
+        self.num_files = 0
         self.text_color = text_color
         self.path = None
         self.longest_file_item = ''
         self.longest_line_item = ''
 
+        self.results_model = ResultsModel(self, text_color, self.font)
+        self.setModel(self.results_model)
+
         # Setup
+        self.setup()
         self.set_title('')
         self.set_sorting(OFF)
         self.setSortingEnabled(False)
         self.setItemDelegate(ItemDelegate(self))
         self.setUniformRowHeights(True)  # Needed for performance
+        self.setItemsExpandable(True)
         self.sortByColumn(0, Qt.AscendingOrder)
 
-        # Only show the actions for collaps/expand all entries in the widget
-        # For further information see spyder-ide/spyder#13178
-        self.common_actions = self.common_actions[:2]
+        # To use mouseMoveEvent
+        self.setMouseTracking(True)
+
+        # Use horizontal scrollbar when needed
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
+        self.header().setStretchLastSection(False)
 
         # Signals
+        self.activated.connect(self.activate)
+        self.clicked.connect(self.click)
         self.header().sectionClicked.connect(self.sort_section)
 
-    def activated(self, item):
+    # ---- SpyderWidgetMixin API
+    # -------------------------------------------------------------------------
+    def setup(self):
+        self.menu = self.create_menu("context_menu")
+
+        # Only show the actions for collaps/expand all entries in the widget
+        # For further information see spyder-ide/spyder#13178
+        self.collapse_all_action = self.create_action(
+            OneColumnTreeActions.CollapseAllAction,
+            text=_("Collapse all"),
+            icon=ima.icon("collapse"),
+            triggered=self.collapseAll,
+            register_shortcut=False,
+        )
+        self.expand_all_action = self.create_action(
+            OneColumnTreeActions.ExpandAllAction,
+            text=_("Expand all"),
+            icon=ima.icon("expand"),
+            triggered=self.expandAll,
+            register_shortcut=False,
+        )
+
+        for item in [self.collapse_all_action, self.expand_all_action]:
+            self.add_item_to_menu(
+                item,
+                self.menu,
+                section=OneColumnTreeContextMenuSections.Global,
+            )
+
+    def update_actions(self):
+        pass
+
+    # ---- Qt methods
+    # -------------------------------------------------------------------------
+    def contextMenuEvent(self, event):
+        """Override Qt method"""
+        self.menu.popup(event.globalPos())
+
+    def mouseMoveEvent(self, event):
+        """Change cursor shape."""
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            vrect = self.visualRect(index)
+            item_identation = vrect.x() - self.visualRect(self.rootIndex()).x()
+            if event.pos().x() > item_identation:
+                # When hovering over results
+                self.setCursor(Qt.PointingHandCursor)
+            else:
+                # On every other element
+                self.setCursor(Qt.ArrowCursor)
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def activate(self, index):
         """Double-click event."""
-        itemdata = self.data.get(id(self.currentItem()))
-        if itemdata is not None:
-            filename, lineno, colno, colend = itemdata
+        match = self.results_model.get_match(index)
+        if match is not None:
+            filename, lineno, colno, colend = match
             self.sig_edit_goto_requested.emit(
                 filename, lineno, self.search_text, colno, colend - colno)
 
@@ -240,77 +539,70 @@ def set_sorting(self, flag):
     def sort_section(self, idx):
         self.setSortingEnabled(True)
 
-    def clicked(self, item):
+    def click(self, index):
         """Click event."""
-        if isinstance(item, FileMatchItem):
-            if item.isExpanded():
-                self.collapseItem(item)
-            else:
-                self.expandItem(item)
+        if self.results_model.is_file(index):
+            self.setExpanded(index, not self.isExpanded(index))
         else:
-            self.activated(item)
+            self.activate(index)
+
+    def set_title(self, title):
+        self.results_model.set_title(title)
 
     def clear_title(self, search_text):
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.clear()
+        self.results_model.font = self.font
+        self.results_model.clear()
         self.setSortingEnabled(False)
         self.num_files = 0
-        self.data = {}
-        self.files = {}
         self.set_sorting(OFF)
         self.search_text = search_text
         title = "'%s' - " % search_text
         text = _('String not found')
         self.set_title(title + text)
 
+    def get_files(self):
+        """Return the files with matches."""
+        return self.results_model.get_files()
+
+    def get_matches(self):
+        """Return the (filename, lineno, start, end) of all matches."""
+        return self.results_model.get_matches()
+
     @Slot(object)
     def append_file_result(self, filename):
         """Real-time update of file items."""
-        if len(self.data) < self.max_results:
-            item = FileMatchItem(
-                self,
-                self.path,
-                filename,
-                self.sorting,
-                self.text_color
-            )
-
-            self.files[filename] = item
-
-            item.setExpanded(True)
+        if self.results_model.num_matches < self.max_results:
+            file_results = self.results_model.add_file(filename, self.path)
+            self.setExpanded(
+                self.results_model.index(file_results.row, 0), True)
             self.num_files += 1
 
-            item_text = osp.join(item.rel_dirname, item.filename)
+            item_text = osp.join(
+                file_results.rel_dirname, osp.basename(filename))
             if len(item_text) > len(self.longest_file_item):
                 self.longest_file_item = item_text
 
     @Slot(object, object)
     def append_result(self, items, title):
         """Real-time update of line items."""
-        if len(self.data) >= self.max_results:
+        if self.results_model.num_matches >= self.max_results:
             self.set_title(_('Maximum number of results reached! Try '
                              'narrowing the search.'))
             self.sig_max_results_reached.emit()
             return
 
-        available = self.max_results - len(self.data)
+        available = self.max_results - self.results_model.num_matches
         if available < len(items):
             items = items[:available]
 
-        self.setUpdatesEnabled(False)
         self.set_title(title)
-        for item in items:
-            filename, lineno, colno, line, match_end = item
-            file_item = self.files.get(filename, None)
-            if file_item:
-                item = LineMatchItem(file_item, lineno, colno, line,
-                                     self.font, self.text_color)
-                self.data[id(item)] = (filename, lineno, colno, match_end)
-
-                if len(item.plain_match) > len(self.longest_line_item):
-                    self.longest_line_item = item.plain_match
+        self.results_model.add_matches(items)
 
-        self.setUpdatesEnabled(True)
+        for item in items:
+            line = item[3]
+            if len(line) > len(self.longest_line_item):
+                self.longest_line_item = str(line).rstrip()
 
     def set_max_results(self, value):
         """Set maximum amount of results to add."""
@@ -322,7 +614,7 @@ def set_path(self, path):
 
     def set_width(self):
         """Set widget width according to its longest item."""
-        if not self.data:
+        if not self.results_model.num_matches:
             return
 
         # File item width
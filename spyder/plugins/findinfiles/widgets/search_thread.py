@@ -7,10 +7,14 @@
 """Search thread."""
 
 # Standard library imports
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import functools
+import logging
+import multiprocessing
 import os
 import os.path as osp
 import re
-import stat
 import traceback
 
 # Third party imports
@@ -19,16 +23,110 @@
 # Local imports
 from spyder.api.translations import _
 from spyder.config.utils import EDIT_EXTENSIONS
-from spyder.utils.encoding import is_text_file
+from spyder.plugins.findinfiles.utils.search import (
+    find_matches_in_file, search_files)
+from spyder.plugins.findinfiles.utils.trigram_index import (
+    compute_signatures, get_index)
+from spyder.plugins.findinfiles.utils.walker import walk_files
 from spyder.utils.palette import SpyderPalette
 
 
 # ---- Constants
 # ----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
 ELLIPSIS = '...'
 MAX_RESULT_LENGTH = 80
 MAX_NUM_CHAR_FRAGMENT = 40
 
+# Number of files processed at once by a worker process
+FILES_PER_CHUNK = 64
+
+# Minimum number of files to use worker processes. Below it, starting them
+# takes longer than searching in this thread.
+MIN_FILES_FOR_WORKERS = 1000
+
+# Number of matches of a single file processed between checks of whether the
+# search was stopped
+MATCHES_PER_CHUNK = 512
+
+
+# ---- Functions
+# ----------------------------------------------------------------------------
+def truncate_result(line, start, end, text_color):
+    """
+    Shorten text on line to display the match within `max_line_length`.
+    """
+    html_escape_table = {
+        "&": "&amp;",
+        '"': "&quot;",
+        "'": "&apos;",
+        ">": "&gt;",
+        "<": "&lt;",
+    }
+
+    def html_escape(text):
+        """Produce entities within text."""
+        return "".join(html_escape_table.get(c, c) for c in text)
+
+    line = str(line)
+    left, match, right = line[:start], line[start:end], line[end:]
+
+    if len(line) > MAX_RESULT_LENGTH:
+        offset = (len(line) - len(match)) // 2
+
+        left = left.split(' ')
+        num_left_words = len(left)
+
+        if num_left_words == 1:
+            left = left[0]
+            if len(left) > MAX_NUM_CHAR_FRAGMENT:
+                left = ELLIPSIS + left[-offset:]
+            left = [left]
+
+        right = right.split(' ')
+        num_right_words = len(right)
+
+        if num_right_words == 1:
+            right = right[0]
+            if len(right) > MAX_NUM_CHAR_FRAGMENT:
+                right = right[:offset] + ELLIPSIS
+            right = [right]
+
+        left = left[-4:]
+        right = right[:4]
+
+        if len(left) < num_left_words:
+            left = [ELLIPSIS] + left
+
+        if len(right) < num_right_words:
+            right = right + [ELLIPSIS]
+
+        left = ' '.join(left)
+        right = ' '.join(right)
+
+        if len(left) > MAX_NUM_CHAR_FRAGMENT:
+            left = ELLIPSIS + left[-30:]
+
+        if len(right) > MAX_NUM_CHAR_FRAGMENT:
+            right = right[:30] + ELLIPSIS
+
+    match_color = SpyderPalette.COLOR_OCCURRENCE_4
+    trunc_line = dict(
+        text=''.join([left, match, right]),
+        formatted_text=(
+            f'<span style="color:{text_color}">'
+            f'{html_escape(left)}'
+            f'<span style="background-color:{match_color}">'
+            f'{html_escape(match)}'
+            f'</span>'
+            f'{html_escape(right)}'
+            f'</span>'
+        )
+    )
+
+    return trunc_line
+
 
 # ---- Thread
 # ----------------------------------------------------------------------------
@@ -77,12 +175,24 @@ def __init__(self, parent, search_text, text_color, max_results=1000):
         self.results = {}
 
         self.num_files = 0
-        self.files = []
+        self.files = set()
         self.partial_results = []
         self.total_items = 0
 
+        self.use_gitignore = True
+        self.index_root = None
+        self._executor = None
+
     def initialize(self, path, is_file, exclude,
-                   texts, text_re, case_sensitive):
+                   texts, text_re, case_sensitive,
+                   use_gitignore=True, index_root=None):
+        """
+        Set the search options.
+
+        If `use_gitignore` is True, files ignored by .gitignore files are not
+        searched. If `index_root` is a directory, a trigram index of it is
+        used to skip files that can't match the search text.
+        """
         self.rootpath = path
         if exclude:
             self.exclude = re.compile(exclude)
@@ -92,6 +202,8 @@ def initialize(self, path, is_file, exclude,
         self.stopped = False
         self.completed = False
         self.case_sensitive = case_sensitive
+        self.use_gitignore = use_gitignore
+        self.index_root = index_root
 
     def run(self):
         try:
@@ -106,6 +218,8 @@ def run(self):
             # (known QThread limitation/bug)
             traceback.print_exc()
             self.error_flag = _("Unexpected error: see internal console")
+        finally:
+            self._shutdown_executor()
         self.stop()
         self.sig_finished.emit(self.completed)
 
@@ -117,167 +231,87 @@ def find_files_in_path(self, path):
         if self.pathlist is None:
             self.pathlist = []
         self.pathlist.append(path)
-        for path, dirs, files in os.walk(path):
+
+        # Find the files to search in
+        files = []
+        for entry in walk_files(path, self.exclude, self.use_gitignore):
             with QMutexLocker(self.mutex):
                 if self.stopped:
                     return False
-            try:
-                # For directories
-                for d in dirs[:]:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    dirname = os.path.join(path, d)
-
-                    # Only search in regular directories
-                    st_dir_mode = os.stat(dirname).st_mode
-                    if not stat.S_ISDIR(st_dir_mode):
-                        dirs.remove(d)
-
-                    if (self.exclude and
-                            re.search(self.exclude, dirname + os.sep)):
-                        # Exclude patterns defined by the user
-                        dirs.remove(d)
-                    elif d.startswith('.'):
-                        # Exclude all dot dirs.
-                        dirs.remove(d)
-
-                # For files
-                for f in files:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    filename = os.path.join(path, f)
-                    ext = osp.splitext(filename)[1]
-
-                    # Only search in regular files (i.e. not pipes).
-                    # The try/except is necessary to catch an error when
-                    # Python can't get the file status due to too many levels
-                    # of symbolic links.
-                    # Fixes spyder-ide/spyder#20798
-                    try:
-                        st_file_mode = os.stat(filename).st_mode
-                        if not stat.S_ISREG(st_file_mode):
-                            continue
-                    except OSError:
-                        continue
-
-                    # Exclude patterns defined by the user
-                    if self.exclude and re.search(self.exclude, filename):
-                        continue
-
-                    # Don't search in plain text files with skipped extensions
-                    # (e.g .svg)
-                    if ext in self.SKIPPED_EXTENSIONS:
-                        continue
-
-                    # It's much faster to check for extension first before
-                    # validating if the file is plain text.
-                    if (
-                        ext in self.PYTHON_EXTENSIONS
-                        or ext in self.USEFUL_EXTENSIONS
-                        or ext in EDIT_EXTENSIONS
-                        or is_text_file(filename)
-                    ):
-                        self.find_string_in_file(filename)
-            except re.error:
-                self.error_flag = _("invalid regular expression")
-                return False
-            except FileNotFoundError:
+
+            ext = osp.splitext(entry.name)[1]
+
+            # Don't search in plain text files with skipped extensions
+            # (e.g .svg)
+            if ext in self.SKIPPED_EXTENSIONS:
+                continue
+
+            # It's much faster to check for extension first before
+            # validating if the file is plain text, which is done when
+            # searching in the file.
+            check_text = not (
+                ext in self.PYTHON_EXTENSIONS
+                or ext in self.USEFUL_EXTENSIONS
+                or ext in EDIT_EXTENSIONS
+            )
+            files.append((entry, check_text))
+
+        if self.index_root is not None and not self.text_re:
+            files = self._filter_with_index(files)
+            if files is None:
                 return False
 
+        # Search in files
+        search_function = functools.partial(
+            search_files,
+            texts=self.texts,
+            text_re=self.text_re,
+            case_sensitive=self.case_sensitive
+        )
+        files = [(entry.path, check_text) for entry, check_text in files]
+        self.error_flag = False
+        try:
+            for chunk_results in self._map(search_function, files):
+                with QMutexLocker(self.mutex):
+                    if self.stopped:
+                        return False
+
+                for fname, matches, error in chunk_results:
+                    self.sig_current_file.emit(fname)
+                    if error:
+                        self.error_flag = _(
+                            "permission denied errors were encountered")
+                    for lineno, start, end, line in matches:
+                        self._add_result(fname, lineno, start, end, line)
+        except re.error:
+            self.error_flag = _("invalid regular expression")
+            return False
+
         # Process any pending results
         if self.partial_results:
             self.process_results()
 
+        self.completed = True
         return True
 
     def find_string_in_file(self, fname):
         self.error_flag = False
         self.sig_current_file.emit(fname)
         try:
-            for lineno, line in enumerate(open(fname, 'rb')):
-                for text, enc in self.texts:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    line_search = line
-                    if not self.case_sensitive:
-                        line_search = line_search.lower()
-                    if self.text_re:
-                        found = re.search(text, line_search)
-                        if found is not None:
-                            break
-                    else:
-                        found = line_search.find(text)
-                        if found > -1:
-                            break
-                try:
-                    line_dec = line.decode(enc)
-                except UnicodeDecodeError:
-                    line_dec = line
-
-                if not self.case_sensitive:
-                    line = line.lower()
-
-                if self.text_re:
-                    for match in re.finditer(text, line):
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        bstart, bend = match.start(), match.end()
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:bstart].decode(enc))
-                            end = start + len(line[bstart:bend].decode(enc))
-                        except UnicodeDecodeError:
-                            start = bstart
-                            end = bend
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-                else:
-                    found = line.find(text)
-                    while found > -1:
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:found].decode(enc))
-                            end = start + len(text.decode(enc))
-                        except UnicodeDecodeError:
-                            start = found
-                            end = found + len(text)
-
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-
-                        for text, enc in self.texts:
-                            found = line.find(text, found + 1)
-                            if found > -1:
-                                break
-        except IOError as xxx_todo_changeme:
-            (_errno, _strerror) = xxx_todo_changeme.args
+            matches = find_matches_in_file(
+                fname, self.texts, self.text_re, self.case_sensitive)
+        except OSError:
+            matches = []
             self.error_flag = _("permission denied errors were encountered")
 
+        fname = osp.abspath(fname)
+        for i, (lineno, start, end, line) in enumerate(matches):
+            if i % MATCHES_PER_CHUNK == 0:
+                with QMutexLocker(self.mutex):
+                    if self.stopped:
+                        return False
+            self._add_result(fname, lineno, start, end, line)
+
         # Process any pending results
         if self.is_file and self.partial_results:
             self.process_results()
@@ -291,8 +325,8 @@ def process_results(self):
         Creates the necessary files and emits signal for the creation of file
         item.
 
-        Creates the necessary data for lines found and emits signal for the
-        creation of line items in batch.
+        Emits the lines found in batch. They are truncated and formatted
+        later by the results model, only when they are displayed.
 
         Creates the title based on the last entry of the lines batch.
         """
@@ -303,11 +337,10 @@ def process_results(self):
                 filename, lineno, colno, match_end, line = result
 
                 if filename not in self.files:
-                    self.files.append(filename)
+                    self.files.add(filename)
                     self.sig_file_match.emit(filename)
                     self.num_files += 1
 
-                line = self.truncate_result(line, colno, match_end)
                 item = (filename, lineno, colno, line, match_end)
                 items.append(item)
                 self.total_items += 1
@@ -333,75 +366,95 @@ def truncate_result(self, line, start, end):
         """
         Shorten text on line to display the match within `max_line_length`.
         """
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&apos;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
-
-        def html_escape(text):
-            """Produce entities within text."""
-            return "".join(html_escape_table.get(c, c) for c in text)
-
-        line = str(line)
-        left, match, right = line[:start], line[start:end], line[end:]
-
-        if len(line) > MAX_RESULT_LENGTH:
-            offset = (len(line) - len(match)) // 2
+        return truncate_result(line, start, end, self.text_color)
 
-            left = left.split(' ')
-            num_left_words = len(left)
-
-            if num_left_words == 1:
-                left = left[0]
-                if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                    left = ELLIPSIS + left[-offset:]
-                left = [left]
-
-            right = right.split(' ')
-            num_right_words = len(right)
-
-            if num_right_words == 1:
-                right = right[0]
-                if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                    right = right[:offset] + ELLIPSIS
-                right = [right]
-
-            left = left[-4:]
-            right = right[:4]
-
-            if len(left) < num_left_words:
-                left = [ELLIPSIS] + left
-
-            if len(right) < num_right_words:
-                right = right + [ELLIPSIS]
+    def get_results(self):
+        return self.results, self.pathlist, self.total_matches, self.error_flag
 
-            left = ' '.join(left)
-            right = ' '.join(right)
+    # ---- Private API
+    def _add_result(self, fname, lineno, start, end, line):
+        """Add a match to the results, processing them in batches."""
+        self.total_matches += 1
+        self.partial_results.append((fname, lineno, start, end, line))
+        if len(self.partial_results) > (2**self.power):
+            self.process_results()
+            if self.power < self.max_power:
+                self.power += 1
 
-            if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                left = ELLIPSIS + left[-30:]
+    def _filter_with_index(self, files):
+        """
+        Keep only the files that may contain the search text according to
+        the trigram index, updating it first.
 
-            if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                right = right[:30] + ELLIPSIS
-
-        match_color = SpyderPalette.COLOR_OCCURRENCE_4
-        trunc_line = dict(
-            text=''.join([left, match, right]),
-            formatted_text=(
-                f'<span style="color:{self.text_color}">'
-                f'{html_escape(left)}'
-                f'<span style="background-color:{match_color}">'
-                f'{html_escape(match)}'
-                f'</span>'
-                f'{html_escape(right)}'
-                f'</span>'
+        Returns None if the search was stopped.
+        """
+        index = get_index(self.index_root)
+        outdated = index.get_outdated([entry for entry, __ in files])
+        try:
+            for signatures in self._map(compute_signatures, list(outdated)):
+                index.update(outdated, signatures)
+                with QMutexLocker(self.mutex):
+                    if self.stopped:
+                        return None
+        finally:
+            index.save()
+
+        candidates = set(
+            index.filter(
+                [entry.path for entry, __ in files],
+                [text for text, __ in self.texts]
             )
         )
+        return [item for item in files if item[0].path in candidates]
 
-        return trunc_line
+    def _map(self, function, items):
+        """
+        Apply function to chunks of items.
 
-    def get_results(self):
-        return self.results, self.pathlist, self.total_matches, self.error_flag
+        This is done in worker processes if there are enough items and in this
+        thread otherwise, or if worker processes can't be started.
+        """
+        chunks = [
+            items[i:i + FILES_PER_CHUNK]
+            for i in range(0, len(items), FILES_PER_CHUNK)
+        ]
+
+        done = 0
+        if len(items) >= MIN_FILES_FOR_WORKERS:
+            executor = self._get_executor()
+            if executor is not None:
+                try:
+                    for result in executor.map(function, chunks):
+                        yield result
+                        done += 1
+                except BrokenProcessPool:
+                    logger.debug("Worker processes failed", exc_info=True)
+                    self._shutdown_executor()
+
+        for chunk in chunks[done:]:
+            yield function(chunk)
+
+    def _get_executor(self):
+        """Return the pool of worker processes, starting it if needed."""
+        if self._executor is None:
+            # Spawn processes to avoid forking a multithreaded process
+            try:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=max(1, (os.cpu_count() or 2) - 1),
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+            except (OSError, ValueError, NotImplementedError):
+                logger.debug("Unable to start worker processes",
+                             exc_info=True)
+                return None
+        return self._executor
+
+    def _shutdown_executor(self):
+        """Stop the worker processes, discarding pending work."""
+        if self._executor is not None:
+            try:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:
+                # cancel_futures was added in Python 3.9
+                self._executor.shutdown(wait=False)
+            self._executor = None
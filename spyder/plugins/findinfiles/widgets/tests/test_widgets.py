@@ -16,7 +16,7 @@
 # Third party imports
 from flaky import flaky
 import pytest
-from qtpy.QtCore import Qt
+from qtpy.QtCore import QModelIndex, QPersistentModelIndex, Qt
 from qtpy.QtWidgets import QMessageBox
 
 # Local imports
@@ -27,6 +27,8 @@
     SearchInComboBox,
     SearchInComboBoxItems
 )
+from spyder.plugins.findinfiles.widgets.results_browser import (
+    MAX_CACHED_DISPLAYS)
 from spyder.plugins.findinfiles.widgets.search_thread import SearchThread
 from spyder.utils.palette import QStylePalette, SpyderPalette
 from spyder.utils.stylesheet import APP_STYLESHEET
@@ -38,13 +40,13 @@
     os.makedirs(NONASCII_DIR)
 
 
-def process_search_results(results):
+def process_search_results(result_browser):
     """
     Transform result representation from the output of the widget to the
     test framework comparison representation.
     """
     matches = {}
-    for result in results.values():
+    for result in result_browser.get_matches():
         file, line, col, __ = result
         filename = osp.basename(file)
         if filename not in matches:
@@ -149,7 +151,7 @@ def test_find_in_files_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     assert expected_results() == matches
 
 
@@ -162,7 +164,7 @@ def test_exclude_extension_regex(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -181,7 +183,7 @@ def test_exclude_extension_string(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -200,7 +202,7 @@ def test_exclude_extension_empty_regex(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     assert expected_results() == matches
 
 
@@ -213,7 +215,7 @@ def test_exclude_extension_string_no_regexp(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     assert expected_results() == matches
 
 
@@ -226,7 +228,7 @@ def test_exclude_extension_multiple_string(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -273,7 +275,7 @@ def test_case_unsensitive_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     print(matches)
     assert expected_case_unsensitive_results() == matches
 
@@ -287,7 +289,7 @@ def test_case_sensitive_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     print(matches)
     assert matches == {'ham.txt': [(9, 0)]}
 
@@ -336,19 +338,67 @@ def test_no_empty_file_items(findinfiles, qtbot):
     # expected because os.walk (used by findinfiles) gives an arbitrary file
     # ordering.)
     spamfiles = set(['spam.py', 'spam.txt', 'spam.cpp'])
-    find_results = process_search_results(findinfiles.result_browser.data)
+    find_results = process_search_results(findinfiles.result_browser)
     assert set(find_results.keys()).issubset(spamfiles)
     assert sum(len(finds) for finds in find_results.values()) == max_results
 
     # Assert that the files with results are exactly the same as those
     # displayed in the results browser.
     files_with_results = set(
-        [v[0] for v in findinfiles.result_browser.data.values()]
+        [v[0] for v in findinfiles.result_browser.get_matches()]
     )
-    displayed_files = set(findinfiles.result_browser.files.keys())
+    displayed_files = set(findinfiles.result_browser.get_files())
     assert files_with_results == displayed_files
 
 
+def test_results_model(findinfiles, qtbot):
+    """
+    Test that the results model stores a large number of matches and builds
+    the text of only the ones that are displayed.
+    """
+    browser = findinfiles.result_browser
+    browser.set_max_results(200000)
+    browser.set_path(LOCATION)
+    browser.clear_title('spam')
+    model = browser.results_model
+
+    filenames = [osp.join(LOCATION, name) for name in ['b.py', 'a.py']]
+    for filename in filenames:
+        browser.append_file_result(filename)
+        items = [
+            (filename, lineno, 4, 'foo spam bar', 8)
+            for lineno in range(1, 100001)
+        ]
+        browser.append_result(items, 'title')
+
+    assert model.num_matches == 200000
+    assert model.rowCount() == 2
+    file_index = model.index(1, 0)
+    assert model.rowCount(file_index) == 100000
+
+    # Matches
+    index = model.index(99, 0, file_index)
+    assert model.get_match(index) == (filenames[1], 100, 4, 8)
+    assert model.get_match(file_index) is None
+    assert model.parent(index) == file_index
+    assert '<b>100</b> (4)' in model.data(index)
+    assert len(model._display_cache) <= MAX_CACHED_DISPLAYS
+
+    # Results over the maximum are discarded
+    with qtbot.waitSignal(browser.sig_max_results_reached):
+        browser.append_result([(filenames[0], 1, 4, 'spam', 8)], 'title')
+    assert model.num_matches == 200000
+
+    # Sorting moves files and their matches with them
+    browser.setExpanded(file_index, True)
+    persistent_index = QPersistentModelIndex(index)
+    model.sort(0)
+    assert model.get_files() == filenames[::-1]
+    assert browser.isExpanded(model.index(0, 0))
+    assert persistent_index.parent().row() == 0
+    assert model.get_match(QModelIndex(persistent_index))[0] == filenames[1]
+
+
 # ---- Tests for SearchInComboBox
 
 def test_add_external_paths(searchin_combobox, mocker):
@@ -720,8 +770,9 @@ def test_max_results(findinfiles, qtbot):
     blocker = qtbot.waitSignal(findinfiles.sig_max_results_reached)
     blocker.wait()
 
-    print(len(findinfiles.result_browser.data), value)
-    assert len(findinfiles.result_browser.data) == value
+    num_matches = findinfiles.result_browser.results_model.num_matches
+    print(num_matches, value)
+    assert num_matches == value
 
     # Restore defaults
     findinfiles.set_max_results(1000)
@@ -742,7 +793,7 @@ def test_find_in_single_file(findinfiles, qtbot):
     with qtbot.waitSignal(findinfiles.sig_finished):
         findinfiles.find()
 
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(findinfiles.result_browser)
     assert list(matches.keys()) == ['spam.txt']
     assert expected_results()['spam.txt'] == matches['spam.txt']
 
@@ -259,6 +259,41 @@ def setup_page(self):
         run_file_layout.addWidget(run_file_browser)
         run_file_group.setLayout(run_file_layout)
 
+        # Kernel pool group
+        pool_group = QGroupBox(_("Pre-started kernels"))
+        pool_label = QLabel(_("Kernels are started in advance for the "
+                              "interpreters used most recently, so that new "
+                              "consoles are ready right away. Modules can "
+                              "also be imported in them in advance."))
+        pool_label.setWordWrap(True)
+        pool_size_spin = self.create_spinbox(
+            _("Kernels per interpreter:"), "", 'kernel_pool_size',
+            min_=0, max_=10, step=1,
+            tip=_("Set it to 0 to not start kernels in advance"))
+        pool_specs_spin = self.create_spinbox(
+            _("Interpreters:"), "", 'kernel_pool_max_specs',
+            min_=1, max_=10, step=1,
+            tip=_("Maximum number of interpreters with kernels started in "
+                  "advance"))
+        pool_memory_spin = self.create_spinbox(
+            _("Maximum memory:"), _(" MB"), 'kernel_pool_max_memory',
+            min_=0, max_=65536, step=256,
+            tip=_("Memory that can be used by all the kernels started in "
+                  "advance. Set it to 0 for no limit"))
+        pool_modules_edit = self.create_lineedit(
+            _("Modules to import:"), 'kernel_pool_preload_modules', '',
+            _("Comma-separated list of modules, for example:<br>"
+              "<i>numpy, pandas, matplotlib.pyplot</i>"),
+            alignment=Qt.Horizontal)
+
+        pool_layout = QVBoxLayout()
+        pool_layout.addWidget(pool_label)
+        pool_layout.addWidget(pool_size_spin)
+        pool_layout.addWidget(pool_specs_spin)
+        pool_layout.addWidget(pool_memory_spin)
+        pool_layout.addWidget(pool_modules_edit)
+        pool_group.setLayout(pool_layout)
+
         # ---- Advanced settings ----
         # Enable Jedi completion
         jedi_group = QGroupBox(_("Jedi completion"))
@@ -431,7 +466,7 @@ def setup_page(self):
 
         self.create_tab(
             _("Startup"),
-            [run_lines_group, run_file_group]
+            [run_lines_group, run_file_group, pool_group]
         )
 
         self.create_tab(
@@ -1071,9 +1071,9 @@ def test_kernel_crash(ipyconsole, qtbot):
             timeout=6000)
 
         # Wait until the error has been received by the cached kernel_handler
-        qtbot.waitUntil(lambda: bool(
-            ipyconsole.get_widget()._cached_kernel_properties[-1]._init_stderr
-        ))
+        kernel_pool = ipyconsole.get_widget()._kernel_pool
+        qtbot.waitUntil(
+            lambda: bool(kernel_pool[0].kernel_handlers[0]._init_stderr))
 
         # Create a new client
         ipyconsole.create_new_client()
@@ -2100,7 +2100,7 @@ def test_old_kernel_version(ipyconsole, qtbot):
     # Set a false _spyder_kernels_version in the cached kernel
     w = ipyconsole.get_widget()
 
-    kernel_handler = w._cached_kernel_properties[-1]
+    kernel_handler = w._kernel_pool[0].kernel_handlers[0]
     kernel_handler.kernel_client.sig_spyder_kernel_info.disconnect()
 
     # Wait until it is launched
@@ -2124,6 +2124,43 @@ def test_old_kernel_version(ipyconsole, qtbot):
     assert "pip install spyder" in control.toPlainText()
 
 
+def test_kernel_pool(ipyconsole, qtbot):
+    """Test that kernels are started in advance for new consoles."""
+    w = ipyconsole.get_widget()
+    w.set_conf('kernel_pool_size', 2)
+    w.set_conf('kernel_pool_preload_modules', 'json, nonexistent_module')
+
+    # Creating a console fills the pool of its kernel spec
+    w.create_new_client()
+    assert len(w._kernel_pool) == 1
+    kernel_handlers = list(w._kernel_pool[0].kernel_handlers)
+    assert len(kernel_handlers) == 2
+
+    # The next console uses the oldest kernel of the pool
+    w.create_new_client()
+    shell = w.get_current_shellwidget()
+    qtbot.waitUntil(lambda: shell._prompt_html is not None,
+                    timeout=SHELL_TIMEOUT)
+    assert shell.kernel_handler.kernel_manager is (
+        kernel_handlers[0].kernel_manager)
+    assert w._kernel_pool[0].kernel_handlers[0] is kernel_handlers[1]
+    assert len(w._kernel_pool[0].kernel_handlers) == 2
+
+    # Preloaded modules are imported without adding names to the namespace
+    with qtbot.waitSignal(shell.executed):
+        shell.execute("import sys; loaded = 'json' in sys.modules")
+    assert shell.get_value('loaded')
+    with pytest.raises(KeyError):
+        shell.get_value('importlib')
+
+    # Closing the cached kernels empties the pool
+    w.close_cached_kernel()
+    assert w._kernel_pool == []
+
+    w.set_conf('kernel_pool_size', 1)
+    w.set_conf('kernel_pool_preload_modules', '')
+
+
 def test_run_script(ipyconsole, qtbot, tmp_path):
     """
     Test running multiple scripts at the same time.
@@ -178,6 +178,8 @@ def env(self):
                 'umr/enabled', section='main_interpreter'),
             'SPY_UMR_VERBOSE': self.get_conf(
                 'umr/verbose', section='main_interpreter'),
+            'SPY_UMR_SELECTIVE': self.get_conf(
+                'umr/selective', section='main_interpreter'),
             'SPY_UMR_NAMELIST': ','.join(umr_namelist),
             'SPY_AUTOCALL_O': self.get_conf('autocall'),
             'SPY_GREEDY_O': self.get_conf('greedy_completer'),
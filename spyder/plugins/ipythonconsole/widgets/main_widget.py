@@ -2036,6 +2036,11 @@ def norm(text):
                 magic_arguments.append(str(cell_name))
                 magic_arguments.append(norm(filename))
                 line = "%" + method + " " + shlex.join(magic_arguments)
+                if not client.shellwidget._executing:
+                    # The command is queued otherwise, so the code could be
+                    # discarded before it runs.
+                    self._send_file_code(
+                        client.shellwidget, norm(filename), save_all=False)
             elif method == 'runcell':
                 # Use copy of cell
                 line = code.strip()
@@ -2141,18 +2146,27 @@ def run_script(self, filename, wdir, args, post_mortem, current_client,
                     # Fixes spyder-ide/spyder#7293.
                     pass
                 elif current_client:
+                    if client.shellwidget.is_spyder_kernel:
+                        self._send_file_code(
+                            client.shellwidget, norm(filename))
                     self.execute_code(line, current_client, clear_variables)
                 else:
                     if is_new_client:
                         client.shellwidget.silent_execute('%clear')
                     else:
                         client.shellwidget.execute('%clear')
-                    client.shellwidget.sig_prompt_ready.connect(
-                        lambda: self.execute_code(
+
+                    def execute_script():
+                        if client.shellwidget.is_spyder_kernel:
+                            self._send_file_code(
+                                client.shellwidget, norm(filename))
+                        self.execute_code(
                             line, current_client, clear_variables,
                             shellwidget=client.shellwidget
                         )
-                    )
+
+                    client.shellwidget.sig_prompt_ready.connect(
+                        execute_script)
             except AttributeError:
                 pass
 
@@ -2167,6 +2181,24 @@ def run_script(self, filename, wdir, args, post_mortem, current_client,
                 QMessageBox.Ok
             )
 
+    def _send_file_code(self, shellwidget, filename, save_all=True):
+        """
+        Send the code of a file that is about to be run to the kernel of
+        shellwidget, so that the kernel doesn't have to wait for it.
+        """
+        handler = self.registered_spyder_kernel_handlers.get('get_file_code')
+        if handler is None or shellwidget.is_debugging():
+            return
+
+        try:
+            code = handler(filename, save_all=save_all)
+        except Exception:
+            # The kernel will request it and show the error
+            return
+
+        if isinstance(code, str):
+            shellwidget.send_file_code(filename, code)
+
     # ---- For working directory and path management
     def set_working_directory(self, dirname):
         """
@@ -8,35 +8,79 @@
 IPython Console mixins.
 """
 
+# Third party imports
+import psutil
+
 # Local imports
-from spyder.plugins.ipythonconsole.utils.kernel_handler import KernelHandler
+from spyder.plugins.ipythonconsole.utils.kernel_handler import (
+    KernelConnectionState, KernelHandler)
+
+
+# Code run in warm kernels to import the modules listed in the preferences.
+# It's executed in its own namespace to leave the one of users untouched,
+# and modules that fail to import are skipped.
+PRELOAD_CODE = """\
+import importlib
+for name in {modules!r}:
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass
+"""
+
+
+class KernelPoolEntry:
+    """Pre-started kernels for a kernel spec."""
+
+    def __init__(self, kernel_spec):
+        self.kernel_spec = kernel_spec
+        self.env = kernel_spec.env
+        self.argv = kernel_spec.argv
+
+        # Kernels in the order they were started, so that the first one is
+        # the most likely to be ready.
+        self.kernel_handlers = []
 
 
 class CachedKernelMixin:
-    """Cached kernel mixin."""
+    """
+    Cached kernel mixin.
+
+    A pool of pre-started kernels is kept for the kernel specs that were
+    used most recently, so that new consoles don't have to wait for their
+    kernel to start.
+    """
 
     def __init__(self):
         super().__init__()
-        self._cached_kernel_properties = None
+
+        # Entries of the kernel pool, from the most to the least recently
+        # used.
+        self._kernel_pool = []
+
+        # Slots connected to sig_kernel_is_ready of warm kernels, to
+        # disconnect them when the kernels are used.
+        self._preload_slots = {}
 
     def close_cached_kernel(self):
-        """Close the cached kernel."""
-        if self._cached_kernel_properties is None:
-            return
-        kernel = self._cached_kernel_properties[-1]
-        kernel.close(now=True)
-        self._cached_kernel_properties = None
+        """Close all the cached kernels."""
+        for entry in self._kernel_pool:
+            for kernel_handler in entry.kernel_handlers:
+                self._close_pool_kernel(kernel_handler)
+        self._kernel_pool = []
 
-    def check_cached_kernel_spec(self, kernel_spec):
-        """Test if kernel_spec corresponds to the cached kernel_spec."""
-        if self._cached_kernel_properties is None:
-            return False
-        (
-            cached_spec,
-            cached_env,
-            cached_argv,
-            _,
-        ) = self._cached_kernel_properties
+    def check_cached_kernel_spec(self, kernel_spec, entry=None):
+        """
+        Test if kernel_spec corresponds to the one of a pool entry (the most
+        recently used one by default).
+        """
+        if entry is None:
+            if not self._kernel_pool:
+                return False
+            entry = self._kernel_pool[0]
+
+        cached_spec = entry.kernel_spec
+        cached_env = entry.env
 
         # Call interrupt_mode so the dict will be the same
         kernel_spec.interrupt_mode
@@ -49,42 +93,160 @@ def check_cached_kernel_spec(self, kernel_spec):
                 kernel_spec.env["PYTEST_CURRENT_TEST"])
         return (
             cached_spec.__dict__ == kernel_spec.__dict__
-            and kernel_spec.argv == cached_argv
+            and kernel_spec.argv == entry.argv
             and kernel_spec.env == cached_env
         )
 
     def get_cached_kernel(self, kernel_spec, cache=True):
-        """Get a new kernel, and cache one for next time."""
-        # Cache another kernel for next time.
-        new_kernel_handler = KernelHandler.new_from_spec(kernel_spec)
-
-        if not cache:
+        """
+        Get a kernel for kernel_spec, from the pool if possible, and refill
+        the pool for next time.
+        """
+        pool_size = self.get_conf('kernel_pool_size')
+        if not cache or pool_size <= 0:
             # remove/don't use cache if requested
             self.close_cached_kernel()
-            return new_kernel_handler
-
-        # Check cached kernel has the same configuration as is being asked or
-        # it crashed.
-        cached_kernel_handler = None
-        if self._cached_kernel_properties is not None:
-            cached_kernel_handler = self._cached_kernel_properties[-1]
-            if (
-                not self.check_cached_kernel_spec(kernel_spec)
-                or cached_kernel_handler._init_stderr
-            ):
-                # Close the kernel
-                self.close_cached_kernel()
-                cached_kernel_handler = None
-
-        # Cache the new kernel
-        self._cached_kernel_properties = (
-            kernel_spec,
-            kernel_spec.env,
-            kernel_spec.argv,
-            new_kernel_handler,
-        )
-
-        if cached_kernel_handler is None:
             return KernelHandler.new_from_spec(kernel_spec)
 
-        return cached_kernel_handler
+        self._check_pool_health()
+
+        entry = None
+        for pool_entry in self._kernel_pool:
+            if self.check_cached_kernel_spec(kernel_spec, pool_entry):
+                entry = pool_entry
+                break
+
+        if entry is None:
+            entry = KernelPoolEntry(kernel_spec)
+        else:
+            self._kernel_pool.remove(entry)
+        self._kernel_pool.insert(0, entry)
+
+        if entry.kernel_handlers:
+            kernel_handler = entry.kernel_handlers.pop(0)
+            self._disconnect_preload(kernel_handler)
+        else:
+            kernel_handler = KernelHandler.new_from_spec(kernel_spec)
+
+        # Start kernels for next time
+        while len(entry.kernel_handlers) < pool_size:
+            entry.kernel_handlers.append(self._new_pool_kernel(kernel_spec))
+
+        # Evict the least recently used specs
+        max_specs = max(self.get_conf('kernel_pool_max_specs'), 1)
+        for old_entry in self._kernel_pool[max_specs:]:
+            for old_kernel_handler in old_entry.kernel_handlers:
+                self._close_pool_kernel(old_kernel_handler)
+        del self._kernel_pool[max_specs:]
+
+        self._check_pool_memory()
+        return kernel_handler
+
+    # ---- Private API
+    def _new_pool_kernel(self, kernel_spec):
+        """Start a kernel for the pool."""
+        kernel_handler = KernelHandler.new_from_spec(kernel_spec)
+
+        modules = [
+            module.strip()
+            for module in self.get_conf('kernel_pool_preload_modules').split(
+                ',')
+            if module.strip()
+        ]
+        if modules:
+            def preload():
+                self._disconnect_preload(kernel_handler)
+                code = PRELOAD_CODE.format(modules=modules)
+                kernel_handler.kernel_client.execute(
+                    "exec({!r}, {{}})".format(code),
+                    silent=True,
+                    store_history=False
+                )
+
+            self._preload_slots[kernel_handler] = preload
+            kernel_handler.sig_kernel_is_ready.connect(preload)
+
+        return kernel_handler
+
+    def _close_pool_kernel(self, kernel_handler):
+        """Close a kernel of the pool."""
+        self._disconnect_preload(kernel_handler)
+        kernel_handler.close(now=True)
+
+    def _disconnect_preload(self, kernel_handler):
+        """Stop preloading modules in a kernel of the pool."""
+        preload = self._preload_slots.pop(kernel_handler, None)
+        if preload is not None:
+            try:
+                kernel_handler.sig_kernel_is_ready.disconnect(preload)
+            except (TypeError, RuntimeError):
+                pass
+
+    def _is_pool_kernel_healthy(self, kernel_handler):
+        """
+        Check that a kernel of the pool can be used.
+
+        Kernels with connection errors are kept, so that the error is shown
+        in the console that uses them.
+        """
+        if kernel_handler._init_stderr:
+            return False
+        if kernel_handler.connection_state in [
+            KernelConnectionState.Crashed,
+            KernelConnectionState.Closed,
+        ]:
+            return False
+        try:
+            return kernel_handler.kernel_manager.is_alive()
+        except Exception:
+            return False
+
+    def _check_pool_health(self):
+        """Close the kernels of the pool that crashed or had errors."""
+        for entry in self._kernel_pool:
+            healthy = []
+            for kernel_handler in entry.kernel_handlers:
+                if self._is_pool_kernel_healthy(kernel_handler):
+                    healthy.append(kernel_handler)
+                else:
+                    self._close_pool_kernel(kernel_handler)
+            entry.kernel_handlers = healthy
+
+    def _get_kernel_memory(self, kernel_handler):
+        """Get the memory used by a kernel and its subprocesses, in MB."""
+        try:
+            pid = kernel_handler.kernel_manager.provisioner.process.pid
+            process = psutil.Process(pid)
+            processes = [process] + process.children(recursive=True)
+        except Exception:
+            return 0
+
+        memory = 0
+        for process in processes:
+            try:
+                memory += process.memory_info().rss
+            except (psutil.AccessDenied, psutil.NoSuchProcess):
+                pass
+        return memory / 2**20
+
+    def _check_pool_memory(self):
+        """
+        Close kernels of the pool, starting with the least recently used
+        specs, until they use less memory than the maximum set in the
+        preferences.
+        """
+        max_memory = self.get_conf('kernel_pool_max_memory')
+        if max_memory <= 0:
+            return
+
+        memory = {
+            kernel_handler: self._get_kernel_memory(kernel_handler)
+            for entry in self._kernel_pool
+            for kernel_handler in entry.kernel_handlers
+        }
+        total = sum(memory.values())
+        for entry in reversed(self._kernel_pool):
+            while entry.kernel_handlers and total > max_memory:
+                kernel_handler = entry.kernel_handlers.pop()
+                total -= memory[kernel_handler]
+                self._close_pool_kernel(kernel_handler)
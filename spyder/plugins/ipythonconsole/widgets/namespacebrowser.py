@@ -35,32 +35,19 @@ class NamepaceBrowserWidget(RichJupyterWidget):
     # --- Public API --------------------------------------------------
     def get_value(self, name):
         """Ask kernel for a value"""
-        reason_big = _("The variable is too big to be retrieved")
-        reason_not_picklable = _("The variable is not picklable")
-        reason_dead = _("The kernel is dead")
-        reason_other = _("An unkown error occurred. Check the console because "
-                         "its contents could have been printed there")
-        reason_comm = _("The comm channel is not working")
-        msg = _("<br><i>%s.</i><br><br><br>"
-                "<b>Note</b>: Please don't report this problem on Github, "
-                "there's nothing to do about it.")
-        try:
-            return self.call_kernel(
-                blocking=True,
-                display_error=True,
-                timeout=CALL_KERNEL_TIMEOUT).get_value(name)
-        except TimeoutError:
-            raise ValueError(msg % reason_big)
-        except (PicklingError, UnpicklingError, TypeError):
-            raise ValueError(msg % reason_not_picklable)
-        except RuntimeError:
-            raise ValueError(msg % reason_dead)
-        except KeyError:
-            raise
-        except CommError:
-            raise ValueError(msg % reason_comm)
-        except Exception:
-            raise ValueError(msg % reason_other)
+        return self._get_from_kernel('get_value', name)
+
+    def open_view_handle(self, name):
+        """Ask kernel for a handle to view a variable without getting it"""
+        return self._get_from_kernel('open_view_handle', name)
+
+    def get_from_view_handle(self, method, handle_id, *args):
+        """Ask kernel for part of the data viewed by a handle"""
+        return self._get_from_kernel(method, handle_id, *args)
+
+    def close_view_handle(self, handle_id):
+        """Release a view handle in the kernel"""
+        self.call_kernel(blocking=False).close_view_handle(handle_id)
 
     def set_value(self, name, value):
         """Set value for a variable"""
@@ -85,3 +72,34 @@ def copy_value(self, orig_name, new_name):
             blocking=False,
             display_error=True,
             ).copy_value(orig_name, new_name)
+
+    # --- Private API -------------------------------------------------
+    def _get_from_kernel(self, method, *args):
+        """Make a blocking call to the kernel and translate its errors"""
+        reason_big = _("The variable is too big to be retrieved")
+        reason_not_picklable = _("The variable is not picklable")
+        reason_dead = _("The kernel is dead")
+        reason_other = _("An unkown error occurred. Check the console because "
+                         "its contents could have been printed there")
+        reason_comm = _("The comm channel is not working")
+        msg = _("<br><i>%s.</i><br><br><br>"
+                "<b>Note</b>: Please don't report this problem on Github, "
+                "there's nothing to do about it.")
+        try:
+            kernel_call = self.call_kernel(
+                blocking=True,
+                display_error=True,
+                timeout=CALL_KERNEL_TIMEOUT)
+            return getattr(kernel_call, method)(*args)
+        except TimeoutError:
+            raise ValueError(msg % reason_big)
+        except (PicklingError, UnpicklingError, TypeError):
+            raise ValueError(msg % reason_not_picklable)
+        except RuntimeError:
+            raise ValueError(msg % reason_dead)
+        except KeyError:
+            raise
+        except CommError:
+            raise ValueError(msg % reason_comm)
+        except Exception:
+            raise ValueError(msg % reason_other)
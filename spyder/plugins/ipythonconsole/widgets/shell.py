@@ -9,6 +9,7 @@
 """
 
 # Standard library imports
+import hashlib
 import os
 import os.path as osp
 import time
@@ -173,6 +174,9 @@ def __init__(self, ipyclient, additional_options, interpreter_versions,
         self.is_kernel_configured = False
         self._init_kernel_setup = False
 
+        # Versions of the code of the files sent to the kernel
+        self._file_code_versions = {}
+
         if handlers is None:
             handlers = {}
         else:
@@ -383,6 +387,7 @@ def setup_spyder_kernel(self):
         # Setup to do after restart
         # Check for fault and send config
         self.kernel_handler.poll_fault_text()
+        self._file_code_versions = {}
 
         self.send_spyder_kernel_configuration()
 
@@ -449,6 +454,29 @@ def set_kernel_configuration(self, key, value):
 
         self._kernel_configuration[key] = value
 
+    def send_file_code(self, filename, code):
+        """
+        Send the code of a file that is about to be run, so that the kernel
+        doesn't need to request it.
+
+        Only the version of the code is sent if the kernel already has it.
+        """
+        version = hashlib.sha1(
+            code.encode('utf-8', 'surrogatepass')).hexdigest()
+
+        def file_code_callback(is_set):
+            if not is_set:
+                # Send the code again next time
+                self._file_code_versions.pop(filename, None)
+
+        if self._file_code_versions.get(filename) == version:
+            self.call_kernel(callback=file_code_callback).set_file_code(
+                filename, version)
+        else:
+            self._file_code_versions[filename] = version
+            self.call_kernel(callback=file_code_callback).set_file_code(
+                filename, version, code)
+
     def kernel_configure_callback(self, dic):
         """Kernel configuration callback"""
         for key, value in dic.items():
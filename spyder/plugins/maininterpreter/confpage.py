@@ -142,6 +142,17 @@ def setup_page(self):
             msg_info=_("Please note that these changes will "
                        "be applied only to new consoles"),
         )
+        umr_selective_box = newcb(
+            _("Only reload modules that changed and the ones that import "
+              "them"),
+            'umr/selective',
+            tip=_("Check the source files of user modules before running a "
+                  "file and only reload the ones that were edited,<br>"
+                  "instead of all of them. This is faster for large "
+                  "projects."),
+            msg_info=_("Please note that these changes will "
+                       "be applied only to new consoles"),
+        )
         umr_namelist_btn = QPushButton(
             _("Set UMR excluded (not reloaded) modules"))
         umr_namelist_btn.clicked.connect(self.set_umr_namelist)
@@ -150,6 +161,7 @@ def setup_page(self):
         umr_layout.addWidget(umr_label)
         umr_layout.addWidget(umr_enabled_box)
         umr_layout.addWidget(umr_verbose_box)
+        umr_layout.addWidget(umr_selective_box)
         umr_layout.addWidget(umr_namelist_btn)
         umr_group.setLayout(umr_layout)
 
@@ -35,7 +35,18 @@ def setup_page(self):
         results_layout.addWidget(results_label2)
         results_group.setLayout(results_layout)
 
+        sampling_group = QGroupBox(_("Console sampling"))
+        sampling_interval = self.create_spinbox(
+            _("Time between samples:"), _("ms"), 'sampling_interval',
+            min_=1, max_=1000, step=1,
+            tip=_("Shorter times give more precise results, but slow down "
+                  "the code run in the console"))
+        sampling_layout = QVBoxLayout()
+        sampling_layout.addWidget(sampling_interval)
+        sampling_group.setLayout(sampling_layout)
+
         vlayout = QVBoxLayout()
         vlayout.addWidget(results_group)
+        vlayout.addWidget(sampling_group)
         vlayout.addStretch(1)
         self.setLayout(vlayout)
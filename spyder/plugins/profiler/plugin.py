@@ -39,7 +39,7 @@ class Profiler(SpyderDockablePlugin, RunExecutor):
 
     NAME = 'profiler'
     REQUIRES = [Plugins.Preferences, Plugins.Editor, Plugins.Run]
-    OPTIONAL = []
+    OPTIONAL = [Plugins.IPythonConsole]
     TABIFY = [Plugins.Help]
     WIDGET_CLASS = ProfilerWidget
     CONF_SECTION = NAME
@@ -92,6 +92,14 @@ def on_editor_available(self):
         editor = self.get_plugin(Plugins.Editor)
         widget.sig_edit_goto_requested.connect(editor.load)
 
+    @on_plugin_available(plugin=Plugins.IPythonConsole)
+    def on_ipython_console_available(self):
+        widget = self.get_widget()
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        widget.sig_sampling_toggled.connect(self._toggle_sampling)
+        ipyconsole.sig_shellwidget_deleted.connect(
+            widget.on_shellwidget_deleted)
+
     @on_plugin_available(plugin=Plugins.Preferences)
     def on_preferences_available(self):
         preferences = self.get_plugin(Plugins.Preferences)
@@ -123,6 +131,15 @@ def on_editor_teardown(self):
         editor = self.get_plugin(Plugins.Editor)
         widget.sig_edit_goto_requested.disconnect(editor.load)
 
+    @on_plugin_teardown(plugin=Plugins.IPythonConsole)
+    def on_ipython_console_teardown(self):
+        widget = self.get_widget()
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        widget.stop_sampling()
+        widget.sig_sampling_toggled.disconnect(self._toggle_sampling)
+        ipyconsole.sig_shellwidget_deleted.disconnect(
+            widget.on_shellwidget_deleted)
+
     @on_plugin_teardown(plugin=Plugins.Preferences)
     def on_preferences_teardown(self):
         preferences = self.get_plugin(Plugins.Preferences)
@@ -180,3 +197,19 @@ def run_file(
             wdir=wdir,
             args=args
         )
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _toggle_sampling(self, checked):
+        """Start or stop sampling the code run in the current console."""
+        widget = self.get_widget()
+        if not checked:
+            widget.stop_sampling()
+            return
+
+        ipyconsole = self.get_plugin(Plugins.IPythonConsole)
+        shellwidget = ipyconsole.get_current_shellwidget()
+        if shellwidget is None:
+            widget.update_actions()
+        else:
+            widget.start_sampling(shellwidget)
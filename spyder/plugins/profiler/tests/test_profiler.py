@@ -9,11 +9,16 @@
 """
 
 
+# Standard library imports
+import cProfile
+import pstats
+
 # Third party imports
 from qtpy.QtGui import QIcon
 import pytest
 
 # Local imports
+from spyder.plugins.profiler.utils import ProfileData
 from spyder.plugins.profiler.widgets.main_widget import ProfilerDataTree
 from spyder.utils.palette import SpyderPalette
 
@@ -101,5 +106,89 @@ class Stats:
                                   ['2.00 s', ['-400.00 ms', SUCESS]]]
 
 
+def test_profile_data():
+    """Test the arrays and call graph of ProfileData."""
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    def main():
+        for __ in range(3):
+            fib(10)
+
+    profiler = cProfile.Profile()
+    profiler.runcall(main)
+    stats = pstats.Stats(profiler)
+    data = ProfileData(stats)
+
+    assert len(data) == len(stats.stats)
+    for func, key in enumerate(data.keys):
+        __, calls, local_time, cumulative_time, callers = stats.stats[key]
+        assert data.calls[func] == calls
+        assert data.local_time[func] == local_time
+        assert data.cumulative_time[func] == cumulative_time
+        for caller in callers:
+            assert func in data.get_callees(data.ids[caller])
+
+    main_func = next(
+        func for func, key in enumerate(data.keys) if key[2] == 'main')
+    fib_func = next(
+        func for func, key in enumerate(data.keys) if key[2] == 'fib')
+    assert data.find_root() == main_func
+    assert list(data.get_callees(main_func)) == [fib_func]
+    assert list(data.get_callees(fib_func)) == [fib_func]
+    assert data.calls[fib_func] == 3 * 177
+    assert data.get_info(fib_func)[2] == 'fib'
+
+    # Compare with the same results
+    data = ProfileData(stats, stats)
+    assert data.compare_calls == data.calls
+    assert data.compare_local_time == data.local_time
+
+
+def test_flame_graph():
+    """Test the boxes of the flame graph of ProfileData."""
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    def g():
+        return sum(range(100000))
+
+    def main():
+        for __ in range(3):
+            fib(15)
+        g()
+
+    profiler = cProfile.Profile()
+    profiler.runcall(main)
+    data = ProfileData(pstats.Stats(profiler))
+    root = data.find_root()
+    graph = data.get_flame_graph(root)
+
+    # The root box spans the whole graph
+    assert data.keys[graph.funcs[0]][2] == 'main'
+    assert graph.depths[0] == 0
+    assert graph.starts[0] == 0
+    assert graph.widths[0] == data.cumulative_time[root]
+
+    # Recursive calls are not included
+    names = [data.keys[func][2] for func in graph.funcs]
+    assert names.count('fib') == 1
+    assert graph.max_depth == 2
+
+    # Children are inside their parent and don't overlap
+    boxes = graph.get_boxes(1, 0, graph.widths[0])
+    assert len(boxes) == 2
+    first, second = boxes
+    assert graph.starts[first] + graph.widths[first] <= graph.starts[second]
+    assert (graph.starts[second] + graph.widths[second]
+            <= graph.widths[0] * (1 + 1e-9))
+
+    # Boxes are found by position
+    assert graph.get_box_at(0, graph.widths[0] / 2) == 0
+    assert graph.get_box_at(1, graph.starts[second]) == second
+    assert graph.get_box_at(0, -1) is None
+    assert graph.get_box_at(3, 0) is None
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Compact representation of the results of the profiler.
+
+pstats keeps a dictionary per function with the functions that called it,
+which is too slow to traverse and too large to copy for big profiles. Here,
+functions are numbered and their measures are stored in arrays indexed by
+those numbers, while the call graph is stored as a single array with the
+callees of all functions, one function after the other.
+"""
+
+# Standard library imports
+from array import array
+import bisect
+from itertools import accumulate
+import os.path as osp
+
+# Local imports
+from spyder.utils.palette import SpyderPalette
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Colors of the differences with the compared results
+WORSE_COLOR = SpyderPalette.COLOR_ERROR_1
+BETTER_COLOR = SpyderPalette.COLOR_SUCCESS_1
+
+# Calls narrower than this fraction of the root of a flame graph are not
+# included in it.
+MIN_FLAME_GRAPH_FRACTION = 0.001
+
+# Maximum depth of the calls included in a flame graph
+MAX_FLAME_GRAPH_DEPTH = 100
+
+
+# ---- Formatting
+# ----------------------------------------------------------------------------
+def format_measure(measure):
+    """Get format and units for data coming from profiler task."""
+    # Convert to a positive value.
+    measure = abs(measure)
+
+    # For number of calls
+    if isinstance(measure, int):
+        return str(measure)
+
+    # For time measurements
+    if 1.e-9 < measure <= 1.e-6:
+        measure = u"{0:.2f} ns".format(measure / 1.e-9)
+    elif 1.e-6 < measure <= 1.e-3:
+        measure = u"{0:.2f} \u03BCs".format(measure / 1.e-6)
+    elif 1.e-3 < measure <= 1:
+        measure = u"{0:.2f} ms".format(measure / 1.e-3)
+    elif 1 < measure <= 60:
+        measure = u"{0:.2f} s".format(measure)
+    elif 60 < measure <= 3600:
+        m, s = divmod(measure, 3600)
+        if s > 60:
+            m, s = divmod(measure, 60)
+            s = str(s).split(".")[-1]
+        measure = u"{0:.0f}.{1:.2s} min".format(m, s)
+    else:
+        h, m = divmod(measure, 3600)
+        if m > 60:
+            m /= 60
+        measure = u"{0:.0f}h:{1:.0f}min".format(h, m)
+    return measure
+
+
+def format_difference(difference):
+    """
+    Get the text and color of the difference of a measure with the compared
+    results.
+
+    The color is None if there's no difference.
+    """
+    if not difference:
+        return '', None
+    if difference < 0:
+        return '-' + format_measure(difference), BETTER_COLOR
+    return '+' + format_measure(difference), WORSE_COLOR
+
+
+def function_info(function_key):
+    """
+    Get processed information about the name and file of a function.
+
+    Returns
+    -------
+    tuple
+        (filename, line_number, function_name, file_and_line, node_type)
+    """
+    node_type = 'function'
+    filename, line_number, function_name = function_key
+    if function_name == '<module>':
+        module_path, module_name = osp.split(filename)
+        node_type = 'module'
+        if module_name == '__init__.py':
+            module_path, module_name = osp.split(module_path)
+        function_name = '<' + module_name + '>'
+    if not filename or filename == '~':
+        file_and_line = '(built-in)'
+        node_type = 'builtin'
+    else:
+        if function_name == '__init__':
+            node_type = 'constructor'
+        file_and_line = '%s : %d' % (filename, line_number)
+    return filename, line_number, function_name, file_and_line, node_type
+
+
+# ---- Data
+# ----------------------------------------------------------------------------
+class FlameGraph:
+    """
+    Boxes of a flame graph.
+
+    The function, depth, start and width of every box are stored in arrays
+    indexed by box number, and the boxes of every depth are numbered from
+    left to right.
+    """
+
+    def __init__(self):
+        self.funcs = array('i')
+        self.depths = array('i')
+        self.starts = array('d')
+        self.widths = array('d')
+        self.max_depth = -1
+
+        # Numbers of the boxes of every depth and their starts, to find
+        # the ones in a range.
+        self._boxes_by_depth = []
+        self._starts_by_depth = []
+
+    def __len__(self):
+        return len(self.funcs)
+
+    def add_box(self, func, depth, start, width):
+        """Add a box at the right of the others of its depth."""
+        box = len(self.funcs)
+        self.funcs.append(func)
+        self.depths.append(depth)
+        self.starts.append(start)
+        self.widths.append(width)
+
+        while depth > self.max_depth:
+            self.max_depth += 1
+            self._boxes_by_depth.append(array('i'))
+            self._starts_by_depth.append(array('d'))
+        self._boxes_by_depth[depth].append(box)
+        self._starts_by_depth[depth].append(start)
+
+    def get_boxes(self, depth, start, end):
+        """Get the numbers of the boxes of depth that overlap start-end."""
+        if not 0 <= depth <= self.max_depth:
+            return array('i')
+
+        starts = self._starts_by_depth[depth]
+        boxes = self._boxes_by_depth[depth]
+        first = bisect.bisect_right(starts, start) - 1
+        if first >= 0 and starts[first] + self.widths[boxes[first]] <= start:
+            first += 1
+        first = max(first, 0)
+        last = bisect.bisect_left(starts, end)
+        return boxes[first:last]
+
+    def get_box_at(self, depth, position):
+        """Get the number of the box of depth at position, or None."""
+        if not 0 <= depth <= self.max_depth:
+            return None
+
+        index = bisect.bisect_right(self._starts_by_depth[depth], position)
+        if index == 0:
+            return None
+
+        box = self._boxes_by_depth[depth][index - 1]
+        if position < self.starts[box] + self.widths[box]:
+            return box
+        return None
+
+
+class ProfileData:
+    """
+    Results of the profiler, with the measures of every function in arrays.
+
+    Parameters
+    ----------
+    stats: pstats.Stats
+        Results to represent.
+    compare_stats: pstats.Stats, optional
+        Previous results to compare them with.
+
+    Notes
+    -----
+    Functions are numbered in the order of `stats`. For every function
+    number, `keys` has its (filename, line_number, function_name) key,
+    `calls` its total number of calls (including recursion), `local_time`
+    the time spent in it (not in its callees) and `cumulative_time` the time
+    spent in it and its callees. The `compare_*` arrays have the same
+    measures from the compared results, or zeros if there are none.
+    """
+
+    def __init__(self, stats, compare_stats=None):
+        stats = stats.stats
+        self.keys = list(stats)
+        self.ids = {key: func for func, key in enumerate(self.keys)}
+
+        self.calls = array('q')
+        self.local_time = array('d')
+        self.cumulative_time = array('d')
+        for __, calls, local_time, cumulative_time, __ in stats.values():
+            self.calls.append(calls)
+            self.local_time.append(local_time)
+            self.cumulative_time.append(cumulative_time)
+
+        self.compare_calls = array('q', bytes(8 * len(self.keys)))
+        self.compare_local_time = array('d', bytes(8 * len(self.keys)))
+        self.compare_cumulative_time = array('d', bytes(8 * len(self.keys)))
+        if compare_stats is not None:
+            for key, values in compare_stats.stats.items():
+                func = self.ids.get(key)
+                if func is not None:
+                    self.compare_calls[func] = values[1]
+                    self.compare_local_time[func] = values[2]
+                    self.compare_cumulative_time[func] = values[3]
+
+        self._build_callees(stats)
+        self._infos = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    # ---- Public API
+    def find_root(self):
+        """
+        Get the number of the function that is at the top of the calls, or
+        None if there are no results.
+
+        That's the function with the largest cumulative time, skipping the
+        calls of the profiler itself.
+        """
+        cumulative_time = self.cumulative_time
+        for func in sorted(range(len(self.keys)),
+                           key=lambda func: -cumulative_time[func]):
+            key = self.keys[func]
+            # This skips the profiler function at the top of the list
+            if (
+                ('~', 0) != key[0:2]
+                and not key[2].startswith('<built-in method exec>')
+            ):
+                return func
+        return None
+
+    def get_callees(self, func):
+        """Get the numbers of the functions called by function func."""
+        return self._callees[self._callee_starts[func]:
+                             self._callee_starts[func + 1]]
+
+    def get_callee_times(self, func):
+        """
+        Get the cumulative time of the calls made by function func to each
+        of its callees, in the same order as get_callees.
+        """
+        return self._callee_times[self._callee_starts[func]:
+                                  self._callee_starts[func + 1]]
+
+    def get_flame_graph(self, root, min_fraction=MIN_FLAME_GRAPH_FRACTION,
+                        max_depth=MAX_FLAME_GRAPH_DEPTH):
+        """
+        Get the flame graph of the calls made from function root.
+
+        Every function called is a box placed below its caller, as wide as
+        the time spent in it from there. pstats only keeps the time spent in
+        a function by every caller, not by every call stack, so that time is
+        split among the boxes of the caller proportionally to their width.
+        Calls that are narrower than min_fraction of the root box, deeper
+        than max_depth or recursive are not included.
+
+        Returns
+        -------
+        FlameGraph
+            Boxes of the graph, from left to right and from top to bottom,
+            with their start and width in seconds.
+        """
+        graph = FlameGraph()
+        total = self.cumulative_time[root]
+        if total <= 0:
+            return graph
+        min_width = total * min_fraction
+
+        # Boxes are added depth first, so that boxes of the same depth are
+        # in increasing start order.
+        pending = [(root, 0, 0., total, (root,))]
+        while pending:
+            func, depth, start, width, stack = pending.pop()
+            graph.add_box(func, depth, start, width)
+            if depth >= max_depth:
+                continue
+
+            func_time = self.cumulative_time[func]
+            scale = width / func_time if func_time > 0 else 0.
+            children = []
+            child_start = start
+            for callee, callee_time in zip(self.get_callees(func),
+                                           self.get_callee_times(func)):
+                child_width = min(callee_time * scale,
+                                  start + width - child_start)
+                if child_width >= min_width and callee not in stack:
+                    children.append((callee, depth + 1, child_start,
+                                     child_width, stack + (callee,)))
+                child_start += callee_time * scale
+
+            pending.extend(reversed(children))
+
+        return graph
+
+    def get_info(self, func):
+        """Get function_info for function func, caching it."""
+        try:
+            return self._infos[func]
+        except KeyError:
+            info = function_info(self.keys[func])
+            self._infos[func] = info
+            return info
+
+    # ---- Private API
+    def _build_callees(self, stats):
+        """
+        Build the call graph from the callers of every function in stats.
+
+        The callees of function f are in
+        _callees[_callee_starts[f]:_callee_starts[f + 1]], and the time
+        spent in them (and their callees) when called by f is at the same
+        positions in _callee_times.
+        """
+        ids = self.ids
+        counts = array('i', bytes(4 * (len(self.keys) + 1)))
+        for values in stats.values():
+            for caller in values[4]:
+                caller = ids.get(caller)
+                if caller is not None:
+                    counts[caller + 1] += 1
+
+        self._callee_starts = array('i', accumulate(counts))
+        self._callees = array('i', bytes(4 * self._callee_starts[-1]))
+        self._callee_times = array('d', bytes(8 * self._callee_starts[-1]))
+        positions = array('i', self._callee_starts)
+        for func, values in enumerate(stats.values()):
+            calls, cumulative_time, callers = values[1], values[3], values[4]
+            for caller, caller_values in callers.items():
+                caller = ids.get(caller)
+                if caller is None:
+                    continue
+
+                if isinstance(caller_values, tuple):
+                    # (cc, nc, tt, ct) of the calls made by caller, as
+                    # given by cProfile
+                    caller_time = caller_values[3]
+                elif calls:
+                    # Only the number of calls is given by profile
+                    caller_time = cumulative_time * caller_values / calls
+                else:
+                    caller_time = 0.
+
+                self._callees[positions[caller]] = func
+                self._callee_times[positions[caller]] = caller_time
+                positions[caller] += 1
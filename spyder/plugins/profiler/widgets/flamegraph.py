@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Flame graph of the calls made by the profiled code."""
+
+# Standard library imports
+import html
+import zlib
+
+# Third party imports
+from qtpy.QtCore import QEvent, QRectF, QSize, Qt, Signal
+from qtpy.QtGui import QColor, QPainter
+from qtpy.QtWidgets import QSizePolicy, QToolTip, QWidget
+
+# Local imports
+from spyder.api.translations import _
+from spyder.plugins.profiler.utils import FlameGraph, format_measure
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+# Vertical space around the names of functions, in pixels
+BOX_MARGIN = 4
+
+# Minimum width of the boxes that are painted and of those that show the
+# name of their function, in pixels
+MIN_BOX_WIDTH = 1
+MIN_TEXT_WIDTH = 30
+
+# Range of hues of the boxes, to tell functions apart
+MIN_HUE = 0
+MAX_HUE = 60
+
+
+class FlameGraphWidget(QWidget):
+    """
+    Widget that paints the flame graph of the calls made by the profiled
+    code.
+
+    The root call is at the top and the functions called from every box are
+    below it. Clicking on a box zooms into it, clicking on the background
+    zooms out and Ctrl+clicking on a box goes to its function.
+    """
+
+    # Signals
+    sig_edit_goto_requested = Signal(str, int, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.profile_data = None
+        self.graph = FlameGraph()
+
+        # Box that is zoomed into
+        self._zoom_box = None
+
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    # ---- Public API
+    def set_data(self, profile_data):
+        """Show the flame graph of the calls of profile_data."""
+        self.profile_data = profile_data
+        self.graph = FlameGraph()
+        if profile_data is not None:
+            root = profile_data.find_root()
+            if root is not None:
+                self.graph = profile_data.get_flame_graph(root)
+        self.reset_zoom()
+
+    def reset_zoom(self):
+        """Show the whole graph."""
+        self.zoom(None)
+
+    def zoom(self, box):
+        """Zoom into box, or show the whole graph if it's None."""
+        if not len(self.graph):
+            box = None
+        elif box is None:
+            box = 0
+        self._zoom_box = box
+        self.updateGeometry()
+        self.update()
+
+    # ---- Qt methods
+    def sizeHint(self):
+        rows = 0
+        if self._zoom_box is not None:
+            rows = self.graph.max_depth - self._get_zoom_depth() + 1
+        return QSize(super().sizeHint().width(), rows * self._box_height())
+
+    def minimumSizeHint(self):
+        return QSize(0, self.sizeHint().height())
+
+    def paintEvent(self, event):
+        if self._zoom_box is None:
+            return
+
+        graph = self.graph
+        data = self.profile_data
+        box_height = self._box_height()
+        zoom_depth = self._get_zoom_depth()
+        view_start, view_end = self._get_zoom_range()
+        scale = self.width() / (view_end - view_start)
+        metrics = self.fontMetrics()
+
+        painter = QPainter(self)
+        painter.setPen(QColor(Qt.black))
+        rect = event.rect()
+        first_row = max(rect.top() // box_height, 0)
+        last_row = rect.bottom() // box_height
+        for row in range(first_row, last_row + 1):
+            y = row * box_height
+            for box in graph.get_boxes(row + zoom_depth, view_start,
+                                       view_end):
+                x = (graph.starts[box] - view_start) * scale
+                width = graph.widths[box] * scale
+                if width < MIN_BOX_WIDTH:
+                    continue
+
+                box_rect = QRectF(x, y, width - 1, box_height - 1)
+                func = graph.funcs[box]
+                painter.fillRect(box_rect, self._get_color(func))
+                if width >= MIN_TEXT_WIDTH:
+                    text = metrics.elidedText(
+                        data.get_info(func)[2],
+                        Qt.ElideRight,
+                        int(width) - 2 * BOX_MARGIN
+                    )
+                    painter.drawText(
+                        box_rect.adjusted(BOX_MARGIN, 0, -BOX_MARGIN, 0),
+                        Qt.AlignLeft | Qt.AlignVCenter,
+                        text
+                    )
+
+        painter.end()
+
+    def event(self, event):
+        if event.type() == QEvent.ToolTip:
+            box = self._get_box_at(event.pos())
+            if box is None:
+                QToolTip.hideText()
+                event.ignore()
+            else:
+                QToolTip.showText(event.globalPos(), self._get_tooltip(box),
+                                  self)
+            return True
+        return super().event(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            box = self._get_box_at(event.pos())
+            if box is None:
+                self.reset_zoom()
+            elif event.modifiers() & Qt.ControlModifier:
+                filename, line_number = (
+                    self.profile_data.keys[self.graph.funcs[box]][:2])
+                self.sig_edit_goto_requested.emit(filename, line_number, '')
+            elif box != self._zoom_box:
+                self.zoom(box)
+        super().mouseReleaseEvent(event)
+
+    # ---- Private API
+    def _box_height(self):
+        return self.fontMetrics().height() + BOX_MARGIN
+
+    def _get_zoom_depth(self):
+        return self.graph.depths[self._zoom_box]
+
+    def _get_zoom_range(self):
+        start = self.graph.starts[self._zoom_box]
+        return start, start + self.graph.widths[self._zoom_box]
+
+    def _get_box_at(self, pos):
+        """Get the box at pos, or None."""
+        if self._zoom_box is None or self.width() <= 0:
+            return None
+
+        view_start, view_end = self._get_zoom_range()
+        position = (
+            view_start + pos.x() * (view_end - view_start) / self.width())
+        depth = self._get_zoom_depth() + pos.y() // self._box_height()
+        return self.graph.get_box_at(depth, position)
+
+    def _get_color(self, func):
+        """Get the color of the boxes of func, the same in every run."""
+        filename, __, name, __, __ = self.profile_data.get_info(func)
+        hue = zlib.crc32((filename + name).encode('utf-8', 'replace'))
+        return QColor.fromHsv(MIN_HUE + hue % (MAX_HUE - MIN_HUE), 150, 240)
+
+    def _get_tooltip(self, box):
+        """Get the text shown when hovering box."""
+        data = self.profile_data
+        graph = self.graph
+        func = graph.funcs[box]
+        __, __, name, file_and_line, __ = data.get_info(func)
+        percent = 100 * graph.widths[box] / graph.widths[0]
+        return '<b>{}</b><br>{}<br>{}: {} ({:.1f}%)<br><i>{}</i>'.format(
+            html.escape(name),
+            html.escape(file_and_line),
+            _('Time'),
+            format_measure(graph.widths[box]),
+            percent,
+            _('Click to zoom in, Ctrl+click to go to the function')
+        )
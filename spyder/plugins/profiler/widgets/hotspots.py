@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Flat table of the functions that took the longest to run."""
+
+# Third party imports
+from qtpy.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+from qtpy.QtWidgets import QAbstractItemView, QHeaderView, QTableView
+
+# Local imports
+from spyder.api.translations import _
+from spyder.plugins.profiler.utils import format_measure
+
+
+class HotspotsColumns:
+    Function = 0
+    LocalTime = 1
+    LocalPercent = 2
+    TotalTime = 3
+    Calls = 4
+    File = 5
+
+
+class HotspotsModel(QAbstractTableModel):
+    """
+    Model of the functions of the profiled code, one per row.
+
+    Rows are sorted by the values of the arrays of ProfileData.
+    """
+
+    def __init__(self, parent, icon_list):
+        super().__init__(parent)
+        self.icon_list = icon_list
+        self.header_list = [_('Function/Module'), _('Local Time'), '%',
+                            _('Total Time'), _('Calls'), _('File:line')]
+        self.tooltip_list = [
+            _('Function or module name'),
+            _('Local time in function (not in sub-functions)'),
+            _('Percentage of the local time of all functions'),
+            _('Time in function (including sub-functions)'),
+            _('Total number of calls (including recursion)'),
+            _('File:line where function is defined'),
+        ]
+        self.profile_data = None
+        self.sort_column = HotspotsColumns.LocalTime
+        self.sort_order = Qt.DescendingOrder
+
+        # Numbers of the functions shown in every row
+        self._rows = []
+        self._total_local_time = 0.
+
+    # ---- Public API
+    def set_data(self, profile_data):
+        """Show the functions of profile_data."""
+        self.beginResetModel()
+        self.profile_data = profile_data
+        if profile_data is None:
+            self._rows = []
+            self._total_local_time = 0.
+        else:
+            self._rows = list(range(len(profile_data)))
+            self._total_local_time = sum(profile_data.local_time)
+            self._sort_rows()
+        self.endResetModel()
+
+    def get_key(self, index):
+        """Get the key of the function at index, or None."""
+        if not index.isValid():
+            return None
+        return self.profile_data.keys[self._rows[index.row()]]
+
+    # ---- Qt methods
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.header_list)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal:
+            if role == Qt.DisplayRole:
+                return self.header_list[section]
+            elif role == Qt.ToolTipRole:
+                return self.tooltip_list[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        data = self.profile_data
+        func = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == HotspotsColumns.Function:
+                return data.get_info(func)[2]
+            elif column == HotspotsColumns.LocalTime:
+                return format_measure(data.local_time[func])
+            elif column == HotspotsColumns.LocalPercent:
+                if self._total_local_time > 0:
+                    return '{0:.1f}'.format(
+                        100 * data.local_time[func] / self._total_local_time)
+                return ''
+            elif column == HotspotsColumns.TotalTime:
+                return format_measure(data.cumulative_time[func])
+            elif column == HotspotsColumns.Calls:
+                return format_measure(data.calls[func])
+            elif column == HotspotsColumns.File:
+                return data.get_info(func)[3]
+        elif role == Qt.DecorationRole:
+            if column == HotspotsColumns.Function:
+                return self.icon_list[data.get_info(func)[4]]
+        elif role == Qt.TextAlignmentRole:
+            if column in (HotspotsColumns.Function, HotspotsColumns.File):
+                return int(Qt.AlignLeft | Qt.AlignVCenter)
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.ToolTipRole:
+            if column in (HotspotsColumns.Function, HotspotsColumns.File):
+                return data.get_info(func)[3]
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort rows by the values of a column."""
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column = column
+        self.sort_order = order
+
+        old_rows = list(self._rows)
+        self._sort_rows()
+
+        # Keep the selection on the same functions
+        new_rows = {func: row for row, func in enumerate(self._rows)}
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.index(new_rows[old_rows[index.row()]], index.column())
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
+    # ---- Private API
+    def _sort_rows(self):
+        """Sort rows by the sort column."""
+        data = self.profile_data
+        if data is None:
+            return
+
+        column = self.sort_column
+        if column == HotspotsColumns.Function:
+            def key(func):
+                return data.get_info(func)[2]
+        elif column == HotspotsColumns.File:
+            def key(func):
+                return data.get_info(func)[3]
+        else:
+            values = {
+                HotspotsColumns.LocalTime: data.local_time,
+                HotspotsColumns.LocalPercent: data.local_time,
+                HotspotsColumns.TotalTime: data.cumulative_time,
+                HotspotsColumns.Calls: data.calls,
+            }[column]
+            key = values.__getitem__
+
+        self._rows.sort(
+            key=key, reverse=(self.sort_order == Qt.DescendingOrder))
+
+
+class HotspotsTable(QTableView):
+    """Table to show the functions that took the longest to run."""
+
+    # Signals
+    sig_edit_goto_requested = Signal(str, int, str)
+
+    def __init__(self, parent, icon_list):
+        super().__init__(parent)
+        self.hotspots_model = HotspotsModel(self, icon_list)
+        self.setModel(self.hotspots_model)
+
+        self.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setShowGrid(False)
+        self.setWordWrap(False)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.horizontalHeader().setStretchLastSection(True)
+        self.setSortingEnabled(True)
+        self.sortByColumn(HotspotsColumns.LocalTime, Qt.DescendingOrder)
+
+        self.activated.connect(self.item_activated)
+
+    def set_data(self, profile_data):
+        """Show the functions of profile_data."""
+        self.hotspots_model.set_data(profile_data)
+        self.resizeColumnToContents(HotspotsColumns.Function)
+
+    def item_activated(self, index):
+        key = self.hotspots_model.get_key(index)
+        if key is not None:
+            filename, line_number = key[:2]
+            self.sig_edit_goto_requested.emit(filename, line_number, '')
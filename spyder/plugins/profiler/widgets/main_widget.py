@@ -15,6 +15,7 @@
 
 # Standard library imports
 import logging
+import marshal
 import os
 import os.path as osp
 import re
@@ -25,10 +26,12 @@
 # Third party imports
 from qtpy import PYQT5, PYQT6
 from qtpy.compat import getopenfilename, getsavefilename
-from qtpy.QtCore import QByteArray, QProcess, QProcessEnvironment, Qt, Signal
+from qtpy.QtCore import (QAbstractItemModel, QByteArray, QModelIndex,
+                         QProcess, QProcessEnvironment, Qt, QTimer, Signal)
 from qtpy.QtGui import QColor
-from qtpy.QtWidgets import (QApplication, QLabel, QMessageBox, QTreeWidget,
-                            QTreeWidgetItem, QStackedWidget, QVBoxLayout)
+from qtpy.QtWidgets import (QActionGroup, QApplication, QLabel, QMessageBox,
+                            QScrollArea, QStackedWidget, QTreeView,
+                            QVBoxLayout)
 
 # Local imports
 from spyder.api.config.decorators import on_conf_change
@@ -36,12 +39,15 @@
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.config.base import get_conf_path
+from spyder.plugins.profiler.utils import (
+    ProfileData, format_difference, format_measure, function_info)
+from spyder.plugins.profiler.widgets.flamegraph import FlameGraphWidget
+from spyder.plugins.profiler.widgets.hotspots import HotspotsTable
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 from spyder.py3compat import to_text_string
 from spyder.utils.misc import get_python_executable, getcwd_or_home
-from spyder.utils.palette import SpyderPalette, QStylePalette
+from spyder.utils.palette import QStylePalette
 from spyder.utils.programs import shell_split
-from spyder.utils.qthelpers import get_item_user_text, set_item_user_text
 from spyder.widgets.comboboxes import PythonModulesComboBox
 from spyder.widgets.helperwidgets import PaneEmptyWidget
 
@@ -54,6 +60,22 @@
 # ----------------------------------------------------------------------------
 MAIN_TEXT_COLOR = QStylePalette.COLOR_TEXT_1
 
+# Time between updates of the results while sampling a console, in ms
+SAMPLES_UPDATE_INTERVAL = 2000
+
+# Maximum number of functions whose texts are cached for display. Only the
+# visible ones are needed.
+MAX_CACHED_DISPLAYS = 1000
+
+# Tooltips of the columns of the results tree
+COLUMN_TOOLTIPS = {
+    0: _('Function or module name'),
+    1: _('Time in function (including sub-functions)'),
+    3: _('Local time in function (not in sub-functions)'),
+    5: _('Total number of calls (including recursion)'),
+    7: _('File:line where function is defined'),
+}
+
 
 class ProfilerWidgetActions:
     # Triggers
@@ -66,6 +88,12 @@ class ProfilerWidgetActions:
     SaveData = 'save_data_action'
     ShowOutput = 'show_output_action'
 
+    # Toggles
+    SampleConsole = 'sample_console_action'
+    ShowCallTree = 'show_call_tree_action'
+    ShowHotspots = 'show_hotspots_action'
+    ShowFlameGraph = 'show_flame_graph_action'
+
 
 class ProfilerWidgetToolbars:
     Information = 'information_toolbar'
@@ -79,6 +107,10 @@ class ProfilerWidgetInformationToolbarSections:
     Main = 'main_section'
 
 
+class ProfilerWidgetOptionsMenuSections:
+    View = 'view_section'
+
+
 class ProfilerWidgetMainToolbarItems:
     FileCombo = 'file_combo'
 
@@ -156,6 +188,17 @@ class ProfilerWidget(PluginMainWidget):
     sig_finished = Signal()
     """This signal is emitted to inform the profile profiling has finished."""
 
+    sig_sampling_toggled = Signal(bool)
+    """
+    This signal is emitted to request to start or stop sampling the code run
+    in the current console.
+
+    Parameters
+    ----------
+    checked: bool
+        True to start sampling and False to stop it.
+    """
+
     def __init__(self, name=None, plugin=None, parent=None):
         super().__init__(name, plugin, parent)
         self.set_conf('text_color', MAIN_TEXT_COLOR)
@@ -169,11 +212,26 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.running = False
         self.text_color = self.get_conf('text_color')
 
+        # Console whose code is sampled and whether the results shown come
+        # from sampling it.
+        self._sampled_shellwidget = None
+        self._sampled = False
+        self._samples_timer = QTimer(self)
+        self._samples_timer.setInterval(SAMPLES_UPDATE_INTERVAL)
+        self._samples_timer.timeout.connect(self._request_samples)
+
         # Widgets
         self.process = None
         self.filecombo = PythonModulesComboBox(
             self, id_=ProfilerWidgetMainToolbarItems.FileCombo)
         self.datatree = ProfilerDataTree(self)
+        self.hotspots_table = HotspotsTable(self, self.datatree.icon_list)
+        self.flame_graph = FlameGraphWidget(self)
+        self.flame_graph_area = QScrollArea(self)
+        self.flame_graph_area.setWidget(self.flame_graph)
+        self.flame_graph_area.setWidgetResizable(True)
+        self.flame_graph_area.setAlignment(Qt.AlignTop)
+        self.current_view = self.datatree
         self.pane_empty = PaneEmptyWidget(
             self,
             "code-profiler",
@@ -189,14 +247,17 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.stacked_widget = QStackedWidget(self)
         self.stacked_widget.addWidget(self.pane_empty)
         self.stacked_widget.addWidget(self.datatree)
+        self.stacked_widget.addWidget(self.hotspots_table)
+        self.stacked_widget.addWidget(self.flame_graph_area)
 
         layout = QVBoxLayout()
         layout.addWidget(self.stacked_widget)
         self.setLayout(layout)
 
         # Signals
-        self.datatree.sig_edit_goto_requested.connect(
-            self.sig_edit_goto_requested)
+        for widget in [self.datatree, self.hotspots_table, self.flame_graph]:
+            widget.sig_edit_goto_requested.connect(
+                self.sig_edit_goto_requested)
 
     # --- PluginMainWidget API
     # ------------------------------------------------------------------------
@@ -204,7 +265,7 @@ def get_title(self):
         return _('Profiler')
 
     def get_focus_widget(self):
-        return self.datatree
+        return self.current_view
 
     def setup(self):
         self.start_action = self.create_action(
@@ -221,6 +282,13 @@ def setup(self):
             icon=self.create_icon('fileopen'),
             triggered=lambda x: self.select_file(),
         )
+        self.sample_action = self.create_action(
+            ProfilerWidgetActions.SampleConsole,
+            text=_("Sample console"),
+            tip=_("Sample the code run in the current console"),
+            icon=self.create_icon('ipython_console'),
+            toggled=self.sig_sampling_toggled.emit,
+        )
         self.log_action = self.create_action(
             ProfilerWidgetActions.ShowOutput,
             text=_("Output"),
@@ -263,12 +331,49 @@ def setup(self):
             icon=self.create_icon('editdelete'),
             triggered=self.clear,
         )
+        self.show_call_tree_action = self.create_action(
+            ProfilerWidgetActions.ShowCallTree,
+            text=_("Call tree"),
+            tip=_("Show the functions called by every function"),
+            toggled=lambda checked: checked and self.set_view(self.datatree),
+            initial=True,
+        )
+        self.show_hotspots_action = self.create_action(
+            ProfilerWidgetActions.ShowHotspots,
+            text=_("Hotspots"),
+            tip=_("Show the functions that took the longest to run"),
+            toggled=lambda checked: (
+                checked and self.set_view(self.hotspots_table)),
+        )
+        self.show_flame_graph_action = self.create_action(
+            ProfilerWidgetActions.ShowFlameGraph,
+            text=_("Flame graph"),
+            tip=_("Show the time spent in every call as a flame graph"),
+            toggled=lambda checked: (
+                checked and self.set_view(self.flame_graph_area)),
+        )
         self.clear_action.setEnabled(False)
         self.save_action.setEnabled(False)
 
+        # Add the view actions to an exclusive QActionGroup
+        view_actions = QActionGroup(self)
+        view_actions.setExclusive(True)
+
+        # Options menu
+        menu = self.get_options_menu()
+        for item in [self.show_call_tree_action, self.show_hotspots_action,
+                     self.show_flame_graph_action]:
+            view_actions.addAction(item)
+            self.add_item_to_menu(
+                item,
+                menu=menu,
+                section=ProfilerWidgetOptionsMenuSections.View,
+            )
+
         # Main Toolbar
         toolbar = self.get_main_toolbar()
-        for item in [self.filecombo, browse_action, self.start_action]:
+        for item in [self.filecombo, browse_action, self.start_action,
+                     self.sample_action]:
             self.add_item_to_toolbar(
                 item,
                 toolbar=toolbar,
@@ -297,7 +402,8 @@ def setup(self):
             # This should happen only on certain GNU/Linux distributions
             # or when this a home-made Python build because the Python
             # profilers are included in the Python standard library
-            for widget in (self.datatree, self.filecombo,
+            for widget in (self.datatree, self.hotspots_table,
+                           self.flame_graph, self.filecombo,
                            self.start_action):
                 widget.setDisabled(True)
             url = 'https://docs.python.org/3/library/profile.html'
@@ -312,9 +418,19 @@ def update_actions(self):
             icon = self.create_icon('run')
         self.start_action.setIcon(icon)
 
-        self.load_action.setEnabled(not self.running)
-        self.clear_action.setEnabled(not self.running)
-        self.start_action.setEnabled(bool(self.filecombo.currentText()))
+        sampling = self._sampled_shellwidget is not None
+        self.load_action.setEnabled(not self.running and not sampling)
+        self.clear_action.setEnabled(not self.running and not sampling)
+        self.start_action.setEnabled(
+            bool(self.filecombo.currentText()) and not sampling)
+        self.sample_action.setEnabled(not self.running)
+        self.sample_action.blockSignals(True)
+        self.sample_action.setChecked(sampling)
+        self.sample_action.blockSignals(False)
+
+        # Only the call tree can be collapsed and expanded
+        for action in [self.collapse_action, self.expand_action]:
+            action.setEnabled(self.current_view is self.datatree)
 
     # --- Private API
     # ------------------------------------------------------------------------
@@ -373,6 +489,49 @@ def _read_output(self, error=False):
         else:
             self.output += text
 
+    def _request_samples(self):
+        """Request the stats of the samples taken so far."""
+        if self._sampled_shellwidget is not None:
+            self._sampled_shellwidget.call_kernel(
+                interrupt=True,
+                callback=self._show_samples
+            ).get_sampling_profiler_stats()
+
+    def _show_samples(self, stats):
+        """Show the stats of the samples taken from a console."""
+        if not stats:
+            return
+
+        # Save them as cProfile does, to be able to load and save them.
+        try:
+            with open(self.DATAPATH, 'wb') as f:
+                marshal.dump(stats, f)
+        except OSError:
+            logger.debug("Unable to save samples", exc_info=True)
+            return
+
+        self._sampled = True
+        self.output = None
+        self.log_action.setEnabled(False)
+        self._show_results()
+        if self._sampled_shellwidget is not None:
+            self.datelabel.setText(_('Sampling console...'))
+
+    def _show_results(self):
+        """Show the results saved in DATAPATH."""
+        self.datatree.load_data(self.DATAPATH)
+        self.datatree.show_tree()
+        self.hotspots_table.set_data(self.datatree.profile_data)
+        self.flame_graph.set_data(self.datatree.profile_data)
+        if self.datatree.profile_data is not None:
+            self.stacked_widget.setCurrentWidget(self.current_view)
+
+        text_style = "<span style=\'color: %s\'><b>%s </b></span>"
+        date_text = text_style % (self.text_color,
+                                  time.strftime("%Y-%m-%d %H:%M:%S",
+                                                time.localtime()))
+        self.datelabel.setText(date_text)
+
     @on_conf_change(section='pythonpath_manager', option='spyder_pythonpath')
     def _update_pythonpath(self, value):
         self.pythonpath = value
@@ -419,6 +578,16 @@ def clear(self):
         self.show_data()
         self.clear_action.setEnabled(False)
 
+    def set_view(self, view):
+        """
+        Show the results with view, which is the call tree, the hotspots
+        table or the flame graph area.
+        """
+        self.current_view = view
+        if self.stacked_widget.currentWidget() is not self.pane_empty:
+            self.stacked_widget.setCurrentWidget(view)
+        self.update_actions()
+
     def analyze(self, filename, wdir=None, args=None):
         """
         Start the profiling process.
@@ -557,6 +726,7 @@ def start(self, wdir=None, args=None):
         self.output = ''
         self.error_output = ''
         self.running = True
+        self._sampled = False
         self.start_spinner()
 
         p_args = ['-m', 'cProfile', '-o', self.DATAPATH]
@@ -612,44 +782,334 @@ def show_data(self, justanalyzed=False):
                                    and len(self.output) > 0)
         self._kill_if_running()
         filename = to_text_string(self.filecombo.currentText())
-        if not filename:
+        if not filename and not self._sampled:
             return
 
         self.datelabel.setText(_('Sorting data, please wait...'))
         QApplication.processEvents()
 
-        self.datatree.load_data(self.DATAPATH)
-        self.datatree.show_tree()
+        self._show_results()
 
-        text_style = "<span style=\'color: %s\'><b>%s </b></span>"
-        date_text = text_style % (self.text_color,
-                                  time.strftime("%Y-%m-%d %H:%M:%S",
-                                                time.localtime()))
-        self.datelabel.setText(date_text)
+    def start_sampling(self, shellwidget):
+        """
+        Start sampling the code run in the console of shellwidget.
 
+        Results are updated periodically until sampling is stopped.
+        """
+        self.stop_sampling()
+        if self.running or not shellwidget.spyder_kernel_ready:
+            self.update_actions()
+            return
 
-class TreeWidgetItem(QTreeWidgetItem):
-    def __init__(self, parent=None):
-        QTreeWidgetItem.__init__(self, parent)
+        self._sampled_shellwidget = shellwidget
+        shellwidget.call_kernel(interrupt=True).start_sampling_profiler(
+            self.get_conf('sampling_interval') / 1000)
+        self._samples_timer.start()
+        self.datelabel.setText(_('Sampling console...'))
+        self.start_spinner()
+        self.update_actions()
 
-    def __lt__(self, otherItem):
-        column = self.treeWidget().sortColumn()
+    def stop_sampling(self):
+        """Stop sampling the code run in a console and show the results."""
+        shellwidget = self._sampled_shellwidget
+        if shellwidget is None:
+            return
+
+        self._sampled_shellwidget = None
+        self._samples_timer.stop()
+        self.datelabel.setText('')
+        if shellwidget.spyder_kernel_ready:
+            shellwidget.call_kernel(
+                interrupt=True,
+                callback=self._show_samples
+            ).stop_sampling_profiler()
+        self.stop_spinner()
+        self.update_actions()
+
+    def on_shellwidget_deleted(self, shellwidget):
+        """Stop sampling the console of shellwidget if it's closed."""
+        if shellwidget is self._sampled_shellwidget:
+            self._sampled_shellwidget = None
+            self._samples_timer.stop()
+            self.datelabel.setText('')
+            self.stop_spinner()
+            self.update_actions()
+
+
+class ProfilerNode:
+    """Node of the tree of calls shown by ProfilerTreeModel."""
+
+    __slots__ = ('func', 'parent', 'row', 'children', 'recursive')
+
+    def __init__(self, func, parent=None, row=0, recursive=False):
+        self.func = func
+        self.parent = parent
+        self.row = row
+
+        # Created when they're requested for the first time
+        self.children = None
+
+        # Whether the function is one of its ancestors
+        self.recursive = recursive
+
+
+class ProfilerTreeModel(QAbstractItemModel):
+    """
+    Model of the tree of calls of the profiled code.
+
+    The measures of functions are taken from the arrays of ProfileData.
+    Nodes are only created for the children of nodes that are shown, their
+    texts are only formatted when they're painted, and siblings are sorted
+    by the values of those arrays.
+    """
+
+    def __init__(self, parent, header_list, icon_list):
+        super().__init__(parent)
+        self.header_list = header_list
+        self.icon_list = icon_list
+        self.profile_data = None
+        self.compare = False
+
+        # As in the former tree widget, ascending order puts the largest
+        # values first.
+        self.sort_column = 1
+        self.sort_order = Qt.AscendingOrder
+
+        self._root = ProfilerNode(None)
+        self._root.children = []
+        self._display_cache = {}
+
+    # ---- Public API
+    def set_data(self, profile_data, root_func=None, compare=False):
+        """
+        Show the calls made by function root_func in profile_data.
+
+        compare is whether profile_data has results to compare with.
+        """
+        self.beginResetModel()
+        self.profile_data = profile_data
+        self.compare = compare
+        self._root = ProfilerNode(root_func)
+        self._root.children = None if root_func is not None else []
+        self._display_cache = {}
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all data."""
+        self.set_data(None)
+
+    def get_key(self, index):
+        """Get the key of the function at index, or None."""
+        node = self._get_node(index)
+        if node is None:
+            return None
+        return self.profile_data.keys[node.func]
+
+    def is_recursive(self, index):
+        """Whether the function at index is one of its ancestors."""
+        node = self._get_node(index)
+        return node is not None and node.recursive
+
+    # ---- Qt methods
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        parent_node = self._get_node(parent) or self._root
+        node = self._get_children(parent_node)[row]
+        return self.createIndex(row, column, node)
+
+    def parent(self, index):
+        node = self._get_node(index)
+        if node is None or node.parent is self._root:
+            return QModelIndex()
+        return self.createIndex(node.parent.row, 0, node.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0:
+            return 0
+        return len(self._get_children(self._get_node(parent) or self._root))
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self._get_node(parent)
+        if node is None:
+            return bool(self._get_children(self._root))
+        if node.recursive or parent.column() != 0:
+            return False
+        if node.children is not None:
+            return bool(node.children)
+        return len(self.profile_data.get_callees(node.func)) > 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.header_list)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.header_list[section]
+        return None
+
+    def flags(self, index):
+        node = self._get_node(index)
+        if node is None or node.recursive:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        node = self._get_node(index)
+        if node is None:
+            return None
+
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 7 and node.recursive:
+                return '(%s)' % _('recursion')
+            return self._get_display(node.func)[column][0]
+        elif role == Qt.ForegroundRole:
+            color = self._get_display(node.func)[column][1]
+            if color is not None:
+                return QColor(color)
+        elif role == Qt.DecorationRole:
+            if column == 0:
+                node_type = self.profile_data.get_info(node.func)[4]
+                return self.icon_list[node_type]
+        elif role == Qt.TextAlignmentRole:
+            if column in (1, 3, 5):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return int(Qt.AlignLeft | Qt.AlignVCenter)
+        elif role == Qt.ToolTipRole:
+            return COLUMN_TOOLTIPS.get(column)
+
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the siblings of every node by the values of a column."""
+        self.layoutAboutToBeChanged.emit()
+        self.sort_column = column
+        self.sort_order = order
+
+        # Only nodes whose children were created need to be sorted.
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            if node.children:
+                self._sort_nodes(node.children)
+                pending.extend(node.children)
+
+        # Indexes point to their nodes, which know their new rows.
+        old_indexes = self.persistentIndexList()
+        new_indexes = [
+            self.createIndex(
+                index.internalPointer().row,
+                index.column(),
+                index.internalPointer()
+            )
+            for index in old_indexes
+        ]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
+    # ---- Private API
+    def _get_node(self, index):
+        """Get the node at index, or None for the invisible root."""
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def _get_children(self, node):
+        """Get the children of node, creating them if needed."""
+        if node.children is not None:
+            return node.children
+
+        if node.recursive or self.profile_data is None:
+            node.children = []
+            return node.children
+
+        # Functions of the node and its ancestors, except the root, which
+        # is not shown.
+        ancestors = set()
+        ancestor = node
+        while ancestor is not self._root:
+            ancestors.add(ancestor.func)
+            ancestor = ancestor.parent
+
+        children = [
+            ProfilerNode(func, node, recursive=func in ancestors)
+            for func in self.profile_data.get_callees(node.func)
+        ]
+        self._sort_nodes(children)
+        node.children = children
+        return children
+
+    def _sort_nodes(self, nodes):
+        """Sort sibling nodes by the sort column and update their rows."""
+        if not nodes:
+            return
+
+        data = self.profile_data
+        column = self.sort_column
+        if column == 0:
+            def key(node):
+                return data.get_info(node.func)[2]
+        elif column == 7:
+            def key(node):
+                return data.get_info(node.func)[3]
+        else:
+            values, compare_values = {
+                1: (data.cumulative_time, None),
+                2: (data.cumulative_time, data.compare_cumulative_time),
+                3: (data.local_time, None),
+                4: (data.local_time, data.compare_local_time),
+                5: (data.calls, None),
+                6: (data.calls, data.compare_calls),
+            }[column]
+            if compare_values is None:
+                def key(node):
+                    return values[node.func]
+            else:
+                def key(node):
+                    return values[node.func] - compare_values[node.func]
+
+        nodes.sort(key=key, reverse=(self.sort_order == Qt.AscendingOrder))
+        for row, node in enumerate(nodes):
+            node.row = row
+
+    def _get_display(self, func):
+        """
+        Get the (text, color) of the columns of function func, caching
+        them.
+        """
         try:
-            if column == 1 or column == 3:  # TODO: Hardcoded Column
-                t0 = gettime_s(self.text(column))
-                t1 = gettime_s(otherItem.text(column))
-                if t0 is not None and t1 is not None:
-                    return t0 > t1
+            return self._display_cache[func]
+        except KeyError:
+            pass
+
+        if len(self._display_cache) >= MAX_CACHED_DISPLAYS:
+            self._display_cache.clear()
+
+        data = self.profile_data
+        info = data.get_info(func)
+        display = [(info[2], None)]
+        for values, compare_values in (
+            (data.cumulative_time, data.compare_cumulative_time),
+            (data.local_time, data.compare_local_time),
+            (data.calls, data.compare_calls),
+        ):
+            display.append((format_measure(values[func]), None))
+            if self.compare:
+                display.append(
+                    format_difference(values[func] - compare_values[func]))
+            else:
+                display.append(('', None))
+        display.append((info[3], None))
 
-            return float(self.text(column)) > float(otherItem.text(column))
-        except ValueError:
-            return self.text(column) > otherItem.text(column)
+        self._display_cache[func] = display
+        return display
 
 
-class ProfilerDataTree(QTreeWidget, SpyderWidgetMixin):
+class ProfilerDataTree(QTreeView, SpyderWidgetMixin):
     """
-    Convenience tree widget (with built-in model)
-    to store and view profiler data.
+    Tree view to show profiler data.
 
     The quantities calculated by the profiler are as follows
     (from profile.Profile):
@@ -664,8 +1124,6 @@ class ProfilerDataTree(QTreeWidget, SpyderWidgetMixin):
     [4] = A dictionary indicating for each function name, the number of times
           it was called by us.
     """
-    SEP = r"<[=]>"  # separator between filename and linenumber
-    # (must be improbable as a filename to avoid splitting the filename itself)
 
     # Signals
     sig_edit_goto_requested = Signal(str, int, str)
@@ -674,7 +1132,7 @@ def __init__(self, parent=None):
         if PYQT5 or PYQT6:
             super().__init__(parent, class_parent=parent)
         else:
-            QTreeWidget.__init__(self, parent)
+            QTreeView.__init__(self, parent)
             SpyderWidgetMixin.__init__(self, class_parent=parent)
 
         self.header_list = [_('Function/Module'), _('Total Time'), _('Diff'),
@@ -689,32 +1147,20 @@ def __init__(self, parent=None):
         self.profdata = None   # To be filled by self.load_data()
         self.stats = None      # To be filled by self.load_data()
         self.stats1 = []       # To be filled by self.load_data()
-        self.item_depth = None
-        self.item_list = None
-        self.items_to_be_shown = None
+        self.profile_data = None  # To be filled by self.load_data()
         self.current_view_depth = None
         self.compare_file = None
-        self.setColumnCount(len(self.header_list))
-        self.setHeaderLabels(self.header_list)
-        self.initialize_view()
-        self.itemActivated.connect(self.item_activated)
-        self.itemExpanded.connect(self.item_expanded)
-
-    def set_item_data(self, item, filename, line_number):
-        """Set tree item user data: filename (string) and line_number (int)"""
-        set_item_user_text(item, '%s%s%d' % (filename, self.SEP, line_number))
 
-    def get_item_data(self, item):
-        """Get tree item user data: (filename, line_number)"""
-        filename, line_number_str = get_item_user_text(item).split(self.SEP)
-        return filename, int(line_number_str)
+        self.profiler_model = ProfilerTreeModel(
+            self, self.header_list, self.icon_list)
+        self.setModel(self.profiler_model)
+        self.setUniformRowHeights(True)
+        self.initialize_view()
+        self.activated.connect(self.item_activated)
 
     def initialize_view(self):
         """Clean the tree and view parameters"""
-        self.clear()
-        self.item_depth = 0   # To be use for collapsing/expanding one level
-        self.item_list = []  # To be use for collapsing/expanding one level
-        self.items_to_be_shown = {}
+        self.profiler_model.clear()
         self.current_view_depth = 0
 
     def load_data(self, profdatafile):
@@ -725,6 +1171,7 @@ def load_data(self, profdatafile):
             stats_indi = [pstats.Stats(profdatafile), ]
         except (OSError, IOError):
             self.profdata = None
+            self.profile_data = None
             return
         self.profdata = stats_indi[0]
 
@@ -739,10 +1186,9 @@ def load_data(self, profdatafile):
                       "The error was<br><br>"
                       "<tt>{0}</tt>").format(e))
                 self.compare_file = None
-        map(lambda x: x.calc_callees(), stats_indi)
-        self.profdata.calc_callees()
         self.stats1 = stats_indi
         self.stats = stats_indi[0].stats
+        self.profile_data = ProfileData(*stats_indi)
 
     def compare(self, filename):
         self.hide_diff_cols(False)
@@ -760,86 +1206,41 @@ def save_data(self, filename):
     def find_root(self):
         """Find a function without a caller"""
         # Fixes spyder-ide/spyder#8336.
-        if self.profdata is not None:
-            self.profdata.sort_stats("cumulative")
-        else:
+        if self.profile_data is None:
             return
-        for func in self.profdata.fcn_list:
-            if ('~', 0) != func[0:2] and not func[2].startswith(
-                    '<built-in method exec>'):
-                # This skips the profiler function at the top of the list
-                # it does only occur in Python 3
-                return func
+        func = self.profile_data.find_root()
+        if func is not None:
+            return self.profile_data.keys[func]
 
     def find_callees(self, parent):
         """Find all functions called by (parent) function."""
-        # FIXME: This implementation is very inneficient, because it
-        #        traverses all the data to find children nodes (callees)
-        return self.profdata.all_callees[parent]
+        data = self.profile_data
+        return [data.keys[func]
+                for func in data.get_callees(data.ids[parent])]
 
     def show_tree(self):
         """Populate the tree with profiler data and display it."""
         self.initialize_view()  # Clear before re-populating
-        self.setItemsExpandable(True)
-        self.setSortingEnabled(False)
         rootkey = self.find_root()  # This root contains profiler overhead
         if rootkey is not None:
-            self.populate_tree(self, self.find_callees(rootkey))
+            self.profiler_model.set_data(
+                self.profile_data,
+                self.profile_data.ids[rootkey],
+                compare=len(self.stats1) > 1
+            )
             self.resizeColumnToContents(0)
             self.setSortingEnabled(True)
-            self.sortItems(1, Qt.AscendingOrder)  # FIXME: hardcoded index
+            self.sortByColumn(1, Qt.AscendingOrder)  # FIXME: hardcoded index
             self.change_view(1)
 
     def function_info(self, functionKey):
         """Returns processed information about the function's name and file."""
-        node_type = 'function'
-        filename, line_number, function_name = functionKey
-        if function_name == '<module>':
-            modulePath, moduleName = osp.split(filename)
-            node_type = 'module'
-            if moduleName == '__init__.py':
-                modulePath, moduleName = osp.split(modulePath)
-            function_name = '<' + moduleName + '>'
-        if not filename or filename == '~':
-            file_and_line = '(built-in)'
-            node_type = 'builtin'
-        else:
-            if function_name == '__init__':
-                node_type = 'constructor'
-            file_and_line = '%s : %d' % (filename, line_number)
-        return filename, line_number, function_name, file_and_line, node_type
+        return function_info(functionKey)
 
     @staticmethod
     def format_measure(measure):
         """Get format and units for data coming from profiler task."""
-        # Convert to a positive value.
-        measure = abs(measure)
-
-        # For number of calls
-        if isinstance(measure, int):
-            return to_text_string(measure)
-
-        # For time measurements
-        if 1.e-9 < measure <= 1.e-6:
-            measure = u"{0:.2f} ns".format(measure / 1.e-9)
-        elif 1.e-6 < measure <= 1.e-3:
-            measure = u"{0:.2f} \u03BCs".format(measure / 1.e-6)
-        elif 1.e-3 < measure <= 1:
-            measure = u"{0:.2f} ms".format(measure / 1.e-3)
-        elif 1 < measure <= 60:
-            measure = u"{0:.2f} s".format(measure)
-        elif 60 < measure <= 3600:
-            m, s = divmod(measure, 3600)
-            if s > 60:
-                m, s = divmod(measure, 60)
-                s = to_text_string(s).split(".")[-1]
-            measure = u"{0:.0f}.{1:.2s} min".format(m, s)
-        else:
-            h, m = divmod(measure, 3600)
-            if m > 60:
-                m /= 60
-            measure = u"{0:.0f}h:{1:.0f}min".format(h, m)
-        return measure
+        return format_measure(measure)
 
     def color_string(self, x):
         """Return a string formatted delta for the values in x.
@@ -857,12 +1258,9 @@ def color_string(self, x):
         color = "black"
 
         if len(x) == 2 and self.compare_file is not None:
-            difference = x[0] - x[1]
-            if difference:
-                color, sign = ((SpyderPalette.COLOR_SUCCESS_1, '-')
-                               if difference < 0
-                               else (SpyderPalette.COLOR_ERROR_1, '+'))
-                diff_str = '{}{}'.format(sign, self.format_measure(difference))
+            diff_str, diff_color = format_difference(x[0] - x[1])
+            if diff_color is not None:
+                color = diff_color
         return [self.format_measure(x[0]), [diff_str, color]]
 
     def format_output(self, child_key):
@@ -880,118 +1278,27 @@ def format_output(self, child_key):
         data = [x.stats.get(child_key, [0, 0, 0, 0, {}]) for x in self.stats1]
         return (map(self.color_string, islice(zip(*data), 1, 4)))
 
-    def populate_tree(self, parentItem, children_list):
-        """
-        Recursive method to create each item (and associated data)
-        in the tree.
-        """
-        for child_key in children_list:
-            self.item_depth += 1
-            (filename, line_number, function_name, file_and_line, node_type
-             ) = self.function_info(child_key)
-
-            ((total_calls, total_calls_dif), (loc_time, loc_time_dif),
-             (cum_time, cum_time_dif)) = self.format_output(child_key)
-
-            child_item = TreeWidgetItem(parentItem)
-            self.item_list.append(child_item)
-            self.set_item_data(child_item, filename, line_number)
-
-            # FIXME: indexes to data should be defined by a dictionary on init
-            child_item.setToolTip(0, _('Function or module name'))
-            child_item.setData(0, Qt.DisplayRole, function_name)
-            child_item.setIcon(0, self.icon_list[node_type])
-
-            child_item.setToolTip(1, _('Time in function '
-                                       '(including sub-functions)'))
-            child_item.setData(1, Qt.DisplayRole, cum_time)
-            child_item.setTextAlignment(1, Qt.AlignRight)
-
-            child_item.setData(2, Qt.DisplayRole, cum_time_dif[0])
-            child_item.setForeground(2, QColor(cum_time_dif[1]))
-            child_item.setTextAlignment(2, Qt.AlignLeft)
-
-            child_item.setToolTip(3, _('Local time in function '
-                                       '(not in sub-functions)'))
-
-            child_item.setData(3, Qt.DisplayRole, loc_time)
-            child_item.setTextAlignment(3, Qt.AlignRight)
-
-            child_item.setData(4, Qt.DisplayRole, loc_time_dif[0])
-            child_item.setForeground(4, QColor(loc_time_dif[1]))
-            child_item.setTextAlignment(4, Qt.AlignLeft)
-
-            child_item.setToolTip(5, _('Total number of calls '
-                                       '(including recursion)'))
-
-            child_item.setData(5, Qt.DisplayRole, total_calls)
-            child_item.setTextAlignment(5, Qt.AlignRight)
-
-            child_item.setData(6, Qt.DisplayRole, total_calls_dif[0])
-            child_item.setForeground(6, QColor(total_calls_dif[1]))
-            child_item.setTextAlignment(6, Qt.AlignLeft)
-
-            child_item.setToolTip(7, _('File:line '
-                                       'where function is defined'))
-            child_item.setData(7, Qt.DisplayRole, file_and_line)
-            #child_item.setExpanded(True)
-            if self.is_recursive(child_item):
-                child_item.setData(7, Qt.DisplayRole, '(%s)' % _('recursion'))
-                child_item.setDisabled(True)
-            else:
-                callees = self.find_callees(child_key)
-                if self.item_depth < 3:
-                    self.populate_tree(child_item, callees)
-                elif callees:
-                    child_item.setChildIndicatorPolicy(child_item.ShowIndicator)
-                    self.items_to_be_shown[id(child_item)] = callees
-            self.item_depth -= 1
-
-    def item_activated(self, item):
-        filename, line_number = self.get_item_data(item)
-        self.sig_edit_goto_requested.emit(filename, line_number, '')
-
-    def item_expanded(self, item):
-        if item.childCount() == 0 and id(item) in self.items_to_be_shown:
-            callees = self.items_to_be_shown[id(item)]
-            self.populate_tree(item, callees)
-
-    def is_recursive(self, child_item):
-        """Returns True is a function is a descendant of itself."""
-        ancestor = child_item.parent()
-        # FIXME: indexes to data should be defined by a dictionary on init
-        while ancestor:
-            if (child_item.data(0, Qt.DisplayRole
-                                ) == ancestor.data(0, Qt.DisplayRole) and
-                child_item.data(7, Qt.DisplayRole
-                                ) == ancestor.data(7, Qt.DisplayRole)):
-                return True
-            else:
-                ancestor = ancestor.parent()
-        return False
-
-    def get_top_level_items(self):
-        """Iterate over top level items"""
-        return [self.topLevelItem(_i)
-                for _i in range(self.topLevelItemCount())]
+    def item_activated(self, index):
+        if self.profiler_model.is_recursive(index):
+            return
+        key = self.profiler_model.get_key(index)
+        if key is not None:
+            filename, line_number = key[:2]
+            self.sig_edit_goto_requested.emit(filename, line_number, '')
 
     def get_items(self, maxlevel):
-        """Return all items with a level <= `maxlevel`"""
-        itemlist = []
-
-        def add_to_itemlist(item, maxlevel, level=1):
-            level += 1
-            for index in range(item.childCount()):
-                citem = item.child(index)
-                itemlist.append(citem)
-                if level <= maxlevel:
-                    add_to_itemlist(citem, maxlevel, level)
-
-        for tlitem in self.get_top_level_items():
-            itemlist.append(tlitem)
-            if maxlevel > 0:
-                add_to_itemlist(tlitem, maxlevel=maxlevel)
-        return itemlist
+        """Return the indexes of all items with a level <= `maxlevel`"""
+        model = self.profiler_model
+        indexes = []
+        parents = [QModelIndex()]
+        for __ in range(maxlevel + 1):
+            level_indexes = []
+            for parent in parents:
+                for row in range(model.rowCount(parent)):
+                    level_indexes.append(model.index(row, 0, parent))
+            indexes.extend(level_indexes)
+            parents = level_indexes
+        return indexes
 
     def change_view(self, change_in_depth):
         """Change view depth by expanding or collapsing all same-level nodes"""
@@ -1000,8 +1307,8 @@ def change_view(self, change_in_depth):
             self.current_view_depth = 0
         self.collapseAll()
         if self.current_view_depth > 0:
-            for item in self.get_items(maxlevel=self.current_view_depth - 1):
-                item.setExpanded(True)
+            for index in self.get_items(maxlevel=self.current_view_depth - 1):
+                self.setExpanded(index, True)
 
 
 # =============================================================================
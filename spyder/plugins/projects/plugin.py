@@ -570,7 +570,7 @@ def _display_items_in_switcher(self, items, setup, clear_section):
                 data=path,
                 last_item=is_last_item,
                 score=1e10,  # To make the editor results appear first
-                use_score=False  # Results come from fzf in the right order
+                use_score=False  # Results are already in the right order
             )
 
         if setup:
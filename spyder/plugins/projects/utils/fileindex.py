@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the files of a project that can be opened in the editor.
+
+The index is built once by walking the project directory and then kept up to
+date with the changes reported by the workspace watcher, so that looking for
+files in the switcher doesn't require walking the project again.
+"""
+
+# Standard library imports
+import bisect
+import heapq
+from itertools import accumulate
+import os
+import os.path as osp
+import re
+
+# Local imports
+from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.plugins.projects.utils.watcher import FOLDERS_TO_IGNORE
+
+
+# ---- Auxiliary functions
+# -----------------------------------------------------------------------------
+def add_line(start, length):
+    """Get the start of the line after one of the given length."""
+    return start + length + 1
+
+
+def ignore_folder(name):
+    """Check if a folder should not be indexed."""
+    return name.startswith(".") or name in FOLDERS_TO_IGNORE
+
+
+def walk_files(root, path=None):
+    """
+    Get the relative paths to root of the files that can be opened in the
+    editor, under path.
+
+    path is root if not given.
+    """
+    files = []
+    pending = [path if path is not None else root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not ignore_folder(entry.name):
+                            pending.append(entry.path)
+                    elif (
+                        osp.splitext(entry.name)[1] in EDIT_EXTENSIONS
+                        and not entry.name.startswith(".")
+                    ):
+                        files.append(osp.relpath(entry.path, root))
+                except OSError:
+                    continue
+
+    return files
+
+
+def get_search_regex(query):
+    """
+    Get a regular expression that matches the lines of text that contain the
+    characters of query in the same order.
+
+    Every character is matched with its first occurrence after the previous
+    one, so the regex doesn't need to backtrack to reject a line.
+    """
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        char = re.escape(char)
+        parts.append(f"[^{char}\n]*{char}")
+    return re.compile("".join(parts))
+
+
+# ---- Index
+# -----------------------------------------------------------------------------
+def build_index(root):
+    """
+    Build the index of the files of the project at root.
+
+    This can take a while for large projects, so it's meant to be called in
+    a thread.
+    """
+    index = ProjectFileIndex(root, walk_files(root))
+
+    # Prepare the index to be searched
+    index._get_texts()
+    return index
+
+
+class ProjectFileIndex:
+    """
+    Index of the files of a project that can be opened in the editor.
+
+    Paths are kept relative to the project root and sorted by length. To
+    search them, they're also joined in lowercase in a single text, and so
+    are their file names, so that matches can be found by string methods
+    and regular expressions scanning those texts, which stop as soon as
+    enough results are found.
+    """
+
+    def __init__(self, root, files=()):
+        self.root = root
+        self._keys = sorted((len(path), path) for path in set(files))
+        self._paths = [self._lower(path) for __, path in self._keys]
+        self._names = [osp.basename(path) for path in self._paths]
+        self._texts = None
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, path):
+        relpath = self._relpath(path)
+        return relpath is not None and self._find(relpath) is not None
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def add_file(self, path):
+        """Add the file at path to the index."""
+        if osp.splitext(path)[1] not in EDIT_EXTENSIONS:
+            return
+
+        relpath = self._relpath(path)
+        if relpath is None:
+            return
+
+        parts = relpath.split(os.sep)
+        if (
+            parts[-1].startswith(".")
+            or any(ignore_folder(part) for part in parts[:-1])
+        ):
+            return
+
+        self._insert(relpath)
+
+    def add_folder(self, path):
+        """Add the files under the folder at path to the index."""
+        if self._relpath(path) is None:
+            return
+
+        self._insert_many(walk_files(self.root, path))
+
+    def remove(self, path):
+        """Remove the file at path, or the files under it, from the index."""
+        relpath = self._relpath(path)
+        if relpath is None:
+            return
+
+        index = self._find(relpath)
+        if index is not None:
+            self._delete(index)
+        else:
+            prefix = relpath + os.sep
+            self._delete_many(
+                [k[1].startswith(prefix) for k in self._keys])
+
+    def search(self, query, limit=None):
+        """
+        Get the absolute paths of the indexed files that match query, from
+        the best match to the worst, or from the shortest to the longest if
+        query is empty.
+
+        The characters of query have to be found in the same order in the
+        paths, ignoring case. Paths whose file name starts with query are the
+        best matches, followed by those whose file name contains it, those
+        that contain it in the name of their folders, and the rest, and
+        shorter paths are preferred among them. Up to limit paths are
+        returned.
+        """
+        query = query.lower().strip()
+        count = len(self._keys) if limit is None else limit
+        if not query:
+            indexes = range(min(count, len(self._keys)))
+        elif "\n" in query:
+            indexes = []
+        else:
+            indexes = []
+            found = set()
+            for index in self._search(query):
+                if index not in found:
+                    found.add(index)
+                    indexes.append(index)
+                    if len(indexes) == count:
+                        break
+
+        return [osp.join(self.root, self._keys[i][1]) for i in indexes]
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _get_texts(self):
+        """
+        Get the texts with the names and paths of the files, one per line,
+        and the positions where their lines start.
+        """
+        if self._texts is None:
+            paths = self._paths
+            names = self._names
+
+            # Lines start after a newline, including the first one.
+            names_text = "\n" + "\n".join(names) + "\n"
+            paths_text = "\n" + "\n".join(paths) + "\n"
+            names_starts = list(
+                accumulate(map(len, names), add_line, initial=1))
+            paths_starts = list(
+                accumulate(map(len, paths), add_line, initial=1))
+
+            self._texts = (
+                (names_text, names_starts),
+                (paths_text, paths_starts),
+            )
+        return self._texts
+
+    def _search(self, query):
+        """
+        Generator of the indexes of the paths that match query, by tiers.
+
+        Paths can be generated more than once.
+        """
+        names, paths = self._get_texts()
+        regex = get_search_regex(query)
+
+        yield from self._find_lines(names, "\n" + query, offset=1)
+        yield from self._find_lines(names, query)
+        yield from self._find_lines(paths, query)
+        yield from self._find_lines(paths, regex)
+
+    @staticmethod
+    def _lower(path):
+        """
+        Get path in lowercase, as it's searched.
+
+        Newlines, which are only possible in paths on Linux, are replaced so
+        as not to break the lines of the texts to search.
+        """
+        return path.lower().replace("\n", "\x00")
+
+    @staticmethod
+    def _find_lines(text_starts, pattern, offset=0):
+        """
+        Generator of the numbers of the lines of a text that contain pattern,
+        a string or a regular expression, in order.
+
+        offset is the position of the line start relative to the match.
+        """
+        text, starts = text_starts
+        if isinstance(pattern, str):
+            def find(pos):
+                return text.find(pattern, pos)
+        else:
+            def find(pos):
+                match = pattern.search(text, pos)
+                return match.start() if match is not None else -1
+
+        pos = find(0)
+        while pos >= 0:
+            line = bisect.bisect_right(starts, pos + offset) - 1
+            yield line
+
+            # Skip the rest of the line
+            pos = find(starts[line + 1])
+
+    def _find(self, relpath):
+        """Get the position of relpath in the index or None."""
+        key = (len(relpath), relpath)
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return index
+        return None
+
+    def _insert(self, relpath):
+        """Insert relpath in the index, if it's not there yet."""
+        key = (len(relpath), relpath)
+        index = bisect.bisect_left(self._keys, key)
+        if index < len(self._keys) and self._keys[index] == key:
+            return
+
+        self._keys.insert(index, key)
+        self._paths.insert(index, self._lower(relpath))
+        self._names.insert(index, osp.basename(self._paths[index]))
+        self._texts = None
+
+    def _insert_many(self, relpaths):
+        """
+        Insert the relpaths that are not in the index yet.
+
+        The new paths are sorted apart and merged with the index in a single
+        pass, instead of being inserted one by one.
+        """
+        keys = sorted(
+            key for key in {(len(relpath), relpath) for relpath in relpaths}
+            if self._find(key[1]) is None
+        )
+        if not keys:
+            return
+
+        paths = [self._lower(relpath) for __, relpath in keys]
+        names = [osp.basename(path) for path in paths]
+        entries = heapq.merge(
+            zip(self._keys, self._paths, self._names),
+            zip(keys, paths, names),
+            key=lambda entry: entry[0]
+        )
+        self._keys, self._paths, self._names = map(list, zip(*entries))
+        self._texts = None
+
+    def _delete(self, index):
+        """Delete the path at index."""
+        del self._keys[index]
+        del self._paths[index]
+        del self._names[index]
+        self._texts = None
+
+    def _delete_many(self, deleted):
+        """
+        Delete the paths whose position is True in deleted, in a single pass.
+        """
+        if not any(deleted):
+            return
+
+        self._keys, self._paths, self._names = (
+            [item for item, d in zip(items, deleted) if not d]
+            for items in (self._keys, self._paths, self._names)
+        )
+        self._texts = None
+
+    def _relpath(self, path):
+        """Get path relative to the root, or None if it's not under it."""
+        path = osp.normpath(path)
+        if not osp.isabs(path):
+            return path
+
+        try:
+            relpath = osp.relpath(path, self.root)
+        except ValueError:
+            # Path on a different drive on Windows
+            return None
+        if relpath == os.pardir or relpath.startswith(os.pardir + os.sep):
+            return None
+        return relpath
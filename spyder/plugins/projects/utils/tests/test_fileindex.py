@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the index of project files."""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils.fileindex import (
+    build_index, ProjectFileIndex)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with some files in it."""
+    for path in ['main.py', 'utils/domain.py', 'utils/strings.py',
+                 'docs/readme.md', 'build/main.py', '.git/main.py',
+                 'utils/.hidden.py', 'image.png']:
+        file = tmp_path / path
+        file.parent.mkdir(exist_ok=True)
+        file.touch()
+    return str(tmp_path)
+
+
+def relpaths(project, paths):
+    return [osp.relpath(path, project) for path in paths]
+
+
+def test_build_index(project):
+    """Test that only files that can be opened in the editor are indexed."""
+    index = build_index(project)
+    assert sorted(relpaths(project, index.search(''))) == [
+        'docs' + osp.sep + 'readme.md',
+        'main.py',
+        'utils' + osp.sep + 'domain.py',
+        'utils' + osp.sep + 'strings.py',
+    ]
+
+
+def test_search(project):
+    """Test the order of search results."""
+    index = build_index(project)
+    utils = 'utils' + osp.sep
+
+    # File names that start with the query come first
+    assert relpaths(project, index.search('MAIN')) == [
+        'main.py', utils + 'domain.py']
+
+    # Then the ones that contain it in folders and the rest
+    assert relpaths(project, index.search('ut')) == [
+        utils + 'domain.py', utils + 'strings.py']
+    assert relpaths(project, index.search('dmn')) == [utils + 'domain.py']
+    assert relpaths(project, index.search('ut', limit=1)) == [
+        utils + 'domain.py']
+    assert index.search('foo') == []
+
+
+def test_update_index(project):
+    """Test adding and removing files from the index."""
+    index = ProjectFileIndex(project)
+    assert len(index) == 0
+
+    index.add_folder(osp.join(project, 'utils'))
+    assert len(index) == 2
+
+    index.add_file(osp.join(project, 'new.py'))
+    index.add_file(osp.join(project, 'build', 'new.py'))
+    index.add_file(osp.join(project, 'new.png'))
+    index.add_file(osp.join(osp.dirname(project), 'new.py'))
+    assert osp.join(project, 'new.py') in index
+    assert len(index) == 3
+    assert relpaths(project, index.search('new')) == ['new.py']
+
+    index.remove(osp.join(project, 'utils'))
+    assert len(index) == 1
+
+    index.remove(osp.join(project, 'new.py'))
+    assert len(index) == 0
+    assert index.search('new') == []
+
+    # Files added with a folder are kept in order and not duplicated
+    index.add_file(osp.join(project, 'utils', 'domain.py'))
+    index.add_folder(project)
+    index.add_folder(project)
+    assert index.search('') == build_index(project).search('')
+    assert index.search('ut') == build_index(project).search('ut')
+
+    index.remove(osp.join(project, 'utils'))
+    assert relpaths(project, index.search('')) == [
+        'main.py', 'docs' + osp.sep + 'readme.md']
+
+
+if __name__ == "__main__":
+    pytest.main()
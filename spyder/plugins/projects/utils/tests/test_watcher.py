@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for the workspace watcher."""
+
+# Standard library imports
+import os.path as osp
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils.watcher import (
+    FileChangeKind, ignore_path, MANY_FILES_CHANGED, WorkspaceWatcher)
+
+
+@pytest.fixture
+def watcher(qtbot):
+    watcher = WorkspaceWatcher()
+    yield watcher
+    watcher.stop()
+
+
+def test_ignore_path(tmp_path):
+    """Test that paths in hidden and ignored folders are ignored."""
+    root = str(tmp_path / '.hidden' / 'project')
+    assert not ignore_path(osp.join(root, 'main.py'), root)
+    assert ignore_path(osp.join(root, '.git', 'main.py'), root)
+    assert ignore_path(osp.join(root, '__pycache__', 'main.pyc'), root)
+    assert ignore_path(osp.join(root, 'main.py'))
+
+
+def test_few_changes(qtbot, watcher):
+    """Test that a few changes are notified one by one."""
+    handler = watcher.event_handler
+    notified = []
+    watcher.sig_file_created.connect(lambda *args: notified.append(args))
+    watcher.sig_file_modified.connect(lambda *args: notified.append(args))
+    watcher.sig_file_moved.connect(lambda *args: notified.append(args))
+
+    with qtbot.assertNotEmitted(watcher.sig_files_changed, wait=0):
+        handler.sig_file_created.emit('a.py', False)
+
+        # Repeated events are notified once
+        handler.sig_file_modified.emit('a.py', False)
+        handler.sig_file_modified.emit('a.py', False)
+        handler.sig_file_moved.emit('a.py', 'b.py', False)
+
+        # Changes are notified after a while
+        assert notified == []
+        qtbot.waitUntil(lambda: len(notified) == 3, timeout=3000)
+
+    assert notified == [
+        ('a.py', False), ('a.py', False), ('a.py', 'b.py', False)
+    ]
+
+
+def test_many_changes(qtbot, watcher):
+    """Test that many changes at once are notified together."""
+    handler = watcher.event_handler
+
+    with qtbot.assertNotEmitted(watcher.sig_file_created, wait=0):
+        with qtbot.waitSignal(
+            watcher.sig_files_changed, timeout=3000
+        ) as blocker:
+            for i in range(MANY_FILES_CHANGED):
+                handler.sig_file_created.emit(f'{i}.py', False)
+            handler.sig_file_deleted.emit('folder', True)
+
+    changes = blocker.args[0]
+    assert len(changes) == MANY_FILES_CHANGED + 1
+    assert changes[0] == (FileChangeKind.Created, '0.py', None, False)
+    assert changes[-1] == (FileChangeKind.Deleted, 'folder', None, True)
+
+
+def test_start_observer(tmp_path, watcher):
+    """Test that the watcher can use both kinds of observers."""
+    watcher.start(str(tmp_path))
+    assert watcher.observer is not None
+    assert 'Polling' not in type(watcher.observer).__name__
+    watcher.stop()
+
+    watcher.start(str(tmp_path), use_polling=True)
+    assert 'Polling' in type(watcher.observer).__name__
@@ -10,12 +10,13 @@
 import os
 import logging
 from pathlib import Path
+import time
 
 # Third-party imports
-from qtpy.QtCore import QObject, Signal
-from superqt.utils import qthrottled
+from qtpy.QtCore import QObject, QTimer, Signal
 import watchdog
 from watchdog.events import FileSystemEventHandler, PatternMatchingEventHandler
+from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserverVFS
 
 # Local imports
@@ -31,6 +32,23 @@
     "build",
 ]
 
+# Time to wait for more events before notifying them all together
+COALESCING_TIMEOUT = 200  # ms
+
+# Maximum time to delay events while waiting for more
+COALESCING_MAX_DELAY = 1000  # ms
+
+# Number of events notified together from which they're considered a change
+# of many files (e.g. after switching git branches)
+MANY_FILES_CHANGED = 50
+
+
+class FileChangeKind:
+    Created = 'created'
+    Moved = 'moved'
+    Deleted = 'deleted'
+    Modified = 'modified'
+
 
 # ---- Monkey patches
 # -----------------------------------------------------------------------------
@@ -64,7 +82,20 @@ def run_wrapper(self):
 # -----------------------------------------------------------------------------
 def ignore_entry(entry: os.DirEntry) -> bool:
     """Check if an entry should be ignored."""
-    parts = Path(entry.path).parts
+    return ignore_path(entry.path)
+
+
+def ignore_path(path: str, root: str = None) -> bool:
+    """
+    Check if a path should be ignored.
+
+    If root is given, only the parts of path relative to it are checked.
+    """
+    parts = Path(path).parts
+    if root is not None:
+        root_parts = Path(root).parts
+        if parts[:len(root_parts)] == root_parts:
+            parts = parts[len(root_parts):]
 
     # Ignore files in hidden directories (e.g. .git)
     if any([p.startswith(".") for p in parts]):
@@ -118,6 +149,9 @@ def __init__(self, parent=None):
             patterns=[f"*{ext}" for ext in EDIT_EXTENSIONS],
         )
 
+        # Folder being watched
+        self.root = None
+
     def fmt_is_dir(self, is_dir):
         return 'directory' if is_dir else 'file'
 
@@ -151,6 +185,14 @@ def on_modified(self, event):
         self.sig_file_modified.emit(src_path, is_dir)
 
     def dispatch(self, event):
+        # OS-based observers report events for all paths, contrary to the
+        # polling one, which doesn't list ignored entries.
+        dest_path = getattr(event, 'dest_path', None)
+        if ignore_path(event.src_path, self.root) and (
+            not dest_path or ignore_path(dest_path, self.root)
+        ):
+            return
+
         # Don't apply patterns to directories, only to files
         if event.is_directory:
             FileSystemEventHandler.dispatch(self, event)
@@ -165,6 +207,11 @@ class WorkspaceWatcher(QObject):
     Wrapper class around watchdog observer and notifier.
 
     It provides methods to start and stop watching folders.
+
+    Events are collected until no new ones arrive for COALESCING_TIMEOUT (or
+    COALESCING_MAX_DELAY passes) and then notified. If there are at least
+    MANY_FILES_CHANGED of them, they're notified together with
+    sig_files_changed instead of one by one.
     """
 
     observer = None
@@ -174,6 +221,17 @@ class WorkspaceWatcher(QObject):
     sig_file_deleted = Signal(str, bool)
     sig_file_modified = Signal(str, bool)
 
+    sig_files_changed = Signal(list)
+    """
+    This signal is emitted when many files changed at once.
+
+    Parameters
+    ----------
+    changes: list
+        List of (kind, path, dest_path, is_dir) tuples, where kind is one of
+        FileChangeKind and dest_path is None unless files were moved.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.event_handler = WorkspaceEventHandler(self)
@@ -183,37 +241,61 @@ def __init__(self, parent=None):
         self.event_handler.sig_file_deleted.connect(self.on_deleted)
         self.event_handler.sig_file_modified.connect(self.on_modified)
 
+        # Events waiting to be notified
+        self._changes = []
+        self._changes_start = None
+        self._changes_timer = QTimer(self)
+        self._changes_timer.setSingleShot(True)
+        self._changes_timer.timeout.connect(self._notify_changes)
+
     def connect_signals(self, project):
         self.sig_file_created.connect(project.file_created)
         self.sig_file_moved.connect(project.file_moved)
         self.sig_file_deleted.connect(project.file_deleted)
         self.sig_file_modified.connect(project.file_modified)
+        self.sig_files_changed.connect(project.files_changed)
+
+    def start(self, workspace_folder, use_polling=False):
+        """
+        Start watching workspace_folder.
+
+        By default, an OS-based observer (e.g. inotify on Linux) is used,
+        which doesn't consume resources when nothing changes. If use_polling
+        is True or it can't be started (e.g. because the limit of inotify
+        watches was reached), the observer polls the folder for changes
+        instead.
+        """
+        self.event_handler.root = workspace_folder
+
+        if not use_polling:
+            # Bursts of events generated by this observer (e.g. when
+            # switching git branches) are coalesced before notifying them.
+            self.observer = Observer()
+            if self._start_observer(workspace_folder):
+                return
 
-    def start(self, workspace_folder):
-        # We use a polling observer because:
-        # * It doesn't introduce long freezes on Linux when switching git
-        #   branches that have many changes between them. That's because the
-        #   OS-based observer (i.e. inotify) generates way too many events.
-        # * The OS-based observer on Windows has many shortcomings (see
-        #   openmsi/openmsistream#56).
-        # * There doesn't seem to be issues on Mac, but it's simpler to use a
-        #   single observer for all OSes.
+            logger.debug(
+                f"Falling back to a polling observer for: {workspace_folder}."
+            )
+
+        # The polling observer only lists the entries that we want to track
+        # and works the same on all OSes, but it needs to stat the whole
+        # folder periodically. It's used by default on Windows because the
+        # OS-based observer there has many shortcomings (see
+        # openmsi/openmsistream#56).
         self.observer = PollingObserverVFS(
             stat=os.stat, listdir=filter_scandir
         )
-
-        self.observer.schedule(
-            self.event_handler, workspace_folder, recursive=True
-        )
-
-        try:
-            self.observer.start()
-        except Exception:
+        if not self._start_observer(workspace_folder):
             logger.debug(
                 f"Observer could not be started for: {workspace_folder}."
             )
 
     def stop(self):
+        self._changes_timer.stop()
+        self._changes = []
+        self._changes_start = None
+
         if self.observer is not None:
             # This is required to avoid showing an error when closing
             # projects.
@@ -226,18 +308,78 @@ def stop(self):
             except RuntimeError:
                 pass
 
-    @qthrottled(timeout=200)
     def on_moved(self, src_path, dest_path, is_dir):
-        self.sig_file_moved.emit(src_path, dest_path, is_dir)
+        self._add_change(FileChangeKind.Moved, src_path, dest_path, is_dir)
 
-    @qthrottled(timeout=200)
     def on_created(self, path, is_dir):
-        self.sig_file_created.emit(path, is_dir)
+        self._add_change(FileChangeKind.Created, path, None, is_dir)
 
-    @qthrottled(timeout=200)
     def on_deleted(self, path, is_dir):
-        self.sig_file_deleted.emit(path, is_dir)
+        self._add_change(FileChangeKind.Deleted, path, None, is_dir)
 
-    @qthrottled(timeout=200)
     def on_modified(self, path, is_dir):
-        self.sig_file_modified.emit(path, is_dir)
+        self._add_change(FileChangeKind.Modified, path, None, is_dir)
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _start_observer(self, workspace_folder):
+        """Start the observer and return whether that was possible."""
+        try:
+            self.observer.schedule(
+                self.event_handler, workspace_folder, recursive=True
+            )
+            self.observer.start()
+        except Exception:
+            logger.debug(
+                f"{type(self.observer).__name__} could not be started for: "
+                f"{workspace_folder}.",
+                exc_info=True
+            )
+            try:
+                self.observer.stop()
+            except Exception:
+                pass
+            self.observer = None
+            return False
+
+        return True
+
+    def _add_change(self, kind, path, dest_path, is_dir):
+        """Add a change to the ones waiting to be notified."""
+        change = (kind, path, dest_path, is_dir)
+
+        # Files are usually modified several times in a row when saved
+        if change in self._changes[-1:]:
+            return
+
+        now = time.monotonic()
+        if not self._changes:
+            self._changes_start = now
+        self._changes.append(change)
+
+        if (now - self._changes_start) * 1000 >= COALESCING_MAX_DELAY:
+            self._notify_changes()
+        else:
+            self._changes_timer.start(COALESCING_TIMEOUT)
+
+    def _notify_changes(self):
+        """Notify the changes waiting to be notified."""
+        self._changes_timer.stop()
+        changes = self._changes
+        self._changes = []
+        self._changes_start = None
+
+        if len(changes) >= MANY_FILES_CHANGED:
+            logger.info(f"{len(changes)} files changed")
+            self.sig_files_changed.emit(changes)
+            return
+
+        for kind, path, dest_path, is_dir in changes:
+            if kind == FileChangeKind.Created:
+                self.sig_file_created.emit(path, is_dir)
+            elif kind == FileChangeKind.Moved:
+                self.sig_file_moved.emit(path, dest_path, is_dir)
+            elif kind == FileChangeKind.Deleted:
+                self.sig_file_deleted.emit(path, is_dir)
+            else:
+                self.sig_file_modified.emit(path, is_dir)
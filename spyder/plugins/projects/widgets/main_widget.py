@@ -23,12 +23,12 @@
     QHBoxLayout, QInputDialog, QLabel, QMessageBox, QVBoxLayout, QWidget)
 
 # Local imports
+from spyder.api.config.decorators import on_conf_change
 from spyder.api.exceptions import SpyderAPIError
 from spyder.api.translations import _
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.config.base import (
     get_home_dir, get_project_config_folder, running_under_pytest)
-from spyder.config.utils import EDIT_EXTENSIONS
 from spyder.plugins.completion.api import (
     CompletionRequestTypes, FileChangeType)
 from spyder.plugins.completion.decorators import (
@@ -36,14 +36,15 @@
 from spyder.plugins.explorer.api import DirViewActions
 from spyder.plugins.projects.api import (
     BaseProjectType, EmptyProject, WORKSPACE)
-from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
+from spyder.plugins.projects.utils.fileindex import build_index
+from spyder.plugins.projects.utils.watcher import (
+    FileChangeKind, WorkspaceWatcher)
 from spyder.plugins.projects.widgets.projectdialog import ProjectDialog
 from spyder.plugins.projects.widgets.projectexplorer import (
     ProjectExplorerTreeWidget)
 from spyder.plugins.switcher.utils import get_file_icon, shorten_paths
 from spyder.utils import encoding
 from spyder.utils.misc import getcwd_or_home
-from spyder.utils.programs import find_program
 from spyder.utils.workers import WorkerManager
 from spyder.widgets.helperwidgets import PaneEmptyWidget
 
@@ -65,6 +66,7 @@ class ProjectsActions:
     DeleteProject = 'delete_project_action'
     ClearRecentProjects = 'clear_recent_projects_action'
     MaxRecent = 'max_recent_action'
+    UsePollingWatcher = 'use_polling_watcher_action'
 
 
 class ProjectsMenuSubmenus:
@@ -171,9 +173,13 @@ def __init__(self, name, plugin, parent=None):
         self.current_active_project = None
         self.latest_project = None
         self.completions_available = False
-        self._fzf = find_program('fzf')
         self._default_switcher_paths = []
 
+        # Index of the project files to look for them in the switcher, and
+        # changes to apply to it when it's being built.
+        self._file_index = None
+        self._file_index_changes = None
+
         # -- Tree widget
         self.treewidget = ProjectExplorerTreeWidget(self, self.show_hscrollbar)
         self.treewidget.setup()
@@ -193,7 +199,7 @@ def __init__(self, name, plugin, parent=None):
         self.watcher = WorkspaceWatcher(self)
         self.watcher.connect_signals(self)
 
-        # -- Worker manager for calls to fzf
+        # -- Worker manager to build the index of project files
         self._worker_manager = WorkerManager(self)
 
         # -- Signals
@@ -201,9 +207,7 @@ def __init__(self, name, plugin, parent=None):
 
         # This is necessary to populate the switcher with some default list of
         # paths instead of computing that list every time it's shown.
-        self.sig_project_loaded.connect(
-            lambda p: self._update_default_switcher_paths()
-        )
+        self.sig_project_loaded.connect(lambda p: self._build_file_index())
 
         # Clear saved paths for the switcher when closing the project.
         self.sig_project_closed.connect(lambda p: self._clear_switcher_paths())
@@ -269,12 +273,25 @@ def setup(self):
         self.recent_project_menu.aboutToShow.connect(self._setup_menu_actions)
         self._setup_menu_actions()
 
+        self.use_polling_watcher_action = self.create_action(
+            ProjectsActions.UsePollingWatcher,
+            text=_("Poll the project for file changes"),
+            tip=_(
+                "Look for changes in the project files periodically instead "
+                "of being notified about them by the operating system"
+            ),
+            toggled=True,
+            initial=self.get_conf('use_polling_watcher'),
+            option='use_polling_watcher'
+        )
+
         # Add some DirView actions to the Options menu for easy access.
         menu = self.get_options_menu()
         hidden_action = self.get_action(DirViewActions.ToggleHiddenFiles)
         single_click_action = self.get_action(DirViewActions.ToggleSingleClick)
 
-        for action in [hidden_action, single_click_action]:
+        for action in [hidden_action, single_click_action,
+                       self.use_polling_watcher_action]:
             self.add_item_to_menu(
                 action,
                 menu=menu,
@@ -290,6 +307,13 @@ def update_actions(self):
     def on_close(self):
         self._worker_manager.terminate_all()
 
+    @on_conf_change(option='use_polling_watcher')
+    def on_use_polling_watcher_update(self, value):
+        path = self.get_active_project_path()
+        if path is not None:
+            self.watcher.stop()
+            self._start_watcher(path)
+
     # ---- Public API
     # -------------------------------------------------------------------------
     @Slot()
@@ -407,7 +431,7 @@ def open_project(self, path=None, project_type=None, restart_console=True,
             else:
                 self.sig_project_loaded.emit(path)
 
-        self.watcher.start(path)
+        self._start_watcher(path)
 
         if restart_console:
             self.sig_restart_console_requested.emit()
@@ -686,7 +710,15 @@ def handle_switcher_search(self, search_text):
         text: str
             The current search text in the switcher dialog box.
         """
-        self._call_fzf(search_text)
+        if self._file_index is None:
+            return
+
+        paths = self._file_index.search(
+            search_text, limit=self.MAX_SWITCHER_RESULTS
+        )
+        self._display_paths_in_switcher(
+            paths, setup=True, clear_section=True
+        )
 
     # ---- Public API for the LSP
     # -------------------------------------------------------------------------
@@ -720,7 +752,7 @@ def handle_response(self, method, params):
     @Slot(str, bool)
     def file_created(self, src_file, is_dir):
         """Notify LSP server about file creation."""
-        self._update_default_switcher_paths()
+        self._update_file_index(added=src_file, is_dir=is_dir)
 
         # LSP specification only considers file updates
         if is_dir:
@@ -739,7 +771,9 @@ def file_created(self, src_file, is_dir):
              requires_response=False)
     def file_moved(self, src_file, dest_file, is_dir):
         """Notify LSP server about a file that is moved."""
-        self._update_default_switcher_paths()
+        self._update_file_index(
+            removed=src_file, added=dest_file, is_dir=is_dir
+        )
 
         if is_dir:
             return
@@ -765,7 +799,7 @@ def file_moved(self, src_file, dest_file, is_dir):
     @Slot(str, bool)
     def file_deleted(self, src_file, is_dir):
         """Notify LSP server about file deletion."""
-        self._update_default_switcher_paths()
+        self._update_file_index(removed=src_file, is_dir=is_dir)
 
         if is_dir:
             return
@@ -794,6 +828,46 @@ def file_modified(self, src_file, is_dir):
         }
         return params
 
+    @request(method=CompletionRequestTypes.WORKSPACE_WATCHED_FILES_UPDATE,
+             requires_response=False)
+    @Slot(list)
+    def files_changed(self, changes):
+        """
+        Notify LSP server about many file changes at once.
+
+        The changes are (kind, path, dest_path, is_dir) tuples, as emitted by
+        WorkspaceWatcher.sig_files_changed.
+        """
+        # Updating the index for every change would be slower than building
+        # it again.
+        self._build_file_index()
+
+        entries = []
+        for kind, path, dest_path, is_dir in changes:
+            # LSP specification only considers file updates
+            if is_dir:
+                continue
+
+            if kind == FileChangeKind.Created:
+                entries.append({'file': path, 'kind': FileChangeType.CREATED})
+            elif kind == FileChangeKind.Moved:
+                entries.append(
+                    {'file': dest_path, 'kind': FileChangeType.CREATED}
+                )
+                entries.append({'file': path, 'kind': FileChangeType.DELETED})
+            elif kind == FileChangeKind.Deleted:
+                entries.append({'file': path, 'kind': FileChangeType.DELETED})
+            else:
+                entries.append({'file': path, 'kind': FileChangeType.CHANGED})
+
+        if not entries:
+            return
+
+        params = {
+            'params': entries
+        }
+        return params
+
     @request(method=CompletionRequestTypes.WORKSPACE_FOLDERS_CHANGE,
              requires_response=False)
     def notify_project_open(self, path):
@@ -1022,68 +1096,66 @@ def _disable_pdb_prevent_closing(self):
                 "pdb_prevent_closing", pdb_prevent_closing, section="debugger"
             )
 
+    def _start_watcher(self, path):
+        """Start watching the project at path for file changes."""
+        self.watcher.start(
+            path, use_polling=self.get_conf('use_polling_watcher')
+        )
+
     # ---- Private API for the Switcher
     # -------------------------------------------------------------------------
-    def _call_fzf(self, search_text=""):
-        """
-        Call fzf in a worker to get the list of files in the current project
-        that match with `search_text`.
-
-        Parameters
-        ----------
-        search_text: str, optional
-            The search text to pass to fzf.
-        """
+    def _build_file_index(self):
+        """Build the index of the project files in a worker."""
+        self._file_index = None
+        self._default_switcher_paths = []
         project_path = self.get_active_project_path()
-        if self._fzf is None or project_path is None:
+        if project_path is None:
+            self._file_index_changes = None
             return
 
         self._worker_manager.terminate_all()
+        self._file_index_changes = []
 
-        worker = self._worker_manager.create_process_worker(
-            [self._fzf, "--filter", search_text],
-            os.environ.copy()
+        worker = self._worker_manager.create_python_worker(
+            build_index, project_path
         )
-
-        worker.set_cwd(project_path)
-        worker.sig_finished.connect(self._process_fzf_output)
+        worker.sig_finished.connect(self._on_file_index_built)
         worker.start()
 
-    def _process_fzf_output(self, worker, output, error):
-        """Process output that comes from the fzf worker."""
-        if output is None or error:
+    def _on_file_index_built(self, worker, index, error):
+        """Start using the index of project files built in a worker."""
+        if (
+            index is None
+            or error
+            or index.root != self.get_active_project_path()
+        ):
             return
 
-        # Get list of paths from fzf output
-        relative_path_list = output.decode('utf-8').strip().split("\n")
+        # Apply the changes made to the project while building the index.
+        changes = self._file_index_changes
+        self._file_index = index
+        self._file_index_changes = None
+        for removed, added, is_dir in changes:
+            self._update_file_index(removed, added, is_dir)
 
-        # List of results with absolute path
-        if relative_path_list != ['']:
-            project_path = self.get_active_project_path()
-            result_list = [
-                osp.normpath(os.path.join(project_path, path))
-                for path in relative_path_list
-            ]
-        else:
-            result_list = []
+        self._update_default_switcher_paths()
 
-        # Filter files that can be opened in the editor
-        result_list = [
-            path for path in result_list
-            if osp.splitext(path)[1] in EDIT_EXTENSIONS
-        ]
+    def _update_file_index(self, removed=None, added=None, is_dir=False):
+        """Update the index of project files after a change in the project."""
+        if self._file_index is None:
+            if self._file_index_changes is not None:
+                self._file_index_changes.append((removed, added, is_dir))
+            return
 
-        # Limit the number of results to not introduce lags when displaying
-        # them in the switcher.
-        if len(result_list) > self.MAX_SWITCHER_RESULTS:
-            result_list = result_list[:self.MAX_SWITCHER_RESULTS]
+        if removed is not None:
+            self._file_index.remove(removed)
+        if added is not None:
+            if is_dir:
+                self._file_index.add_folder(added)
+            else:
+                self._file_index.add_file(added)
 
-        if not self._default_switcher_paths:
-            self._default_switcher_paths = result_list
-        else:
-            self._display_paths_in_switcher(
-                result_list, setup=True, clear_section=True
-            )
+        self._update_default_switcher_paths()
 
     def _convert_paths_to_switcher_items(self, paths):
         """
@@ -1128,11 +1200,17 @@ def _display_paths_in_switcher(self, paths, setup, clear_section):
     def _clear_switcher_paths(self):
         """Clear saved switcher results."""
         self._default_switcher_paths = []
+        self._file_index = None
+        self._file_index_changes = None
 
     def _update_default_switcher_paths(self):
         """Update default paths to be shown in the switcher."""
-        self._default_switcher_paths = []
-        self._call_fzf()
+        if self._file_index is None:
+            self._default_switcher_paths = []
+        else:
+            self._default_switcher_paths = self._file_index.search(
+                "", limit=self.MAX_SWITCHER_RESULTS
+            )
 
 # =============================================================================
 # Tests
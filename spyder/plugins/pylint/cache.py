@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © 2020- Spyder Project Contributors
+#
+# Released under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""
+Cache of the Pylint results of individual files.
+
+Results are stored by file path, together with the hash of the file contents
+and the hash of the Pylint configuration used to get them, so they're only
+reused if neither of them changed since then.
+"""
+
+# Standard library imports
+import hashlib
+import logging
+import os
+import os.path as osp
+import pickle
+
+# Local imports
+from spyder.config.base import get_conf_path
+
+
+# ---- Constants
+# ----------------------------------------------------------------------------
+logger = logging.getLogger(__name__)
+
+# Version of the on-disk format
+CACHE_VERSION = 1
+
+# Extensions of the files analyzed in directories
+PYTHON_EXTENSIONS = ('.py', '.pyw')
+
+# Folders that are not analyzed in directories
+FOLDERS_TO_IGNORE = ('__pycache__', 'build', 'node_modules')
+
+
+# ---- Hashes
+# ----------------------------------------------------------------------------
+def get_file_hash(path):
+    """Get the hash of the contents of a file, or None if it can't be read."""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def get_config_hash(command_args, pylintrc_path=None):
+    """
+    Get the hash of the configuration used to run Pylint.
+
+    That includes its command line arguments and the contents of the
+    pylintrc file passed to it, if any.
+    """
+    sha1 = hashlib.sha1('\0'.join(command_args).encode('utf-8'))
+    if pylintrc_path is not None:
+        try:
+            with open(pylintrc_path, 'rb') as f:
+                sha1.update(f.read())
+        except OSError:
+            pass
+    return sha1.hexdigest()
+
+
+# ---- Files
+# ----------------------------------------------------------------------------
+def get_python_files(root):
+    """Get the Python files under root, skipping hidden and build folders."""
+    files = []
+    pending = [root]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in FOLDERS_TO_IGNORE:
+                            pending.append(entry.path)
+                    elif osp.splitext(entry.name)[1] in PYTHON_EXTENSIONS:
+                        files.append(entry.path)
+                except OSError:
+                    continue
+
+    return sorted(files)
+
+
+def check_files(root, cache, config_hash):
+    """
+    Look for the results of the Python files under root in cache.
+
+    This reads all files to hash them, so it's meant to be called in a
+    thread.
+
+    Returns
+    -------
+    tuple
+        Map of the paths of the files with cached results to them, and list
+        of (path, file_hash) of the files that need to be analyzed.
+    """
+    cached = {}
+    pending = []
+    for path in get_python_files(root):
+        file_hash = get_file_hash(path)
+        if file_hash is None:
+            continue
+
+        results = cache.get(path, file_hash, config_hash)
+        if results is None:
+            pending.append((path, file_hash))
+        else:
+            cached[path] = results
+
+    return cached, pending
+
+
+# ---- Cache
+# ----------------------------------------------------------------------------
+class PylintResultsCache:
+    """
+    Cache of the Pylint results of individual files.
+
+    Parameters
+    ----------
+    filename: str, optional
+        File where the cache is saved. By default, it's saved in Spyder's
+        configuration directory.
+    """
+
+    def __init__(self, filename=None):
+        if filename is None:
+            filename = get_conf_path('pylint.cache')
+        self.filename = filename
+
+        # Map of file path to (file_hash, config_hash, statements, messages)
+        self.files = {}
+        self._modified = False
+
+    def __len__(self):
+        return len(self.files)
+
+    # ---- Public API
+    def load(self):
+        """Load the cache from disk, if it was saved before."""
+        try:
+            with open(self.filename, 'rb') as f:
+                data = pickle.load(f)
+        except Exception:
+            return
+
+        if data.get('version') == CACHE_VERSION:
+            self.files = data['files']
+
+    def save(self):
+        """Save the cache to disk if it was modified."""
+        if not self._modified:
+            return
+
+        # Forget about files that don't exist anymore
+        self.files = {
+            path: entry for path, entry in self.files.items()
+            if osp.isfile(path)
+        }
+
+        data = {
+            'version': CACHE_VERSION,
+            'files': self.files,
+        }
+        try:
+            tmp_filename = self.filename + '.tmp'
+            with open(tmp_filename, 'wb') as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_filename, self.filename)
+            self._modified = False
+        except OSError:
+            logger.debug("Unable to save Pylint cache", exc_info=True)
+
+    def get(self, path, file_hash, config_hash):
+        """
+        Get the (statements, messages) results of a file, or None if they're
+        not in the cache or were obtained for a different content or
+        configuration.
+        """
+        entry = self.files.get(path)
+        if entry is None or entry[:2] != (file_hash, config_hash):
+            return None
+        return entry[2:]
+
+    def set(self, path, file_hash, config_hash, statements, messages):
+        """Set the results of a file."""
+        self.files[path] = (file_hash, config_hash, statements, messages)
+        self._modified = True
+
+    def clear(self):
+        """Remove all results."""
+        if self.files:
+            self.files = {}
+            self._modified = True
@@ -12,18 +12,18 @@
 # pylint: disable=R0201
 
 # Standard library imports
+import json
+import math
 import os
 import os.path as osp
 import pickle
-import re
 import sys
 import time
 
 # Third party imports
 import pylint
 from qtpy.compat import getopenfilename
-from qtpy.QtCore import (QByteArray, QProcess, QProcessEnvironment, Signal,
-                         Slot)
+from qtpy.QtCore import QProcess, QProcessEnvironment, Signal, Slot
 from qtpy.QtWidgets import (QComboBox, QInputDialog, QLabel, QMessageBox,
                             QTreeWidgetItem, QStackedWidget, QVBoxLayout)
 
@@ -33,12 +33,15 @@
 from spyder.api.widgets.main_widget import PluginMainWidget
 from spyder.config.base import get_conf_path, is_conda_based_app
 from spyder.config.utils import is_anaconda
-from spyder.plugins.pylint.utils import get_pylintrc_path
+from spyder.plugins.pylint.cache import (
+    check_files, get_config_hash, PylintResultsCache)
+from spyder.plugins.pylint.utils import get_global_rate, get_pylintrc_path
 from spyder.plugins.variableexplorer.widgets.texteditor import TextEditor
 from spyder.utils.icon_manager import ima
 from spyder.utils.misc import getcwd_or_home, get_home_dir
 from spyder.utils.misc import get_python_executable
 from spyder.utils.palette import QStylePalette, SpyderPalette
+from spyder.utils.workers import WorkerManager
 from spyder.widgets.comboboxes import (PythonModulesComboBox,
                                        is_module_or_package)
 from spyder.widgets.onecolumntree import OneColumnTree, OneColumnTreeActions
@@ -54,6 +57,16 @@
 WARNING_COLOR = SpyderPalette.COLOR_WARN_1
 SUCCESS_COLOR = SpyderPalette.COLOR_SUCCESS_1
 
+# Script to analyze the files of directories
+RUNNER_PATH = osp.join(osp.dirname(__file__), "runner.py")
+
+# Maximum number of Pylint processes run in parallel to analyze directories
+MAX_PROCESSES = max(1, (os.cpu_count() or 2) - 1)
+
+# Maximum number of files analyzed by each of those processes. Results are
+# shown after every process finishes, so this shouldn't be too large.
+MAX_BATCH_SIZE = 10
+
 
 # TODO: There should be some palette from the appearance plugin so this
 # is easier to use
@@ -64,6 +77,7 @@
 class PylintWidgetActions:
     ChangeHistory = "change_history_depth_action"
     RunCodeAnalysis = "run_analysis_action"
+    RunProjectAnalysis = "run_project_analysis_action"
     BrowseFile = "browse_action"
     ShowLog = "log_action"
 
@@ -116,6 +130,19 @@ class CategoryItem(QTreeWidgetItem):
     }
 
     def __init__(self, parent, category, number_of_messages):
+        super().__init__(parent, [""], QTreeWidgetItem.Type)
+        self.category = category
+        self.set_number_of_messages(number_of_messages)
+
+        # Items of the modules of messages, by module path
+        self.modules = {}
+
+        # Set icon
+        icon = self.CATEGORIES[category]['icon']
+        self.setIcon(0, icon)
+
+    def set_number_of_messages(self, number_of_messages):
+        """Show the number of messages in the category title."""
         # Messages string to append to category.
         if number_of_messages > 1 or number_of_messages == 0:
             messages = _('messages')
@@ -123,21 +150,41 @@ def __init__(self, parent, category, number_of_messages):
             messages = _('message')
 
         # Category title.
-        title = self.CATEGORIES[category]['translation_string']
+        title = self.CATEGORIES[self.category]['translation_string']
         title += f" ({number_of_messages} {messages})"
-
-        super().__init__(parent, [title], QTreeWidgetItem.Type)
-
-        # Set icon
-        icon = self.CATEGORIES[category]['icon']
-        self.setIcon(0, icon)
+        self.setText(0, title)
 
 
 # ---- Widgets
 # ----------------------------------------------------------------------------
+def can_be_analyzed(path):
+    """Return True if path is a Python module/package or a directory."""
+    return is_module_or_package(path) or osp.isdir(path)
+
+
+class AnalysisTargetComboBox(PythonModulesComboBox):
+    """
+    Combobox of the Python modules/packages and the directories that can be
+    analyzed.
+    """
+
+    def is_valid(self, qstr=None):
+        """Return True if string is valid"""
+        if qstr is None:
+            qstr = self.currentText()
+        return can_be_analyzed(str(qstr))
+
+
 # TODO: display results on 3 columns instead of 1: msg_id, lineno, message
 class ResultsTree(OneColumnTree):
 
+    CATEGORIES = (
+        ("Convention", "C:"),
+        ("Refactor", "R:"),
+        ("Warning", "W:"),
+        ("Error", "E:"),
+    )
+
     sig_edit_goto_requested = Signal(str, int, str)
     """
     This signal will request to open a file in a given row and column
@@ -158,6 +205,7 @@ def __init__(self, parent):
         self.filename = None
         self.results = None
         self.data = None
+        self.category_items = {}
         self.set_title("")
 
     def activated(self, item):
@@ -191,73 +239,101 @@ def refresh(self):
         self.set_title(title)
         self.clear()
         self.data = {}
+        self.category_items = {}
 
         # Populating tree
-        results = (
-            ("Convention", self.results["C:"]),
-            ("Refactor", self.results["R:"]),
-            ("Warning", self.results["W:"]),
-            ("Error", self.results["E:"]),
-        )
-
-        for category, messages in results:
+        for category, key in self.CATEGORIES:
+            messages = self.results[key]
             title_item = CategoryItem(self, category, len(messages))
             if not messages:
                 title_item.setDisabled(True)
 
-            modules = {}
-            for message_data in messages:
-                # If message data is legacy version without message_name
-                if len(message_data) == 4:
-                    message_data = tuple(list(message_data) + [None])
+            self.category_items[key] = title_item
+            self._add_messages(title_item, messages)
 
-                module, lineno, message, msg_id, message_name = message_data
+    def add_results(self, results):
+        """
+        Add results to the ones shown.
 
-                basename = osp.splitext(osp.basename(self.filename))[0]
-                if not module.startswith(basename):
-                    # Pylint bug
-                    i_base = module.find(basename)
-                    module = module[i_base:]
+        This is used to show the results of the files of a directory as they
+        are analyzed.
+        """
+        for key, messages in results.items():
+            if not messages:
+                continue
 
-                dirname = osp.dirname(self.filename)
-                if module.startswith(".") or module == basename:
-                    modname = osp.join(dirname, module)
-                else:
-                    modname = osp.join(dirname, *module.split("."))
-
-                if osp.isdir(modname):
-                    modname = osp.join(modname, "__init__")
-
-                for ext in (".py", ".pyw"):
-                    if osp.isfile(modname+ext):
-                        modname = modname + ext
-                        break
-
-                if osp.isdir(self.filename):
-                    parent = modules.get(modname)
-                    if parent is None:
-                        item = QTreeWidgetItem(title_item, [module],
-                                               QTreeWidgetItem.Type)
-                        item.setIcon(0, ima.icon("python"))
-                        modules[modname] = item
-                        parent = item
+            self.results[key].extend(messages)
+            title_item = self.category_items[key]
+            title_item.set_number_of_messages(len(self.results[key]))
+            title_item.setDisabled(False)
+            self._add_messages(title_item, messages)
+
+    def _add_messages(self, title_item, messages):
+        """Add items for messages to the one of their category."""
+        for message_data in messages:
+            # If message data is legacy version without message_name
+            if len(message_data) == 4:
+                message_data = tuple(list(message_data) + [None])
+
+            # If message data doesn't have the path of its module
+            if len(message_data) == 5:
+                message_data = tuple(message_data) + (None,)
+
+            (module, lineno, message, msg_id, message_name,
+             modname) = message_data
+
+            if modname is None:
+                module, modname = self._resolve_module(module)
+
+            if osp.isdir(self.filename):
+                parent = title_item.modules.get(modname)
+                if parent is None:
+                    item = QTreeWidgetItem(title_item, [module],
+                                           QTreeWidgetItem.Type)
+                    item.setIcon(0, ima.icon("python"))
+                    title_item.modules[modname] = item
+                    parent = item
+            else:
+                parent = title_item
+
+            if len(msg_id) > 1:
+                if not message_name:
+                    message_string = "{msg_id} "
                 else:
-                    parent = title_item
+                    message_string = "{msg_id} ({message_name}) "
+
+            message_string += "line {lineno}: {message}"
+            message_string = message_string.format(
+                msg_id=msg_id, message_name=message_name,
+                lineno=lineno, message=message)
+            msg_item = QTreeWidgetItem(
+                parent, [message_string], QTreeWidgetItem.Type)
+            msg_item.setIcon(0, ima.icon("arrow"))
+            self.data[id(msg_item)] = (modname, lineno)
+
+    def _resolve_module(self, module):
+        """Get the name and path of a module reported by Pylint."""
+        basename = osp.splitext(osp.basename(self.filename))[0]
+        if not module.startswith(basename):
+            # Pylint bug
+            i_base = module.find(basename)
+            module = module[i_base:]
+
+        dirname = osp.dirname(self.filename)
+        if module.startswith(".") or module == basename:
+            modname = osp.join(dirname, module)
+        else:
+            modname = osp.join(dirname, *module.split("."))
 
-                if len(msg_id) > 1:
-                    if not message_name:
-                        message_string = "{msg_id} "
-                    else:
-                        message_string = "{msg_id} ({message_name}) "
+        if osp.isdir(modname):
+            modname = osp.join(modname, "__init__")
 
-                message_string += "line {lineno}: {message}"
-                message_string = message_string.format(
-                    msg_id=msg_id, message_name=message_name,
-                    lineno=lineno, message=message)
-                msg_item = QTreeWidgetItem(
-                    parent, [message_string], QTreeWidgetItem.Type)
-                msg_item.setIcon(0, ima.icon("arrow"))
-                self.data[id(msg_item)] = (modname, lineno)
+        for ext in (".py", ".pyw"):
+            if osp.isfile(modname+ext):
+                modname = modname + ext
+                break
+
+        return module, modname
 
 
 class PylintWidget(PluginMainWidget):
@@ -296,7 +372,6 @@ def __init__(self, name=None, plugin=None, parent=None):
         super().__init__(name, plugin, parent)
 
         # Attributes
-        self._process = None
         self.output = None
         self.error_output = None
         self.filename = None
@@ -305,8 +380,26 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.code_analysis_action = None
         self.browse_action = None
 
+        # Analysis in progress
+        self._analyzed = None
+        self._options = []
+        self._batches = []
+        self._processes = []
+        self._process_buffers = {}
+        self._received_records = False
+        self._file_messages = {}
+        self._statements = 0
+        self._rate = None
+        self._previous_rate = ""
+
+        # Directory analysis
+        self._cache = None
+        self._config_hash = None
+        self._pending_hashes = {}
+        self._worker_manager = WorkerManager(self)
+
         # Widgets
-        self.filecombo = PythonModulesComboBox(
+        self.filecombo = AnalysisTargetComboBox(
             self, id_=PylintWidgetToolbarItems.FileComboBox)
 
         self.ratelabel = QLabel(self)
@@ -359,20 +452,36 @@ def __init__(self, name=None, plugin=None, parent=None):
     @Slot()
     def _start(self):
         """Start the code analysis."""
+        filename = osp.abspath(self.get_filename())
         self.start_spinner()
         self.output = ""
         self.error_output = ""
-        self._process = process = QProcess(self)
+        self._analyzed = filename
+        self._received_records = False
+        self._statements = 0
+        self._rate = None
+        self._previous_rate = ""
+        self._pending_hashes = {}
+        self._file_messages = {}
+
+        # Results are shown as they're received
+        self.stacked_widget.setCurrentWidget(self.treewidget)
+        self.treewidget.set_results(
+            filename, {"C:": [], "R:": [], "W:": [], "E:": []}
+        )
+        self.ratelabel.setText(_("Analyzing..."))
+        self.datelabel.setText("")
 
-        process.setProcessChannelMode(QProcess.SeparateChannels)
-        process.setWorkingDirectory(getcwd_or_home())
-        process.readyReadStandardOutput.connect(self._read_output)
-        process.readyReadStandardError.connect(
-            lambda: self._read_output(error=True))
-        process.finished.connect(
-            lambda ec, es=QProcess.ExitStatus: self._finished(ec, es))
+        if osp.isdir(filename):
+            self._start_directory_analysis(filename)
+        else:
+            pylintrc_path = self.get_pylintrc_path(filename=filename)
+            self._options = self._get_options(pylintrc_path)
+            self._batches = [[filename]]
+            self._start_batch()
 
-        command_args = self.get_command(self.get_filename())
+    def _get_process_environment(self):
+        """Get the environment of Pylint processes."""
         processEnvironment = QProcessEnvironment()
         processEnvironment.insert("PYTHONIOENCODING", "utf8")
 
@@ -387,42 +496,164 @@ def _start(self):
             if not is_conda_based_app() and not is_anaconda():
                 processEnvironment.insert("APPDATA", os.environ.get("APPDATA"))
 
-        process.setProcessEnvironment(processEnvironment)
-        process.start(sys.executable, command_args)
-        running = process.waitForStarted()
-        if not running:
+        return processEnvironment
+
+    def _get_cache(self):
+        """Get the cache of results of individual files."""
+        if self._cache is None:
+            self._cache = PylintResultsCache()
+            self._cache.load()
+        return self._cache
+
+    def _start_directory_analysis(self, dirname):
+        """
+        Start the code analysis of the Python files in a directory.
+
+        Files are analyzed in parallel by several processes, and only if
+        their results are not in the cache.
+        """
+        # Duplicate code can't be detected across files analyzed by
+        # different processes, and makes results depend on other files.
+        # Also, Pylint would save the stats of every batch of files as if
+        # they were the ones of their first file.
+        pylintrc_path = self.get_pylintrc_path(filename=dirname)
+        self._options = self._get_options(pylintrc_path) + [
+            "--disable=duplicate-code",
+            "--persistent=n",
+        ]
+        self._config_hash = get_config_hash(
+            [str(PYLINT_VER)] + self._options, pylintrc_path
+        )
+
+        # Reading and hashing files can take a while, so it's done in a
+        # thread.
+        worker = self._worker_manager.create_python_worker(
+            check_files, dirname, self._get_cache(), self._config_hash
+        )
+        worker.sig_finished.connect(self._on_directory_checked)
+        worker.start()
+
+    def _on_directory_checked(self, worker, output, error):
+        """Show the cached results and analyze the rest of the files."""
+        if self._analyzed is None:
+            # Analysis was stopped
+            return
+
+        if output is None or error:
+            self._analyzed = None
             self.stop_spinner()
-            QMessageBox.critical(
-                self,
-                _("Error"),
-                _("Process failed to start"),
-            )
+            return
 
-    def _read_output(self, error=False):
-        process = self._process
-        if error:
-            process.setReadChannel(QProcess.StandardError)
-        else:
-            process.setReadChannel(QProcess.StandardOutput)
+        cached, pending = output
+        self._pending_hashes = dict(pending)
 
-        qba = QByteArray()
-        while process.bytesAvailable():
-            if error:
-                qba += process.readAllStandardError()
-            else:
-                qba += process.readAllStandardOutput()
+        results = {"C:": [], "R:": [], "W:": [], "E:": []}
+        for path, (statements, messages) in cached.items():
+            self._statements += statements
+            for message in messages:
+                results[message[3][0] + ":"].append(message + (path,))
+        self.treewidget.add_results(results)
+
+        self.output = _(
+            "Results of {} files were reused from previous analyses.\n"
+        ).format(len(cached))
+
+        files = [path for path, __ in pending]
+        if not files:
+            self._finish_analysis()
+            return
 
-        text = str(qba.data(), "utf-8")
-        if error:
-            self.error_output += text
-        else:
-            self.output += text
+        processes = min(MAX_PROCESSES, len(files))
+        size = min(MAX_BATCH_SIZE, math.ceil(len(files) / processes))
+        self._batches = [
+            files[i:i + size] for i in range(0, len(files), size)
+        ]
+        for __ in range(processes):
+            self._start_batch()
 
+        self._show_progress()
+
+    def _start_batch(self):
+        """Start a process to analyze the next batch of files."""
+        files = self._batches.pop(0)
+        process = QProcess(self)
+        self._processes.append(process)
+        self._process_buffers[process] = b""
+
+        process.setProcessChannelMode(QProcess.SeparateChannels)
+        process.setWorkingDirectory(getcwd_or_home())
+        process.readyReadStandardOutput.connect(
+            lambda: self._read_output(process))
+        process.readyReadStandardError.connect(
+            lambda: self._read_error_output(process))
+        process.finished.connect(lambda ec, es: self._finished(process))
+        process.errorOccurred.connect(
+            lambda error: self._process_failed(process, error))
+
+        process.setProcessEnvironment(self._get_process_environment())
+        process.start(sys.executable, [RUNNER_PATH] + self._options + files)
+
+    def _read_output(self, process):
+        """Read and show the results received from process so far."""
+        data = (
+            self._process_buffers[process]
+            + process.readAllStandardOutput().data()
+        )
+
+        # Results are given as a record per line, so the last line is kept
+        # until it's complete.
+        *lines, self._process_buffers[process] = data.split(b"\n")
+        results = self.parse_output(lines)
+        self.treewidget.add_results(results)
+
+        if self._pending_hashes:
+            self._show_progress()
         self.update_actions()
 
-    def _finished(self, exit_code, exit_status):
-        if not self.output:
+    def _read_error_output(self, process):
+        """Read the error output of process."""
+        self.error_output += str(
+            process.readAllStandardError().data(), "utf-8", "replace"
+        )
+
+    def _process_failed(self, process, error):
+        """Handle errors of processes."""
+        if error == QProcess.FailedToStart:
+            self.error_output += _("Process failed to start") + "\n"
+            self._finished(process)
+
+    def _finished(self, process):
+        """Start analyzing the next batch, or finish the analysis."""
+        if process not in self._processes:
+            # Analysis was stopped
+            return
+
+        self._read_output(process)
+        self._read_error_output(process)
+        self._processes.remove(process)
+        self._process_buffers.pop(process)
+        process.deleteLater()
+
+        if self._batches:
+            self._start_batch()
+        elif not self._processes:
+            self._finish_analysis()
+
+    def _show_progress(self):
+        """Show how many files remain to be analyzed."""
+        self.ratelabel.setText(
+            _("Files pending analysis: {}").format(len(self._pending_hashes))
+        )
+
+    def _finish_analysis(self):
+        """Save and show the results of the analysis."""
+        filename = self._analyzed
+        self._analyzed = None
+        self._file_messages = {}
+
+        if not self._received_records:
             self.stop_spinner()
+            self.update_actions()
             if self.error_output:
                 QMessageBox.critical(
                     self,
@@ -430,10 +661,32 @@ def _finished(self, exit_code, exit_status):
                     self.error_output,
                 )
                 print("pylint error:\n\n" + self.error_output, file=sys.stderr)
+            self.show_data()
             return
 
-        filename = self.get_filename()
-        rate, previous, results = self.parse_output(self.output)
+        results = self.treewidget.results
+        if osp.isdir(filename):
+            # Files that couldn't be analyzed, if any
+            for path in self._pending_hashes:
+                self.error_output += (
+                    _("Unable to analyze {}").format(path) + "\n"
+                )
+            self._pending_hashes = {}
+            self._get_cache().save()
+
+            rate = get_global_rate(self._statements, results)
+            _index, data = self.get_data(filename)
+            previous = data[1] if data is not None and data[1] else ""
+        else:
+            rate = self._rate
+            previous = self._previous_rate
+
+        if rate is not None:
+            text = "Your code has been rated at {}/10".format(rate)
+            if previous:
+                text += " (previous run: {}/10)".format(previous)
+            self.output += text + "\n"
+
         self._save_history()
         self.set_data(filename, (time.localtime(), rate, previous, results))
         self.output = self.error_output + self.output
@@ -448,12 +701,20 @@ def _check_new_file(self):
             self.show_data()
 
     def _is_running(self):
-        process = self._process
-        return process is not None and process.state() == QProcess.Running
+        return self._analyzed is not None
 
     def _kill_process(self):
-        self._process.close()
-        self._process.waitForFinished(1000)
+        self._analyzed = None
+        self._batches = []
+        self._pending_hashes = {}
+        self._file_messages = {}
+        self._process_buffers = {}
+        processes, self._processes = self._processes, []
+        for process in processes:
+            process.close()
+            process.waitForFinished(1000)
+        self._worker_manager.terminate_all()
+
         self.stop_spinner()
 
     def _update_combobox_history(self):
@@ -519,6 +780,15 @@ def setup(self):
             icon=self.create_icon("fileopen"),
             triggered=self.select_file,
         )
+        self.project_analysis_action = self.create_action(
+            PylintWidgetActions.RunProjectAnalysis,
+            text=_("Run code analysis on project"),
+            tip=_("Analyze the Python files of the current project"),
+            icon=self.create_icon("project_spyder"),
+            triggered=self.start_project_analysis,
+        )
+        self.project_analysis_action.setEnabled(
+            self.get_conf("project_dir") is not None)
         self.log_action = self.create_action(
             PylintWidgetActions.ShowLog,
             text=_("Output"),
@@ -528,6 +798,11 @@ def setup(self):
         )
 
         options_menu = self.get_options_menu()
+        self.add_item_to_menu(
+            self.project_analysis_action,
+            menu=options_menu,
+            section=PylintWidgetOptionsMenuSections.Global,
+        )
         self.add_item_to_menu(
             self.treewidget.get_action(
                 OneColumnTreeActions.CollapseAllAction),
@@ -601,13 +876,16 @@ def setup(self):
         # Signals
         self.filecombo.valid.connect(self.code_analysis_action.setEnabled)
 
-    @on_conf_change(option=['max_entries', 'history_filenames'])
+    @on_conf_change(option=['max_entries', 'history_filenames',
+                            'project_dir'])
     def on_conf_update(self, option, value):
         if option == "max_entries":
             self._update_combobox_history()
         elif option == "history_filenames":
             self.curr_filenames = value
             self._update_combobox_history()
+        elif option == "project_dir":
+            self.project_analysis_action.setEnabled(value is not None)
 
     def update_actions(self):
         if self._is_running():
@@ -619,6 +897,8 @@ def update_actions(self):
 
     def on_close(self):
         self.stop_code_analysis()
+        if self._cache is not None:
+            self._cache.save()
 
     # --- Public API
     # ------------------------------------------------------------------------
@@ -720,6 +1000,24 @@ def start_code_analysis(self, filename=None):
 
         self.update_actions()
 
+    @Slot()
+    def start_project_analysis(self):
+        """
+        Perform code analysis for the Python files of the current project.
+
+        Only the files that changed since they were analyzed are analyzed
+        again.
+        """
+        project_dir = self.get_conf("project_dir")
+        if project_dir is None:
+            return
+
+        if self._is_running():
+            self._kill_process()
+
+        self.set_filename(project_dir)
+        self.sig_start_analysis_requested.emit()
+
     def stop_code_analysis(self):
         """
         Stop the code analysis process.
@@ -732,7 +1030,7 @@ def remove_obsolete_items(self):
         Removing obsolete items.
         """
         self.rdata = [(filename, data) for filename, data in self.rdata
-                      if is_module_or_package(filename)]
+                      if can_be_analyzed(filename)]
 
     def get_filenames(self):
         """
@@ -821,7 +1119,13 @@ def show_data(self, justanalyzed=False):
                     text_prun = " (%s %s/10)" % (text_prun, previous_rate)
                     text += prevrate_style % (prevrate_color, text_prun)
 
-                self.treewidget.set_results(filename, results)
+                # The results of directories are already shown after
+                # analyzing them.
+                if (
+                    self.treewidget.filename != filename
+                    or self.treewidget.results is not results
+                ):
+                    self.treewidget.set_results(filename, results)
                 date = time.strftime("%Y-%m-%d %H:%M:%S", datetime)
                 date_text = text_style % (text_color, date)
 
@@ -919,19 +1223,18 @@ def get_command(self, filename):
         """
         Return command to use to run code analysis on given filename
         """
-        command_args = []
-        if PYLINT_VER is not None:
-            command_args = [
-                "-m",
-                "pylint",
-                "--output-format=text",
-                "--msg-template="
-                '{msg_id}:{symbol}:{line:3d},{column}: {msg}"',
-            ]
+        pylintrc_path = self.get_pylintrc_path(filename=filename)
+        return [RUNNER_PATH] + self._get_options(pylintrc_path) + [filename]
 
+    def _get_options(self, pylintrc_path):
+        """
+        Return the Pylint options to use the current interpreter and the
+        pylintrc file at pylintrc_path, if it's not None.
+        """
+        options = []
         path_of_custom_interpreter = self.test_for_custom_interpreter()
         if path_of_custom_interpreter is not None:
-            command_args += [
+            options += [
                 "--init-hook="
                 'import pylint_venv; \
                     pylint_venv.inithook(\'{}\',\
@@ -939,77 +1242,54 @@ def get_command(self, filename):
                         path_of_custom_interpreter.replace("\\", "\\\\")),
             ]
 
-        pylintrc_path = self.get_pylintrc_path(filename=filename)
         if pylintrc_path is not None:
-            command_args += ["--rcfile={}".format(pylintrc_path)]
+            options += ["--rcfile={}".format(pylintrc_path)]
 
-        command_args.append(filename)
-        return command_args
+        return options
 
-    def parse_output(self, output):
+    def parse_output(self, lines):
         """
-        Parse output and return current revious rate and results.
+        Parse lines of output of the runner script and return the results of
+        the messages in them.
+
+        The statements and score in them, and the messages of files that are
+        being analyzed, are saved to finish the analysis.
         """
         # Convention, Refactor, Warning, Error
         results = {"C:": [], "R:": [], "W:": [], "E:": []}
-        txt_module = "************* Module "
-
-        module = ""  # Should not be needed - just in case something goes wrong
-        for line in output.splitlines():
-            if line.startswith(txt_module):
-                # New module
-                module = line[len(txt_module):]
-                continue
-            # Supporting option include-ids: ("R3873:" instead of "R:")
-            if not re.match(r"^[CRWE]+([0-9]{4})?:", line):
+        for line in lines:
+            try:
+                record = json.loads(line)
+                record_type = record["type"]
+            except (ValueError, KeyError, TypeError):
+                self.error_output += str(line, "utf-8", "replace") + "\n"
                 continue
 
-            items = {}
-            idx_0 = 0
-            idx_1 = 0
-            key_names = ["msg_id", "message_name", "line_nb", "message"]
-            for key_idx, key_name in enumerate(key_names):
-                if key_idx == len(key_names) - 1:
-                    idx_1 = len(line)
-                else:
-                    idx_1 = line.find(":", idx_0)
-
-                if idx_1 < 0:
-                    break
-
-                item = line[(idx_0):idx_1]
-                if not item:
-                    break
-
-                if key_name == "line_nb":
-                    item = int(item.split(",")[0])
-
-                items[key_name] = item
-                idx_0 = idx_1 + 1
-            else:
-                pylint_item = (module, items["line_nb"], items["message"],
-                               items["msg_id"], items["message_name"])
-                results[line[0] + ":"].append(pylint_item)
-
-        # Rate
-        rate = None
-        txt_rate = "Your code has been rated at "
-        i_rate = output.find(txt_rate)
-        if i_rate > 0:
-            i_rate_end = output.find("/10", i_rate)
-            if i_rate_end > 0:
-                rate = output[i_rate+len(txt_rate):i_rate_end]
-
-        # Previous run
-        previous = ""
-        if rate is not None:
-            txt_prun = "previous run: "
-            i_prun = output.find(txt_prun, i_rate_end)
-            if i_prun > 0:
-                i_prun_end = output.find("/10", i_prun)
-                previous = output[i_prun+len(txt_prun):i_prun_end]
-
-        return rate, previous, results
+            self._received_records = True
+            if record_type == "message":
+                path = record["path"]
+                message = tuple(record["message"])
+                results[message[3][0] + ":"].append(message + (path,))
+                if self._pending_hashes:
+                    self._file_messages.setdefault(path, []).append(message)
+            elif record_type == "file":
+                path = record["path"]
+                statements = record["statements"]
+                self._statements += statements
+
+                # Save the results of the files of directories
+                file_hash = self._pending_hashes.pop(path, None)
+                messages = self._file_messages.pop(path, [])
+                if file_hash is not None:
+                    self._get_cache().set(
+                        path, file_hash, self._config_hash, statements,
+                        messages
+                    )
+            elif record_type == "score":
+                self._rate = record["rate"]
+                self._previous_rate = record["previous"] or ""
+
+        return results
 
 
 # =============================================================================
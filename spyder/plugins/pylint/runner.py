@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © 2020- Spyder Project Contributors
+#
+# Released under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""
+Script to analyze files with Pylint, reporting its results as records that
+can be parsed as they are printed.
+
+It takes the same arguments as Pylint and prints a line with a JSON object
+for every record, whose "type" is one of:
+
+* "message": A message for the file at "path", printed as soon as Pylint
+  emits it, as a (module, line, message, msg_id, symbol) list.
+* "file": The number of "statements" of the file at "path", printed when
+  the analysis finishes, after all its messages.
+* "score": The global evaluation of the code ("rate") and the one of the
+  previous run ("previous"), formatted as strings, or None if unavailable.
+
+It's run directly by path with the Python interpreter that runs Pylint, so
+it must not import Spyder.
+"""
+
+# Standard library imports
+import json
+import os.path as osp
+import sys
+
+# Don't analyze files against the modules next to this script
+if sys.path and osp.abspath(sys.path[0]) == osp.dirname(osp.abspath(__file__)):
+    sys.path.pop(0)
+
+# Third party imports
+from pylint.lint import Run  # noqa: E402
+from pylint.reporters import BaseReporter  # noqa: E402
+
+
+# Message categories that are shown by Spyder
+CATEGORIES = "CRWE"
+
+
+def get_stat(stats, name):
+    """Get a value from Pylint stats, or None if it's not available."""
+    if stats is None:
+        return None
+    if isinstance(stats, dict):
+        # Pylint < 2.12
+        return stats.get(name)
+    return getattr(stats, name, None)
+
+
+def get_statements(stats, module):
+    """Get the number of statements of module from Pylint stats."""
+    by_module = get_stat(stats, "by_module") or {}
+    return by_module.get(module, {}).get("statement", 0) or 0
+
+
+def format_note(note):
+    """Format a global evaluation of the code like Pylint does."""
+    return None if note is None else f"{note:.2f}"
+
+
+def print_record(record_type, **record):
+    """Print a record of the results."""
+    print(json.dumps(dict(type=record_type, **record)))
+
+
+class FileReporter(BaseReporter):
+    """Reporter that prints the results of Pylint as records."""
+
+    name = "spyder-records"
+
+    def __init__(self, output=None):
+        super().__init__(output)
+        self.previous_note = None
+        self._modules = {}
+
+    def handle_message(self, msg):
+        if msg.C not in CATEGORIES:
+            return
+
+        # Stdout is not flushed, so messages are written in chunks.
+        print_record(
+            "message",
+            path=osp.abspath(msg.abspath),
+            message=[msg.module, msg.line, msg.msg, msg.msg_id, msg.symbol],
+        )
+
+    def on_set_current_module(self, module, filepath):
+        if filepath:
+            self._modules[osp.abspath(filepath)] = module
+
+    def on_close(self, stats, previous_stats):
+        self.previous_note = get_stat(previous_stats, "global_note")
+        for path, module in self._modules.items():
+            print_record(
+                "file", path=path, statements=get_statements(stats, module)
+            )
+
+    def display_messages(self, layout):
+        pass
+
+    def display_reports(self, layout):
+        pass
+
+    def _display(self, layout):
+        pass
+
+
+def main(args):
+    reporter = FileReporter()
+    run = Run(args, reporter=reporter, exit=False)
+
+    # Pylint only evaluates code with statements
+    stats = run.linter.stats
+    rate = None
+    if get_stat(stats, "statement"):
+        rate = get_stat(stats, "global_note")
+    print_record(
+        "score",
+        rate=format_note(rate),
+        previous=format_note(reporter.previous_note),
+    )
+    sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# ----------------------------------------------------------------------------
+# Copyright © 2020- Spyder Project Contributors
+#
+# Released under the terms of the MIT License
+# ----------------------------------------------------------------------------
+
+"""Tests for the cache of Pylint results and the runner that gets them."""
+
+# Standard library imports
+import json
+import os.path as osp
+import subprocess
+import sys
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.pylint.cache import (
+    check_files, get_config_hash, get_file_hash, PylintResultsCache)
+from spyder.plugins.pylint.utils import get_global_rate
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a directory with some Python files in it."""
+    files = {
+        'main.py': 'import os\nx = 1\n',
+        'package/__init__.py': '"""Package."""\n',
+        'package/module.py': 'def f(:\n',
+        '.hidden/skipped.py': 'import os\n',
+        '__pycache__/skipped.py': 'import os\n',
+        'readme.md': 'Not Python\n',
+    }
+    for path, contents in files.items():
+        file = tmp_path / path
+        file.parent.mkdir(exist_ok=True)
+        file.write_text(contents)
+    return tmp_path
+
+
+def test_cache(project, tmp_path):
+    """Test that results are only reused for the same contents and config."""
+    root = str(project)
+    cache = PylintResultsCache(str(tmp_path / 'pylint.cache'))
+    config_hash = get_config_hash(['--disable=duplicate-code'])
+
+    # All Python files need to be analyzed at first
+    cached, pending = check_files(root, cache, config_hash)
+    assert cached == {}
+    assert sorted(osp.relpath(path, root) for path, __ in pending) == [
+        'main.py',
+        osp.join('package', '__init__.py'),
+        osp.join('package', 'module.py'),
+    ]
+
+    messages = [('main', 1, 'Unused import os', 'W0611', 'unused-import')]
+    for path, file_hash in pending:
+        cache.set(path, file_hash, config_hash, 2, messages)
+    cache.save()
+
+    # Results are reused after loading the cache again
+    cache = PylintResultsCache(str(tmp_path / 'pylint.cache'))
+    cache.load()
+    cached, pending = check_files(root, cache, config_hash)
+    assert len(cached) == 3
+    assert pending == []
+    assert cached[str(project / 'main.py')] == (2, messages)
+
+    # But not for modified files or a different configuration
+    (project / 'main.py').write_text('x = 2\n')
+    cached, pending = check_files(root, cache, config_hash)
+    assert [path for path, __ in pending] == [str(project / 'main.py')]
+    assert pending[0][1] == get_file_hash(str(project / 'main.py'))
+
+    cached, pending = check_files(root, cache, get_config_hash([]))
+    assert cached == {}
+    assert len(pending) == 3
+
+
+def test_global_rate():
+    """Test the global evaluation of results."""
+    results = {
+        "C:": [None] * 2,
+        "R:": [],
+        "W:": [None],
+        "E:": [None],
+    }
+    assert get_global_rate(0, results) is None
+    assert get_global_rate(40, results) == "8.00"
+    assert get_global_rate(1, results) == "0.00"
+
+
+def test_runner(project):
+    """Test the records reported by the runner."""
+    pytest.importorskip("pylint")
+    from spyder.plugins.pylint.main_widget import RUNNER_PATH
+
+    files = [str(project / 'main.py'), str(project / 'package' / 'module.py')]
+    output = subprocess.check_output(
+        [sys.executable, RUNNER_PATH, '--disable=duplicate-code',
+         '--persistent=n'] + files,
+        cwd=str(project)
+    )
+    records = [
+        json.loads(line) for line in output.decode('utf-8').splitlines()
+    ]
+
+    # Messages are reported first, then files and finally the score
+    types = [record['type'] for record in records]
+    assert types == sorted(types, key=['message', 'file', 'score'].index)
+
+    messages = {}
+    for record in records:
+        if record['type'] == 'message':
+            messages.setdefault(record['path'], []).append(record['message'])
+    assert {message[4] for message in messages[files[0]]} == {
+        'missing-module-docstring', 'invalid-name', 'unused-import'
+    }
+    assert [message[3] for message in messages[files[1]]] == ['E0001']
+
+    statements = {
+        record['path']: record['statements']
+        for record in records if record['type'] == 'file'
+    }
+    assert statements == {files[0]: 2, files[1]: 0}
+
+    assert records[-1]['rate'] == '0.00'
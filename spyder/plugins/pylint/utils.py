@@ -56,3 +56,23 @@ def get_pylintrc_path(search_paths=None, home_path=None):
         os.chdir(current_cwd)
 
     return pylintrc_path
+
+
+def get_global_rate(statements, results):
+    """
+    Get the global evaluation of code with Pylint's default formula, from its
+    number of statements and its results.
+
+    Returns None if there are no statements to evaluate.
+    """
+    if not statements:
+        return None
+
+    weighted_messages = (
+        5 * len(results["E:"])
+        + len(results["W:"])
+        + len(results["R:"])
+        + len(results["C:"])
+    )
+    rate = max(0.0, 10.0 - (weighted_messages / statements) * 10)
+    return f"{rate:.2f}"
@@ -85,10 +85,14 @@ def get_score(self):
 
     def set_score(self, value):
         """Set the search text fuzzy match score."""
-        if self._use_score:
+        if self._use_score and value != self._score:
             self._score = value
             self._set_rendered_text()
 
+    def uses_score(self):
+        """Return whether the item is filtered and sorted by its score."""
+        return self._use_score
+
     def is_action_item(self):
         """Return whether the item is of action type."""
         return bool(self._action_item)
@@ -22,7 +22,7 @@
 from spyder.py3compat import to_text_string
 from spyder.utils.icon_manager import ima
 from spyder.widgets.helperwidgets import HTMLDelegate
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import get_best_scores, SearchChoices
 from spyder.plugins.switcher.utils import clean_string
 
 
@@ -141,6 +141,7 @@ class Switcher(QDialog):
     """
 
     _MAX_NUM_ITEMS = 15
+    _MAX_RICH_TITLES = 100
     _MIN_WIDTH = 580
     _MIN_HEIGHT = 200
     _MAX_HEIGHT = 390
@@ -157,6 +158,9 @@ def __init__(self, parent, help_text=None, item_styles=ITEM_STYLES,
         self._item_styles = item_styles
         self._item_separator_styles = item_separator_styles
 
+        # Titles of the items prepared to search them
+        self._search_choices = SearchChoices([])
+
         # Widgets
         self.edit = QLineEdit(self)
         self.list = QListView(self)
@@ -318,15 +322,32 @@ def setup(self):
 
             titles.append(title)
 
+        if titles != self._search_choices.choices:
+            self._search_choices = SearchChoices(titles)
+
         search_text = clean_string(search_text)
-        scores = get_search_scores(to_text_string(search_text),
-                                   titles, template=u"<b>{0}</b>")
+        scores = self._search_choices.get_scores(to_text_string(search_text))
+
+        # Only highlight the search text in the titles of the first rows,
+        # which are the ones that can be shown without scrolling much.
+        shown = {
+            idx for (__, idx) in
+            get_best_scores(scores, self._MAX_RICH_TITLES)
+        }
 
-        for idx, (title, rich_title, score_value) in enumerate(scores):
+        for idx, score_value in enumerate(scores):
             item = self.model.item(idx)
             if not self._is_separator(item) and not item.is_action_item():
-                rich_title = rich_title.replace(" ", "&nbsp;")
-                item.set_rich_title(rich_title)
+                if idx in shown or not item.uses_score():
+                    rich_title = self._search_choices.get_rich_text(
+                        idx, template=u"<b>{0}</b>"
+                    )
+                    rich_title = rich_title.replace(" ", "&nbsp;")
+                else:
+                    rich_title = ''
+
+                if rich_title != item.get_rich_title():
+                    item.set_rich_title(rich_title)
 
             item.set_score(score_value)
 
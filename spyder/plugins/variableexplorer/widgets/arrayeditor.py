@@ -227,6 +227,10 @@ def get_data(self):
         """Return data"""
         return self._data
 
+    def get_window(self, row_min, row_max, col_min, col_max):
+        """Return the data between the given rows and columns (inclusive)."""
+        return self._data[row_min:row_max+1, col_min:col_max+1]
+
     def set_format_spec(self, format_spec):
         """Change display format"""
         self._format_spec = format_spec
@@ -407,6 +411,128 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteArrayModel(ArrayModel):
+    """
+    Array Editor Table Model for an array that lives in the kernel.
+
+    Data is requested from the kernel in tiles through a view handle, so
+    arrays that don't fit in memory (e.g. memory-mapped arrays or HDF5
+    datasets) can be browsed. The range of values used for background colors
+    is extended with the range of each tile as tiles are retrieved, instead
+    of being computed over the whole array.
+    """
+
+    def __init__(self, view_handle, format_spec=".6g", parent=None):
+        QAbstractTableModel.__init__(self)
+
+        self.dialog = parent
+        self.changes = {}
+        self.readonly = True
+        self.view_handle = view_handle
+        self._data = None
+        self._format_spec = format_spec
+
+        dtype = view_handle.dtype
+        if dtype in (np.complex64, np.complex128):
+            self.color_func = np.abs
+        else:
+            self.color_func = np.real
+
+        # Backgroundcolor settings
+        huerange = [.66, .99] # Hue
+        self.sat = .7 # Saturation
+        self.val = 1. # Value
+        self.alp = .6 # Alpha-channel
+        self.hue0 = huerange[0]
+        self.dhue = huerange[1]-huerange[0]
+        self.vmin = None
+        self.vmax = None
+        self.has_inf = False
+        self.bgcolor_enabled = dtype.kind in 'biufc'
+
+        self.total_rows, self.total_cols = view_handle.shape
+        size = self.total_rows * self.total_cols
+
+        # Use paging when the total size, number of rows or number of
+        # columns is too large
+        if size > LARGE_SIZE:
+            self.rows_loaded = self.ROWS_TO_LOAD
+            self.cols_loaded = self.COLS_TO_LOAD
+        else:
+            if self.total_rows > LARGE_NROWS:
+                self.rows_loaded = self.ROWS_TO_LOAD
+            else:
+                self.rows_loaded = self.total_rows
+            if self.total_cols > LARGE_COLS:
+                self.cols_loaded = self.COLS_TO_LOAD
+            else:
+                self.cols_loaded = self.total_cols
+
+    def get_data(self):
+        """Return data"""
+        return None
+
+    def get_window(self, row_min, row_max, col_min, col_max):
+        """Return the data between the given rows and columns (inclusive)."""
+        return self.view_handle.get_window(
+            row_min, row_max + 1, col_min, col_max + 1)
+
+    def get_value(self, index):
+        return self.view_handle.get_value(index.row(), index.column())
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell content."""
+        if not index.isValid() or not self.view_handle.is_open:
+            # Queued events can ask for data after the handle was closed
+            return to_qvariant()
+
+        if role == Qt.DisplayRole:
+            tile, row, column = self.view_handle.get_tile(
+                index.row(), index.column())
+            return tile.get_display(row, column, self._format_spec)
+        elif role == Qt.TextAlignmentRole:
+            return to_qvariant(int(Qt.AlignCenter|Qt.AlignVCenter))
+        elif role == Qt.BackgroundColorRole and self.bgcolor_enabled:
+            tile, row, column = self.view_handle.get_tile(
+                index.row(), index.column())
+            return to_qvariant(self.get_bgcolor(tile, row, column))
+        elif role == Qt.FontRole:
+            return self.get_font(SpyderFontType.MonospaceInterface)
+        return to_qvariant()
+
+    def get_bgcolor(self, tile, row, column):
+        """Background color of a cell depending on its value."""
+        if tile.vmin is None:
+            return None
+
+        # Extend the color range with the one of the tile
+        if self.vmin is None or tile.vmin < self.vmin:
+            self.vmin = tile.vmin
+        if self.vmax is None or tile.vmax > self.vmax:
+            self.vmax = tile.vmax
+
+        value = self.color_func(tile.data[row, column])
+        if not np.isfinite(value):
+            return None
+
+        vmin = self.vmin if self.vmax != self.vmin else self.vmin - 1
+        hue = (self.hue0 +
+               self.dhue * (float(self.vmax) - value)
+               / (float(self.vmax) - vmin))
+        hue = float(np.abs(hue))
+        return QColor.fromHsvF(hue, self.sat, self.val, self.alp)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Cell content change"""
+        return False
+
+    def flags(self, index):
+        """Set flags"""
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsEnabled
+        return QAbstractTableModel.flags(self, index)
+
+
 class ArrayDelegate(QItemDelegate, SpyderFontsMixin):
     """Array Editor Item Delegate"""
     def __init__(self, dtype, parent=None):
@@ -601,12 +727,11 @@ def _sel_to_text(self, cell_range):
         if row_min == 0 and row_max == (self.model().rows_loaded-1):
             row_max = self.model().total_rows-1
 
-        _data = self.model().get_data()
         output = io.BytesIO()
         try:
             fmt = '%' + self.model().get_format_spec()
-            np.savetxt(output, _data[row_min:row_max+1, col_min:col_max+1],
-                       delimiter='\t', fmt=fmt)
+            _data = self.model().get_window(row_min, row_max, col_min, col_max)
+            np.savetxt(output, _data, delimiter='\t', fmt=fmt)
         except:
             QMessageBox.warning(self, _("Warning"),
                                 _("It was not possible to copy values for "
@@ -682,6 +807,34 @@ def change_format(self):
             self.model.set_format_spec(format_spec)
 
 
+class RemoteArrayEditorWidget(ArrayEditorWidget):
+    """Widget to show an array that lives in the kernel."""
+
+    def __init__(self, parent, view_handle):
+        QWidget.__init__(self, parent)
+        self.data = None
+        self.old_data_shape = None
+
+        format_spec = SUPPORTED_FORMATS.get(view_handle.dtype.name, 's')
+        self.model = RemoteArrayModel(view_handle, format_spec=format_spec,
+                                      parent=self)
+        self.view = ArrayView(self, self.model, view_handle.dtype,
+                              view_handle.shape)
+
+        layout = QVBoxLayout()
+        layout.addWidget(self.view)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+
+    def accept_changes(self):
+        """Accept changes"""
+        pass
+
+    def reject_changes(self):
+        """Reject changes"""
+        pass
+
+
 class ArrayEditor(BaseDialog, SpyderWidgetMixin):
     """Array Editor Dialog"""
 
@@ -715,6 +868,7 @@ def __init__(
 
         self.data_function = data_function
         self.data = None
+        self.view_handle = None
         self.arraywidget = None
         self.stack = None
         self.btn_save_and_close = None
@@ -732,6 +886,23 @@ def setup_and_check(self, data, title='', readonly=False):
         self.setup_ui(title, readonly)
         return self.set_data_and_check(data, readonly)
 
+    def setup_and_check_remote(self, view_handle, title=''):
+        """
+        Setup the editor to show an array that lives in the kernel.
+
+        Data is retrieved on demand through `view_handle`, which is an
+        ArrayViewHandle, and can't be edited. The handle is closed when the
+        editor is closed.
+
+        It returns False if data is not supported, True otherwise.
+        """
+        self.view_handle = view_handle
+        self.finished.connect(lambda result: self.view_handle.close())
+
+        self.setup_ui(title, readonly=True)
+        self.refresh_action.setEnabled(True)
+        return self.set_view_handle_and_check()
+
     def setup_ui(self, title='', readonly=False):
         """
         Create the user interface.
@@ -897,6 +1068,53 @@ def do_nothing():
         # Make the dialog act as a window
         self.setWindowFlags(Qt.Window)
 
+    def set_view_handle_and_check(self):
+        """
+        Setup ArrayEditor to show the data of the view handle:
+        return False if data is not supported, True otherwise
+        """
+        dtype = self.view_handle.dtype
+        dtn = dtype.name
+        if (dtn != 'object' and dtn not in SUPPORTED_FORMATS
+                and not dtn.startswith('str')
+                and not dtn.startswith('bytes')
+                and not dtn.startswith('unicode')):
+            arr = _("%s arrays") % dtn
+            self.error(_("%s are currently not supported") % arr)
+            return False
+
+        # Remove old widgets, if any
+        while self.stack.count() > 0:
+            widget = self.stack.widget(0)
+            self.stack.removeWidget(widget)
+            widget.deleteLater()
+
+        self.stack.addWidget(RemoteArrayEditorWidget(self, self.view_handle))
+        self.arraywidget = self.stack.currentWidget()
+
+        safe_disconnect(self.format_action.triggered)
+        self.format_action.triggered.connect(self.arraywidget.change_format)
+        self.format_action.setEnabled(is_float(dtype))
+
+        safe_disconnect(self.resize_action.triggered)
+        self.resize_action.triggered.connect(
+            self.arraywidget.view.resize_to_contents)
+
+        safe_disconnect(self.toggle_bgcolor_action.toggled)
+        self.toggle_bgcolor_action.toggled.connect(
+            lambda state: self.arraywidget.model.bgcolor(state))
+        self.toggle_bgcolor_action.setEnabled(
+            self.arraywidget.model.bgcolor_enabled)
+        self.toggle_bgcolor_action.setChecked(
+            self.arraywidget.model.bgcolor_enabled)
+
+        for widget in [self.combo_label, self.combo_box, self.shape_label,
+                       self.index_label, self.index_spin, self.slicing_label,
+                       self.masked_label, self.btn_save_and_close]:
+            widget.hide()
+
+        return True
+
     def set_data_and_check(self, data, readonly=False):
         """
         Setup ArrayEditor:
@@ -1134,6 +1352,23 @@ def refresh(self) -> None:
         """
         Refresh data in editor.
         """
+        if self.view_handle is not None:
+            try:
+                self.view_handle.refresh()
+            except (IndexError, KeyError):
+                self.error(_('The variable no longer exists.'))
+                return
+            except ValueError as e:
+                self.error(str(e))
+                return
+
+            if not self.set_view_handle_and_check():
+                self.error(
+                    _('The new value cannot be displayed in the array '
+                      'editor.')
+                )
+            return
+
         assert self.data_function is not None
 
         if self.btn_save_and_close.isEnabled():
@@ -195,6 +195,9 @@ class DataFrameModel(QAbstractTableModel, SpyderFontsMixin):
     https://github.com/wavexx/gtabview/blob/master/gtabview/models.py
     """
 
+    # Whether the data can be edited
+    readonly = False
+
     def __init__(self, dataFrame, format_spec=DEFAULT_FORMAT, parent=None):
         QAbstractTableModel.__init__(self)
         self.dialog = parent
@@ -205,8 +208,8 @@ def __init__(self, dataFrame, format_spec=DEFAULT_FORMAT, parent=None):
         self.complex_intran = None
         self.display_error_idxs = []
 
-        self.total_rows = self.df.shape[0]
-        self.total_cols = self.df.shape[1]
+        self.total_rows = self.shape[0]
+        self.total_cols = self.shape[1]
         size = self.total_rows * self.total_cols
 
         self.max_min_col = None
@@ -569,6 +572,11 @@ def get_data(self):
         """Return data"""
         return self.df
 
+    def get_window(self, row_min, row_max, col_min, col_max):
+        """Return the data between the given rows and columns (inclusive)."""
+        return self.df.iloc[slice(row_min, row_max + 1),
+                            slice(col_min, col_max + 1)]
+
     def rowCount(self, index=QModelIndex()):
         """DataFrame row number"""
         # Avoid a "Qt exception in virtual methods" generated in our
@@ -620,6 +628,131 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteDataFrameModel(DataFrameModel):
+    """
+    DataFrame Table Model for a dataframe that lives in the kernel.
+
+    Instead of holding the dataframe, this model uses a view handle to
+    request from the kernel only the windows of data, header labels and
+    column statistics that are displayed. This makes opening huge dataframes
+    take constant time and memory on Spyder's side, at the cost of not
+    allowing to edit them.
+    """
+
+    readonly = True
+
+    def __init__(self, view_handle, format_spec=DEFAULT_FORMAT, parent=None):
+        self.view_handle = view_handle
+        super().__init__(None, format_spec=format_spec, parent=parent)
+
+    @property
+    def shape(self):
+        """Return the shape of the dataframe."""
+        return self.view_handle.shape
+
+    @property
+    def header_shape(self):
+        """Return the levels for the columns and rows of the dataframe."""
+        return self.view_handle.header_shape
+
+    def header(self, axis, x, level=0):
+        """
+        Return the values of the labels for the header of columns or rows.
+
+        The value corresponds to the header of column or row x in the
+        given level.
+        """
+        if not self.view_handle.is_open:
+            # Queued events can ask for headers after the handle was closed
+            return ''
+        if x >= self.shape[1 - axis]:
+            return None
+        return self.view_handle.header(axis, x, level)
+
+    def name(self, axis, level):
+        """Return the labels of the levels if any."""
+        return self.view_handle.name_of_level(axis, level)
+
+    def max_min_col_update(self):
+        """
+        Determines the maximum and minimum number in each column.
+
+        This is computed by the kernel, see `DataFrameModel.max_min_col_update`
+        for the format of the result.
+        """
+        if self.view_handle.is_open:
+            self.max_min_col = self.view_handle.get_max_min()
+        else:
+            self.max_min_col = None
+
+    def get_value(self, row, column):
+        """
+        Return the value of the DataFrame, or an empty one if its handle was
+        closed.
+        """
+        if not self.view_handle.is_open:
+            return ''
+        return self.view_handle.get_value(row, column)
+
+    def get_window(self, row_min, row_max, col_min, col_max):
+        """Return the data between the given rows and columns (inclusive)."""
+        return self.view_handle.get_window(
+            row_min, row_max + 1, col_min, col_max + 1)
+
+    def recalculate_index(self):
+        """
+        Recalcuate index information.
+
+        Rows are sorted in the kernel, so only the cached data has to be
+        discarded here.
+        """
+        self.view_handle.clear_cache()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Overriding sort method"""
+        ascending = order == Qt.AscendingOrder
+        try:
+            self.view_handle.sort(column, ascending)
+        except Exception as e:
+            QMessageBox.critical(self.dialog, "Error", str(e))
+            return False
+
+        self.reset()
+        return True
+
+    def flags(self, index):
+        """Set flags"""
+        return QAbstractTableModel.flags(self, index)
+
+    def setData(self, index, value, role=Qt.EditRole, change_type=None):
+        """Cell content change"""
+        return False
+
+    def get_data(self):
+        """Return data"""
+        return None
+
+    def columnCount(self, index=QModelIndex()):
+        """DataFrame column number"""
+        # Series are viewed as a one column dataframe, so there's no need
+        # to handle them here.
+        if self.total_cols <= self.cols_loaded:
+            return self.total_cols
+        else:
+            return self.cols_loaded
+
+    def fetch_more(self, rows=False, columns=False):
+        """Get more columns and/or rows, retrieving them from the kernel."""
+        super().fetch_more(rows=rows, columns=columns)
+
+        # Retrieve the block that contains the last loaded cell, so that
+        # it's available when the view paints the new rows or columns.
+        last_row = min(self.rows_loaded, self.total_rows) - 1
+        last_col = min(self.cols_loaded, self.total_cols) - 1
+        if last_row >= 0 and last_col >= 0:
+            self.get_value(last_row, last_col)
+
+
 class DataFrameView(QTableView, SpyderWidgetMixin):
     """
     Data Frame view class.
@@ -760,7 +893,8 @@ def refresh_menu(self):
         # Enable/disable edit actions
         condition_edit = (
             index.isValid() and
-            (len(self.selectedIndexes()) == 1)
+            (len(self.selectedIndexes()) == 1) and
+            not self.model().readonly
         )
 
         for action in [self.edit_action, self.insert_action_above,
@@ -775,9 +909,11 @@ def refresh_menu(self):
             (len(self.selectedIndexes()) > 0)
         )
 
-        for action in [self.copy_action, self.remove_row_action,
-                       self.remove_col_action]:
-            action.setEnabled(condition_copy_remove)
+        self.copy_action.setEnabled(condition_copy_remove)
+        for action in [self.remove_row_action, self.remove_col_action]:
+            action.setEnabled(
+                condition_copy_remove and not self.model().readonly
+            )
 
     def setup_menu(self):
         """Setup context menu."""
@@ -943,9 +1079,7 @@ def copy(self):
         # Copy index and header too (equal True).
         # See spyder-ide/spyder#11096
         index = header = True
-        df = self.model().df
-        obj = df.iloc[slice(row_min, row_max + 1),
-                      slice(col_min, col_max + 1)]
+        obj = self.model().get_window(row_min, row_max, col_min, col_max)
         output = io.StringIO()
         try:
             obj.to_csv(output, sep='\t', index=index, header=header)
@@ -980,6 +1114,9 @@ def flags(self, index):
 
     def edit_header_item(self):
         """Edit header item"""
+        if self.model().readonly:
+            return
+
         pos = self.header_class.currentIndex()
         index = self.header_class.logicalIndex(pos.column())
         if index >= 0:
@@ -1550,6 +1687,12 @@ def data(self, index, role):
 
     def flags(self, index):
         """Set flags"""
+        if self.model.readonly:
+            return Qt.ItemFlags(
+                int(QAbstractTableModel.flags(self, index) |
+                    Qt.ItemIsEnabled |
+                    Qt.ItemIsSelectable)
+            )
         return Qt.ItemFlags(
             int(QAbstractTableModel.flags(self, index) |
                 Qt.ItemIsEditable |
@@ -1738,6 +1881,7 @@ def __init__(
         # a segmentation fault on UNIX or an application crash on Windows
         self.setAttribute(Qt.WA_DeleteOnClose)
         self.is_series = False
+        self.view_handle = None
         self.layout = None
         self.glayout = None
         self.menu_header_v = None
@@ -1758,6 +1902,29 @@ def setup_and_check(self, data, title='') -> bool:
         self.setup_ui(title)
         return self.set_data_and_check(data)
 
+    def setup_and_check_remote(self, view_handle, title='') -> bool:
+        """
+        Setup editor to show a dataframe that lives in the kernel.
+
+        Data is retrieved on demand through `view_handle`, which is a
+        DataFrameViewHandle, and can't be edited. The handle is closed when
+        the editor is closed.
+        """
+        type_name = view_handle.type_name
+        if title:
+            title = to_text_string(title) + " - %s" % type_name
+        else:
+            title = _("%s editor") % type_name
+
+        self.view_handle = view_handle
+        self.finished.connect(lambda result: self.view_handle.close())
+        self.refresh_action.setEnabled(True)
+
+        self.setup_ui(title)
+        self.is_series = view_handle.is_series
+        return self.set_model_and_check(
+            RemoteDataFrameModel(view_handle, parent=self))
+
     def setup_ui(self, title: str) -> None:
         """
         Create user interface.
@@ -1841,17 +2008,23 @@ def set_data_and_check(self, data) -> bool:
         if not isinstance(data, (pd.DataFrame, pd.Series, pd.Index)):
             return False
 
-        self._selection_rec = False
-        self._model = None
-
         if isinstance(data, pd.Series):
             self.is_series = True
             data = data.to_frame()
         elif isinstance(data, pd.Index):
             data = pd.DataFrame(data)
 
+        return self.set_model_and_check(DataFrameModel(data, parent=self))
+
+    def set_model_and_check(self, model) -> bool:
+        """
+        Display the data of a model in the editor and return True.
+        """
+        self._selection_rec = False
+        self._model = None
+
         # Create the model and view of the data
-        self.dataModel = DataFrameModel(data, parent=self)
+        self.dataModel = model
         self.dataModel.dataChanged.connect(self.save_and_close_enable)
         self.create_data_table()
 
@@ -2267,6 +2440,10 @@ def refresh_editor(self) -> None:
         """
         Refresh data in editor.
         """
+        if self.view_handle is not None:
+            self._refresh_remote_editor()
+            return
+
         assert self.data_function is not None
 
         if self.btn_save_and_close.isEnabled():
@@ -2285,6 +2462,26 @@ def refresh_editor(self) -> None:
                   'editor.')
             )
 
+    def _refresh_remote_editor(self) -> None:
+        """
+        Refresh data in editor when it's retrieved through a view handle.
+        """
+        try:
+            self.view_handle.refresh()
+        except (IndexError, KeyError):
+            self.error(_('The variable no longer exists.'))
+            return
+        except ValueError as e:
+            self.error(str(e))
+            return
+
+        model = RemoteDataFrameModel(self.view_handle, parent=self)
+        if not self.set_model_and_check(model):
+            self.error(
+                _('The new value cannot be displayed in the dataframe '
+                  'editor.')
+            )
+
     def ask_for_refresh_confirmation(self) -> bool:
         """
         Ask user to confirm refreshing the editor.
@@ -84,6 +84,10 @@ def __init__(self, parent):
         self.filename = None
         self.plots_plugin_enabled = False
 
+        # Version of the namespace view shown by the editor (as given by the
+        # kernel), used to request only the changes to it.
+        self._view_version = None
+
         # Widgets
         self.editor = None
         self.shellwidget = None
@@ -209,8 +213,9 @@ def update_view(self, kernel_state):
             A new kernel state. The structure of this dictionary is defined in
             the `SpyderKernel.get_state` method of Spyder-kernels.
         """
-        if "namespace_view" in kernel_state:
-            self.process_remote_view(kernel_state.pop("namespace_view"))
+        if "namespace_view_delta" in kernel_state:
+            self.process_remote_view_delta(
+                kernel_state.pop("namespace_view_delta"))
         if "var_properties" in kernel_state:
             self.set_var_properties(kernel_state.pop("var_properties"))
 
@@ -220,8 +225,8 @@ def refresh_namespacebrowser(self, *, interrupt=True):
             return
         self.shellwidget.call_kernel(
             interrupt=interrupt,
-            callback=self.process_remote_view
-        ).get_namespace_view()
+            callback=self.process_remote_view_delta
+        ).get_namespace_view_delta(self._view_version)
 
         self.shellwidget.call_kernel(
             interrupt=interrupt,
@@ -240,8 +245,34 @@ def set_namespace_view_settings(self):
     def process_remote_view(self, remote_view):
         """Process remote view"""
         if remote_view is not None:
+            # This view is not versioned by the kernel (e.g. it's the
+            # namespace of a frame), so changes can't be applied to it.
+            self._view_version = None
             self.set_data(remote_view)
 
+    def process_remote_view_delta(self, delta):
+        """
+        Process the changes in the remote view since the last one shown.
+
+        The structure of `delta` is defined in the
+        `NamespaceViewCache.get_delta` method of Spyder-kernels.
+        """
+        if delta is None:
+            return
+
+        if delta['base'] is None:
+            self._view_version = delta['version']
+            self.set_data(delta['changed'])
+        elif delta['base'] == self._view_version:
+            self._view_version = delta['version']
+            if delta['changed'] or delta['removed']:
+                self.editor.update_data(delta['changed'], delta['removed'])
+                self.editor.adjust_columns()
+        else:
+            # We missed some changes, so we need the full view
+            self._view_version = None
+            self.refresh_namespacebrowser(interrupt=False)
+
     def set_var_properties(self, properties):
         """Set properties of variables"""
         if properties is not None:
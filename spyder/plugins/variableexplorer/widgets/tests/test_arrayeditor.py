@@ -26,7 +26,9 @@
 
 # Local imports
 from spyder.plugins.variableexplorer.widgets.arrayeditor import (
-    ArrayEditor, ArrayModel)
+    ArrayEditor, ArrayModel, RemoteArrayModel)
+from spyder.plugins.variableexplorer.widgets.viewhandles import (
+    ArrayViewHandle)
 
 
 # =============================================================================
@@ -47,6 +49,41 @@ def launch_arrayeditor(data, title=""):
     return dlg.get_value()
 
 
+def data(model, i, j):
+    """Return the text displayed in a cell of an array model."""
+    return model.data(model.index(i, j))
+
+
+def bgcolor(model, i, j):
+    """Return the hue of the background color of a cell of an array model."""
+    color = model.data(model.index(i, j), Qt.BackgroundColorRole)
+    return color.hueF()
+
+
+class FakeShellWidget:
+    """Serve view handles from a namespace, as the kernel does."""
+
+    def __init__(self, namespace):
+        from spyder_kernels.utils.viewhandles import ViewHandleManager
+        self.namespace = namespace
+        self.manager = ViewHandleManager()
+        self.calls = []
+
+    def open_view_handle(self, name):
+        return self.manager.open(name, self.namespace[name])
+
+    def close_view_handle(self, handle_id):
+        self.manager.close(handle_id)
+
+    def get_from_view_handle(self, method, handle_id, *args):
+        self.calls.append(method)
+        method = {
+            'get_view_window': self.manager.get_window,
+            'get_view_tile': self.manager.get_tile,
+        }[method]
+        return method(handle_id, *args)
+
+
 # =============================================================================
 # Fixtures
 # =============================================================================
@@ -454,5 +491,75 @@ def test_arrayeditor_edit_overflow(qtbot, monkeypatch):
                       dialog.get_value()) == len(expected_array)
 
 
+def test_remote_array_model(tmp_path):
+    """
+    Test that the remote model only retrieves from the kernel the tiles it
+    needs to display, also for memory-mapped arrays.
+    """
+    filename = str(tmp_path / 'data.npy')
+    np.save(filename, np.arange(2000 * 300, dtype=float).reshape(2000, 300))
+    arr = np.load(filename, mmap_mode='r')
+    shellwidget = FakeShellWidget({'arr': arr})
+    view_handle = ArrayViewHandle(shellwidget, 'arr')
+    model = RemoteArrayModel(view_handle)
+
+    assert model.total_rows == 2000
+    assert model.rowCount() == RemoteArrayModel.ROWS_TO_LOAD
+    assert model.columnCount() == RemoteArrayModel.COLS_TO_LOAD
+    assert not model.flags(model.index(0, 0)) & Qt.ItemIsEditable
+
+    # Only one tile is retrieved for cells in the same tile
+    assert data(model, 0, 0) == '0'
+    assert data(model, 10, 5) == '3005'
+    assert shellwidget.calls == ['get_view_tile']
+
+    # The color range grows with the tiles that are displayed
+    bgcolor(model, 0, 0)
+    assert (model.vmin, model.vmax) == (0, 499 * 300 + 39)
+    assert bgcolor(model, 0, 0) > bgcolor(model, 10, 5)
+    assert shellwidget.calls == ['get_view_tile']
+
+    # Copying a selection asks for the corresponding window
+    assert model.get_window(1, 2, 3, 4).tolist() == [
+        [303.0, 304.0], [603.0, 604.0]]
+    assert shellwidget.calls == ['get_view_tile', 'get_view_window']
+
+    view_handle.close()
+    assert not shellwidget.manager._handles
+
+
+def test_remote_arrayeditor(qtbot):
+    """Test showing an array through a view handle in the editor."""
+    arr = np.arange(100)
+    shellwidget = FakeShellWidget({'arr': arr})
+    view_handle = ArrayViewHandle(shellwidget, 'arr')
+
+    editor = ArrayEditor()
+    qtbot.addWidget(editor)
+    assert editor.setup_and_check_remote(view_handle, title='arr')
+    assert not editor.btn_save_and_close.isVisible()
+    assert data(editor.arraywidget.model, 99, 0) == '99'
+
+    # The handle is released when closing the editor
+    editor.reject()
+    assert not shellwidget.manager._handles
+
+
+@pytest.mark.parametrize('dtype', ['U256', 'S64'])
+def test_remote_arrayeditor_text(qtbot, dtype):
+    """Test showing large arrays of strings through a view handle."""
+    arr = np.full((2000, 300), 'spam', dtype=dtype)
+    shellwidget = FakeShellWidget({'arr': arr})
+    view_handle = ArrayViewHandle(shellwidget, 'arr')
+    assert view_handle.dtype == arr.dtype
+
+    editor = ArrayEditor()
+    qtbot.addWidget(editor)
+    assert editor.setup_and_check_remote(view_handle, title='arr')
+    assert data(editor.arraywidget.model, 10, 5) == 'spam'
+
+    editor.reject()
+
+
 if __name__ == "__main__":
     pytest.main()
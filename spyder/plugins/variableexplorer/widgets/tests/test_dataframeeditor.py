@@ -34,7 +34,9 @@
 from spyder.utils.test import close_message_box
 from spyder.plugins.variableexplorer.widgets import dataframeeditor
 from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
-    DataFrameEditor, DataFrameModel)
+    DataFrameEditor, DataFrameModel, RemoteDataFrameModel)
+from spyder.plugins.variableexplorer.widgets.viewhandles import (
+    DataFrameViewHandle)
 
 
 # =============================================================================
@@ -71,6 +73,32 @@ def data_index(dfi, i, j, role=Qt.DisplayRole):
     return dfi.data(dfi.createIndex(i, j), role)
 
 
+class FakeShellWidget:
+    """Serve view handles from a namespace, as the kernel does."""
+
+    def __init__(self, namespace):
+        from spyder_kernels.utils.viewhandles import ViewHandleManager
+        self.namespace = namespace
+        self.manager = ViewHandleManager()
+        self.calls = []
+
+    def open_view_handle(self, name):
+        return self.manager.open(name, self.namespace[name])
+
+    def close_view_handle(self, handle_id):
+        self.manager.close(handle_id)
+
+    def get_from_view_handle(self, method, handle_id, *args):
+        self.calls.append(method)
+        method = {
+            'get_view_window': self.manager.get_window,
+            'get_view_header': self.manager.get_header,
+            'get_view_max_min': self.manager.get_max_min,
+            'sort_view': self.manager.sort,
+        }[method]
+        return method(handle_id, *args)
+
+
 def generate_pandas_indexes():
     """Creates a dictionary of many possible pandas indexes."""
     # Float64Index was removed in Pandas 2.0
@@ -1049,5 +1077,69 @@ def test_no_convert_strings_to_unicode():
     assert data(dfm, 0, 0) != u'файла'
 
 
+def test_remote_dataframe_model():
+    """
+    Test that the remote model only retrieves from the kernel the windows
+    of data it needs to display.
+    """
+    df = DataFrame(numpy.arange(2000 * 300).reshape(2000, 300))
+    shellwidget = FakeShellWidget({'df': df})
+    view_handle = DataFrameViewHandle(shellwidget, 'df')
+    dfm = RemoteDataFrameModel(view_handle)
+
+    assert dfm.shape == (2000, 300)
+    assert dfm.rowCount() == dataframeeditor.ROWS_TO_LOAD
+    assert dfm.columnCount() == dataframeeditor.COLS_TO_LOAD
+    assert not dfm.flags(dfm.createIndex(0, 0)) & Qt.ItemIsEditable
+
+    # Only one window is retrieved for cells in the same block
+    assert data(dfm, 0, 0) == '0'
+    assert data(dfm, 10, 5) == '3005'
+    assert shellwidget.calls == ['get_view_window']
+
+    # Cells far away need another window
+    assert data(dfm, 1999, 299) == str(2000 * 300 - 1)
+    assert shellwidget.calls == ['get_view_window'] * 2
+
+    # Headers
+    assert dfm.header(0, 299) == 299
+    assert dfm.header(1, 1999) == 1999
+
+    # Sorting is done in the kernel without touching the dataframe
+    assert dfm.sort(3, order=Qt.DescendingOrder)
+    assert data(dfm, 0, 3) == str(1999 * 300 + 3)
+    assert dfm.header(1, 0) == 1999
+    assert df.iat[0, 3] == 3
+
+    view_handle.close()
+    assert not shellwidget.manager._handles
+
+
+def test_remote_dataframeeditor(qtbot):
+    """Test showing a dataframe through a view handle in the editor."""
+    df = DataFrame({'a': range(100), 'b': [1.5] * 100})
+    shellwidget = FakeShellWidget({'df': df})
+    view_handle = DataFrameViewHandle(shellwidget, 'df')
+
+    editor = DataFrameEditor(None)
+    qtbot.addWidget(editor)
+    assert editor.setup_and_check_remote(view_handle, title='df')
+    assert editor.windowTitle() == 'df - DataFrame'
+
+    dfm = editor.model()
+    header = editor.table_header.model()
+    assert header.headerData(1, Qt.Horizontal, Qt.DisplayRole) == 'b'
+    assert data(dfm, 99, 0) == '99'
+    assert not editor.dataTable.edit_action.isEnabled()
+
+    # The handle is released when closing the editor
+    editor.reject()
+    assert not shellwidget.manager._handles
+
+    # Events processed after that don't need the handle
+    assert header.headerData(1, Qt.Horizontal, Qt.DisplayRole) == ''
+    assert data(dfm, 99, 0) == ''
+
+
 if __name__ == "__main__":
     pytest.main()
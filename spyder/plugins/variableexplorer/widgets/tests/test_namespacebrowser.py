@@ -203,6 +203,73 @@ def test_filtering_with_large_rows(namespacebrowser, qtbot):
     assert model.rowCount() == 1
 
 
+def test_process_remote_view_delta(namespacebrowser):
+    """
+    Test that changes in the namespace view are applied in place and that
+    the full view is requested when some changes were missed.
+    """
+    browser = namespacebrowser
+    model = browser.editor.model
+
+    def entry(view):
+        return {'type': 'int', 'size': 1, 'view': view, 'python_type': 'int',
+                'numpy_type': 'Unknown'}
+
+    browser.process_remote_view_delta({
+        'version': 'v1',
+        'base': None,
+        'changed': {'a': entry('1'), 'b': entry('2'), 'c': entry('3')},
+        'removed': [],
+    })
+    assert model.rowCount() == 3
+
+    # Apply changes without resetting the model
+    browser.editor.selectRow(0)
+    with patch.object(browser.editor.source_model, 'reset') as mock_reset:
+        browser.process_remote_view_delta({
+            'version': 'v2',
+            'base': 'v1',
+            'changed': {'b': entry('20'), 'd': entry('4')},
+            'removed': ['c'],
+        })
+        mock_reset.assert_not_called()
+
+    assert model.rowCount() == 3
+    assert [data(model, i, 0) for i in range(3)] == ['a', 'b', 'd']
+    assert data(model, 1, 3) == '20'
+    assert browser.editor.selectionModel().isRowSelected(0, QModelIndex())
+    assert browser.editor.source_model.title.endswith('(3 elements)')
+
+    # Remove several consecutive and non consecutive rows at once
+    browser.process_remote_view_delta({
+        'version': 'v3',
+        'base': 'v2',
+        'changed': {'e': entry('5'), 'f': entry('6'), 'g': entry('7')},
+        'removed': [],
+    })
+    browser.process_remote_view_delta({
+        'version': 'v3.1',
+        'base': 'v3',
+        'changed': {},
+        'removed': ['b', 'd', 'f', 'g'],
+    })
+    assert model.rowCount() == 2
+    assert [data(model, i, 0) for i in range(2)] == ['a', 'e']
+    assert browser.editor.source_model.title.endswith('(2 elements)')
+
+    # A delta with respect to another version asks for the full view
+    browser.shellwidget.call_kernel.reset_mock()
+    browser.process_remote_view_delta({
+        'version': 'v4',
+        'base': 'v3',
+        'changed': {},
+        'removed': ['a'],
+    })
+    assert model.rowCount() == 2
+    browser.shellwidget.call_kernel.return_value.\
+        get_namespace_view_delta.assert_called_with(None)
+
+
 def test_namespacebrowser_plot_with_mute_inline_plotting_true(
         namespacebrowser, qtbot):
     """
@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Frontend side of the view handles provided by the kernel.
+
+A view handle gives access to a variable that lives in the kernel without
+transferring it to Spyder. Only the windows of data the editors display are
+requested, and they are cached in blocks so that scrolling back and forth
+doesn't make a new request to the kernel for every cell.
+"""
+
+# Standard library imports
+from collections import OrderedDict
+
+# Third party imports
+from spyder_kernels.utils.lazymodules import numpy as np
+from spyder_kernels.utils.nsview import value_to_display
+
+
+# Number of rows and columns requested from the kernel at once
+ROWS_PER_BLOCK = 500
+COLS_PER_BLOCK = 40
+
+# Maximum number of blocks kept in memory per handle
+MAX_CACHED_BLOCKS = 64
+
+
+class BlockCache(OrderedDict):
+    """Least recently used cache of blocks retrieved from the kernel."""
+
+    def __init__(self, max_size=MAX_CACHED_BLOCKS):
+        super().__init__()
+        self.max_size = max_size
+
+    def get_or_load(self, key, load_function):
+        """Return the block for key, calling load_function if not cached."""
+        try:
+            self.move_to_end(key)
+            return self[key]
+        except KeyError:
+            block = load_function()
+            self[key] = block
+            if len(self) > self.max_size:
+                self.popitem(last=False)
+            return block
+
+
+class ArrayTile:
+    """
+    Rectangular part of an array retrieved from the kernel.
+
+    Besides the data, a tile stores the range of its values (computed by
+    the kernel) and the text used to display its cells, which is formatted
+    for the whole tile at once the first time it's needed.
+    """
+
+    def __init__(self, data, vmin, vmax):
+        self.data = data
+        self.vmin = vmin
+        self.vmax = vmax
+        self._format_spec = None
+        self._display = None
+
+    def get_display(self, row, column, format_spec):
+        """Return the text to display for a cell of the tile."""
+        if self._display is None or format_spec != self._format_spec:
+            self._format_spec = format_spec
+            self._display = self._format(format_spec)
+        return self._display[row][column]
+
+    def _format(self, format_spec):
+        """Format all values of the tile."""
+        if self.data.dtype.name == 'object':
+            # We don't know what's inside an object array, so we can't
+            # trust value repr's here.
+            formatter = value_to_display
+        else:
+            def formatter(value):
+                # Transform binary strings to unicode so they are displayed
+                # correctly
+                if isinstance(value, bytes):
+                    try:
+                        value = value.decode('utf8')
+                    except UnicodeDecodeError:
+                        pass
+                try:
+                    return format(value, format_spec)
+                except (TypeError, ValueError):
+                    return repr(value)
+
+        display = []
+        for row in self.data:
+            display.append([formatter(value) for value in row])
+        return display
+
+
+class ViewHandle:
+    """
+    Handle to a variable viewed in the kernel.
+
+    Parameters
+    ----------
+    shellwidget: ShellWidget
+        Console connected to the kernel where the variable lives.
+    name: str
+        Name of the variable in the kernel namespace.
+    """
+
+    def __init__(self, shellwidget, name):
+        self.shellwidget = shellwidget
+        self.name = name
+        self.info = None
+
+        # The info of the handle is kept after closing it, because queued
+        # Qt events can still ask for it.
+        self.is_open = False
+        self.open()
+
+    # ---- Public API
+    @property
+    def handle_id(self):
+        """Identifier of the handle in the kernel."""
+        return self.info['handle_id']
+
+    @property
+    def type_name(self):
+        """Name of the type of the viewed variable."""
+        return self.info['type']
+
+    @property
+    def shape(self):
+        """Shape of the viewed variable."""
+        return tuple(self.info['shape'])
+
+    def open(self):
+        """Open the handle in the kernel."""
+        self.info = self.shellwidget.open_view_handle(self.name)
+        self.is_open = True
+        self.clear_cache()
+
+    def refresh(self):
+        """
+        Open a new handle to the current value of the variable.
+
+        This raises a KeyError if the variable doesn't exist anymore.
+        """
+        self.close()
+        self.open()
+
+    def close(self):
+        """Release the handle in the kernel."""
+        if self.is_open:
+            try:
+                self.shellwidget.close_view_handle(self.handle_id)
+            except Exception:
+                # The kernel could be dead at this point, in which case there
+                # is nothing to release.
+                pass
+            self.is_open = False
+            self.clear_cache()
+
+    def clear_cache(self):
+        """Forget all data retrieved from the kernel."""
+        pass
+
+    # ---- Private API
+    def _get(self, method, *args):
+        """Get data viewed by this handle from the kernel."""
+        return self.shellwidget.get_from_view_handle(
+            method, self.handle_id, *args)
+
+
+class DataFrameViewHandle(ViewHandle):
+    """Handle to a DataFrame, Series or Index viewed in the kernel."""
+
+    def __init__(self, shellwidget, name):
+        self._windows = BlockCache()
+        self._headers = BlockCache()
+        super().__init__(shellwidget, name)
+
+    # ---- Public API
+    @property
+    def is_series(self):
+        """Whether the viewed variable is a Series."""
+        return self.type_name == 'Series'
+
+    @property
+    def header_shape(self):
+        """Number of levels of the columns and index."""
+        return tuple(self.info['header_shape'])
+
+    @property
+    def dtypes(self):
+        """Names of the dtypes of each column."""
+        return self.info['dtypes']
+
+    def name_of_level(self, axis, level):
+        """Return the name of a level of the columns (0) or index (1)."""
+        names = self.info['names'][axis]
+        if len(names) > 1:
+            return names[level]
+        return names[0]
+
+    def clear_cache(self):
+        """Forget all data retrieved from the kernel."""
+        self._windows.clear()
+        self._headers.clear()
+
+    def get_value(self, row, column):
+        """Return the value of a cell, retrieving its block if necessary."""
+        row_block, row_offset = divmod(row, ROWS_PER_BLOCK)
+        col_block, col_offset = divmod(column, COLS_PER_BLOCK)
+        window = self.get_block(row_block, col_block)
+        return window.iat[row_offset, col_offset]
+
+    def get_block(self, row_block, col_block):
+        """Return a block of data, retrieving it from the kernel if needed."""
+        def load():
+            row_start = row_block * ROWS_PER_BLOCK
+            col_start = col_block * COLS_PER_BLOCK
+            return self.get_window(
+                row_start, row_start + ROWS_PER_BLOCK,
+                col_start, col_start + COLS_PER_BLOCK)
+
+        return self._windows.get_or_load((row_block, col_block), load)
+
+    def get_window(self, row_start, row_stop, col_start, col_stop):
+        """Retrieve an arbitrary window of data from the kernel."""
+        return self._get(
+            'get_view_window', row_start, row_stop, col_start, col_stop)
+
+    def header(self, axis, x, level=0):
+        """Return the label of column (axis 0) or row (axis 1) x."""
+        size = COLS_PER_BLOCK if axis == 0 else ROWS_PER_BLOCK
+        block, offset = divmod(x, size)
+
+        def load():
+            start = block * size
+            return self._get('get_view_header', axis, start, start + size)
+
+        labels = self._headers.get_or_load((axis, block), load)
+        label = labels[offset]
+        if self.header_shape[axis] > 1:
+            return label[level]
+        return label
+
+    def get_max_min(self):
+        """Return the maximum and minimum of each column."""
+        return self._get('get_view_max_min')
+
+    def sort(self, column, ascending=True):
+        """Sort rows by column, or by index if column is -1."""
+        self._get('sort_view', column, ascending)
+        self.clear_cache()
+
+
+class ArrayViewHandle(ViewHandle):
+    """
+    Handle to an array viewed in the kernel.
+
+    This also works for memory-mapped arrays and HDF5 datasets, for which
+    the kernel reads only the tiles that are displayed.
+    """
+
+    def __init__(self, shellwidget, name):
+        self._tiles = BlockCache()
+        super().__init__(shellwidget, name)
+
+    # ---- Public API
+    @property
+    def dtype(self):
+        """Data type of the viewed array."""
+        return np.dtype(self.info['dtype'])
+
+    @property
+    def ndim(self):
+        """Number of dimensions of the viewed array."""
+        return self.info['ndim']
+
+    def clear_cache(self):
+        """Forget all data retrieved from the kernel."""
+        self._tiles.clear()
+
+    def get_tile(self, row, column):
+        """
+        Return the tile that contains a cell, retrieving it if needed.
+
+        Returns the tile and the position of the cell in it.
+        """
+        row_block, row_offset = divmod(row, ROWS_PER_BLOCK)
+        col_block, col_offset = divmod(column, COLS_PER_BLOCK)
+
+        def load():
+            row_start = row_block * ROWS_PER_BLOCK
+            col_start = col_block * COLS_PER_BLOCK
+            tile = self._get(
+                'get_view_tile',
+                row_start, row_start + ROWS_PER_BLOCK,
+                col_start, col_start + COLS_PER_BLOCK)
+            return ArrayTile(tile['data'], tile['vmin'], tile['vmax'])
+
+        tile = self._tiles.get_or_load((row_block, col_block), load)
+        return tile, row_offset, col_offset
+
+    def get_value(self, row, column):
+        """Return the value of a cell."""
+        tile, row_offset, col_offset = self.get_tile(row, column)
+        return tile.data[row_offset, col_offset]
+
+    def get_window(self, row_start, row_stop, col_start, col_stop):
+        """Retrieve an arbitrary window of the array from the kernel."""
+        return self._get(
+            'get_view_window', row_start, row_stop, col_start, col_stop)
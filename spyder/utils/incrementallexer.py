@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Incremental lexing of documents with Pygments lexers.
+
+The lexer state is recorded for every line so that, after a change, lexing
+can resume from a line before it instead of from the start of the document,
+and stop as soon as the lexer reaches a line after it in the same state it
+had before the change.
+"""
+
+# Third party imports
+from pygments.lexer import RegexLexer
+from pygments.token import _TokenType, Error, Whitespace
+
+
+def get_format_name(token_type, tokmap):
+    """Get the Spyder format name for a Pygments token type."""
+    # Exact matches first
+    if token_type in tokmap:
+        return tokmap[token_type]
+
+    # Partial (parent-> child) matches
+    for key, value in tokmap.items():
+        if token_type in key:  # Checks if token_type is a subtype of key.
+            return value
+
+    return 'normal'
+
+
+def is_resumable(lexer):
+    """
+    Whether lexing can be resumed from any state with lexer.
+
+    That's the case for lexers based on regular expressions and state
+    stacks, which are the great majority of Pygments lexers.
+    """
+    return (
+        isinstance(lexer, RegexLexer)
+        and type(lexer).get_tokens_unprocessed
+        is RegexLexer.get_tokens_unprocessed
+    )
+
+
+def lex(lexer, text, pos=0, stack=('root',)):
+    """
+    Lex text from pos with a RegexLexer, starting in the given state stack.
+
+    This is the same as RegexLexer.get_tokens_unprocessed, but it also
+    yields the stack at the start of every match of the lexer rules (or None
+    for the tokens that don't start a match), to resume lexing from there
+    later.
+    """
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    while True:
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is not None:
+                    match_stack = tuple(statestack)
+                    if type(action) is _TokenType:
+                        yield pos, action, m.group(), match_stack
+                    else:
+                        for token in action(lexer, m):
+                            yield token + (match_stack,)
+                            match_stack = None
+                pos = m.end()
+                if new_state is not None:
+                    # State transition
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == '#pop':
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == '#push':
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        # Pop, but keep at least one state on the stack
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == '#push':
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                break
+        else:
+            # No rule matched
+            if pos >= len(text):
+                break
+            match_stack = tuple(statestack)
+            if text[pos] == '\n':
+                # At EOL, reset state to "root"
+                statestack = ['root']
+                statetokens = tokendefs['root']
+                yield pos, Whitespace, '\n', match_stack
+            else:
+                yield pos, Error, text[pos], match_stack
+            pos += 1
+
+
+class IncrementalLexer:
+    """
+    Lexer of a document given as a list of lines, which can be updated
+    incrementally.
+
+    For every line, the formats of its text are kept as run-length spans of
+    (start, length, format name), with positions given in characters. The
+    column and state stack of the first match of the lexer rules that starts
+    in the line are also kept, to be able to resume lexing from them.
+
+    Lexing is done by a generator, so it can be run in slices. Lexers that
+    can't be resumed have to lex the whole document after every change.
+    """
+
+    def __init__(self, lexer, tokmap):
+        self.lexer = lexer
+        self.tokmap = tokmap
+        self.resumable = is_resumable(lexer)
+        self.lines = []
+        self.spans = []
+        self._starts = []
+        self._formats = {}
+
+        # Lexing in progress, the line it has reached and the line after the
+        # last one changed since lexing started.
+        self._task = None
+        self._line = 0
+        self._changed_until = 0
+
+    # ---- Public API
+    @property
+    def is_lexing(self):
+        """Whether there are lines pending to be lexed."""
+        return self._task is not None
+
+    def set_lines(self, lines):
+        """Set the lines of the document, which need to be lexed again."""
+        self.lines = list(lines)
+        self.spans = [()] * len(self.lines)
+        self._starts = [None] * len(self.lines)
+        self._task = None
+        self._line = 0
+        self._changed_until = 0
+        self._schedule(0, len(self.lines))
+
+    def replace_lines(self, first, count, new_lines):
+        """
+        Replace count lines starting from first with new_lines.
+
+        The lines after the new ones are lexed again until the lexer state
+        is the same it was before the change.
+        """
+        new_count = len(new_lines)
+        end = first + new_count
+        self.lines[first:first + count] = new_lines
+        self.spans[first:first + count] = [()] * new_count
+        self._starts[first:first + count] = [None] * new_count
+
+        if self._task is not None:
+            # Lines lexed by the current task before the change are kept
+            delta = new_count - count
+            if self._changed_until > first + count:
+                self._changed_until += delta
+            end = max(end, self._changed_until)
+            if self._line > first:
+                self._line = first
+
+        self._schedule(first, end)
+
+    def relex(self):
+        """
+        Lex the whole document again.
+
+        Incremental lexing can miss changes before the lines it starts from,
+        because the rules of some lexers match text spanning several lines
+        (e.g. block comments), so this is needed once in a while.
+        """
+        self._schedule(0, len(self.lines))
+
+    def lex(self):
+        """
+        Generator that lexes the pending lines and yields the number of
+        every line whose spans changed, or None for the lines that didn't.
+        """
+        while self._task is not None:
+            try:
+                yield next(self._task)
+            except StopIteration:
+                self._task = None
+                self._changed_until = 0
+
+    def get_spans(self, line):
+        """Get the spans of line."""
+        return self.spans[line]
+
+    # ---- Private API
+    def _schedule(self, first, end):
+        """Schedule lexing from before line first until after line end."""
+        if not self.lines:
+            self._task = None
+            return
+
+        if self._task is not None:
+            first = min(first, self._line)
+
+        if self.resumable:
+            # Resume from the last line before first where a match started,
+            # which is not affected by changes in first.
+            line = min(first, len(self.lines)) - 1
+            while line > 0 and self._starts[line] is None:
+                line -= 1
+            line = max(line, 0)
+        else:
+            line = 0
+
+        self._changed_until = end
+        self._line = line
+        self._task = self._lex_from(line)
+
+    def _get_format(self, token_type):
+        try:
+            return self._formats[token_type]
+        except KeyError:
+            name = get_format_name(token_type, self.tokmap)
+            self._formats[token_type] = name
+            return name
+
+    def _lex_from(self, first):
+        """
+        Generator that lexes lines from first.
+
+        It yields the number of every line whose spans changed, or None for
+        the lines that didn't.
+        """
+        lines = self.lines
+        spans = self.spans
+        starts = self._starts
+        resumable = self.resumable
+
+        def commit(line, line_spans, line_match):
+            """Save the spans and match start of line."""
+            self._line = line + 1
+            starts[line] = line_match
+            line_spans = tuple(line_spans)
+            if spans[line] == line_spans:
+                return None
+            spans[line] = line_spans
+            return line
+
+        start = starts[first] if first > 0 else None
+        if start is None:
+            column, stack = 0, ('root',)
+        else:
+            column, stack = start
+
+        text = '\n'.join(lines[first:]) + '\n'
+        if resumable:
+            tokens = lex(self.lexer, text, column, stack)
+        else:
+            tokens = (
+                token + (None,)
+                for token in self.lexer.get_tokens_unprocessed(text)
+            )
+
+        line = first
+        line_start = 0
+        line_end = len(lines[line])
+        line_spans = [
+            (span_start, min(length, column - span_start), fmt)
+            for span_start, length, fmt in spans[line]
+            if span_start < column
+        ]
+        line_match = (column, stack) if column else None
+
+        for pos, token_type, value, match_stack in tokens:
+            if not value:
+                continue
+
+            # Move to the line where the token starts
+            while pos > line_end:
+                yield commit(line, line_spans, line_match)
+                line += 1
+                line_start = line_end + 1
+                line_end = line_start + len(lines[line])
+                line_spans = []
+                line_match = None
+
+            if line_match is None and (match_stack is not None
+                                       or not resumable):
+                line_match = (pos - line_start, match_stack)
+
+                # Stop if lexing reached a line after the changed ones in
+                # the same state it had before.
+                if (
+                    resumable
+                    and line >= self._changed_until
+                    and line_match == starts[line]
+                ):
+                    column = pos - line_start
+                    line_spans.extend(
+                        (max(span_start, column),
+                         span_start + length - max(span_start, column),
+                         fmt)
+                        for span_start, length, fmt in spans[line]
+                        if span_start + length > column
+                    )
+                    yield commit(line, line_spans, line_match)
+                    return
+
+            fmt = self._get_format(token_type)
+            token_end = pos + len(value)
+            while True:
+                span_end = min(token_end, line_end)
+                if span_end > pos:
+                    last = line_spans[-1] if line_spans else None
+                    if (
+                        last is not None
+                        and last[2] == fmt
+                        and last[0] + last[1] == pos - line_start
+                    ):
+                        # Merge consecutive spans with the same format
+                        line_spans[-1] = (
+                            last[0], last[1] + span_end - pos, fmt)
+                    else:
+                        line_spans.append(
+                            (pos - line_start, span_end - pos, fmt))
+                if token_end <= line_end + 1 or line + 1 >= len(lines):
+                    break
+
+                # The token continues in the next line
+                yield commit(line, line_spans, line_match)
+                line += 1
+                pos = line_end + 1
+                line_start = pos
+                line_end = line_start + len(lines[line])
+                line_spans = []
+                line_match = None
+
+        yield commit(line, line_spans, line_match)
+
+        # Lines without tokens, if any
+        for line in range(line + 1, len(lines)):
+            yield commit(line, [], None)
@@ -18,3 +18,21 @@ def qstring_length(text):
     if utf16_text[:2] in [b'\xff\xfe', b'\xff\xff', b'\xfe\xff']:
         length -= 1
     return length
+
+
+def qstring_position_to_index(text, position):
+    """
+    Return the index in text of a position in an utf16-encoded QString.
+
+    Positions in QStrings count characters outside the Basic Multilingual
+    Plane (e.g. emojis) as two.
+    """
+    if len(text) == qstring_length(text):
+        return position
+
+    length = 0
+    for index, char in enumerate(text):
+        if length >= position:
+            return index
+        length += 2 if ord(char) > 0xFFFF else 1
+    return len(text)
@@ -8,6 +8,8 @@
 String search and match utilities useful when filtering a list of texts.
 """
 
+import functools
+import heapq
 import re
 
 from spyder.py3compat import to_text_string
@@ -15,6 +17,12 @@
 NOT_FOUND_SCORE = -1
 NO_SCORE = 0
 
+# Character that replaces the matched letters to compute scores
+MATCH_CHAR = u'-'
+
+# Regex for the characters that are not spaces or the one above
+NOT_SPACE_OR_MATCH = re.compile(u'[^ -]')
+
 
 def get_search_regex(query, ignore_case=True):
     """Returns a compiled regex pattern to search for query letters in order.
@@ -181,6 +189,227 @@ def get_search_score(query, choice, ignore_case=True, apply_regex=True,
     return original_choice, enriched_text, score
 
 
+def get_subsequence_regex(query):
+    """
+    Returns a compiled regex pattern that finds the letters of query in order,
+    matching each one with its first occurrence after the previous one.
+
+    Contrary to the pattern returned by get_search_regex, this one doesn't
+    need to backtrack to reject texts, which makes it much faster.
+    """
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        char = re.escape(char)
+        parts.append(u'[^{0}]*{0}'.format(char))
+    return re.compile(u''.join(parts), re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_runs_score(runs, length):
+    """
+    Get the part of the score given by the lengths of the runs of consecutive
+    letters found for a query of the given length.
+    """
+    return sum(
+        (length - sum(run // i for run in runs)) * 100000
+        for i in range(1, length + 1)
+    )
+
+
+def _get_match(query, text):
+    """
+    Get the score of the match of query in text, which must contain its
+    letters in order, and where the letters were found.
+
+    This gives the same score as get_search_score, without building the
+    enriched text. The letters are given by the position where query was
+    found in text, or by a list of the positions of each letter if it was
+    not found as is.
+    """
+    score = 0
+    start = text.find(query)
+    if start >= 0:
+        score += start
+        if u' ' + query + u' ' in u' ' + text + u' ':
+            # Exact match of a word
+            score += 1
+        else:
+            score += 100
+        positions = range(start, start + len(query))
+    else:
+        positions = []
+        index = -1
+        for char in query:
+            index = text.find(char, index + 1)
+            positions.append(index)
+        score += positions[0]
+        start = positions
+
+    length = len(query)
+    if MATCH_CHAR in text:
+        # Letters that are not matches but are counted like them
+        chars = list(NOT_SPACE_OR_MATCH.sub(u'x', text))
+        for index in positions:
+            chars[index] = MATCH_CHAR
+        pattern_text = u''.join(chars)
+
+        for i in range(1, length + 1):
+            score += (length - pattern_text.count(MATCH_CHAR * i)) * 100000
+
+        parts = [part for part in pattern_text.split(MATCH_CHAR) if part]
+        if not pattern_text.startswith(MATCH_CHAR):
+            parts = parts[1:]
+        if not pattern_text.endswith(MATCH_CHAR):
+            parts = parts[:-1]
+    else:
+        # Same as above, but computed from the runs of consecutive letters
+        # found, and the parts of text between them.
+        runs = []
+        parts = []
+        if isinstance(start, int):
+            runs.append(length)
+        else:
+            run_start = previous = positions[0]
+            for index in positions[1:]:
+                if index != previous + 1:
+                    runs.append(previous + 1 - run_start)
+                    parts.append(text[previous + 1:index])
+                    run_start = index
+                previous = index
+            runs.append(previous + 1 - run_start)
+
+        score += _get_runs_score(tuple(runs), length)
+
+    for part in parts:
+        spaces = part.count(u' ')
+        score += spaces * 10000
+        score += (len(part) - spaces) * 100
+
+    return score, start
+
+
+def _enrich_text(text, query, start, template):
+    """Apply template to the letters of query found in text."""
+    if isinstance(start, int):
+        end = start + len(query)
+        return text[:start] + template.format(text[start:end]) + text[end:]
+
+    chars = list(text)
+    for index in start:
+        chars[index] = template.format(chars[index])
+    return u''.join(chars)
+
+
+def get_best_scores(scores, count):
+    """
+    Get the count best scores that are not NOT_FOUND_SCORE, from the best to
+    the worst, with their positions in scores.
+
+    Ties are resolved in favor of the first positions.
+    """
+    return heapq.nsmallest(
+        count,
+        ((score, index) for index, score in enumerate(scores)
+         if score != NOT_FOUND_SCORE)
+    )
+
+
+class SearchChoices:
+    """
+    Table of choices to search for a query in them repeatedly.
+
+    The choices are prepared to be searched once, and then they're all scored
+    for each query in one pass, which first rejects the ones that don't
+    contain the letters of the query with a fast regular expression. Rich
+    texts with the letters found are only built when requested, e.g. for the
+    choices that are shown.
+
+    Scores are the same given by get_search_score.
+    """
+
+    def __init__(self, choices, ignore_case=True):
+        self.choices = [
+            to_text_string(choice, encoding='utf-8') for choice in choices]
+        self.ignore_case = ignore_case
+        if ignore_case:
+            self._texts = [choice.lower() for choice in self.choices]
+        else:
+            self._texts = self.choices
+        self._query = None
+        self._matches = {}
+
+    def __len__(self):
+        return len(self.choices)
+
+    def _prepare_query(self, query):
+        """Get query as it's searched in the choices."""
+        query = to_text_string(query, encoding='utf-8').replace(u' ', u'')
+        if self.ignore_case:
+            query = query.lower()
+        return query
+
+    def _score(self, index, query):
+        """Score the choice at index, which contains the letters of query."""
+        text = self._texts[index]
+        if len(text) != len(self.choices[index]):
+            # Lowercase changed the length of the choice, so positions in
+            # text don't correspond to the ones in the choice.
+            result = get_search_score(
+                query, self.choices[index], ignore_case=self.ignore_case,
+                apply_regex=False)
+            match = (result[-1], None)
+        else:
+            match = _get_match(query, text)
+        self._matches[index] = match
+        return match[0]
+
+    def get_scores(self, query):
+        """
+        Get the scores of all choices for query.
+
+        Lower scores imply a better match. Choices that don't match have a
+        score of NOT_FOUND_SCORE, and all have NO_SCORE if query is empty.
+        """
+        query = self._prepare_query(query)
+        self._query = query
+        self._matches = {}
+        if not query:
+            return [NO_SCORE] * len(self.choices)
+
+        scores = [NOT_FOUND_SCORE] * len(self.choices)
+        found = map(get_subsequence_regex(query).search, self._texts)
+        for index, match in enumerate(found):
+            if match is not None:
+                scores[index] = self._score(index, query)
+        return scores
+
+    def get_best(self, query, count):
+        """
+        Get the scores and positions of the count choices that match query
+        best, from the best to the worst.
+        """
+        return get_best_scores(self.get_scores(query), count)
+
+    def get_rich_text(self, index, template='{}'):
+        """
+        Get the choice at index with the letters of the last query found in
+        it surrounded by template.
+
+        Returns the choice as is if it didn't match the last query.
+        """
+        choice = self.choices[index]
+        match = self._matches.get(index)
+        if match is None:
+            return choice
+
+        start = match[1]
+        if start is None:
+            return get_search_score(
+                self._query, choice, ignore_case=self.ignore_case,
+                apply_regex=False, template=template)[1]
+        return _enrich_text(choice, self._query, start, template)
+
+
 def get_search_scores(query, choices, ignore_case=True, template='{}',
                       valid_only=False, sort=False):
     """Search for query inside choices and return a list of tuples.
@@ -206,28 +435,24 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     results : list of tuples
         List of tuples where the first item is the text (enriched if a
         template was used) and a search score. Lower scores means better match.
+
+    Notes
+    -----
+    To search for several queries in the same choices, or when only the best
+    matches are needed, use SearchChoices instead.
     """
-    # First remove spaces from query
-    query = query.replace(' ', '')
-    pattern = get_search_regex(query, ignore_case)
+    search_choices = SearchChoices(choices, ignore_case=ignore_case)
+    scores = search_choices.get_scores(query)
     results = []
 
-    for choice in choices:
-        r = re.search(pattern, choice)
-        if query and r:
-            result = get_search_score(query, choice, ignore_case=ignore_case,
-                                      apply_regex=False, template=template)
-        else:
-            if query:
-                result = (choice, choice, NOT_FOUND_SCORE)
-            else:
-                result = (choice, choice, NO_SCORE)
-
-        if valid_only:
-            if result[-1] != NOT_FOUND_SCORE:
-                results.append(result)
+    for index, (choice, score) in enumerate(zip(choices, scores)):
+        if score == NOT_FOUND_SCORE:
+            if not valid_only:
+                results.append((choice, choice, score))
         else:
-            results.append(result)
+            results.append(
+                (choice, search_choices.get_rich_text(index, template), score)
+            )
 
     if sort:
         results = sorted(results, key=lambda row: row[-1])
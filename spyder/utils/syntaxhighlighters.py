@@ -12,17 +12,19 @@
 # Standard library imports
 import builtins
 import keyword
+import logging
 import os
 import re
+import time
 
 # Third party imports
 from pygments.lexer import RegexLexer, bygroups
 from pygments.lexers import get_lexer_by_name
 from pygments.token import (Text, Other, Keyword, Name, String, Number,
                             Comment, Generic, Token)
-from qtpy.QtCore import Qt, QTimer, Signal
+from qtpy.QtCore import Qt, QTimer, Signal, Slot
 from qtpy.QtGui import (QColor, QCursor, QFont, QSyntaxHighlighter,
-                        QTextCharFormat, QTextOption)
+                        QTextCharFormat, QTextCursor, QTextOption)
 from qtpy.QtWidgets import QApplication
 
 # Local imports
@@ -32,11 +34,13 @@
 from spyder.plugins.editor.utils.languages import CELL_LANGUAGES
 from spyder.plugins.editor.utils.editor import TextBlockHelper as tbh
 from spyder.plugins.editor.utils.editor import BlockUserData
-from spyder.utils.workers import WorkerManager
 from spyder.plugins.outlineexplorer.api import OutlineExplorerData
+from spyder.utils.incrementallexer import IncrementalLexer
 from spyder.utils.qstringhelpers import qstring_length
 
 
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Constants
@@ -488,6 +492,18 @@ def make_ipython_patterns(additional_keywords=[], additional_builtins=[]):
             + r"|^\s*%%?(?P<magic>[^\s]*)")
 
 
+# Files with at least this number of lines are highlighted lazily when
+# opened, i.e. only their first blocks are highlighted before showing them.
+LAZY_HIGHLIGHTING_MIN_BLOCKS = 2000  # blocks
+
+# Number of blocks after the visible ones that are highlighted before showing
+# files highlighted lazily.
+LAZY_HIGHLIGHTING_MARGIN = 100  # blocks
+
+# Maximum time to highlight blocks in one iteration of the event loop
+HIGHLIGHTING_TIME_SLICE = 0.02  # 20 ms
+
+
 def get_code_cell_name(text):
     """Returns a code cell name from a code cell comment."""
     name = text.strip().lstrip("#% ")
@@ -526,6 +542,26 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.outline_explorer_data_update_timer = QTimer()
         self.outline_explorer_data_update_timer.setSingleShot(True)
 
+        # Lazy highlighting (see start_lazy_highlighting).
+        # The cursor is at the first block of the ones not highlighted yet,
+        # which are highlighted in order, but the visible ones are
+        # highlighted first.
+        self.highlighting_report = None
+        self._lazy_name = None
+        self._lazy_sync_blocks = 0
+        self._lazy_cursor = None
+        self._lazy_visible = (0, -1)
+        self._lazy_done = set()
+        self._lazy_block_count = 0
+        self._lazy_start = None
+        self._lazy_first_paint = None
+        self._highlighting_lazily = False
+
+        self._lazy_timer = QTimer(self)
+        self._lazy_timer.setSingleShot(True)
+        self._lazy_timer.setInterval(0)
+        self._lazy_timer.timeout.connect(self._highlight_pending_blocks)
+
     def highlight_match(self, text, match, key, value, offset,
                         state, import_stmt, oedata):
         """Highlight a single match."""
@@ -619,6 +655,13 @@ def highlight_match(self, text, match, key, value, offset,
 
     def highlight_block(self, text):
         """Implement specific highlight for Python."""
+        if self._lazy_start is not None and self._skip_block():
+            # Assume the block doesn't end inside a string until it's
+            # highlighted, so that highlighting it doesn't propagate to
+            # the next blocks if that's the case.
+            tbh.set_state(self.currentBlock(), self.NORMAL)
+            return
+
         text = to_text_string(text)
         prev_state = tbh.get_state(self.currentBlock().previous())
         if prev_state == self.INSIDE_DQ3STRING:
@@ -701,8 +744,138 @@ def get_import_statements(self):
         return statments
 
     def rehighlight(self):
+        self.stop()
         BaseSH.rehighlight(self)
 
+    def stop(self):
+        """Stop highlighting blocks lazily."""
+        self._lazy_timer.stop()
+        self._lazy_start = None
+        self._lazy_cursor = None
+        self._lazy_done = set()
+
+    def start_lazy_highlighting(self, sync_blocks, name=None):
+        """
+        Highlight lazily the text set next in the document.
+
+        Only its first sync_blocks blocks are highlighted when it's set and
+        the rest in slices of time afterwards, starting with the visible
+        ones, so that large files can be shown quickly.
+
+        A report of the time it took to highlight the text, identified by
+        name, is saved in highlighting_report and logged when finished.
+        """
+        self.stop()
+        self.highlighting_report = None
+        self._lazy_name = name
+        self._lazy_sync_blocks = sync_blocks
+        self._lazy_visible = (0, -1)
+        self._lazy_first_paint = None
+        self._lazy_start = time.perf_counter()
+        self._lazy_timer.start()
+
+    @property
+    def is_highlighting_lazily(self):
+        """Whether there are blocks pending to be highlighted."""
+        return self._lazy_start is not None
+
+    def _skip_block(self):
+        """Whether the current block is left to be highlighted later."""
+        if self._highlighting_lazily:
+            return False
+
+        number = self.currentBlock().blockNumber()
+        if self._lazy_cursor is None:
+            if number < self._lazy_sync_blocks:
+                return False
+            self._lazy_cursor = QTextCursor(self.currentBlock())
+            return True
+
+        first_visible, last_visible = self._lazy_visible
+        return (number >= self._lazy_cursor.blockNumber()
+                and not first_visible <= number <= last_visible)
+
+    @Slot()
+    def _highlight_pending_blocks(self):
+        """
+        Highlight pending blocks for at most HIGHLIGHTING_TIME_SLICE,
+        starting with the visible ones.
+        """
+        if self._lazy_start is None:
+            return
+
+        now = time.perf_counter()
+        if self._lazy_first_paint is None:
+            # The text was set and the editor could be painted since lazy
+            # highlighting started.
+            self._lazy_first_paint = now - self._lazy_start
+        deadline = now + HIGHLIGHTING_TIME_SLICE
+
+        document = self.document()
+        if document is None:
+            self.stop()
+            return
+
+        if self._lazy_cursor is None:
+            # All blocks were highlighted when the text was set
+            self._finish_lazy_highlighting()
+            return
+
+        self._highlighting_lazily = True
+        try:
+            first_pending = self._lazy_cursor.blockNumber()
+
+            # Visible blocks first. Some of them could be inside strings
+            # that start in pending blocks, so they're highlighted again
+            # when all the previous ones are.
+            if document.blockCount() != self._lazy_block_count:
+                self._lazy_block_count = document.blockCount()
+                self._lazy_done = set()
+            if self.editor is not None:
+                self._lazy_visible = self.editor.get_visible_block_numbers()
+            first_visible, last_visible = self._lazy_visible
+            for number in range(max(first_visible, first_pending),
+                                last_visible + 1):
+                if number not in self._lazy_done:
+                    self._lazy_done.add(number)
+                    self.rehighlightBlock(document.findBlockByNumber(number))
+
+            # Then the rest in order
+            block = self._lazy_cursor.block()
+            while block.isValid() and time.perf_counter() < deadline:
+                self.rehighlightBlock(block)
+                block = block.next()
+        finally:
+            self._highlighting_lazily = False
+
+        if block.isValid():
+            self._lazy_cursor.setPosition(block.position())
+            self._lazy_timer.start()
+        else:
+            self._finish_lazy_highlighting()
+
+    def _finish_lazy_highlighting(self):
+        """Save and log the report of the time it took to highlight."""
+        total = time.perf_counter() - self._lazy_start
+        document = self.document()
+        self.highlighting_report = {
+            'name': self._lazy_name,
+            'blocks': document.blockCount() if document is not None else 0,
+            'sync_blocks': self._lazy_sync_blocks,
+            'first_paint': self._lazy_first_paint,
+            'total': total,
+        }
+        self.stop()
+
+        logger.debug(
+            "Highlighted %s lazily: %d blocks, first paint after %.1f ms, "
+            "all blocks after %.1f ms",
+            self.highlighting_report['name'],
+            self.highlighting_report['blocks'],
+            self.highlighting_report['first_paint'] * 1000,
+            total * 1000
+        )
+
 
 # =============================================================================
 # IPython syntax highlighter
@@ -1239,6 +1412,9 @@ def setup_formats(self, font=None):
 #==============================================================================
 # Pygments based omni-parser
 #==============================================================================
+# Maximum time to lex lines in one iteration of the event loop
+LEXING_TIME_SLICE = 0.02  # 20 ms
+
 # IMPORTANT NOTE:
 # --------------
 # Do not be tempted to generalize the use of PygmentsSH (that is tempting
@@ -1274,90 +1450,132 @@ def __init__(self, parent, font=None, color_scheme=None):
 
         BaseSH.__init__(self, parent, font, color_scheme)
 
-        # This worker runs in a thread to avoid blocking when doing full file
-        # parsing
-        self._worker_manager = WorkerManager()
+        # Lexer that stores the formats of every line and only lexes again
+        # the lines affected by changes.
+        self._incremental_lexer = IncrementalLexer(self._lexer, self._tokmap)
+        self._lexing = None
 
-        # Store the format for all the tokens after Pygments parsing
-        self._charlist = []
+        # Lines are lexed in slices of time, to not block the interface
+        # when lexing the whole file.
+        self._lexing_timer = QTimer(self)
+        self._lexing_timer.setSingleShot(True)
+        self._lexing_timer.setInterval(0)
+        self._lexing_timer.timeout.connect(self._lex_pending_lines)
 
-        # Flag variable to avoid unnecessary highlights if the worker has not
-        # yet finished processing
-        self._allow_highlight = True
+        document = self.document()
+        self._incremental_lexer.set_lines(self._get_lines(document))
+        document.contentsChange.connect(self._on_contents_change)
+        self._lex_pending_lines()
 
     def stop(self):
-        self._worker_manager.terminate_all()
+        self._lexing_timer.stop()
+        self._lexing = None
 
     def make_charlist(self):
-        """Parses the complete text and stores format for each character."""
-
-        def worker_output(worker, output, error):
-            """Worker finished callback."""
-            self._charlist = output
-            if error is None and output:
-                self._allow_highlight = True
-                self.rehighlight()
-            self._allow_highlight = False
-
-        text = to_text_string(self.document().toPlainText())
-        tokens = self._lexer.get_tokens(text)
-
-        # Before starting a new worker process make sure to end previous
-        # incarnations
-        self._worker_manager.terminate_all()
-
-        worker = self._worker_manager.create_python_worker(
-            self._make_charlist,
-            tokens,
-            self._tokmap,
-            self.formats,
-        )
-        worker.sig_finished.connect(worker_output)
-        worker.start()
-
-    def _make_charlist(self, tokens, tokmap, formats):
         """
-        Parses the complete text and stores format for each character.
-
-        Uses the attached lexer to parse into a list of tokens and Pygments
-        token types.  Then breaks tokens into individual letters, each with a
-        Spyder token type attached.  Stores this list as self._charlist.
+        Lex the whole document again in the background.
 
-        It's attached to the contentsChange signal of the parent QTextDocument
-        so that the charlist is updated whenever the document changes.
+        Changes are lexed as they're made, but this is needed once in a
+        while because some changes can affect the lines before them.
         """
-
-        def _get_fmt(typ):
-            """Get the Spyder format code for the given Pygments token type."""
-            # Exact matches first
-            if typ in tokmap:
-                return tokmap[typ]
-            # Partial (parent-> child) matches
-            for key, val in tokmap.items():
-                if typ in key: # Checks if typ is a subtype of key.
-                    return val
-
-            return 'normal'
-
-        charlist = []
-        for typ, token in tokens:
-            fmt = formats[_get_fmt(typ)]
-            for letter in token:
-                charlist.append((fmt, letter))
-
-        return charlist
+        self._incremental_lexer.relex()
+        self._lexing = None
+        self._lexing_timer.start()
 
     def highlightBlock(self, text):
         """ Actually highlight the block"""
-        # Note that an undefined blockstate is equal to -1, so the first block
-        # will have the correct behaviour of starting at 0.
-        if self._allow_highlight:
-            start = self.previousBlockState() + 1
-            end = start + qstring_length(text)
-            for i, (fmt, letter) in enumerate(self._charlist[start:end]):
-                self.setFormat(i, 1, fmt)
-            self.setCurrentBlockState(end)
-            self.highlight_extras(text)
+        lexer = self._incremental_lexer
+        line = self.currentBlock().blockNumber()
+
+        # The block can be highlighted before its changes reach the lexer,
+        # in which case it's highlighted again after lexing them.
+        if 0 <= line < len(lexer.lines) and lexer.lines[line] == text:
+            formats = self.formats
+            spans = lexer.get_spans(line)
+            if qstring_length(text) == len(text):
+                for start, length, fmt in spans:
+                    self.setFormat(start, length, formats[fmt])
+            else:
+                # Spans are given in characters and formats are set in
+                # UTF-16 code units.
+                for start, length, fmt in spans:
+                    qstart = qstring_length(text[:start])
+                    qlength = qstring_length(text[start:start + length])
+                    self.setFormat(qstart, qlength, formats[fmt])
+
+        self.highlight_extras(text)
+
+    @staticmethod
+    def _get_lines(document, first_block=None, last_block=None):
+        """Get the text of the blocks from first_block to last_block."""
+        block = first_block if first_block is not None else (
+            document.firstBlock())
+        lines = []
+        while block.isValid():
+            lines.append(block.text())
+            if block == last_block:
+                break
+            block = block.next()
+        return lines
+
+    @Slot(int, int, int)
+    def _on_contents_change(self, position, removed, added):
+        """Lex the blocks changed in the document."""
+        document = self.document()
+        if document is None:
+            return
+
+        lexer = self._incremental_lexer
+        first_block = document.findBlock(position)
+        last_block = document.findBlock(position + added)
+        if not first_block.isValid():
+            return
+        if not last_block.isValid():
+            last_block = document.lastBlock()
+
+        first = first_block.blockNumber()
+        new_lines = self._get_lines(document, first_block, last_block)
+        count = len(new_lines) - (document.blockCount() - len(lexer.lines))
+
+        # Changes that don't modify the text are also reported, e.g. when
+        # setting formats.
+        if (count == len(new_lines) and
+                new_lines == lexer.lines[first:first + count]):
+            return
+
+        lexer.replace_lines(first, count, new_lines)
+        self._lexing = None
+        self._lex_pending_lines(
+            rehighlight=range(first, first + len(new_lines)))
+
+    @Slot()
+    def _lex_pending_lines(self, rehighlight=()):
+        """
+        Lex pending lines for at most LEXING_TIME_SLICE and rehighlight the
+        ones whose formats changed, plus the lines in rehighlight.
+        """
+        if self._lexing is None:
+            if not self._incremental_lexer.is_lexing:
+                return
+            self._lexing = self._incremental_lexer.lex()
+
+        lines = set(rehighlight)
+        deadline = time.perf_counter() + LEXING_TIME_SLICE
+        for line in self._lexing:
+            if line is not None:
+                lines.add(line)
+            if time.perf_counter() > deadline:
+                self._lexing_timer.start()
+                break
+        else:
+            self._lexing = None
+
+        document = self.document()
+        if document is not None:
+            for line in sorted(lines):
+                block = document.findBlockByNumber(line)
+                if block.isValid():
+                    self.rehighlightBlock(block)
 
 
 class PythonLoggingLexer(RegexLexer):
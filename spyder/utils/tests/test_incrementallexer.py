@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""Tests for incrementallexer.py"""
+
+# Standard library imports
+import random
+
+# Third party imports
+from pygments.lexers import get_lexer_by_name
+from pygments.token import Comment, Keyword, Name, String, Text
+import pytest
+
+# Local imports
+from spyder.utils.incrementallexer import IncrementalLexer, is_resumable
+
+
+TOKMAP = {
+    Text: 'normal',
+    Keyword: 'keyword',
+    Name: 'normal',
+    Comment: 'comment',
+    String: 'string',
+}
+
+FRAGMENTS = {
+    'html': ['<div class="a">', '<!-- comment', '-->', '<script>',
+             'var a = "<b>";', '</script>', '</div>', '', '  text'],
+    'markdown': ['# Title', '*a* and `b`', '```', 'code', '> quote', '',
+                 '- item'],
+    'yaml': ['a: 1', '- b', '  c: "x', 'y"', '# comment', 'key: |',
+             '  text', ''],
+}
+
+
+def lex_all(lexer, lines):
+    """Lex lines at once, without resuming."""
+    incremental_lexer = IncrementalLexer(lexer, TOKMAP)
+    incremental_lexer.resumable = False
+    incremental_lexer.set_lines(lines)
+    list(incremental_lexer.lex())
+    return incremental_lexer.spans
+
+
+def char_formats(spans):
+    """Expand spans to the format of every character of each line."""
+    formats = []
+    for line_spans in spans:
+        line_formats = {}
+        for start, length, fmt in line_spans:
+            for i in range(start, start + length):
+                line_formats[i] = fmt
+        formats.append(line_formats)
+    return formats
+
+
+def test_spans():
+    """Test the spans of a multiline comment."""
+    lexer = get_lexer_by_name('html')
+    assert is_resumable(lexer)
+
+    incremental_lexer = IncrementalLexer(lexer, TOKMAP)
+    incremental_lexer.set_lines(['<p>a</p> <!-- b', 'c -->', ''])
+    assert list(incremental_lexer.lex()) == [0, 1, None]
+    assert incremental_lexer.spans == [
+        ((0, 9, 'normal'), (9, 6, 'comment')),
+        ((0, 5, 'comment'),),
+        (),
+    ]
+
+
+@pytest.mark.parametrize('language', list(FRAGMENTS))
+def test_random_edits(language):
+    """
+    Test that lexing incrementally gives the same formats as lexing the
+    whole text, after relexing it when needed.
+    """
+    rng = random.Random(0)
+    fragments = FRAGMENTS[language]
+    lexer = get_lexer_by_name(language)
+    lines = [rng.choice(fragments) for __ in range(50)]
+
+    incremental_lexer = IncrementalLexer(lexer, TOKMAP)
+    incremental_lexer.set_lines(lines)
+    list(incremental_lexer.lex())
+    assert char_formats(incremental_lexer.spans) == char_formats(
+        lex_all(lexer, lines))
+
+    for __ in range(200):
+        first = rng.randrange(len(lines))
+        count = rng.randint(1, min(3, len(lines) - first))
+        new_lines = [
+            rng.choice(fragments) + rng.choice(['', ' x', '"', '-->'])
+            for __ in range(rng.randint(1, 3))
+        ]
+        lines[first:first + count] = new_lines
+        incremental_lexer.replace_lines(first, count, new_lines)
+
+        # Interrupt lexing sometimes
+        if rng.random() < 0.3:
+            for __, __ in zip(incremental_lexer.lex(), range(5)):
+                pass
+            continue
+
+        list(incremental_lexer.lex())
+        expected = char_formats(lex_all(lexer, lines))
+        if char_formats(incremental_lexer.spans) != expected:
+            incremental_lexer.relex()
+            list(incremental_lexer.lex())
+            assert char_formats(incremental_lexer.spans) == expected
+
+
+def test_lex_only_changed_lines():
+    """Test that lexing stops after the changed lines when possible."""
+    lexer = get_lexer_by_name('markdown')
+    lines = ['# Title', '', 'Some *text*', ''] * 1000
+    incremental_lexer = IncrementalLexer(lexer, TOKMAP)
+    incremental_lexer.set_lines(lines)
+    list(incremental_lexer.lex())
+
+    incremental_lexer.replace_lines(2001, 1, ['Some `code`'])
+    assert len(list(incremental_lexer.lex())) < 5
+    assert incremental_lexer.spans == lex_all(
+        lexer, lines[:2001] + ['Some `code`'] + lines[2002:])
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -10,12 +10,14 @@
 
 # Standard library imports
 import os
+import time
 
 # Test library imports
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import (
+    get_search_regex, get_search_score, get_search_scores, SearchChoices)
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +218,73 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_search_choices():
+    """Test searching the same choices several times."""
+    choices = ['layout preferences', 'Use next Layout', 'close pane', 'yank']
+    search_choices = SearchChoices(choices)
+
+    assert search_choices.get_scores('lay') == [400100, 400109, -1, -1]
+    assert search_choices.get_best('lay', 1) == [(400100, 0)]
+    assert search_choices.get_rich_text(1, '<b>{0}</b>') == (
+        'Use next <b>Lay</b>out')
+    assert search_choices.get_rich_text(2, '<b>{0}</b>') == 'close pane'
+
+    assert search_choices.get_best('cpn', 10) == [(search_choices.get_scores(
+        'cpn')[2], 2)]
+    assert search_choices.get_rich_text(2, '<b>{0}</b>') == (
+        '<b>c</b>lose <b>p</b>a<b>n</b>e')
+
+    # Regular expression characters are searched as is
+    assert search_choices.get_scores('.*') == [-1, -1, -1, -1]
+    assert search_choices.get_scores('') == [0, 0, 0, 0]
+
+
+@pytest.mark.slow
+def test_benchmark():
+    """
+    Compare scoring choices one by one with scoring them in batch and only
+    enriching the best ones.
+    """
+    choices = []
+    for i in range(20000):
+        if i % 3:
+            choices.append('module_{}.py'.format(i))
+        else:
+            choices.append('SomeClass{}.method_name'.format(i))
+    template = '<b>{0}</b>'
+    total_per_choice = total_batch = 0
+
+    for query in ['mod', 'smn', 'zzz', 'method']:
+        # This is how get_search_scores used to work
+        t0 = time.perf_counter()
+        pattern = get_search_regex(query)
+        results = [
+            (index, get_search_score(query, choice, apply_regex=False,
+                                     template=template))
+            for index, choice in enumerate(choices)
+            if pattern.search(choice)
+        ]
+        expected = sorted(
+            (result[-1], index, result[1]) for index, result in results
+        )[:100]
+        t_per_choice = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        search_choices = SearchChoices(choices)
+        found = [
+            (score, index, search_choices.get_rich_text(index, template))
+            for score, index in search_choices.get_best(query, 100)
+        ]
+        t_batch = time.perf_counter() - t0
+
+        print('{}: {:.1f} ms per choice, {:.1f} ms in batch'.format(
+            query, t_per_choice * 1000, t_batch * 1000))
+        assert found == expected
+        total_per_choice += t_per_choice
+        total_batch += t_batch
+
+    assert total_batch < total_per_choice
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -6,10 +6,10 @@
 """Tests for syntaxhighlighters.py"""
 
 import pytest
-from qtpy.QtWidgets import QApplication
-from qtpy.QtGui import QTextDocument
+from qtpy.QtGui import QTextCursor, QTextDocument
 
-from spyder.utils.syntaxhighlighters import HtmlSH, PythonSH, MarkdownSH
+from spyder.utils.syntaxhighlighters import (
+    HtmlSH, PythonSH, MarkdownSH, guess_pygments_highlighter)
 
 def compare_formats(actualFormats, expectedFormats, sh):
     assert len(actualFormats) == len(expectedFormats)
@@ -111,6 +111,73 @@ def test_Markdown_basic():
     compare_formats(doc.firstBlock().layout().formats(), res, sh)
 
 
+def test_PygmentsSH_incremental(qtbot):
+    """Test that Pygments highlighters update the blocks affected by edits."""
+    txt = '<p>a</p>\n<!-- b\nc -->\n<p>d</p>'
+    doc = QTextDocument(txt)
+    # Documents only emit contentsChange once they have a layout
+    doc.documentLayout()
+    sh = guess_pygments_highlighter('test.xml')(doc, color_scheme='Spyder')
+
+    def block_formats(line):
+        block = doc.findBlockByNumber(line)
+        return [(fmt.start, fmt.length,
+                 fmt.format.foreground().color().name())
+                for fmt in block.layout().formats()]
+
+    def color(fmt):
+        return sh.formats[fmt].foreground().color().name()
+
+    sh.rehighlight()
+    assert block_formats(2) == [(0, 5, color('comment'))]
+
+    # Remove the start of the comment
+    cursor = QTextCursor(doc.findBlockByNumber(1))
+    cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+    cursor.insertText('b')
+    while sh._incremental_lexer.is_lexing:
+        sh._lex_pending_lines()
+
+    assert block_formats(1) == [(0, 1, color('normal'))]
+    assert block_formats(2) == [(0, 5, color('normal'))]
+
+
+def test_PythonSH_lazy_highlighting(qtbot):
+    """Test that blocks are highlighted lazily after setting the text."""
+    txt = '\n'.join(['x = 1'] * 50 + ['s = """', 'def f', '"""'] +
+                    ['def f(): pass'] * 50)
+    doc = QTextDocument()
+    doc.documentLayout()
+    sh = PythonSH(doc, color_scheme='Spyder')
+
+    def block_formats(line):
+        block = doc.findBlockByNumber(line)
+        return [(fmt.start, fmt.length,
+                 fmt.format.foreground().color().name())
+                for fmt in block.layout().formats()]
+
+    def color(fmt):
+        return sh.formats[fmt].foreground().color().name()
+
+    sh.start_lazy_highlighting(10, name='test.py')
+    doc.setPlainText(txt)
+    assert block_formats(0) == [(0, 4, color('normal')),
+                                (4, 1, color('number'))]
+    assert block_formats(20) == []
+    assert sh.is_highlighting_lazily
+
+    while sh.is_highlighting_lazily:
+        sh._highlight_pending_blocks()
+
+    assert block_formats(20) == block_formats(0)
+    assert block_formats(51) == [(0, 5, color('string'))]
+    assert block_formats(60)[2] == (4, 1, color('definition'))
+    report = sh.highlighting_report
+    assert report['name'] == 'test.py'
+    assert report['blocks'] == 103
+    assert report['total'] >= report['first_paint']
+
+
 @pytest.mark.parametrize('line', ['# --- First variant',
                                   '#------ 2nd variant',
                                   '### 3rd variant'])
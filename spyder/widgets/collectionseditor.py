@@ -20,7 +20,9 @@
 
 # Standard library imports
 import datetime
+import functools
 import io
+import operator
 import re
 import sys
 import warnings
@@ -55,7 +57,7 @@
 from spyder.utils.qthelpers import mimedata2url
 from spyder.utils.stringmatching import get_search_scores, get_search_regex
 from spyder.plugins.variableexplorer.widgets.collectionsdelegate import (
-    CollectionsDelegate)
+    CollectionsDelegate, LARGE_ARRAY)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
 from spyder.widgets.helperwidgets import CustomSortFilterProxy
 from spyder.plugins.variableexplorer.widgets.basedialog import BaseDialog
@@ -252,11 +254,8 @@ def set_data(self, data, coll_filter=None):
                 self.header0 = _("Attribute")
 
         if not isinstance(self._data, ProxyObject):
-            if len(self.keys) > 1:
-                elements = _("elements")
-            else:
-                elements = _("element")
-            self.title += (' (' + str(len(self.keys)) + ' ' + elements + ')')
+            self._title_without_count = self.title
+            self.title += self._get_count_text()
         else:
             data_type = get_type_string(data)
             self.title += data_type
@@ -277,6 +276,113 @@ def set_data(self, data, coll_filter=None):
 
         self.reset()
 
+    def update_data(self, changed, removed):
+        """
+        Update the entries of a remote namespace view in place.
+
+        Parameters
+        ----------
+        changed: dict
+            New entries of variables that were added or changed.
+        removed: list
+            Names of the variables that were removed.
+
+        Notes
+        -----
+        Rows are inserted, removed or updated instead of resetting the model,
+        which keeps the selection and sorting of the view. If not all rows
+        are loaded, the model is reset with the new data.
+        """
+        data = self._data
+        if self.rows_loaded < self.total_rows:
+            data = {
+                key: value for key, value in data.items()
+                if key not in removed
+            }
+            data.update(changed)
+            self.set_data(data)
+            return
+
+        key_rows = {key: row for row, key in enumerate(self.keys)}
+
+        # Remove consecutive rows together, starting from the last ones so
+        # that the rows to remove before them don't change. Scores are
+        # removed with their rows because they don't depend on other rows.
+        rows = sorted(
+            [key_rows[key] for key in removed if key in key_rows],
+            reverse=True
+        )
+        if rows:
+            self.scores = list(self.scores)
+            for first, last in self._get_row_ranges(rows):
+                self.beginRemoveRows(QModelIndex(), first, last)
+                for key in self.keys[first:last + 1]:
+                    del data[key]
+                del self.keys[first:last + 1]
+                del self.sizes[first:last + 1]
+                del self.types[first:last + 1]
+                del self.scores[first:last + 1]
+                self.total_rows = self.rows_loaded = len(self.keys)
+                self.endRemoveRows()
+            key_rows = {key: row for row, key in enumerate(self.keys)}
+
+        # Update changed rows
+        new_keys = []
+        for key, value in changed.items():
+            if key not in data:
+                new_keys.append(key)
+                continue
+
+            row = key_rows[key]
+            data[key] = value
+            self.sizes[row] = value['size']
+            self.types[row] = value['type']
+            self.dataChanged.emit(
+                self.index(row, 0),
+                self.index(row, self.columnCount() - 1)
+            )
+
+        # Add new rows at the end, the proxy model takes care of sorting them
+        if new_keys:
+            first = len(self.keys)
+            self.beginInsertRows(
+                QModelIndex(), first, first + len(new_keys) - 1)
+            for key in new_keys:
+                value = changed[key]
+                data[key] = value
+                self.keys.append(key)
+                self.sizes.append(value['size'])
+                self.types.append(value['type'])
+            self.total_rows = self.rows_loaded = len(self.keys)
+            self._update_scores()
+            self.endInsertRows()
+
+        if new_keys or rows:
+            self.title = self._title_without_count + self._get_count_text()
+
+        self.sig_setting_data.emit()
+
+    def _get_row_ranges(self, rows):
+        """
+        Group rows sorted in descending order in ranges of consecutive rows,
+        as (first, last) tuples.
+        """
+        ranges = []
+        for row in rows:
+            if ranges and ranges[-1][0] == row + 1:
+                ranges[-1][0] = row
+            else:
+                ranges.append([row, row])
+        return [tuple(row_range) for row_range in ranges]
+
+    def _get_count_text(self):
+        """Get the number of elements shown in the title."""
+        if len(self.keys) > 1:
+            elements = _("elements")
+        else:
+            elements = _("element")
+        return ' (' + str(len(self.keys)) + ' ' + elements + ')'
+
     def set_size_and_type(self, start=None, stop=None):
         data = self._data
 
@@ -441,6 +547,16 @@ def update_search_letters(self, text=""):
             self.normal_text, _, self.scores = zip(*results)
             self.reset()
 
+    def _update_scores(self):
+        """Update search scores for the current keys without a reset."""
+        names = [str(key) for key in self.keys]
+        results = get_search_scores(
+            getattr(self, 'letters', ''), names, template='<b>{0}</b>')
+        if results:
+            self.normal_text, _, self.scores = zip(*results)
+        else:
+            self.normal_text, self.scores = (), ()
+
     def row_key(self, row_num):
         """
         Get row name based on model index.
@@ -1822,6 +1938,57 @@ def get_value(self, index):
             name = source_index.model().keys[source_index.row()]
             return self.parent().get_value(name)
 
+    def createEditor(self, parent, option, index, object_explorer=False):
+        """Overriding method createEditor"""
+        if index.column() == 3 and not object_explorer:
+            source_index = index.model().mapToSource(index)
+            name = source_index.model().keys[source_index.row()]
+            if self.parent().is_viewed_by_handle(name):
+                # Large dataframes and arrays are viewed through a handle to
+                # avoid transferring them from the kernel.
+                if self.create_remote_editor(parent, index, name):
+                    return None
+
+        return super().createEditor(parent, option, index, object_explorer)
+
+    def create_remote_editor(self, parent, index, name):
+        """
+        Create a DataFrameEditor or ArrayEditor that retrieves its data on
+        demand.
+
+        Returns False if the kernel is not able to provide a view handle for
+        the variable, in which case it has to be retrieved as usual.
+        """
+        from spyder.plugins.variableexplorer.widgets.arrayeditor import (
+            ArrayEditor)
+        from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
+            DataFrameEditor)
+        from spyder.plugins.variableexplorer.widgets.viewhandles import (
+            ArrayViewHandle, DataFrameViewHandle)
+
+        shellwidget = self.parent().shellwidget
+        try:
+            if self.parent().is_data_frame(name) or self.parent().is_series(
+                    name):
+                view_handle = DataFrameViewHandle(shellwidget, name)
+                editor_class = DataFrameEditor
+            else:
+                view_handle = ArrayViewHandle(shellwidget, name)
+                editor_class = ArrayEditor
+        except Exception:
+            return False
+
+        self.sig_editor_creation_started.emit()
+        editor = editor_class(parent=parent)
+        if not editor.setup_and_check_remote(view_handle, title=name):
+            view_handle.close()
+            self.sig_editor_shown.emit()
+            return True
+
+        self.create_dialog(editor, dict(model=index.model(), editor=editor,
+                                        key=name, readonly=True))
+        return True
+
     def set_value(self, index, value):
         if index.isValid():
             source_index = index.model().mapToSource(index)
@@ -1908,6 +2075,10 @@ def __init__(self, parent, data, shellwidget=None, remote_editing=False,
             self.menu = self.setup_menu()
 
     # ------ Remote/local API -------------------------------------------------
+    def update_data(self, changed, removed):
+        """Update table data with the changes of a namespace view"""
+        self.source_model.update_data(changed, removed)
+
     def get_value(self, name):
         """Get the value of a variable"""
         value = self.shellwidget.get_value(name)
@@ -1961,6 +2132,34 @@ def is_series(self, name):
         """Return True if variable is a Series"""
         return self.var_properties[name]['is_series']
 
+    def is_viewed_by_handle(self, name):
+        """
+        Return True if variable is a DataFrame, Series or array so large that
+        it's better to view it without retrieving its value.
+
+        The limit is the same one used by the delegate to warn that opening a
+        variable can be slow, so smaller objects are still copied as before.
+
+        Arrays that are not NumPy arrays (e.g. HDF5 datasets) are always
+        viewed that way because their data is not in memory. Other objects
+        that can be viewed by handle (e.g. Index objects) don't have a remote
+        editor, so their value is retrieved as usual.
+        """
+        try:
+            properties = self.var_properties[name]
+            if not properties.get('viewable_by_handle'):
+                return False
+            if self.is_data_frame(name) or self.is_series(name):
+                shape = self.get_len(name)
+            elif self.is_array(name):
+                shape = self.get_array_shape(name)
+            else:
+                return bool(properties.get('is_viewable_array'))
+            size = functools.reduce(operator.mul, shape)
+        except (KeyError, TypeError):
+            return False
+        return size > LARGE_ARRAY
+
     def get_array_shape(self, name):
         """Return array's shape"""
         return self.var_properties[name]['array_shape']
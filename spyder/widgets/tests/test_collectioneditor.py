@@ -286,6 +286,80 @@ def test_remote_make_data_function():
     assert value == mock_shellwidget.get_value.return_value
 
 
+def test_remote_index_is_not_viewed_by_handle(monkeypatch):
+    """
+    Test that Index objects are opened with the editor that retrieves their
+    value, since there's no remote editor for them.
+    """
+    index = pandas.Index(range(10**7))
+    variables = {'index': {'type': 'RangeIndex',
+                           'size': (10**7,),
+                           'view': 'RangeIndex',
+                           'python_type': 'RangeIndex',
+                           'numpy_type': 'Unknown'}}
+    mock_shellwidget = Mock()
+    mock_shellwidget.get_value.return_value = index
+    editor = RemoteCollectionsEditorTableView(
+        None, variables, mock_shellwidget
+    )
+    editor.var_properties = {'index': {'is_list': False,
+                                       'is_dict': False,
+                                       'is_set': False,
+                                       'len': (10**7,),
+                                       'is_array': False,
+                                       'is_image': False,
+                                       'is_data_frame': False,
+                                       'is_series': False,
+                                       'array_shape': None,
+                                       'array_ndim': None,
+                                       'viewable_by_handle': True,
+                                       'is_viewable_array': False}}
+    assert not editor.is_viewed_by_handle('index')
+
+    MockDataFrameEditor = Mock()
+    mockDataFrameEditor_instance = MockDataFrameEditor()
+    monkeypatch.setattr(
+        'spyder.plugins.variableexplorer.widgets.dataframeeditor.'
+        'DataFrameEditor',
+        MockDataFrameEditor
+    )
+    monkeypatch.setattr(editor.delegate, 'show_warning', lambda index: False)
+    editor.delegate.createEditor(None, None, editor.model.index(0, 3))
+
+    mock_shellwidget.get_value.assert_called_once_with('index')
+    mock_shellwidget.open_view_handle.assert_not_called()
+    mockDataFrameEditor_instance.setup_and_check.assert_called_once_with(
+        index, title='index')
+
+
+@pytest.mark.parametrize('shape,by_handle', [((1000, 1000), False),
+                                             ((10**7,), True)])
+def test_remote_array_viewed_by_handle(shape, by_handle):
+    """
+    Test that only arrays larger than the size that makes the delegate warn
+    about a slow opening are viewed through a handle.
+    """
+    variables = {'arr': {'type': 'Array of int64',
+                         'size': shape,
+                         'view': 'Min: 0 Max: 0',
+                         'python_type': 'ndarray',
+                         'numpy_type': 'int64'}}
+    editor = RemoteCollectionsEditorTableView(None, variables, Mock())
+    editor.var_properties = {'arr': {'is_list': False,
+                                     'is_dict': False,
+                                     'is_set': False,
+                                     'len': None,
+                                     'is_array': True,
+                                     'is_image': False,
+                                     'is_data_frame': False,
+                                     'is_series': False,
+                                     'array_shape': shape,
+                                     'array_ndim': len(shape),
+                                     'viewable_by_handle': True,
+                                     'is_viewable_array': True}}
+    assert editor.is_viewed_by_handle('arr') == by_handle
+
+
 def test_create_dataframeeditor_with_correct_format(qtbot):
     df = pandas.DataFrame(['foo', 'bar'])
     editor = CollectionsEditorTableView(None, {'df': df})